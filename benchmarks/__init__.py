@@ -0,0 +1,15 @@
+"""Performance benchmarks for docvet's check runners.
+
+The suite generates a synthetic project with :mod:`benchmarks.synthetic`
+and times every CLI runner against it with :mod:`benchmarks.run`, which
+writes machine-readable JSON results and can compare them with a
+baseline file to catch regressions in hot paths before a release.
+
+Examples:
+    Record a baseline, then compare a later run against it:
+
+    ```bash
+    python -m benchmarks.run --output baseline.json
+    python -m benchmarks.run --baseline baseline.json
+    ```
+"""
@@ -0,0 +1,490 @@
+"""Time docvet's check runners on a synthetic project.
+
+Generates a project with :func:`benchmarks.synthetic.generate` (or
+reuses one given with ``--project``), discovers its files once, and
+times each runner a configurable number of times after an untimed
+warm-up run.  Results are written as JSON with the median, minimum, and
+individual run times per runner, plus the finding count as a
+correctness check.  With ``--baseline``, each runner's median is
+compared with the baseline's and the script exits with status 1 when
+any runner slowed down by more than ``--max-regression``.
+
+With ``--memory``, the script also runs ``docvet check --all --no-cache``
+on the project in fresh child processes and records their peak resident
+set size (``ru_maxrss`` from :func:`resource.getrusage`, Unix only).
+Against a baseline with a memory section, a peak RSS growth beyond
+``--max-regression`` also fails the run.
+
+Runners are called without a result cache or progress bar, so every
+run analyses every file.  ``_run_fix`` runs in dry-run mode and leaves
+the project untouched.
+
+Examples:
+    Benchmark a larger Sphinx-style project and save the results:
+
+    ```bash
+    python -m benchmarks.run --modules 50 --style sphinx --output results.json
+    ```
+
+    Fail when a runner is more than 25% slower than a saved baseline:
+
+    ```bash
+    python -m benchmarks.run --baseline results.json --max-regression 0.25
+    ```
+
+    Record the peak RSS of a full ``check`` alongside the timings:
+
+    ```bash
+    python -m benchmarks.run --memory --output results.json
+    ```
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import dataclasses
+import importlib.metadata
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from docvet.cli import (
+    FreshnessMode,
+    _run_coverage,
+    _run_enrichment,
+    _run_fix,
+    _run_freshness,
+    _run_griffe,
+    _run_presence,
+)
+from docvet.config import DocvetConfig, load_config
+from docvet.discovery import DiscoveryMode, discover_files
+
+from .synthetic import STYLES, SyntheticSpec, generate
+
+__all__ = ["RUNNERS", "compare", "main", "measure_memory", "run_benchmarks"]
+
+# Schema version of the results document.
+_FORMAT_VERSION = 1
+
+_Runner = Callable[[list[Path], DocvetConfig], int]
+
+# Command measured by ``--memory``.
+_MEMORY_ARGS = ("check", "--all", "--no-cache")
+
+# Runs the docvet app in a fresh interpreter and writes its own peak RSS
+# (``ru_maxrss``: KiB on Linux, bytes on macOS) as the last stderr line.
+_MEMORY_SCRIPT = """\
+import resource, sys
+from docvet.cli import app
+try:
+    app(sys.argv[1:], prog_name="docvet")
+except SystemExit:
+    pass
+sys.stderr.write(f"\\n{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}\\n")
+"""
+
+
+def _presence(files: list[Path], config: DocvetConfig) -> int:
+    """Run the presence runner.
+
+    Args:
+        files: Discovered files.
+        config: Project configuration.
+
+    Returns:
+        The number of findings.
+    """
+    return len(_run_presence(files, config)[0])
+
+
+def _enrichment(files: list[Path], config: DocvetConfig) -> int:
+    """Run the enrichment runner.
+
+    Args:
+        files: Discovered files.
+        config: Project configuration.
+
+    Returns:
+        The number of findings.
+    """
+    return len(_run_enrichment(files, config)[0])
+
+
+def _freshness_diff(files: list[Path], config: DocvetConfig) -> int:
+    """Run the freshness runner in diff mode against ``HEAD``.
+
+    Args:
+        files: Discovered files.
+        config: Project configuration.
+
+    Returns:
+        The number of findings.
+    """
+    findings, _ = _run_freshness(files, config, FreshnessMode.DIFF, DiscoveryMode.ALL)
+    return len(findings)
+
+
+def _freshness_drift(files: list[Path], config: DocvetConfig) -> int:
+    """Run the freshness runner in drift mode (git blame per file).
+
+    Args:
+        files: Discovered files.
+        config: Project configuration.
+
+    Returns:
+        The number of findings.
+    """
+    findings, _ = _run_freshness(files, config, FreshnessMode.DRIFT, DiscoveryMode.ALL)
+    return len(findings)
+
+
+def _coverage(files: list[Path], config: DocvetConfig) -> int:
+    """Run the coverage runner.
+
+    Args:
+        files: Discovered files.
+        config: Project configuration.
+
+    Returns:
+        The number of findings.
+    """
+    return len(_run_coverage(files, config)[0])
+
+
+def _griffe(files: list[Path], config: DocvetConfig) -> int:
+    """Run the griffe runner, loading whole packages as ``--all`` does.
+
+    Args:
+        files: Discovered files.
+        config: Project configuration.
+
+    Returns:
+        The number of findings.
+    """
+    return len(_run_griffe(files, config)[0])
+
+
+def _fix(files: list[Path], config: DocvetConfig) -> int:
+    """Run the fix runner in dry-run mode.
+
+    Args:
+        files: Discovered files.
+        config: Project configuration.
+
+    Returns:
+        The number of scaffolded files.
+    """
+    return len(_run_fix(files, config, dry_run=True)[3])
+
+
+RUNNERS: dict[str, _Runner] = {
+    "presence": _presence,
+    "enrichment": _enrichment,
+    "freshness-diff": _freshness_diff,
+    "freshness-drift": _freshness_drift,
+    "coverage": _coverage,
+    "griffe": _griffe,
+    "fix": _fix,
+}
+
+
+def _time_runner(
+    runner: _Runner, files: list[Path], config: DocvetConfig, repeat: int
+) -> dict[str, object]:
+    """Time *runner* once untimed, then *repeat* times.
+
+    Runner output on stdout and stderr (parse warnings, skip notices)
+    is discarded so it does not mix with the report.
+
+    Args:
+        runner: Benchmark adapter from :data:`RUNNERS`.
+        files: Discovered files.
+        config: Project configuration.
+        repeat: Number of timed runs.
+
+    Returns:
+        The median, minimum, and individual run times in seconds, and
+        the runner's result count.
+    """
+    sink = io.StringIO()
+    timings: list[float] = []
+    with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+        count = runner(files, config)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            count = runner(files, config)
+            timings.append(time.perf_counter() - start)
+    return {
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "runs_s": timings,
+        "findings": count,
+    }
+
+
+def measure_memory(project: Path, *, repeat: int = 3) -> dict[str, object]:
+    """Measure the peak RSS of ``docvet check --all --no-cache``.
+
+    Each run is a fresh child interpreter, so the peak covers imports,
+    discovery, every check, and reporting, and no run inherits memory
+    from an earlier one.
+
+    Args:
+        project: Project root containing ``pyproject.toml``.
+        repeat: Number of measured runs.
+
+    Returns:
+        The command, and the median, maximum, and individual peak RSS
+        values in MiB.
+
+    Raises:
+        RuntimeError: If a child does not report its peak RSS.
+    """
+    scale = 1 if sys.platform == "darwin" else 1024
+    peaks: list[float] = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", _MEMORY_SCRIPT, *_MEMORY_ARGS],
+            cwd=project,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        last = proc.stderr.rstrip().rpartition("\n")[2]
+        if not last.isdigit():
+            msg = f"memory run failed: {proc.stderr.strip()}"
+            raise RuntimeError(msg)
+        peaks.append(int(last) * scale / 2**20)
+    return {
+        "command": ["docvet", *_MEMORY_ARGS],
+        "peak_rss_mib": statistics.median(peaks),
+        "max_rss_mib": max(peaks),
+        "runs_mib": peaks,
+    }
+
+
+def run_benchmarks(
+    project: Path,
+    *,
+    repeat: int = 5,
+    runners: list[str] | None = None,
+    memory: bool = False,
+) -> dict[str, object]:
+    """Time the selected runners on the project at *project*.
+
+    Args:
+        project: Project root containing ``pyproject.toml``.
+        repeat: Timed runs per runner.
+        runners: Names from :data:`RUNNERS`, or *None* for all.
+        memory: Also measure peak RSS with :func:`measure_memory`.
+
+    Returns:
+        The results document: environment metadata, the file count,
+        per-runner timings keyed by runner name, and with *memory* a
+        ``memory`` section.
+    """
+    config = load_config(project / "pyproject.toml")
+    files = discover_files(config, DiscoveryMode.ALL)
+    results = {
+        name: _time_runner(RUNNERS[name], files, config, repeat)
+        for name in runners or RUNNERS
+    }
+    document: dict[str, object] = {
+        "format_version": _FORMAT_VERSION,
+        "docvet_version": importlib.metadata.version("docvet"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "files": len(files),
+        "repeat": repeat,
+        "results": results,
+    }
+    if memory:
+        document["memory"] = measure_memory(project, repeat=repeat)
+    return document
+
+
+def compare(
+    results: dict[str, object],
+    baseline: dict[str, object],
+    *,
+    max_regression: float,
+) -> list[str]:
+    """Find runners whose median time regressed against *baseline*.
+
+    Runners missing from either document are ignored.  When both
+    documents have a ``memory`` section, a median peak RSS growth
+    beyond *max_regression* is reported too.
+
+    Args:
+        results: Document from :func:`run_benchmarks`.
+        baseline: A previously saved results document.
+        max_regression: Allowed slowdown as a fraction (``0.2`` allows
+            medians up to 20% above the baseline).
+
+    Returns:
+        One message per regression; empty when none regressed.
+    """
+    current: dict[str, dict[str, float]] = results["results"]  # type: ignore[assignment]
+    previous: dict[str, dict[str, float]] = baseline["results"]  # type: ignore[assignment]
+    messages: list[str] = []
+    for name, timing in current.items():
+        base = previous.get(name)
+        if base is None or base["median_s"] <= 0:
+            continue
+        ratio = timing["median_s"] / base["median_s"]
+        if ratio > 1 + max_regression:
+            messages.append(
+                f"{name}: {timing['median_s']:.3f}s vs {base['median_s']:.3f}s "
+                f"baseline ({ratio - 1:+.0%})"
+            )
+    memory: dict[str, float] | None = results.get("memory")  # type: ignore[assignment]
+    base_memory: dict[str, float] | None = baseline.get("memory")  # type: ignore[assignment]
+    if memory and base_memory and base_memory["peak_rss_mib"] > 0:
+        ratio = memory["peak_rss_mib"] / base_memory["peak_rss_mib"]
+        if ratio > 1 + max_regression:
+            messages.append(
+                f"peak RSS: {memory['peak_rss_mib']:.1f} MiB vs "
+                f"{base_memory['peak_rss_mib']:.1f} MiB baseline ({ratio - 1:+.0%})"
+            )
+    return messages
+
+
+def _format_table(results: dict[str, object]) -> str:
+    """Render the per-runner timings as a plain-text table.
+
+    Args:
+        results: Document from :func:`run_benchmarks`.
+
+    Returns:
+        The table, one runner per line.
+    """
+    rows: dict[str, dict[str, float]] = results["results"]  # type: ignore[assignment]
+    lines = [f"{'runner':<16} {'median':>9} {'min':>9} {'findings':>9}"]
+    lines.extend(
+        f"{name:<16} {row['median_s']:>8.3f}s {row['min_s']:>8.3f}s "
+        f"{row['findings']:>9}"
+        for name, row in rows.items()
+    )
+    memory: dict[str, float] | None = results.get("memory")  # type: ignore[assignment]
+    if memory:
+        lines.append(
+            f"peak RSS of check --all: {memory['peak_rss_mib']:.1f} MiB "
+            f"(max {memory['max_rss_mib']:.1f} MiB)"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Arguments after the program name, or *None* for
+            ``sys.argv``.
+
+    Returns:
+        The parsed arguments.
+    """
+    defaults = SyntheticSpec()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Time docvet's check runners on a synthetic project.",
+    )
+    parser.add_argument("--packages", type=int, default=defaults.packages)
+    parser.add_argument("--modules", type=int, default=defaults.modules)
+    parser.add_argument("--classes", type=int, default=defaults.classes)
+    parser.add_argument("--methods", type=int, default=defaults.methods)
+    parser.add_argument("--functions", type=int, default=defaults.functions)
+    parser.add_argument("--style", choices=STYLES, default=defaults.style)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--project",
+        type=Path,
+        help="Benchmark an existing project instead of generating one.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per runner.")
+    parser.add_argument(
+        "--runner",
+        action="append",
+        choices=list(RUNNERS),
+        help="Runner to time (repeatable); all runners by default.",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Also measure the peak RSS of `docvet check --all --no-cache`.",
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results here.")
+    parser.add_argument(
+        "--baseline", type=Path, help="Compare against saved JSON results."
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Allowed median slowdown against the baseline (default: 0.2).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite from the command line.
+
+    Args:
+        argv: Arguments after the program name, or *None* for
+            ``sys.argv``.
+
+    Returns:
+        ``1`` when a runner regressed against ``--baseline``, else ``0``.
+    """
+    args = _parse_args(argv)
+    with contextlib.ExitStack() as stack:
+        project = args.project
+        spec = None
+        if project is None:
+            spec = SyntheticSpec(
+                packages=args.packages,
+                modules=args.modules,
+                classes=args.classes,
+                methods=args.methods,
+                functions=args.functions,
+                style=args.style,
+                seed=args.seed,
+            )
+            project = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+            generate(project, spec)
+        results = run_benchmarks(
+            project.resolve(),
+            repeat=args.repeat,
+            runners=args.runner,
+            memory=args.memory,
+        )
+    results["spec"] = None if spec is None else dataclasses.asdict(spec)
+
+    sys.stderr.write(_format_table(results))
+    document = json.dumps(results, indent=2) + "\n"
+    if args.output is not None:
+        args.output.write_text(document, encoding="utf-8")
+    else:
+        sys.stdout.write(document)
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(results, baseline, max_regression=args.max_regression)
+    for message in regressions:
+        sys.stderr.write(f"regression: {message}\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,425 @@
+"""Synthetic project generator for the benchmark suite.
+
+Writes a git repository with a configurable number of packages,
+modules, classes, methods, and functions, documented in Google or
+Sphinx style.  A seeded fraction of symbols carries the defects the
+checks look for (missing docstrings, undocumented raises, returns,
+yields, and attributes), so every runner does real work.
+
+The history is built for the freshness runners: everything is committed
+with an old timestamp, a fraction of function bodies is changed in a
+second commit a year later (drift findings), and another fraction is
+changed in the working tree without committing (diff findings).
+
+Examples:
+    Generate a small project and list its files:
+
+    ```python
+    files = generate(tmp_path, SyntheticSpec(packages=2, modules=10))
+    ```
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+__all__ = ["STYLES", "SyntheticSpec", "generate"]
+
+STYLES = ("google", "sphinx")
+
+_INITIAL_DATE = "2020-01-01T00:00:00+00:00"
+_DRIFT_DATE = "2021-01-01T00:00:00+00:00"
+
+# Function defect kinds, chosen per symbol for ``defect_ratio`` of them.
+_FUNCTION_DEFECTS = ("undocumented", "raises", "returns", "yields")
+
+# Body versions: committed first, changed in the drift commit, changed in
+# the working tree.
+_ORIGINAL, _DRIFTED, _EDITED = 0, 1, 2
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Shape of a generated project.
+
+    Attributes:
+        packages (int): Top-level packages under ``src/``.
+        modules (int): Modules per package, besides ``__init__.py``.
+        classes (int): Classes per module.
+        methods (int): Methods per class, besides ``__init__``.
+        functions (int): Module-level functions per module.
+        style (str): Docstring convention, ``"google"`` or ``"sphinx"``.
+        defect_ratio (float): Fraction of symbols with a docstring
+            defect.
+        drift_ratio (float): Fraction of functions whose body changes
+            in a later commit.
+        diff_ratio (float): Fraction of functions whose body changes in
+            the working tree.
+        seed (int): Random seed; equal specs generate identical trees.
+
+    Examples:
+        ```python
+        spec = SyntheticSpec(packages=8, modules=50, style="sphinx")
+        spec.file_count  # 408
+        ```
+    """
+
+    packages: int = 4
+    modules: int = 25
+    classes: int = 2
+    methods: int = 3
+    functions: int = 5
+    style: str = "google"
+    defect_ratio: float = 0.2
+    drift_ratio: float = 0.1
+    diff_ratio: float = 0.1
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate the docstring style.
+
+        Raises:
+            ValueError: If *style* is not one of :data:`STYLES`.
+        """
+        if self.style not in STYLES:
+            msg = f"style must be one of {', '.join(STYLES)}, got {self.style!r}"
+            raise ValueError(msg)
+
+    @property
+    def file_count(self) -> int:
+        """Number of Python files the spec generates.
+
+        Returns:
+            Modules plus one ``__init__.py`` per package.
+        """
+        return self.packages * (self.modules + 1)
+
+
+@dataclass(frozen=True)
+class _Function:
+    """One generated module-level function.
+
+    Attributes:
+        name (str): Function name.
+        defect (str | None): Defect kind from ``_FUNCTION_DEFECTS``.
+
+    Examples:
+        ```python
+        _Function("func_000", defect="raises")
+        ```
+    """
+
+    name: str
+    defect: str | None
+
+
+@dataclass(frozen=True)
+class _Module:
+    """One generated module and the choices made for its symbols.
+
+    Attributes:
+        path (Path): File path relative to the project root.
+        functions (tuple[_Function, ...]): Module-level functions.
+        undocumented_attributes (frozenset[int]): Indices of classes
+            without an ``Attributes`` section.
+
+    Examples:
+        ```python
+        _Module(Path("src/pkg_000/mod_000.py"), (), frozenset())
+        ```
+    """
+
+    path: Path
+    functions: tuple[_Function, ...]
+    undocumented_attributes: frozenset[int]
+
+
+def _docstring(style: str, summary: str, params: list[str], returns: str | None) -> str:
+    """Render a function docstring body in *style*.
+
+    Args:
+        style: ``"google"`` or ``"sphinx"``.
+        summary: Summary line.
+        params: Parameter names to document.
+        returns: Description of the return value, or *None*.
+
+    Returns:
+        Docstring lines indented for a function body, including quotes.
+    """
+    sections = [[f'    """{summary}']]
+    if style == "google":
+        if params:
+            sections.append(
+                [
+                    "    Args:",
+                    *(f"        {name}: The {name} value." for name in params),
+                ]
+            )
+        if returns:
+            sections.append(["    Returns:", f"        {returns}"])
+    else:
+        fields = [f"    :param {name}: The {name} value." for name in params]
+        if returns:
+            fields.append(f"    :returns: {returns}")
+        if fields:
+            sections.append(fields)
+    lines: list[str] = []
+    for section in sections:
+        if lines:
+            lines.append("")
+        lines.extend(section)
+    lines.append('    """')
+    return "\n".join(lines)
+
+
+def _indent(text: str) -> str:
+    """Indent every non-empty line of *text* by four spaces.
+
+    Args:
+        text: Source text.
+
+    Returns:
+        The indented text.
+    """
+    return "\n".join(f"    {line}" if line else line for line in text.splitlines())
+
+
+def _render_function(function: _Function, style: str, version: int) -> str:
+    """Render one module-level function.
+
+    Args:
+        function: The function and its defect.
+        style: Docstring convention.
+        version: Body version; bumping it changes only the body.
+
+    Returns:
+        The function source.
+    """
+    defect = function.defect
+    header = f"def {function.name}(value, count=1):"
+    if defect == "yields":
+        body = f"    for step in range(count):\n        yield value + step + {version}"
+        doc = _docstring(style, "Produce a series of values.", ["value", "count"], None)
+    elif defect == "raises":
+        body = (
+            "    if count < 0:\n"
+            '        raise ValueError("count must not be negative")\n'
+            f"    return value * count + {version}"
+        )
+        doc = _docstring(
+            style, "Scale a value.", ["value", "count"], "The scaled value."
+        )
+    else:
+        body = f"    result = value * count + {version}\n    return result"
+        returns = None if defect == "returns" else "The scaled value."
+        doc = _docstring(style, "Scale a value.", ["value", "count"], returns)
+    if defect == "undocumented":
+        return f"{header}\n{body}\n"
+    return f"{header}\n{doc}\n{body}\n"
+
+
+def _render_class(index: int, spec: SyntheticSpec, *, attributes: bool) -> str:
+    """Render one class with an ``__init__`` and *spec.methods* methods.
+
+    Args:
+        index: Class index within the module.
+        spec: Generator settings.
+        attributes: Whether the class documents its attributes.
+
+    Returns:
+        The class source.
+    """
+    if spec.style == "google":
+        attrs_doc = (
+            "\n\n    Attributes:\n        size: Current size.\n        label: Label text."
+            if attributes
+            else ""
+        )
+    else:
+        attrs_doc = (
+            "\n\n    :ivar size: Current size.\n    :ivar label: Label text."
+            if attributes
+            else ""
+        )
+    lines = [
+        f"class Widget{index:03d}:",
+        f'    """A generated widget.{attrs_doc}\n    """',
+        "",
+        "    def __init__(self, size, label):",
+        _indent(_docstring(spec.style, "Create a widget.", ["size", "label"], None)),
+        "        self.size = size",
+        "        self.label = label",
+    ]
+    for method in range(spec.methods):
+        lines.extend(
+            [
+                "",
+                f"    def method_{method:03d}(self, value):",
+                _indent(
+                    _docstring(
+                        spec.style, "Combine with a value.", ["value"], "The result."
+                    )
+                ),
+                f"        return self.size * value + {method}",
+            ]
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _render_module(
+    module: _Module, spec: SyntheticSpec, versions: dict[str, int]
+) -> str:
+    """Render a module from its symbol choices and body versions.
+
+    Args:
+        module: The module's symbol choices.
+        spec: Generator settings.
+        versions: Body version per function name; missing names use
+            the original body.
+
+    Returns:
+        The module source.
+    """
+    parts = [f'"""Generated module {module.path.stem}."""\n']
+    for index in range(spec.classes):
+        parts.append(
+            _render_class(
+                index,
+                spec,
+                attributes=index not in module.undocumented_attributes,
+            )
+        )
+    for function in module.functions:
+        parts.append(
+            _render_function(
+                function, spec.style, versions.get(function.name, _ORIGINAL)
+            )
+        )
+    return "\n\n".join(parts)
+
+
+def _plan(spec: SyntheticSpec) -> list[_Module]:
+    """Choose the defects of every generated module.
+
+    Args:
+        spec: Generator settings.
+
+    Returns:
+        The modules to generate, in path order.
+    """
+    rng = random.Random(spec.seed)
+    modules: list[_Module] = []
+    for package in range(spec.packages):
+        for index in range(spec.modules):
+            functions = tuple(
+                _Function(
+                    f"func_{number:03d}",
+                    rng.choice(_FUNCTION_DEFECTS)
+                    if rng.random() < spec.defect_ratio
+                    else None,
+                )
+                for number in range(spec.functions)
+            )
+            undocumented = frozenset(
+                number
+                for number in range(spec.classes)
+                if rng.random() < spec.defect_ratio
+            )
+            path = Path("src", f"pkg_{package:03d}", f"mod_{index:03d}.py")
+            modules.append(_Module(path, functions, undocumented))
+    return modules
+
+
+def _git(root: Path, *args: str, date: str | None = None) -> None:
+    """Run a git command in *root*.
+
+    Args:
+        root: Repository root.
+        *args: Git arguments.
+        date: Author and committer date for commits.
+    """
+    env = dict(os.environ)
+    if date is not None:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date
+    subprocess.run(["git", *args], cwd=root, env=env, check=True, capture_output=True)
+
+
+def _write_modules(
+    root: Path,
+    modules: list[_Module],
+    spec: SyntheticSpec,
+    versions: dict[tuple[Path, str], int],
+) -> None:
+    """Write every module with the given body versions.
+
+    Args:
+        root: Project root.
+        modules: The planned modules.
+        spec: Generator settings.
+        versions: Body version per ``(module path, function name)``.
+    """
+    by_path: dict[Path, dict[str, int]] = {}
+    for (path, name), version in versions.items():
+        by_path.setdefault(path, {})[name] = version
+    for module in modules:
+        (root / module.path).write_text(
+            _render_module(module, spec, by_path.get(module.path, {})),
+            encoding="utf-8",
+        )
+
+
+def generate(root: Path, spec: SyntheticSpec) -> list[Path]:
+    """Generate a synthetic project and its git history in *root*.
+
+    Args:
+        root: Empty or missing directory to generate into.
+        spec: Generator settings.
+
+    Returns:
+        Absolute paths of the generated Python files, sorted.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "pyproject.toml").write_text(
+        '[project]\nname = "synthetic"\nversion = "0.0.0"\n\n'
+        f'[tool.docvet]\nsrc-root = "src"\ndocstring-style = "{spec.style}"\n',
+        encoding="utf-8",
+    )
+    modules = _plan(spec)
+    init_files: list[Path] = []
+    for package in range(spec.packages):
+        init = root / "src" / f"pkg_{package:03d}" / "__init__.py"
+        init.parent.mkdir(parents=True, exist_ok=True)
+        init.write_text(
+            f'"""Generated package {init.parent.name}."""\n', encoding="utf-8"
+        )
+        init_files.append(init)
+
+    rng = random.Random(spec.seed + 1)
+    functions = [(m.path, f.name) for m in modules for f in m.functions]
+    drifted = {key for key in functions if rng.random() < spec.drift_ratio}
+    edited = {key for key in functions if rng.random() < spec.diff_ratio}
+
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "bench@example.com")
+    _git(root, "config", "user.name", "Benchmark")
+    _git(root, "config", "core.autocrlf", "false")
+    versions: dict[tuple[Path, str], int] = {}
+    _write_modules(root, modules, spec, versions)
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "Initial", date=_INITIAL_DATE)
+
+    if drifted:
+        versions.update(dict.fromkeys(drifted, _DRIFTED))
+        _write_modules(root, modules, spec, versions)
+        _git(root, "commit", "-q", "-am", "Change bodies", date=_DRIFT_DATE)
+
+    if edited:
+        versions.update(dict.fromkeys(edited, _EDITED))
+        _write_modules(root, modules, spec, versions)
+
+    files = init_files + [root / module.path for module in modules]
+    return sorted(path.resolve() for path in files)
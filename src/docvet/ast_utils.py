@@ -3,7 +3,10 @@
 Provides the ``Symbol`` dataclass, utilities for walking an AST tree
 to extract documented symbols, and :func:`module_display_name` for
 converting file paths to dotted Python module names.  Used by all
-check modules to map source locations to semantic symbols.
+check modules to map source locations to semantic symbols.  The
+:class:`ParsedFile` container bundles a parsed source file with its
+lazily derived symbol list, node index, and line map so that callers
+running several checks on one file pay for each derivation once.
 
 Examples:
     Extract documented symbols from a source file:
@@ -24,21 +27,29 @@ from __future__ import annotations
 
 import ast
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Literal
 
+from docvet.profiling import timed
+
 __all__: list[str] = []
 
 _ScopeNode = ast.Module | ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+_DefNode = ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Symbol:
     """An extracted documentable symbol from a Python AST.
 
+    Instances are slotted: a whole-repository run creates one per
+    definition, so dropping the per-instance ``__dict__`` keeps the
+    symbol lists compact.
+
     Attributes:
         name (str): Symbol name, or ``"<module>"`` for the module
             itself.
@@ -378,17 +389,24 @@ def module_display_name(file_path: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-def map_lines_to_symbols(tree: ast.Module) -> dict[int, Symbol]:
+def map_lines_to_symbols(
+    tree: ast.Module,
+    *,
+    symbols: list[Symbol] | None = None,
+) -> dict[int, Symbol]:
     """Map each source line to its innermost containing symbol.
 
     Args:
         tree: A parsed ``ast.Module`` from ``ast.parse()``.
+        symbols: Pre-extracted symbols for *tree*.  Extracted via
+            :func:`get_documented_symbols` when not provided.
 
     Returns:
         A dict mapping line numbers (1-based) to the most specific
         :class:`Symbol` whose definition range contains that line.
     """
-    symbols = get_documented_symbols(tree)
+    if symbols is None:
+        symbols = get_documented_symbols(tree)
 
     # Sort by range size ascending — smallest (innermost) first.
     # Tiebreaker: non-module symbols before module (more specific wins).
@@ -407,3 +425,95 @@ def map_lines_to_symbols(tree: ast.Module) -> dict[int, Symbol]:
                 break
 
     return line_map
+
+
+# ---------------------------------------------------------------------------
+# Node index
+# ---------------------------------------------------------------------------
+
+
+def build_node_index(tree: ast.Module) -> dict[int, _DefNode]:
+    """Build a line-number-to-AST-node lookup table for O(1) access.
+
+    Walks the AST tree once and collects all ``FunctionDef``,
+    ``AsyncFunctionDef``, and ``ClassDef`` nodes, indexed by their line
+    number. This enables rules to retrieve the AST node for a symbol via
+    ``symbol.line`` without re-walking the tree for each rule.
+
+    Args:
+        tree: The parsed AST tree for the source file.
+
+    Returns:
+        A dict mapping line numbers to AST nodes. Module-level symbols
+        have no corresponding node, so ``node_index.get(symbol.line)``
+        returns ``None`` for them.
+    """
+    index: dict[int, _DefNode] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            index[node.lineno] = node
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Parsed file container
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, eq=False)
+class ParsedFile:
+    """A source file parsed once and shared across checks.
+
+    Derived structures are computed on first access and cached on the
+    instance, so a file checked by presence, enrichment, and freshness
+    in the same run is walked for symbols only once.  Consumers must
+    treat the cached collections as read-only.  Each derivation is
+    timed as the ``"symbols"`` phase of an active run profile.
+
+    Attributes:
+        source (str): Raw source text of the file.
+        tree (ast.Module): Parsed AST module from ``ast.parse()``.
+
+    Examples:
+        Share one parse between several consumers:
+
+        ```python
+        parsed = ParsedFile(source=source, tree=ast.parse(source))
+        parsed.symbols  # extracted on first access
+        parsed.line_map  # reuses parsed.symbols
+        ```
+    """
+
+    source: str
+    tree: ast.Module
+
+    @cached_property
+    def symbols(self) -> list[Symbol]:
+        """Documented symbols from :func:`get_documented_symbols`.
+
+        Returns:
+            Flat list of symbols ordered by line number.
+        """
+        with timed("phases", "symbols"):
+            return get_documented_symbols(self.tree)
+
+    @cached_property
+    def node_index(self) -> dict[int, _DefNode]:
+        """Line-number-to-node lookup from :func:`build_node_index`.
+
+        Returns:
+            A dict mapping definition lines to AST nodes.
+        """
+        with timed("phases", "symbols"):
+            return build_node_index(self.tree)
+
+    @cached_property
+    def line_map(self) -> dict[int, Symbol]:
+        """Line-to-symbol mapping from :func:`map_lines_to_symbols`.
+
+        Returns:
+            A dict mapping line numbers to their innermost symbol.
+        """
+        symbols = self.symbols
+        with timed("phases", "symbols"):
+            return map_lines_to_symbols(self.tree, symbols=symbols)
@@ -7,7 +7,9 @@ detected issues.
 The Finding dataclass is the shared API contract between all check modules
 (enrichment, freshness, griffe, coverage, presence) and the CLI layer.
 The ``scaffold_missing_sections`` function inserts placeholder sections
-into docstrings based on enrichment findings.
+into docstrings based on enrichment findings.  Only ``Finding`` is
+imported eagerly; the check functions load their modules on first
+access, so importing a single check never pulls in griffe.
 
 Attributes:
     Finding: Immutable dataclass representing a docstring quality finding.
@@ -33,13 +35,18 @@ See Also:
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+
 from docvet.checks._finding import Finding
-from docvet.checks.coverage import check_coverage
-from docvet.checks.enrichment import check_enrichment
-from docvet.checks.fix import scaffold_missing_sections
-from docvet.checks.freshness import check_freshness_diff, check_freshness_drift
-from docvet.checks.griffe_compat import check_griffe_compat
-from docvet.checks.presence import PresenceStats, check_presence
+
+if TYPE_CHECKING:
+    from docvet.checks.coverage import check_coverage
+    from docvet.checks.enrichment import check_enrichment
+    from docvet.checks.fix import scaffold_missing_sections
+    from docvet.checks.freshness import check_freshness_diff, check_freshness_drift
+    from docvet.checks.griffe_compat import check_griffe_compat
+    from docvet.checks.presence import PresenceStats, check_presence
 
 __all__ = [
     "Finding",
@@ -52,3 +59,47 @@ __all__ = [
     "check_presence",
     "scaffold_missing_sections",
 ]
+
+# Re-exported name -> defining submodule.  Submodules are imported on
+# first attribute access so that importing one check (or just
+# ``Finding``) does not load griffe or the fix engine.
+_LAZY_EXPORTS: dict[str, str] = {
+    "PresenceStats": "presence",
+    "check_coverage": "coverage",
+    "check_enrichment": "enrichment",
+    "check_freshness_diff": "freshness",
+    "check_freshness_drift": "freshness",
+    "check_griffe_compat": "griffe_compat",
+    "check_presence": "presence",
+    "scaffold_missing_sections": "fix",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a re-exported check function on first access.
+
+    Args:
+        name: The attribute being looked up on the package.
+
+    Returns:
+        The re-exported object, cached on the package for later lookups.
+
+    Raises:
+        AttributeError: If *name* is not a re-exported check API.
+    """
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including not-yet-imported re-exports.
+
+    Returns:
+        Sorted attribute names.
+    """
+    return sorted({*globals(), *_LAZY_EXPORTS})
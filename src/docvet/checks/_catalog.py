@@ -1,8 +1,10 @@
-"""Rule catalog for the docvet MCP server.
+"""Rule catalog shared by the MCP server and suppression validation.
 
 Static catalog of all 32 docvet rules with descriptions, categories,
 fix guidance, and examples. Used by the ``docvet_rules`` MCP tool
-to provide rule discovery for AI agents.
+to provide rule discovery for AI agents, and by the inline suppression
+parser to flag unknown rule IDs.  The module is pure data with no
+third-party imports, so the CLI can load it without the ``mcp`` extra.
 
 Attributes:
     _RULE_CATALOG: Complete list of rule entries across all 5 checks.
@@ -10,12 +12,13 @@ Attributes:
 
 See Also:
     [`docvet.mcp`][]: MCP server and tool handlers.
+    [`docvet.cli._suppression`][]: Suppression parser that validates rule IDs.
 
 Examples:
     Look up which check owns a rule:
 
     ```python
-    from docvet.mcp._catalog import _RULE_TO_CHECK
+    from docvet.checks._catalog import _RULE_TO_CHECK
 
     check = _RULE_TO_CHECK["missing-raises"]  # "enrichment"
     ```
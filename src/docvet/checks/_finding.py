@@ -18,13 +18,14 @@ See Also:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Literal
 
 __all__: list[str] = []
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     """A docstring quality finding.
 
@@ -37,6 +38,10 @@ class Finding:
     separators in ``file`` are normalized to forward slashes on construction
     for consistent cross-platform output.
 
+    Instances are slotted, and ``file``, ``rule``, and ``category`` are
+    interned on construction, so large runs hold one copy of each
+    repeated string instead of one per finding.
+
     Attributes:
         file (str): Source file path where the finding was detected.
             Backslashes are normalized to forward slashes.
@@ -75,8 +80,9 @@ class Finding:
         """Validate Finding fields and normalize paths after initialization.
 
         Normalizes backslash path separators to forward slashes for
-        consistent cross-platform output.  Validates that ``category`` is
-        one of ``"required"``, ``"recommended"``, or ``"scaffold"``.
+        consistent cross-platform output and interns the ``file``,
+        ``rule``, and ``category`` strings.  Validates that ``category``
+        is one of ``"required"``, ``"recommended"``, or ``"scaffold"``.
 
         Raises:
             ValueError: If any field has an invalid value.
@@ -97,3 +103,6 @@ class Finding:
                 f'category must be "required", "recommended", or "scaffold",'
                 f" got {self.category!r}"
             )
+        object.__setattr__(self, "file", sys.intern(self.file))
+        object.__setattr__(self, "rule", sys.intern(self.rule))
+        object.__setattr__(self, "category", sys.intern(self.category))
@@ -8,9 +8,12 @@ Attributes, typed attributes, Examples, cross-references, fenced code
 blocks), ``_params`` (parameter agreement), ``_deprecation`` (missing
 deprecation notices), ``_reverse`` (extra Raises/Yields/Returns), and
 ``_late_rules`` (trivial docstrings, return types, init params,
-scaffold-incomplete).  This module retains section parsing, shared
-constants, the ``_should_skip_reverse_check`` guard, and the
-``check_enrichment`` dispatch orchestrator.
+scaffold-incomplete).  Function-body rules share one scope-aware walk
+per function through ``_facts``, and every rule reads docstring sections
+from the shared index in ``_docstring``.  This module retains section
+parsing entry points, shared constants, the
+``_should_skip_reverse_check`` guard, and the ``check_enrichment``
+dispatch orchestrator.
 
 Supports both Google-style and Sphinx/RST docstring conventions via the
 ``style`` parameter on :func:`check_enrichment`. NumPy-style section
@@ -42,11 +45,16 @@ from __future__ import annotations
 
 import ast
 import re
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 from docvet.ast_utils import Symbol, get_documented_symbols
+from docvet.ast_utils import build_node_index as _build_node_index
 from docvet.checks._finding import Finding
 from docvet.config import EnrichmentConfig
+from docvet.profiling import active_profile, timed
 
 __all__ = ["check_enrichment"]
 
@@ -168,6 +176,9 @@ def _parse_sections(docstring: str, *, style: str = "google") -> set[str]:
     negatives at the rule level (safe direction per NFR5) since the rule
     will believe the section exists.
 
+    The scan is cached on the docstring's shared
+    :class:`~docvet.checks.enrichment._docstring.ParsedDocstring`.
+
     Args:
         docstring: The raw docstring text to parse.
         style: Docstring convention: ``"google"`` or ``"sphinx"``.
@@ -176,11 +187,7 @@ def _parse_sections(docstring: str, *, style: str = "google") -> set[str]:
         A set of internal section names found in the docstring. Returns an
         empty set when no recognized section headers are found.
     """
-    if style == "sphinx":
-        return _parse_sphinx_sections(docstring)
-    sections = set(_SECTION_PATTERN.findall(docstring))
-    sections.update(_NUMPY_UNDERLINE_PATTERN.findall(docstring))
-    return sections
+    return set(_parse_docstring(docstring).sections(style))
 
 
 def _parse_sphinx_sections(docstring: str) -> set[str]:
@@ -213,7 +220,9 @@ def _extract_section_content(docstring: str, section_name: str) -> str | None:
     Finds the section header line matching the given name and collects
     all subsequent lines until the next section header (Google colon or
     NumPy underline format) or end of docstring. Returns ``None`` if the
-    section is not found.
+    section is not found.  Header positions are indexed once per
+    docstring by its shared
+    :class:`~docvet.checks.enrichment._docstring.ParsedDocstring`.
 
     Args:
         docstring: The raw docstring text to search.
@@ -223,30 +232,7 @@ def _extract_section_content(docstring: str, section_name: str) -> str | None:
         The text content below the section header, or ``None`` if the
         section is not found.
     """
-    lines = docstring.splitlines()
-    header_pattern = re.compile(rf"^\s*{re.escape(section_name)}:\s*$")
-    start_idx = None
-    for i, line in enumerate(lines):
-        if header_pattern.match(line):
-            start_idx = i + 1
-            break
-
-    if start_idx is None:
-        return None
-
-    content_lines: list[str] = []
-    for i, line in enumerate(lines[start_idx:], start_idx):
-        if _SECTION_PATTERN.match(line):
-            break
-        # NumPy underline boundary: header line + next line is 3+ dashes/equals
-        stripped = line.strip()
-        if stripped in _SECTION_HEADERS and i + 1 < len(lines):
-            next_line = lines[i + 1].strip()
-            if len(next_line) >= 3 and all(c in "-=" for c in next_line):
-                break
-        content_lines.append(line)
-
-    return "\n".join(content_lines)
+    return _parse_docstring(docstring).section_content(section_name)
 
 
 # ---------------------------------------------------------------------------
@@ -255,7 +241,6 @@ def _extract_section_content(docstring: str, section_name: str) -> str | None:
 
 from ._forward import (  # noqa: E402
     _ABSTRACT_DECORATORS,  # noqa: F401 – re-exported for tests
-    _build_node_index,
     _check_missing_other_parameters,
     _check_missing_raises,
     _check_missing_receives,
@@ -317,16 +302,52 @@ from ._class_module import (  # noqa: E402
     _is_typeddict,  # noqa: F401 – re-exported for tests
 )
 
-# Active docstring style, set by the orchestrator before dispatch.
-# Allows param agreement checks to use the correct parser without
-# changing the uniform check function signature.
-_active_style: str = "google"
+# Docstring style of the enrichment run in progress, scoped by
+# :func:`_style_scope`.  Lets the param agreement and return-type rules
+# pick the right parser without changing the uniform check function
+# signature.  A context variable rather than a module global, so runs
+# with different styles in concurrent threads never see each other's
+# value.
+_run_style: ContextVar[str] = ContextVar("docvet_enrichment_style", default="google")
+
+
+@contextmanager
+def _style_scope(style: str) -> Iterator[None]:
+    """Run the enclosed rule calls under a docstring style.
+
+    Restores the previous style on exit, so scopes nest and a run
+    never leaks its style into later calls in the same thread.
+
+    Args:
+        style: Docstring convention: ``"google"`` or ``"sphinx"``.
+
+    Yields:
+        Control to the enclosed block with :data:`_run_style` set.
+
+    Examples:
+        Call a style-aware rule directly in sphinx mode:
+
+        ```python
+        with _style_scope("sphinx"):
+            finding = _check_missing_param_in_docstring(
+                symbol, sections, node_index, config, path
+            )
+        ```
+    """
+    token = _run_style.set(style)
+    try:
+        yield
+    finally:
+        _run_style.reset(token)
+
 
 from ._deprecation import (  # noqa: E402
     _check_missing_deprecation,
     _has_deprecated_decorator,  # noqa: F401 – re-exported for tests
     _is_deprecation_warn_call,  # noqa: F401 – re-exported for tests
 )
+from ._docstring import ParsedDocstring, _parse_docstring  # noqa: E402, F401
+from ._facts import _body_facts, _BodyFacts  # noqa: E402, F401
 from ._params import (  # noqa: E402
     _check_extra_param_in_docstring,
     _check_missing_param_in_docstring,
@@ -396,6 +417,97 @@ _RULE_DISPATCH: tuple[tuple[str, _CheckFn], ...] = (
     ("scaffold_incomplete", _check_scaffold_incomplete),
 )
 
+_SYMBOL_KINDS: tuple[str, ...] = ("function", "method", "class", "module")
+_FUNCTION_KINDS: frozenset[str] = frozenset({"function", "method"})
+
+# Symbol kinds each rule can report on; rules not listed apply to every
+# kind.  Mirrors the kind guard at the top of each rule so the plan can
+# skip rules that would return ``None`` immediately.
+_RULE_KINDS: dict[_CheckFn, frozenset[str]] = {
+    _check_missing_raises: _FUNCTION_KINDS,
+    _check_missing_returns: _FUNCTION_KINDS,
+    _check_missing_yields: _FUNCTION_KINDS,
+    _check_missing_receives: _FUNCTION_KINDS,
+    _check_missing_warns: _FUNCTION_KINDS,
+    _check_missing_other_parameters: _FUNCTION_KINDS,
+    _check_missing_attributes: frozenset({"class", "module"}),
+    _check_missing_typed_attributes: frozenset({"class"}),
+    _check_missing_examples: frozenset({"class", "module"}),
+    _check_missing_param_in_docstring: _FUNCTION_KINDS,
+    _check_extra_param_in_docstring: _FUNCTION_KINDS,
+    _check_missing_deprecation: _FUNCTION_KINDS,
+    _check_extra_raises_in_docstring: _FUNCTION_KINDS,
+    _check_extra_yields_in_docstring: _FUNCTION_KINDS,
+    _check_extra_returns_in_docstring: _FUNCTION_KINDS,
+    _check_missing_return_type: _FUNCTION_KINDS,
+    _check_undocumented_init_params: frozenset({"class"}),
+}
+
+# Symbol kind -> enabled (config attr, rule) steps in dispatch order.
+_RulePlan = dict[str, tuple[tuple[str, _CheckFn], ...]]
+
+# Plans keyed by style and enabled rule attributes.  Configs are not
+# hashable (``require_examples`` is a list), so the key is derived from
+# the resolved toggles; the key space is tiny in practice.
+_PLAN_CACHE: dict[tuple[str, frozenset[str]], _RulePlan] = {}
+
+
+def _enabled_rules(config: EnrichmentConfig, style: str) -> frozenset[str]:
+    """Resolve which dispatch attributes are enabled for a run.
+
+    Applies config toggles and, for ``"sphinx"`` style, the
+    ``_SPHINX_AUTO_DISABLE_RULES`` auto-disable unless the user set the
+    key explicitly (tracked via ``config.user_set_keys``).
+
+    Args:
+        config: Enrichment configuration controlling rule toggles.
+        style: Docstring convention: ``"google"`` or ``"sphinx"``.
+
+    Returns:
+        The config attribute names of the rules that should run.
+    """
+    enabled: set[str] = set()
+    for attr, _check_fn in _RULE_DISPATCH:
+        if (
+            style == "sphinx"
+            and attr in _SPHINX_AUTO_DISABLE_RULES
+            and attr not in config.user_set_keys
+        ):
+            continue
+        if getattr(config, attr):
+            enabled.add(attr)
+    return frozenset(enabled)
+
+
+def _rule_plan(config: EnrichmentConfig, style: str) -> _RulePlan:
+    """Return the pre-compiled rule plan for a config and style.
+
+    The plan lists, per symbol kind, only the enabled rules that can
+    report on that kind, in ``_RULE_DISPATCH`` order.  Plans are cached
+    across files and runs that resolve to the same enabled rule set.
+
+    Args:
+        config: Enrichment configuration controlling rule toggles.
+        style: Docstring convention: ``"google"`` or ``"sphinx"``.
+
+    Returns:
+        A mapping from symbol kind to its ``(attr, check_fn)`` steps.
+    """
+    enabled = _enabled_rules(config, style)
+    key = (style, enabled)
+    plan = _PLAN_CACHE.get(key)
+    if plan is None:
+        plan = {
+            kind: tuple(
+                (attr, check_fn)
+                for attr, check_fn in _RULE_DISPATCH
+                if attr in enabled and kind in _RULE_KINDS.get(check_fn, _SYMBOL_KINDS)
+            )
+            for kind in _SYMBOL_KINDS
+        }
+        _PLAN_CACHE[key] = plan
+    return plan
+
 
 def check_enrichment(
     source: str,
@@ -404,56 +516,82 @@ def check_enrichment(
     file_path: str,
     *,
     style: str = "google",
+    symbols: list[Symbol] | None = None,
+    node_index: dict[int, _NodeT] | None = None,
 ) -> list[Finding]:
     """Run all enrichment rules on a parsed source file.
 
     Iterates over documented symbols, parses their docstring sections,
-    and dispatches to each enabled rule function via ``_RULE_DISPATCH``.
-    Sets the module-level ``_active_style`` before dispatch so param
-    agreement checks use the correct parser. For
+    and runs the rules listed for the symbol's kind in the pre-compiled
+    plan from :func:`_rule_plan`, so config gating is resolved once per
+    config and style rather than per symbol.
+    Runs the rules inside :func:`_style_scope` so param agreement checks
+    use the correct parser; concurrent runs in other threads keep their
+    own style. For
     ``prefer_fenced_code_blocks``, a second-pass helper receives an
     explicit pattern type and checks for the other pattern so both
     doctest and rST findings surface in one run. Symbols without a
     docstring are skipped (FR20). Config gating and sphinx auto-disable
-    control which rules run.
+    control which rules enter the plan.
 
     When *style* is ``"sphinx"``, rules in ``_SPHINX_AUTO_DISABLE_RULES``
     are skipped unless the user explicitly enabled them (tracked via
     ``config.user_set_keys``).
 
+    Under an active :func:`~docvet.profiling.profile_scope`, section
+    parsing and each rule call are timed into the profile; otherwise
+    the loop carries no timing overhead.
+
     Args:
         source: Raw source text of the file (reserved for future rules).
         tree: Parsed AST module from ``ast.parse()``.
         config: Enrichment configuration controlling rule toggles.
         file_path: Source file path for finding records.
         style: Docstring convention: ``"google"`` or ``"sphinx"``.
+        symbols: Pre-extracted symbols for *tree*, e.g. from a shared
+            :class:`~docvet.ast_utils.ParsedFile`.  Extracted from *tree*
+            when not provided.
+        node_index: Pre-built line-to-node index for *tree*.  Built
+            from *tree* when not provided.
 
     Returns:
         A list of findings from all enabled enrichment rules. Returns an
         empty list when no issues are detected.
     """
-    global _active_style  # noqa: PLW0603
-    _active_style = style
-
-    symbols = get_documented_symbols(tree)
-    node_index = _build_node_index(tree)
+    if symbols is None:
+        with timed("phases", "symbols"):
+            symbols = get_documented_symbols(tree)
+    if node_index is None:
+        with timed("phases", "symbols"):
+            node_index = _build_node_index(tree)
+    plan = _rule_plan(config, style)
     findings: list[Finding] = []
+    profile = active_profile()
 
-    for symbol in symbols:
-        if not symbol.docstring:
-            continue
-        sections = _parse_sections(symbol.docstring, style=style)
-
-        for attr, check_fn in _RULE_DISPATCH:
-            # Sphinx auto-disable: skip unless user explicitly enabled.
-            if (
-                style == "sphinx"
-                and attr in _SPHINX_AUTO_DISABLE_RULES
-                and attr not in config.user_set_keys
-            ):
+    with _style_scope(style):
+        for symbol in symbols:
+            if not symbol.docstring:
                 continue
-            if getattr(config, attr):
-                if f := check_fn(symbol, sections, node_index, config, file_path):
+            if profile is None:
+                sections = _parse_sections(symbol.docstring, style=style)
+            else:
+                with timed("phases", "sections"):
+                    sections = _parse_sections(symbol.docstring, style=style)
+
+            for attr, check_fn in plan[symbol.kind]:
+                if profile is None:
+                    f = check_fn(symbol, sections, node_index, config, file_path)
+                else:
+                    start = time.perf_counter()
+                    f = check_fn(symbol, sections, node_index, config, file_path)
+                    elapsed = time.perf_counter() - start
+                    profile.record(profile.phases, "rules", elapsed)
+                    profile.record(
+                        profile.rules,
+                        check_fn.__name__.removeprefix("_check_"),
+                        elapsed,
+                    )
+                if f:
                     # Sphinx cross-ref: roles anywhere in body satisfy check.
                     if (
                         style == "sphinx"
@@ -25,11 +25,13 @@ import ast
 import re
 from typing import Literal
 
+import docvet.checks.enrichment as _enrichment_pkg
 from docvet.ast_utils import Symbol, module_display_name
 from docvet.checks._finding import Finding
 from docvet.config import EnrichmentConfig
 
 from . import _SEE_ALSO, _XREF_MD_LINK, _XREF_SPHINX, _extract_section_content
+from ._docstring import _parse_docstring
 from ._forward import _NodeT
 
 # ---------------------------------------------------------------------------
@@ -254,12 +256,11 @@ def _has_self_attribute_target(node: ast.Assign | ast.AnnAssign) -> bool:
 def _has_self_assignments(node: ast.ClassDef) -> bool:
     """Check whether a class has ``self.*`` assignments in ``__init__``.
 
-    Finds the ``__init__`` method via ``_find_init_method`` and walks
-    its body with a scope-aware iterative walk that stops at nested
-    ``FunctionDef``, ``AsyncFunctionDef``, and ``ClassDef`` boundaries.
-    Detects both ``self.x = value`` (``ast.Assign``) and
-    ``self.x: int = value`` (``ast.AnnAssign``) via
-    ``_has_self_attribute_target``.
+    Finds the ``__init__`` method via ``_find_init_method`` and reads
+    its body facts, whose walk stops at nested ``FunctionDef``,
+    ``AsyncFunctionDef``, and ``ClassDef`` boundaries.  Detects both
+    ``self.x = value`` (``ast.Assign``) and ``self.x: int = value``
+    (``ast.AnnAssign``) via ``_has_self_attribute_target``.
 
     Args:
         node: The ``ClassDef`` AST node to inspect.
@@ -271,18 +272,7 @@ def _has_self_assignments(node: ast.ClassDef) -> bool:
     init_node = _find_init_method(node)
     if init_node is None:
         return False
-
-    stack = list(ast.iter_child_nodes(init_node))
-    while stack:
-        child = stack.pop()
-        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            continue
-        if isinstance(child, (ast.Assign, ast.AnnAssign)):
-            if _has_self_attribute_target(child):
-                return True
-        stack.extend(ast.iter_child_nodes(child))
-
-    return False
+    return _enrichment_pkg._body_facts(init_node).self_assignments
 
 
 # Used only by _check_missing_attributes (module Attributes: is __init__.py-only
@@ -681,33 +671,6 @@ def _check_missing_cross_references(
 # Rule: prefer-fenced-code-blocks
 # ---------------------------------------------------------------------------
 
-_DOCTEST_PATTERN = re.compile(r"^\s*>>>")
-_RST_BLOCK_PATTERN = re.compile(r"::\s*$")
-
-
-def _has_rst_indented_block(lines: list[str], index: int) -> bool:
-    """Check whether the ``::`` line at *index* is followed by an indented block.
-
-    Determines if the line ending with ``::`` introduces a
-    reStructuredText indented code block by verifying that the first
-    non-blank line after ``index`` has strictly greater indentation
-    than the ``::`` line itself.
-
-    Args:
-        lines: All lines from the ``Examples:`` section content.
-        index: Index of the line ending with ``::``.
-
-    Returns:
-        ``True`` when a non-blank line with greater indentation follows,
-        ``False`` otherwise (including when no non-blank line follows).
-    """
-    rst_indent = len(lines[index]) - len(lines[index].lstrip())
-    for subsequent in lines[index + 1 :]:
-        if not subsequent.strip():
-            continue
-        return (len(subsequent) - len(subsequent.lstrip())) > rst_indent
-    return False
-
 
 def _check_prefer_fenced_code_blocks(
     symbol: Symbol,
@@ -719,9 +682,10 @@ def _check_prefer_fenced_code_blocks(
     """Detect ``Examples:`` sections using non-fenced code block formats.
 
     Checks for ``>>>`` doctest patterns and ``::`` reStructuredText
-    indented code blocks in the ``Examples:`` section content.  The
-    ``>>>`` scan runs first; ``::`` detection fires only when no
-    doctest pattern is found.  Module-kind symbols use the display
+    indented code blocks in the ``Examples:`` section content, as
+    indexed by the docstring's shared ``ParsedDocstring``.  Doctest
+    takes precedence; ``::`` is reported only when no doctest pattern
+    is found.  Module-kind symbols use the display
     name; others use ``symbol.name``.
 
     Args:
@@ -743,8 +707,8 @@ def _check_prefer_fenced_code_blocks(
     if not symbol.docstring:
         return None
 
-    content = _extract_section_content(symbol.docstring, "Examples")
-    if content is None:
+    code_blocks = _parse_docstring(symbol.docstring).code_blocks
+    if not code_blocks:
         return None
 
     kind_display = _SYMBOL_KIND_DISPLAY.get(symbol.kind, symbol.kind)
@@ -752,38 +716,31 @@ def _check_prefer_fenced_code_blocks(
         module_display_name(file_path) if symbol.kind == "module" else symbol.name
     )
 
-    lines = content.splitlines()
-
-    for line in lines:
-        if _DOCTEST_PATTERN.match(line):
-            return Finding(
-                file=file_path,
-                line=symbol.line,
-                symbol=display_name,
-                rule="prefer-fenced-code-blocks",
-                message=(
-                    f"Examples: section in {kind_display} '{display_name}' "
-                    f"uses doctest format (>>>) instead of fenced code blocks"
-                ),
-                category="recommended",
-            )
-
-    for i, line in enumerate(lines):
-        if _RST_BLOCK_PATTERN.search(line) and _has_rst_indented_block(lines, i):
-            return Finding(
-                file=file_path,
-                line=symbol.line,
-                symbol=display_name,
-                rule="prefer-fenced-code-blocks",
-                message=(
-                    f"Examples: section in {kind_display} '{display_name}' "
-                    f"uses reStructuredText indented code block (::) "
-                    f"instead of fenced code blocks"
-                ),
-                category="recommended",
-            )
+    if "doctest" in code_blocks:
+        return Finding(
+            file=file_path,
+            line=symbol.line,
+            symbol=display_name,
+            rule="prefer-fenced-code-blocks",
+            message=(
+                f"Examples: section in {kind_display} '{display_name}' "
+                f"uses doctest format (>>>) instead of fenced code blocks"
+            ),
+            category="recommended",
+        )
 
-    return None
+    return Finding(
+        file=file_path,
+        line=symbol.line,
+        symbol=display_name,
+        rule="prefer-fenced-code-blocks",
+        message=(
+            f"Examples: section in {kind_display} '{display_name}' "
+            f"uses reStructuredText indented code block (::) "
+            f"instead of fenced code blocks"
+        ),
+        category="recommended",
+    )
 
 
 def _check_fenced_code_blocks_extra(
@@ -812,46 +769,31 @@ def _check_fenced_code_blocks_extra(
     if not symbol.docstring:
         return None
 
-    content = _extract_section_content(symbol.docstring, "Examples")
-    if content is None:
+    other = "rst" if pattern_type == "doctest" else "doctest"
+    if other not in _parse_docstring(symbol.docstring).code_blocks:
         return None
 
     kind_display = _SYMBOL_KIND_DISPLAY.get(symbol.kind, symbol.kind)
     display_name = (
         module_display_name(file_path) if symbol.kind == "module" else symbol.name
     )
-    lines = content.splitlines()
-
-    if pattern_type == "doctest":
-        # First finding was doctest — check for rST
-        for i, line in enumerate(lines):
-            if _RST_BLOCK_PATTERN.search(line) and _has_rst_indented_block(lines, i):
-                return Finding(
-                    file=file_path,
-                    line=symbol.line,
-                    symbol=display_name,
-                    rule="prefer-fenced-code-blocks",
-                    message=(
-                        f"Examples: section in {kind_display} '{display_name}' "
-                        f"uses reStructuredText indented code block (::) "
-                        f"instead of fenced code blocks"
-                    ),
-                    category="recommended",
-                )
-    else:
-        # First finding was rST — check for doctest
-        for line in lines:
-            if _DOCTEST_PATTERN.match(line):
-                return Finding(
-                    file=file_path,
-                    line=symbol.line,
-                    symbol=display_name,
-                    rule="prefer-fenced-code-blocks",
-                    message=(
-                        f"Examples: section in {kind_display} '{display_name}' "
-                        f"uses doctest format (>>>) instead of fenced code blocks"
-                    ),
-                    category="recommended",
-                )
 
-    return None
+    if other == "rst":
+        message = (
+            f"Examples: section in {kind_display} '{display_name}' "
+            f"uses reStructuredText indented code block (::) "
+            f"instead of fenced code blocks"
+        )
+    else:
+        message = (
+            f"Examples: section in {kind_display} '{display_name}' "
+            f"uses doctest format (>>>) instead of fenced code blocks"
+        )
+    return Finding(
+        file=file_path,
+        line=symbol.line,
+        symbol=display_name,
+        rule="prefer-fenced-code-blocks",
+        message=message,
+        category="recommended",
+    )
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import ast
 
+import docvet.checks.enrichment as _enrichment_pkg
 from docvet.ast_utils import Symbol
 from docvet.checks._finding import Finding
 from docvet.config import EnrichmentConfig
@@ -131,8 +132,8 @@ def _check_missing_deprecation(
     1. ``@deprecated("reason")`` decorator (PEP 702) via
        :func:`_has_deprecated_decorator`.
     2. ``warnings.warn(..., DeprecationWarning)`` (and
-       ``PendingDeprecationWarning``, ``FutureWarning``) via a scope-aware
-       AST walk using :func:`_is_deprecation_warn_call`.
+       ``PendingDeprecationWarning``, ``FutureWarning``) recorded in the
+       function's body facts via :func:`_is_deprecation_warn_call`.
 
     A deprecation notice is satisfied by the word ``"deprecated"``
     appearing anywhere in the docstring (case-insensitive).  This
@@ -183,24 +184,16 @@ def _check_missing_deprecation(
             category="required",
         )
 
-    # Scope-aware walk for deprecation warn calls.
-    stack = list(ast.iter_child_nodes(node))
-    while stack:
-        child = stack.pop()
-        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            continue
-        if isinstance(child, ast.Call) and _is_deprecation_warn_call(child):
-            return Finding(
-                file=file_path,
-                line=symbol.line,
-                symbol=symbol.name,
-                rule="missing-deprecation",
-                message=(
-                    f"Function '{symbol.name}' uses deprecation warnings "
-                    "but has no deprecation notice in docstring"
-                ),
-                category="required",
-            )
-        stack.extend(ast.iter_child_nodes(child))
-
-    return None
+    if not _enrichment_pkg._body_facts(node).deprecation_warns:
+        return None
+    return Finding(
+        file=file_path,
+        line=symbol.line,
+        symbol=symbol.name,
+        rule="missing-deprecation",
+        message=(
+            f"Function '{symbol.name}' uses deprecation warnings "
+            "but has no deprecation notice in docstring"
+        ),
+        category="required",
+    )
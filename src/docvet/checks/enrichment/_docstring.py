@@ -0,0 +1,331 @@
+"""Structured docstring index shared by the enrichment rules.
+
+Tokenizes a docstring once into a :class:`ParsedDocstring` that records
+the summary line, the span of every colon-style section header, the
+documented ``Args:``/``Raises:`` entries, and the non-fenced code block
+formats used in ``Examples:``.  Derived structures are computed on first
+access and cached on the instance, and :func:`_parse_docstring` memoizes
+instances by docstring text, so every rule that inspects the same
+docstring in a run reads one shared index instead of re-scanning the
+text with its own regexes.
+
+See Also:
+    [`docvet.checks.enrichment`][]: Orchestrator and dispatch table.
+    [`docvet.ast_utils.ParsedFile`][]: The per-file counterpart.
+
+Examples:
+    Read a section and its entries from the shared index:
+
+    ```python
+    parsed = _parse_docstring(symbol.docstring)
+    parsed.section_content("Args")
+    parsed.entries("Raises", style="google")
+    ```
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+
+from . import (
+    _NUMPY_UNDERLINE_PATTERN,
+    _SECTION_HEADERS,
+    _SECTION_PATTERN,
+    _parse_sphinx_sections,
+)
+
+# Regex to extract param names from Google-style Args: section entries.
+# Matches at detected base indent, with optional leading */** for varargs.
+_ARGS_ENTRY_PATTERN = re.compile(r"\*{0,2}(\w+)[^\S\n]*[\s(:]")
+
+# Regex to extract param names from Sphinx :param name: entries.
+_SPHINX_PARAM_PATTERN = re.compile(r":param\s+(\w+)\s*:")
+
+# Regex to extract exception names from Google-style Raises: section entries.
+# Matches ClassName followed by colon at entry level (analogous to _ARGS_ENTRY_PATTERN).
+_RAISES_ENTRY_PATTERN = re.compile(r"(\w+)\s*:")
+
+# Regex to extract exception names from Sphinx :raises ExcType: entries.
+_SPHINX_RAISES_PATTERN = re.compile(r":raises\s+(\w+)\s*:")
+
+# Section name -> (Google entry pattern, Sphinx field pattern).
+_ENTRY_PATTERNS: dict[str, tuple[re.Pattern[str], re.Pattern[str]]] = {
+    "Args": (_ARGS_ENTRY_PATTERN, _SPHINX_PARAM_PATTERN),
+    "Raises": (_RAISES_ENTRY_PATTERN, _SPHINX_RAISES_PATTERN),
+}
+
+_DOCTEST_PATTERN = re.compile(r"^\s*>>>")
+_RST_BLOCK_PATTERN = re.compile(r"::\s*$")
+
+# Upper bound on memoized parses; a run revisits a docstring only while
+# checking its own symbol, so the cache only needs to span one file.
+_PARSE_CACHE_SIZE = 1024
+
+
+def _is_underline(line: str) -> bool:
+    """Check whether *line* is a NumPy section underline.
+
+    Args:
+        line: A single docstring line.
+
+    Returns:
+        ``True`` when the stripped line is three or more ``-``/``=``
+        characters.
+    """
+    stripped = line.strip()
+    return len(stripped) >= 3 and all(c in "-=" for c in stripped)
+
+
+def _has_rst_indented_block(lines: list[str], index: int) -> bool:
+    """Check whether the ``::`` line at *index* is followed by an indented block.
+
+    Determines if the line ending with ``::`` introduces a
+    reStructuredText indented code block by verifying that the first
+    non-blank line after ``index`` has strictly greater indentation
+    than the ``::`` line itself.
+
+    Args:
+        lines: All lines from the ``Examples:`` section content.
+        index: Index of the line ending with ``::``.
+
+    Returns:
+        ``True`` when a non-blank line with greater indentation follows,
+        ``False`` otherwise (including when no non-blank line follows).
+    """
+    rst_indent = len(lines[index]) - len(lines[index].lstrip())
+    for subsequent in lines[index + 1 :]:
+        if not subsequent.strip():
+            continue
+        return (len(subsequent) - len(subsequent.lstrip())) > rst_indent
+    return False
+
+
+def _scan_entries(content: str, pattern: re.Pattern[str]) -> frozenset[str]:
+    """Collect entry names at the base indent level of a section body.
+
+    The base indent is taken from the first non-empty line; deeper
+    (continuation) lines are skipped.
+
+    Args:
+        content: Section body text below the header.
+        pattern: Regex whose first group captures the entry name.
+
+    Returns:
+        The entry names found, or an empty set when the body has no
+        indented entries.
+    """
+    lines = content.splitlines()
+    base_indent = ""
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped:
+            base_indent = line[: len(line) - len(stripped)]
+            break
+
+    if not base_indent:
+        return frozenset()
+
+    names: set[str] = set()
+    for line in lines:
+        # Only process lines at exactly the base indent level.
+        if not line.startswith(base_indent):
+            continue
+        after_indent = line[len(base_indent) :]
+        # Skip continuation lines (deeper indent).
+        if after_indent and after_indent[0] == " ":
+            continue
+        m = pattern.match(after_indent)
+        if m:
+            names.add(m.group(1))
+    return frozenset(names)
+
+
+@dataclass(frozen=True, eq=False)
+class ParsedDocstring:
+    """A docstring tokenized once and shared across enrichment rules.
+
+    Derived structures are computed on first access and cached on the
+    instance.  Consumers must treat the returned collections as
+    read-only.
+
+    Attributes:
+        text (str): The raw docstring text.
+
+    Examples:
+        ```python
+        parsed = ParsedDocstring(function.__doc__)
+        parsed.summary  # first non-empty line
+        parsed.entries("Args")  # documented parameter names
+        ```
+    """
+
+    text: str
+    _sections: dict[str, frozenset[str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _contents: dict[str, str | None] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _entries: dict[tuple[str, str], frozenset[str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Docstring text split into lines.
+
+        Returns:
+            The lines of :attr:`text` without line terminators.
+        """
+        return self.text.splitlines()
+
+    @cached_property
+    def summary(self) -> str | None:
+        """First non-empty line of the docstring, stripped.
+
+        Returns:
+            The summary line, or ``None`` for a blank docstring.
+        """
+        for line in self.lines:
+            stripped = line.strip()
+            if stripped:
+                return stripped
+        return None
+
+    @cached_property
+    def _spans(self) -> tuple[dict[str, int], list[int]]:
+        """Header positions and section boundaries from one line scan.
+
+        Returns:
+            A ``(headers, boundaries)`` pair: the first line index of
+            every ``Name:`` header line, and the sorted indices of lines
+            that start a recognized section (Google colon or NumPy
+            underline format).
+        """
+        lines = self.lines
+        headers: dict[str, int] = {}
+        boundaries: list[int] = []
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if stripped.endswith(":"):
+                headers.setdefault(stripped[:-1], i)
+            if _SECTION_PATTERN.match(line) or (
+                stripped in _SECTION_HEADERS
+                and i + 1 < len(lines)
+                and _is_underline(lines[i + 1])
+            ):
+                boundaries.append(i)
+        return headers, boundaries
+
+    def sections(self, style: str = "google") -> frozenset[str]:
+        """Recognized section names for a docstring convention.
+
+        Args:
+            style: Docstring convention: ``"google"`` or ``"sphinx"``.
+
+        Returns:
+            Internal section names found in the docstring.
+        """
+        found = self._sections.get(style)
+        if found is None:
+            if style == "sphinx":
+                found = frozenset(_parse_sphinx_sections(self.text))
+            else:
+                found = frozenset(_SECTION_PATTERN.findall(self.text)).union(
+                    _NUMPY_UNDERLINE_PATTERN.findall(self.text)
+                )
+            self._sections[style] = found
+        return found
+
+    def section_content(self, name: str) -> str | None:
+        """Text below a colon-style section header.
+
+        Collects the lines after the first ``name:`` header up to the
+        next recognized section header or the end of the docstring.
+
+        Args:
+            name: The section header name (e.g. ``"Attributes"``).
+
+        Returns:
+            The section body, or ``None`` if the header is not found.
+        """
+        if name in self._contents:
+            return self._contents[name]
+        headers, boundaries = self._spans
+        content: str | None = None
+        header = headers.get(name)
+        if header is not None:
+            start = header + 1
+            pos = bisect.bisect_left(boundaries, start)
+            end = boundaries[pos] if pos < len(boundaries) else len(self.lines)
+            content = "\n".join(self.lines[start:end])
+        self._contents[name] = content
+        return content
+
+    def entries(self, name: str, *, style: str = "google") -> frozenset[str]:
+        """Documented entry names of an ``Args`` or ``Raises`` section.
+
+        In Google mode, parses entry lines of the section body at the
+        detected base indent level.  In Sphinx mode, scans the whole
+        docstring for ``:param name:`` or ``:raises ExcType:`` fields.
+
+        Args:
+            name: ``"Args"`` or ``"Raises"``.
+            style: Docstring convention: ``"google"`` or ``"sphinx"``.
+
+        Returns:
+            The documented names, or an empty set when the section is
+            absent or in NumPy underline format.
+        """
+        key = (name, style)
+        found = self._entries.get(key)
+        if found is None:
+            entry_pattern, sphinx_pattern = _ENTRY_PATTERNS[name]
+            if style == "sphinx":
+                found = frozenset(sphinx_pattern.findall(self.text))
+            else:
+                content = self.section_content(name)
+                found = (
+                    frozenset()
+                    if content is None
+                    else _scan_entries(content, entry_pattern)
+                )
+            self._entries[key] = found
+        return found
+
+    @cached_property
+    def code_blocks(self) -> frozenset[str]:
+        """Non-fenced code block formats used in the ``Examples:`` section.
+
+        Returns:
+            A subset of ``{"doctest", "rst"}``: ``"doctest"`` for ``>>>``
+            prompts and ``"rst"`` for ``::`` lines introducing an
+            indented block.
+        """
+        content = self.section_content("Examples")
+        if content is None:
+            return frozenset()
+        lines = content.splitlines()
+        formats: set[str] = set()
+        for i, line in enumerate(lines):
+            if _DOCTEST_PATTERN.match(line):
+                formats.add("doctest")
+            if _RST_BLOCK_PATTERN.search(line) and _has_rst_indented_block(lines, i):
+                formats.add("rst")
+        return frozenset(formats)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_docstring(docstring: str) -> ParsedDocstring:
+    """Return the shared :class:`ParsedDocstring` for *docstring*.
+
+    Args:
+        docstring: The raw docstring text.
+
+    Returns:
+        The memoized index for *docstring*.
+    """
+    return ParsedDocstring(docstring)
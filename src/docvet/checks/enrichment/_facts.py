@@ -0,0 +1,134 @@
+"""Single-pass body facts shared by the function enrichment rules.
+
+Walks a function body once and records everything the forward, reverse,
+deprecation, and attribute rules need: raised exception names, whether
+the body returns a value, yields, receives via ``.send()``, calls
+``warnings.warn()`` (with or without a deprecation category), and
+assigns ``self.*`` attributes.  The walk is scope-aware and stops at
+nested ``FunctionDef``, ``AsyncFunctionDef``, and ``ClassDef``
+boundaries, matching the per-rule walks it replaces.
+
+Facts are memoized per AST node for the lifetime of the tree, so every
+rule after the first reads the record instead of re-walking the body.
+
+See Also:
+    [`docvet.checks.enrichment`][]: Orchestrator and dispatch table.
+
+Examples:
+    Read the facts for a function node:
+
+    ```python
+    facts = _body_facts(node)
+    if facts.yields and "Yields" not in sections:
+        ...
+    ```
+"""
+
+from __future__ import annotations
+
+import ast
+import weakref
+from dataclasses import dataclass
+
+from ._class_module import _has_self_attribute_target
+from ._deprecation import _is_deprecation_warn_call
+from ._forward import _extract_exception_name, _is_meaningful_return, _is_warn_call
+
+
+@dataclass(frozen=True)
+class _BodyFacts:
+    """Behaviour observed in a function body by one scope-aware walk.
+
+    Attributes:
+        raises (frozenset[str]): Exception names from ``raise``
+            statements, including ``"(re-raise)"`` for bare ``raise``.
+        returns_value (bool): A ``return`` with a meaningful value.
+        yields (bool): A ``yield`` or ``yield from`` expression.
+        receives (bool): A ``yield`` used as an assignment value.
+        warns (bool): A ``warnings.warn()`` call.
+        deprecation_warns (bool): A ``warnings.warn()`` call with a
+            deprecation category.
+        self_assignments (bool): An assignment to a ``self.*``
+            attribute.
+
+    Examples:
+        ```python
+        facts = _body_facts(function_node)
+        facts.raises  # frozenset({"ValueError"})
+        ```
+    """
+
+    raises: frozenset[str]
+    returns_value: bool
+    yields: bool
+    receives: bool
+    warns: bool
+    deprecation_warns: bool
+    self_assignments: bool
+
+
+_FACTS_CACHE: weakref.WeakKeyDictionary[ast.AST, _BodyFacts] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _collect_body_facts(node: ast.AST) -> _BodyFacts:
+    """Walk *node*'s body once and record its facts.
+
+    Args:
+        node: The function (or class) AST node to walk.
+
+    Returns:
+        The facts observed outside nested scopes.
+    """
+    raises: set[str] = set()
+    returns_value = yields = receives = warns = deprecation_warns = False
+    self_assignments = False
+    stack = list(ast.iter_child_nodes(node))
+    while stack:
+        child = stack.pop()
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        if isinstance(child, ast.Raise):
+            name = _extract_exception_name(child)
+            if name is not None:
+                raises.add(name)
+        elif isinstance(child, ast.Return):
+            returns_value = returns_value or _is_meaningful_return(child)
+        elif isinstance(child, (ast.Yield, ast.YieldFrom)):
+            yields = True
+        elif isinstance(child, ast.Call):
+            if _is_warn_call(child):
+                warns = True
+                deprecation_warns = deprecation_warns or _is_deprecation_warn_call(
+                    child
+                )
+        elif isinstance(child, (ast.Assign, ast.AnnAssign)):
+            if isinstance(child.value, ast.Yield):
+                receives = True
+            self_assignments = self_assignments or _has_self_attribute_target(child)
+        stack.extend(ast.iter_child_nodes(child))
+    return _BodyFacts(
+        raises=frozenset(raises),
+        returns_value=returns_value,
+        yields=yields,
+        receives=receives,
+        warns=warns,
+        deprecation_warns=deprecation_warns,
+        self_assignments=self_assignments,
+    )
+
+
+def _body_facts(node: ast.AST) -> _BodyFacts:
+    """Return the memoized body facts for *node*.
+
+    Args:
+        node: The function (or class) AST node.
+
+    Returns:
+        The facts for *node*, computed on first use.
+    """
+    facts = _FACTS_CACHE.get(node)
+    if facts is None:
+        facts = _FACTS_CACHE[node] = _collect_body_facts(node)
+    return facts
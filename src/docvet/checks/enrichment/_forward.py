@@ -1,7 +1,8 @@
 """Forward missing-section enrichment checks.
 
 Detects missing docstring sections (Raises, Returns, Yields, Receives,
-Warns, Other Parameters) by walking the function's AST subtree.  Each
+Warns, Other Parameters) from the function's single-pass body facts
+(see ``_facts``).  Each
 check function follows the uniform five-parameter dispatch signature
 used by ``_RULE_DISPATCH`` in the enrichment orchestrator.  Also provides
 shared helpers for stub detection (``_is_stub_function``,
@@ -24,6 +25,7 @@ from __future__ import annotations
 
 import ast
 
+import docvet.checks.enrichment as _enrichment_pkg
 from docvet.ast_utils import Symbol
 from docvet.checks._finding import Finding
 from docvet.config import EnrichmentConfig
@@ -31,29 +33,6 @@ from docvet.config import EnrichmentConfig
 _NodeT = ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
 
 
-def _build_node_index(tree: ast.Module) -> dict[int, _NodeT]:
-    """Build a line-number-to-AST-node lookup table for O(1) access.
-
-    Walks the AST tree once and collects all ``FunctionDef``,
-    ``AsyncFunctionDef``, and ``ClassDef`` nodes, indexed by their line
-    number. This enables rules to retrieve the AST node for a symbol via
-    ``symbol.line`` without re-walking the tree for each rule.
-
-    Args:
-        tree: The parsed AST tree for the source file.
-
-    Returns:
-        A dict mapping line numbers to AST nodes. Module-level symbols
-        have no corresponding node, so ``node_index.get(symbol.line)``
-        returns ``None`` for them.
-    """
-    index: dict[int, _NodeT] = {}
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            index[node.lineno] = node
-    return index
-
-
 # ---------------------------------------------------------------------------
 # Rule functions
 # ---------------------------------------------------------------------------
@@ -101,11 +80,11 @@ def _check_missing_raises(
 ) -> Finding | None:
     """Detect a function that raises exceptions without a Raises section.
 
-    Walks the function's AST subtree to find ``raise`` statements and
+    Reads the function's shared body facts to find ``raise`` statements and
     extracts exception class names. Returns a finding when exceptions are
     raised but no ``Raises:`` section is present in the docstring.
 
-    The walk is scope-aware: it stops at nested ``FunctionDef``,
+    The body walk is scope-aware: it stops at nested ``FunctionDef``,
     ``AsyncFunctionDef``, and ``ClassDef`` boundaries so that raises
     inside nested scopes are not attributed to the outer function.
 
@@ -131,18 +110,7 @@ def _check_missing_raises(
     if "Raises" in sections:
         return None
 
-    names: set[str] = set()
-    stack = list(ast.iter_child_nodes(node))
-    while stack:
-        child = stack.pop()
-        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            continue
-        if isinstance(child, ast.Raise):
-            name = _extract_exception_name(child)
-            if name is not None:
-                names.add(name)
-        stack.extend(ast.iter_child_nodes(child))
-
+    names = _enrichment_pkg._body_facts(node).raises
     if not names:
         return None
 
@@ -361,11 +329,11 @@ def _check_missing_returns(
 ) -> Finding | None:
     """Detect a function that returns values without a Returns section.
 
-    Walks the function's AST subtree to find ``return`` statements with
+    Reads the function's shared body facts to find ``return`` statements with
     meaningful values (not bare ``return`` or ``return None``). Returns a
     finding when such returns exist but no ``Returns:`` section is present.
 
-    The walk is scope-aware: it stops at nested ``FunctionDef``,
+    The body walk is scope-aware: it stops at nested ``FunctionDef``,
     ``AsyncFunctionDef``, and ``ClassDef`` boundaries so that returns
     inside nested scopes are not attributed to the outer function.
 
@@ -396,19 +364,7 @@ def _check_missing_returns(
     if _should_skip_returns_check(symbol, node, sections):
         return None
 
-    # Scope-aware walk for meaningful return statements
-    has_meaningful_return = False
-    stack = list(ast.iter_child_nodes(node))
-    while stack:
-        child = stack.pop()
-        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            continue
-        if isinstance(child, ast.Return) and _is_meaningful_return(child):
-            has_meaningful_return = True
-            break
-        stack.extend(ast.iter_child_nodes(child))
-
-    if not has_meaningful_return:
+    if not _enrichment_pkg._body_facts(node).returns_value:
         return None
 
     return Finding(
@@ -430,11 +386,11 @@ def _check_missing_yields(
 ) -> Finding | None:
     """Detect a generator function that yields without a Yields section.
 
-    Walks the function's AST subtree to find ``yield`` and ``yield from``
+    Reads the function's shared body facts to find ``yield`` and ``yield from``
     expressions. Returns a finding when yields are present but no
     ``Yields:`` section is present in the docstring.
 
-    The walk is scope-aware: it stops at nested ``FunctionDef``,
+    The body walk is scope-aware: it stops at nested ``FunctionDef``,
     ``AsyncFunctionDef``, and ``ClassDef`` boundaries so that yields
     inside nested scopes are not attributed to the outer function.
 
@@ -460,18 +416,7 @@ def _check_missing_yields(
     if "Yields" in sections:
         return None
 
-    has_yield = False
-    stack = list(ast.iter_child_nodes(node))
-    while stack:
-        child = stack.pop()
-        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            continue
-        if isinstance(child, (ast.Yield, ast.YieldFrom)):
-            has_yield = True
-            break
-        stack.extend(ast.iter_child_nodes(child))
-
-    if not has_yield:
+    if not _enrichment_pkg._body_facts(node).yields:
         return None
 
     return Finding(
@@ -493,7 +438,7 @@ def _check_missing_receives(
 ) -> Finding | None:
     """Detect a generator using the send pattern without a Receives section.
 
-    Walks the function's AST subtree to find ``yield`` expressions used
+    Reads the function's shared body facts to find ``yield`` expressions used
     as assignment targets (``value = yield``), indicating that the
     generator protocol's ``.send()`` method is intentionally used.
     Returns a finding when the send pattern is present but no
@@ -503,7 +448,7 @@ def _check_missing_receives(
     ``ast.Yield`` are considered send patterns. Bare ``yield`` (not
     assigned) and ``yield from`` do not trigger this rule.
 
-    The walk is scope-aware: it stops at nested scope boundaries.
+    The body walk is scope-aware: it stops at nested scope boundaries.
 
     Args:
         symbol: The documented symbol to inspect.
@@ -527,25 +472,7 @@ def _check_missing_receives(
     if "Receives" in sections:
         return None
 
-    has_send = False
-    stack = list(ast.iter_child_nodes(node))
-    while stack:
-        child = stack.pop()
-        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            continue
-        if isinstance(child, ast.Assign) and isinstance(child.value, ast.Yield):
-            has_send = True
-            break
-        if (
-            isinstance(child, ast.AnnAssign)
-            and child.value is not None
-            and isinstance(child.value, ast.Yield)
-        ):
-            has_send = True
-            break
-        stack.extend(ast.iter_child_nodes(child))
-
-    if not has_send:
+    if not _enrichment_pkg._body_facts(node).receives:
         return None
 
     return Finding(
@@ -595,13 +522,13 @@ def _check_missing_warns(
 ) -> Finding | None:
     """Detect a function calling ``warnings.warn()`` without a Warns section.
 
-    Walks the function's AST subtree to find ``ast.Call`` nodes where
+    Reads the function's shared body facts to find ``ast.Call`` nodes where
     the callee is ``warnings.warn`` (qualified) or bare ``warn``
     (after ``from warnings import warn``). Returns a finding when a
     warn call is present but no ``Warns:`` section exists in the
     docstring.
 
-    The walk is scope-aware: it stops at nested ``FunctionDef``,
+    The body walk is scope-aware: it stops at nested ``FunctionDef``,
     ``AsyncFunctionDef``, and ``ClassDef`` boundaries so that warn
     calls inside nested scopes are not attributed to the outer function.
 
@@ -627,18 +554,7 @@ def _check_missing_warns(
     if "Warns" in sections:
         return None
 
-    has_warn = False
-    stack = list(ast.iter_child_nodes(node))
-    while stack:
-        child = stack.pop()
-        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            continue
-        if isinstance(child, ast.Call) and _is_warn_call(child):
-            has_warn = True
-            break
-        stack.extend(ast.iter_child_nodes(child))
-
-    if not has_warn:
+    if not _enrichment_pkg._body_facts(node).warns:
         return None
 
     return Finding(
@@ -31,6 +31,7 @@ from docvet.config import EnrichmentConfig
 
 from . import _extract_section_content, _parse_sections
 from ._class_module import _find_init_method
+from ._docstring import _parse_docstring
 from ._forward import _is_property, _NodeT
 
 # ---------------------------------------------------------------------------
@@ -94,7 +95,8 @@ def _decompose_name(name: str) -> set[str]:
 def _extract_summary_words(docstring: str) -> set[str]:
     """Extract meaningful words from the first line of a docstring.
 
-    Takes the first non-empty line, strips the trailing period, tokenises
+    Takes the summary line from the docstring's shared
+    ``ParsedDocstring``, strips the trailing period, tokenises
     on non-alphanumeric characters, lowercases every token, and filters
     out stop words.
 
@@ -110,13 +112,10 @@ def _extract_summary_words(docstring: str) -> set[str]:
         _extract_summary_words("Process the data.") == {"process", "data"}
         ```
     """
-    for line in docstring.split("\n"):
-        stripped = line.strip()
-        if stripped:
-            break
-    else:
+    summary = _parse_docstring(docstring).summary
+    if summary is None:
         return set()
-    summary = stripped.rstrip(".")
+    summary = summary.rstrip(".")
     tokens = re.split(r"[^a-zA-Z0-9]+", summary)
     return {t.lower() for t in tokens if t and t.lower() not in _STOP_WORDS}
 
@@ -206,7 +205,7 @@ def _has_return_type_in_docstring(docstring: str) -> bool:
         otherwise.  Returns ``True`` conservatively when content
         cannot be extracted (e.g. NumPy underline format).
     """
-    if _enrichment_pkg._active_style == "sphinx":
+    if _enrichment_pkg._run_style.get() == "sphinx":
         return ":rtype:" in docstring
 
     content = _extract_section_content(docstring, "Returns")
@@ -358,7 +357,7 @@ def _check_undocumented_init_params(
     init_docstring = ast.get_docstring(init_node)
     if init_docstring:
         init_sections = _parse_sections(
-            init_docstring, style=_enrichment_pkg._active_style
+            init_docstring, style=_enrichment_pkg._run_style.get()
         )
         if "Args" in init_sections:
             return None
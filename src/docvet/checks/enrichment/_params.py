@@ -2,7 +2,7 @@
 
 Detects mismatches between function signature parameters and ``Args:``
 section entries.  Supports both Google-style and Sphinx/RST conventions
-via the module-level ``_active_style`` in the parent package.
+via the run style (``_run_style``) in the parent package.
 
 See Also:
     [`docvet.checks.enrichment`][]: Orchestrator and dispatch table.
@@ -19,30 +19,15 @@ Examples:
 from __future__ import annotations
 
 import ast
-import re
 
 import docvet.checks.enrichment as _enrichment_pkg
 from docvet.ast_utils import Symbol
 from docvet.checks._finding import Finding
 from docvet.config import EnrichmentConfig
 
-from . import _extract_section_content
+from ._docstring import _parse_docstring
 from ._forward import _NodeT
 
-# Regex to extract param names from Google-style Args: section entries.
-# Matches at detected base indent, with optional leading */** for varargs.
-_ARGS_ENTRY_PATTERN = re.compile(r"\*{0,2}(\w+)[^\S\n]*[\s(:]")
-
-# Regex to extract param names from Sphinx :param name: entries.
-_SPHINX_PARAM_PATTERN = re.compile(r":param\s+(\w+)\s*:")
-
-# Regex to extract exception names from Google-style Raises: section entries.
-# Matches ClassName followed by colon at entry level (analogous to _ARGS_ENTRY_PATTERN).
-_RAISES_ENTRY_PATTERN = re.compile(r"(\w+)\s*:")
-
-# Regex to extract exception names from Sphinx :raises ExcType: entries.
-_SPHINX_RAISES_PATTERN = re.compile(r":raises\s+(\w+)\s*:")
-
 
 def _parse_args_entries(
     docstring: str,
@@ -51,14 +36,13 @@ def _parse_args_entries(
 ) -> set[str]:
     """Extract documented parameter names from a docstring.
 
-    In Google mode, extracts the ``Args:`` section via
-    :func:`_extract_section_content` and parses entry lines at the
-    detected base indent level.  In Sphinx mode, scans the full
-    docstring for ``:param name:`` patterns.
+    In Google mode, reads the ``Args:`` entries parsed at the detected
+    base indent level by the docstring's shared ``ParsedDocstring``.  In
+    Sphinx mode, scans the full docstring for ``:param name:`` patterns.
 
     Returns an empty set when no ``Args:`` section is found or when
     content extraction fails (e.g. NumPy underline format, which
-    ``_extract_section_content`` does not yet support).
+    section content extraction does not yet support).
 
     Args:
         docstring: The raw docstring text to parse.
@@ -67,44 +51,7 @@ def _parse_args_entries(
     Returns:
         A set of documented parameter names (stars stripped).
     """
-    if style == "sphinx":
-        return set(_SPHINX_PARAM_PATTERN.findall(docstring))
-
-    content = _extract_section_content(docstring, "Args")
-    if content is None:
-        # NumPy underline Args format — not yet supported for content
-        # extraction. Return empty set; future story will add support.
-        return set()
-
-    lines = content.splitlines()
-    if not lines:
-        return set()
-
-    # Detect base indent from first non-empty content line.
-    base_indent = ""
-    for line in lines:
-        stripped = line.lstrip()
-        if stripped:
-            base_indent = line[: len(line) - len(stripped)]
-            break
-
-    if not base_indent:
-        return set()
-
-    params: set[str] = set()
-    for line in lines:
-        # Only process lines at exactly the base indent level.
-        if not line.startswith(base_indent):
-            continue
-        after_indent = line[len(base_indent) :]
-        # Skip continuation lines (deeper indent).
-        if after_indent and after_indent[0] == " ":
-            continue
-        m = _ARGS_ENTRY_PATTERN.match(after_indent)
-        if m:
-            params.add(m.group(1))
-
-    return params
+    return set(_parse_docstring(docstring).entries("Args", style=style))
 
 
 def _parse_raises_entries(
@@ -114,10 +61,9 @@ def _parse_raises_entries(
 ) -> set[str]:
     """Extract documented exception names from a docstring.
 
-    In Google mode, extracts the ``Raises:`` section via
-    :func:`_extract_section_content` and parses entry lines at the
-    detected base indent level.  In Sphinx mode, scans the full
-    docstring for ``:raises ExcType:`` patterns.
+    In Google mode, reads the ``Raises:`` entries parsed at the detected
+    base indent level by the docstring's shared ``ParsedDocstring``.  In
+    Sphinx mode, scans the full docstring for ``:raises ExcType:`` patterns.
 
     Returns an empty set when no ``Raises:`` section is found or when
     content extraction fails.
@@ -129,42 +75,7 @@ def _parse_raises_entries(
     Returns:
         A set of documented exception class names.
     """
-    if style == "sphinx":
-        return set(_SPHINX_RAISES_PATTERN.findall(docstring))
-
-    content = _extract_section_content(docstring, "Raises")
-    if content is None:
-        return set()
-
-    lines = content.splitlines()
-    if not lines:
-        return set()
-
-    # Detect base indent from first non-empty content line.
-    base_indent = ""
-    for line in lines:
-        stripped = line.lstrip()
-        if stripped:
-            base_indent = line[: len(line) - len(stripped)]
-            break
-
-    if not base_indent:
-        return set()
-
-    exceptions: set[str] = set()
-    for line in lines:
-        # Only process lines at exactly the base indent level.
-        if not line.startswith(base_indent):
-            continue
-        after_indent = line[len(base_indent) :]
-        # Skip continuation lines (deeper indent).
-        if after_indent and after_indent[0] == " ":
-            continue
-        m = _RAISES_ENTRY_PATTERN.match(after_indent)
-        if m:
-            exceptions.add(m.group(1))
-
-    return exceptions
+    return set(_parse_docstring(docstring).entries("Raises", style=style))
 
 
 def _extract_signature_params(
@@ -247,7 +158,7 @@ def _check_missing_param_in_docstring(
 
     sig_params = _extract_signature_params(node, config)
     doc_params = _parse_args_entries(
-        symbol.docstring, style=_enrichment_pkg._active_style
+        symbol.docstring, style=_enrichment_pkg._run_style.get()
     )
     missing = sorted(sig_params - doc_params)
 
@@ -299,7 +210,7 @@ def _check_extra_param_in_docstring(
 
     sig_params = _extract_signature_params(node, config)
     doc_params = _parse_args_entries(
-        symbol.docstring, style=_enrichment_pkg._active_style
+        symbol.docstring, style=_enrichment_pkg._run_style.get()
     )
     extra = sorted(doc_params - sig_params)
 
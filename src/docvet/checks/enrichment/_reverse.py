@@ -1,8 +1,8 @@
 """Reverse enrichment checks — docstring claims behaviour code doesn't exhibit.
 
 Detects ``Raises:``, ``Yields:``, and ``Returns:`` sections that describe
-behaviour the function body does not actually implement.  Each check uses
-a scope-aware AST walk that stops at nested function/class boundaries.
+behaviour the function body does not actually implement.  Each check reads
+the shared body facts, whose walk stops at nested function/class boundaries.
 
 See Also:
     [`docvet.checks.enrichment`][]: Orchestrator and dispatch table.
@@ -18,15 +18,13 @@ Examples:
 
 from __future__ import annotations
 
-import ast
-
 import docvet.checks.enrichment as _enrichment_pkg
 from docvet.ast_utils import Symbol
 from docvet.checks._finding import Finding
 from docvet.config import EnrichmentConfig
 
 from . import _should_skip_reverse_check
-from ._forward import _extract_exception_name, _is_meaningful_return, _NodeT
+from ._forward import _NodeT
 from ._params import _parse_raises_entries
 
 
@@ -40,8 +38,8 @@ def _check_extra_raises_in_docstring(
     """Detect documented exceptions not raised in the function body.
 
     Parses the ``Raises:`` section to collect documented exception names,
-    then walks the AST subtree (scope-aware) to collect actually raised
-    exceptions.  Any documented name absent from the code is flagged.
+    then compares them with the exceptions actually raised according to
+    the function's body facts.  Any documented name absent from the code is flagged.
 
     Args:
         symbol: The documented symbol to inspect.
@@ -68,24 +66,12 @@ def _check_extra_raises_in_docstring(
         return None
 
     doc_raises = _parse_raises_entries(
-        symbol.docstring, style=_enrichment_pkg._active_style
+        symbol.docstring, style=_enrichment_pkg._run_style.get()
     )
     if not doc_raises:
         return None
 
-    # Scope-aware walk to collect actually raised exception names.
-    code_raises: set[str] = set()
-    stack = list(ast.iter_child_nodes(node))
-    while stack:
-        child = stack.pop()
-        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            continue
-        if isinstance(child, ast.Raise):
-            name = _extract_exception_name(child)
-            if name is not None:
-                code_raises.add(name)
-        stack.extend(ast.iter_child_nodes(child))
-
+    code_raises = _enrichment_pkg._body_facts(node).raises
     extra = sorted(doc_raises - code_raises)
     if not extra:
         return None
@@ -133,15 +119,8 @@ def _check_extra_yields_in_docstring(
     if _should_skip_reverse_check(node):
         return None
 
-    # Scope-aware walk for yield/yield-from.
-    stack = list(ast.iter_child_nodes(node))
-    while stack:
-        child = stack.pop()
-        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            continue
-        if isinstance(child, (ast.Yield, ast.YieldFrom)):
-            return None  # Section is truthful.
-        stack.extend(ast.iter_child_nodes(child))
+    if _enrichment_pkg._body_facts(node).yields:
+        return None  # Section is truthful.
 
     return Finding(
         file=file_path,
@@ -188,15 +167,8 @@ def _check_extra_returns_in_docstring(
     if _should_skip_reverse_check(node):
         return None
 
-    # Scope-aware walk for meaningful return statements.
-    stack = list(ast.iter_child_nodes(node))
-    while stack:
-        child = stack.pop()
-        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            continue
-        if isinstance(child, ast.Return) and _is_meaningful_return(child):
-            return None  # Section is truthful.
-        stack.extend(ast.iter_child_nodes(child))
+    if _enrichment_pkg._body_facts(node).returns_value:
+        return None  # Section is truthful.
 
     return Finding(
         file=file_path,
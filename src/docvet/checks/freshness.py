@@ -25,6 +25,7 @@ from __future__ import annotations
 import ast
 import re
 import time
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from typing import Literal
 
@@ -39,6 +40,8 @@ __all__ = ["check_freshness_diff", "check_freshness_drift"]
 # ---------------------------------------------------------------------------
 
 _HUNK_PATTERN = re.compile(r"^@@ .+\+(\d+)(?:,(\d+))? @@")
+_FILE_HEADER_PATTERN = re.compile(r"^(?=diff --git )", re.MULTILINE)
+_NEW_PATH_PATTERN = re.compile(r"^\+\+\+ (.+?)\t?$", re.MULTILINE)
 
 # Rule identifier string literals (for reference):
 # "stale-signature"  — function signature changed, docstring not updated
@@ -160,6 +163,32 @@ def _parse_diff_hunks(diff_output: str) -> set[int]:
     return changed
 
 
+def _split_diff_by_file(diff_output: str) -> dict[str, str]:
+    """Split multi-file ``git diff`` output into per-file diffs.
+
+    Cuts the output at each ``diff --git`` header and keys every section
+    by the new-file path from its ``+++`` line, so one ``git diff`` for
+    many files can be fed to :func:`check_freshness_diff` file by file
+    without cross-file hunk contamination.  Expects ``--no-prefix``
+    output, where ``+++`` lines carry the bare path.
+
+    Args:
+        diff_output: Raw unified diff output covering any number of files.
+
+    Returns:
+        A dict mapping each post-image path (as printed by git) to that
+        file's section of the diff.  Sections without a ``+++`` line
+        (binary, mode-only, or pure-rename changes) and deleted files
+        are omitted.
+    """
+    diffs: dict[str, str] = {}
+    for section in _FILE_HEADER_PATTERN.split(diff_output):
+        match = _NEW_PATH_PATTERN.search(section)
+        if match and match.group(1) != "/dev/null":
+            diffs[match.group(1)] = section
+    return diffs
+
+
 def _classify_changed_lines(
     changed_lines: set[int],
     symbol: Symbol,
@@ -204,6 +233,8 @@ def check_freshness_diff(
     file_path: str,
     diff_output: str,
     tree: ast.Module,
+    *,
+    line_map: dict[int, Symbol] | None = None,
 ) -> list[Finding]:
     """Check a file for stale docstrings using git diff output.
 
@@ -216,6 +247,9 @@ def check_freshness_diff(
         file_path: Source file path for finding attribution.
         diff_output: Raw unified diff output from ``git diff``.
         tree: Parsed AST module from ``ast.parse()``.
+        line_map: Pre-computed line-to-symbol map for *tree*.  Built
+            via :func:`~docvet.ast_utils.map_lines_to_symbols` when not
+            provided.
 
     Returns:
         A list of findings for symbols with stale docstrings.
@@ -226,7 +260,8 @@ def check_freshness_diff(
     if not changed_lines:
         return []
 
-    line_map = map_lines_to_symbols(tree)
+    if line_map is None:
+        line_map = map_lines_to_symbols(tree)
 
     # Invert: group changed lines by symbol
     symbol_changes: dict[Symbol, set[int]] = {}
@@ -272,7 +307,8 @@ def _classify_blame_line(line: str) -> tuple[str, int | None]:
     field, a tab-prefixed content line, or other metadata.
 
     Args:
-        line: A single line from ``git blame --line-porcelain`` output.
+        line: A single line from ``git blame --porcelain`` or
+            ``--line-porcelain`` output.
 
     Returns:
         A ``(kind, value)`` pair.  *kind* is ``"sha"`` (value = line
@@ -299,18 +335,26 @@ def _classify_blame_line(line: str) -> tuple[str, int | None]:
     return "other", None
 
 
-def _parse_blame_timestamps(blame_output: str) -> dict[int, int]:
+def _parse_blame_timestamps(blame_output: str | Iterable[str]) -> dict[int, int]:
     """Extract per-line modification timestamps from git blame porcelain output.
 
-    Parses ``git blame --line-porcelain`` output and builds a mapping from
-    1-based line numbers to Unix timestamps extracted from ``author-time``
-    fields.  Uses a simple state machine: each blame block starts with a
-    SHA line (setting the current line number), accumulates an
-    ``author-time`` value, and emits the mapping entry when a tab-prefixed
-    content line is encountered.
+    Parses ``git blame --porcelain`` or ``--line-porcelain`` output and
+    builds a mapping from 1-based line numbers to Unix timestamps
+    extracted from ``author-time`` fields.  Uses a simple state machine:
+    each blame block starts with a SHA line (setting the current commit
+    and line number), may carry an ``author-time`` value, and emits the
+    mapping entry when a tab-prefixed content line is encountered.
+    Compact ``--porcelain`` output prints a commit's headers only the
+    first time the commit appears, so author times are kept in a
+    per-commit table and later blocks for the same commit look theirs
+    up there.  Accepts either the whole output or an iterable of lines
+    (such as a subprocess pipe), so callers can stream blame output
+    without buffering it.
 
     Args:
-        blame_output: Raw output from ``git blame --line-porcelain``.
+        blame_output: Raw output from ``git blame --porcelain`` or
+            ``--line-porcelain``, as one string or as an iterable of
+            lines.
 
     Returns:
         A dict mapping 1-based line numbers to Unix timestamps.  Returns
@@ -319,23 +363,25 @@ def _parse_blame_timestamps(blame_output: str) -> dict[int, int]:
     """
     if not blame_output:
         return {}
+    lines = blame_output.splitlines() if isinstance(blame_output, str) else blame_output
 
     timestamps: dict[int, int] = {}
+    commit_times: dict[str, int] = {}
+    current_sha: str | None = None
     current_line: int | None = None
-    current_timestamp: int | None = None
 
-    for line in blame_output.splitlines():
+    for line in lines:
         kind, value = _classify_blame_line(line)
         if kind == "sha":
+            current_sha = line[:40]
             current_line = value
-            current_timestamp = None
-        elif kind == "timestamp" and value is not None:
-            current_timestamp = value
+        elif kind == "timestamp" and value is not None and current_sha is not None:
+            commit_times[current_sha] = value
         elif kind == "content":
-            if current_line is not None and current_timestamp is not None:
-                timestamps[current_line] = current_timestamp
+            if current_line is not None and current_sha in commit_times:
+                timestamps[current_line] = commit_times[current_sha]
+            current_sha = None
             current_line = None
-            current_timestamp = None
 
     return timestamps
 
@@ -487,34 +533,43 @@ def check_freshness_drift(
     config: FreshnessConfig,
     *,
     now: int | None = None,
+    line_map: dict[int, Symbol] | None = None,
+    timestamps: dict[int, int] | None = None,
 ) -> list[Finding]:
     """Check a file for stale docstrings using git blame timestamps.
 
     Parses blame output to extract per-line timestamps, groups them by
     AST symbol, and checks each symbol for drift (code newer than
-    docstring) and age (docstring untouched too long).
+    docstring) and age (docstring untouched too long).  Callers that
+    already parsed the blame output (for example while streaming it
+    from ``git``) pass *timestamps* instead.
 
     Args:
         file_path: Source file path for finding attribution.
-        blame_output: Raw output from ``git blame --line-porcelain``.
+        blame_output: Raw output from ``git blame --porcelain`` or
+            ``--line-porcelain``.
         tree: Parsed AST module from ``ast.parse()``.
         config: Freshness configuration with threshold values.
         now: Current time as a Unix timestamp.  Defaults to
             ``int(time.time())`` when not provided.
+        line_map: Pre-computed line-to-symbol map for *tree*.  Built
+            via :func:`~docvet.ast_utils.map_lines_to_symbols` when not
+            provided.
+        timestamps: Pre-parsed mapping of 1-based line numbers to Unix
+            timestamps.  When provided, *blame_output* is ignored.
 
     Returns:
         A list of findings for symbols with stale docstrings, sorted
         by line number.  Returns an empty list when blame output is
         empty or no symbols exceed thresholds.
     """
-    if not blame_output:
-        return []
-
-    timestamps = _parse_blame_timestamps(blame_output)
+    if timestamps is None:
+        timestamps = _parse_blame_timestamps(blame_output)
     if not timestamps:
         return []
 
-    line_map = map_lines_to_symbols(tree)
+    if line_map is None:
+        line_map = map_lines_to_symbols(tree)
     symbol_code_ts, symbol_doc_ts = _group_timestamps_by_symbol(timestamps, line_map)
 
     effective_now = now if now is not None else int(time.time())
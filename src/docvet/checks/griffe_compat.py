@@ -24,11 +24,15 @@ import logging
 import re
 import types
 from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from griffe import Alias as GriffeAlias
+    from griffe import Module as GriffeModule
     from griffe import Object as GriffeObject
 
 from docvet.checks._finding import Finding
@@ -76,6 +80,24 @@ class _WarningCollector(logging.Handler):
         self.records.append(record)
 
 
+@contextmanager
+def _capture_warnings() -> Iterator[_WarningCollector]:
+    """Attach a fresh warning collector to the griffe logger.
+
+    The collector is detached when the block exits, including on error.
+
+    Yields:
+        The attached warning collector.
+    """
+    griffe_logger = logging.getLogger("griffe")
+    handler = _WarningCollector()
+    griffe_logger.addHandler(handler)
+    try:
+        yield handler
+    finally:
+        griffe_logger.removeHandler(handler)
+
+
 def _classify_warning(message: str) -> tuple[str, Literal["required", "recommended"]]:
     """Classify a griffe warning message into a rule and category.
 
@@ -198,6 +220,106 @@ def _collect_object_findings(
     return findings
 
 
+def _target_packages(src_root: Path, file_set: set[Path]) -> set[str]:
+    """Return the top-level directory names under *src_root* holding files.
+
+    Args:
+        src_root: Root source directory containing Python packages.
+        file_set: Resolved absolute paths of the files to check.
+
+    Returns:
+        Names of the first path component below *src_root* for every
+        file nested at least one directory deep.
+    """
+    root = src_root.resolve()
+    names: set[str] = set()
+    for file_path in file_set:
+        try:
+            parts = file_path.relative_to(root).parts
+        except ValueError:
+            continue
+        if len(parts) > 1:
+            names.add(parts[0])
+    return names
+
+
+def _package_dirs(src_root: Path, file_set: set[Path]) -> list[Path]:
+    """List the package directories under *src_root* that hold target files.
+
+    Args:
+        src_root: Root source directory containing Python packages.
+        file_set: Resolved absolute paths of the files to check.
+
+    Returns:
+        Sorted package directories (those with an ``__init__.py``)
+        containing at least one file from *file_set*.
+    """
+    targets = _target_packages(src_root, file_set)
+    return [
+        child
+        for child in sorted(src_root.iterdir())
+        if child.name in targets and child.is_dir() and (child / "__init__.py").exists()
+    ]
+
+
+def _check_package(
+    name: str,
+    src_root: Path,
+    file_set: set[Path],
+    handler: _WarningCollector,
+) -> list[Finding]:
+    """Load one griffe package and collect its docstring findings.
+
+    Args:
+        name: Top-level package name.
+        src_root: Root source directory containing the package.
+        file_set: Resolved absolute paths to filter griffe objects.
+        handler: Attached warning collector for the griffe logger.
+
+    Returns:
+        A list of findings, or an empty list when the package fails to
+        load.
+    """
+    if griffe is None:
+        return []
+    try:
+        package = griffe.load(
+            name,
+            search_paths=[str(src_root)],
+            docstring_parser="google",
+            allow_inspection=False,
+        )
+    except (
+        griffe.LoadingError,
+        ModuleNotFoundError,
+        OSError,
+        SyntaxError,
+    ):
+        return []
+
+    findings: list[Finding] = []
+    for obj in _walk_objects(package, file_set):
+        findings.extend(_collect_object_findings(obj, handler))
+    return findings
+
+
+def _check_package_isolated(
+    name: str, src_root: Path, file_set: set[Path]
+) -> list[Finding]:
+    """Check one package in a worker process with its own warning collector.
+
+    Args:
+        name: Top-level package name.
+        src_root: Root source directory containing the package.
+        file_set: Resolved absolute paths to filter griffe objects.
+
+    Returns:
+        The package's findings, pickled back to the parent process.
+    """
+    with _capture_warnings() as handler:
+        return _check_package(name, src_root, file_set, handler)
+
+
 def _load_and_check_packages(
     src_root: Path,
     file_set: set[Path],
@@ -205,9 +327,10 @@ def _load_and_check_packages(
 ) -> list[Finding]:
     """Load griffe packages under *src_root* and collect docstring findings.
 
-    Iterates directories that look like Python packages, loads them via
-    griffe, triggers docstring parsing to capture warnings, and converts
-    captured records to findings.
+    Iterates directories that look like Python packages and contain at
+    least one file from *file_set*, loads them via griffe, triggers
+    docstring parsing to capture warnings, and converts captured records
+    to findings.
 
     Args:
         src_root: Root source directory containing Python packages.
@@ -221,39 +344,196 @@ def _load_and_check_packages(
         return []
 
     findings: list[Finding] = []
-    for child in sorted(src_root.iterdir()):
-        if not child.is_dir() or not (child / "__init__.py").exists():
-            continue
-        try:
-            package = griffe.load(
-                child.name,
-                search_paths=[str(src_root)],
-                docstring_parser="google",
-                allow_inspection=False,
-            )
-        except (
-            griffe.LoadingError,
-            ModuleNotFoundError,
-            OSError,
-            SyntaxError,
-        ):
-            continue
-
-        for obj in _walk_objects(package, file_set):
-            findings.extend(_collect_object_findings(obj, handler))
+    for child in _package_dirs(src_root, file_set):
+        findings.extend(_check_package(child.name, src_root, file_set, handler))
     return findings
 
 
-def check_griffe_compat(src_root: Path, files: Sequence[Path]) -> list[Finding]:
+def _module_parts(file_path: Path, src_root: Path) -> tuple[str, ...] | None:
+    """Map a file under *src_root* to the dotted parts of its module path.
+
+    Mirrors the packages :func:`_load_and_check_packages` visits: every
+    directory from the top-level package down to the file must contain
+    an ``__init__.py``. A package's ``__init__.py`` maps to the package
+    itself.
+
+    Args:
+        file_path: Resolved path of a Python file.
+        src_root: Resolved root source directory.
+
+    Returns:
+        The module path parts (e.g. ``("pkg", "sub", "mod")``), or
+        ``None`` when the file does not belong to a package under
+        *src_root*.
+    """
+    try:
+        parts = file_path.with_suffix("").relative_to(src_root).parts
+    except ValueError:
+        return None
+    if len(parts) < 2:
+        return None
+    for depth in range(1, len(parts)):
+        if not (src_root.joinpath(*parts[:depth]) / "__init__.py").is_file():
+            return None
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return parts
+
+
+class _ModuleTree:
+    """Resident griffe modules under a source root, loaded per file.
+
+    Instead of loading whole packages, each requested module is visited
+    on its own, together with the ``__init__`` modules of its parent
+    packages. Modules stay resident, so re-checking an edited file
+    re-visits that one module and reattaches it to its parent.
+
+    Attributes:
+        src_root (Path): Resolved root source directory.
+
+    Examples:
+        Keep a tree alive across saves and re-check one file:
+
+        ```python
+        tree = _ModuleTree(Path("src"))
+        findings = tree.check(Path("src/pkg/mod.py"), source)
+        ```
+    """
+
+    def __init__(self, src_root: Path) -> None:
+        """Initialize an empty tree rooted at *src_root*.
+
+        Args:
+            src_root: Root source directory containing Python packages.
+        """
+        self.src_root = src_root.resolve()
+        self._modules: dict[tuple[str, ...], GriffeModule] = {}
+
+    def _filepath(self, parts: tuple[str, ...]) -> Path:
+        """Return the source file backing the module at *parts*.
+
+        Args:
+            parts: Module path parts.
+
+        Returns:
+            The package ``__init__.py`` or the module's ``.py`` file.
+        """
+        path = self.src_root.joinpath(*parts)
+        if path.is_dir():
+            return path / "__init__.py"
+        return path.with_suffix(".py")
+
+    def _module(self, parts: tuple[str, ...]) -> GriffeModule:
+        """Return the resident module at *parts*, visiting it if absent.
+
+        Args:
+            parts: Module path parts.
+
+        Returns:
+            The griffe module.
+        """
+        module = self._modules.get(parts)
+        if module is None:
+            module = self._visit(parts, None)
+        return module
+
+    def _visit(self, parts: tuple[str, ...], source: str | None) -> GriffeModule:
+        """Visit the module at *parts* and attach it to its parent.
+
+        Submodules of a previously visited package are carried over to
+        the new package module so an ``__init__.py`` edit does not
+        discard them.
+
+        Args:
+            parts: Module path parts.
+            source: Module source text, read from disk when ``None``.
+
+        Returns:
+            The freshly visited griffe module.
+        """
+        filepath = self._filepath(parts)
+        if source is None:
+            source = filepath.read_text(encoding="utf-8")
+        parent = self._module(parts[:-1]) if len(parts) > 1 else None
+        module = griffe.visit(  # type: ignore[union-attr]
+            parts[-1],
+            filepath,
+            source,
+            parent=parent,
+            docstring_parser="google",
+        )
+        if (previous := self._modules.get(parts)) is not None:
+            for name, member in previous.members.items():
+                if name not in module.members and member.is_module:
+                    module.set_member(name, member)
+        if parent is not None:
+            parent.set_member(parts[-1], module)
+        self._modules[parts] = module
+        return module
+
+    def check(self, file_path: Path, source: str | None = None) -> list[Finding]:
+        """Re-visit one file and collect its docstring findings.
+
+        Args:
+            file_path: Path of the file to check.
+            source: Current file text, read from disk when ``None``.
+
+        Returns:
+            A list of findings for objects defined in *file_path*.
+            Files outside a package under the source root, or that fail
+            to parse, produce no findings.
+        """
+        if griffe is None:
+            return []
+        resolved = file_path.resolve()
+        parts = _module_parts(resolved, self.src_root)
+        if parts is None:
+            return []
+        findings: list[Finding] = []
+        with _capture_warnings() as handler:
+            try:
+                module = self._visit(parts, source)
+            except (OSError, SyntaxError, UnicodeDecodeError):
+                return []
+            for obj in _walk_objects(module, {resolved}):
+                findings.extend(_collect_object_findings(obj, handler))
+        return findings
+
+
+def check_griffe_compat(
+    src_root: Path,
+    files: Sequence[Path],
+    *,
+    targeted: bool = False,
+    jobs: int = 1,
+    tree: _ModuleTree | None = None,
+) -> list[Finding]:
     """Check Python packages for griffe docstring compatibility issues.
 
-    Loads each package under src_root via griffe, captures parser warnings,
-    and converts them to Finding objects. Packages that fail to load are
-    skipped without aborting other packages.
+    Loads each package under src_root that contains one of *files* via
+    griffe, captures parser warnings, and converts them to Finding
+    objects. Packages that fail to load are skipped without aborting
+    other packages.
+
+    In targeted mode only the modules backing *files* are visited,
+    together with the ``__init__`` modules of their parent packages,
+    instead of whole packages. Use it when *files* is a small slice of
+    the tree, such as a diff; modules that fail to parse are skipped.
+    Passing a resident *tree* keeps parent package modules loaded across
+    calls, so only the requested modules are re-visited.
+
+    Otherwise, with *jobs* above one, packages are loaded in up to
+    *jobs* worker processes. Each worker captures warnings with its own
+    collector and returns its findings, which are concatenated in
+    package order so the result matches a serial run.
 
     Args:
         src_root: Root source directory containing Python packages.
         files: Sequence of file paths to check (used to filter griffe objects).
+        targeted: Visit only the modules backing *files*.
+        jobs: Worker processes for whole-package loading.
+        tree: Resident module tree rooted at *src_root* to reuse in
+            targeted mode; a fresh tree is built when ``None``.
 
     Returns:
         A list of Finding objects for docstring rendering compatibility issues.
@@ -264,12 +544,23 @@ def check_griffe_compat(src_root: Path, files: Sequence[Path]) -> list[Finding]:
         return []
 
     file_set = _resolve_file_set(files)
-    griffe_logger = logging.getLogger("griffe")
-    handler = _WarningCollector()
-    griffe_logger.addHandler(handler)
-    try:
-        findings = _load_and_check_packages(src_root, file_set, handler)
-    finally:
-        griffe_logger.removeHandler(handler)
-
-    return findings
+    if targeted:
+        if tree is None:
+            tree = _ModuleTree(src_root)
+        findings: list[Finding] = []
+        for file_path in sorted(file_set):
+            findings.extend(tree.check(file_path))
+        return findings
+    if jobs > 1:
+        names = [child.name for child in _package_dirs(src_root, file_set)]
+        if len(names) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(names))) as executor:
+                results = executor.map(
+                    _check_package_isolated,
+                    names,
+                    repeat(src_root),
+                    repeat(file_set),
+                )
+                return [finding for chunk in results for finding in chunk]
+    with _capture_warnings() as handler:
+        return _load_and_check_packages(src_root, file_set, handler)
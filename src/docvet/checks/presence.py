@@ -157,6 +157,9 @@ def check_presence(
     source: str,
     file_path: str,
     config: PresenceConfig,
+    *,
+    tree: ast.Module | None = None,
+    symbols: list[Symbol] | None = None,
 ) -> tuple[list[Finding], PresenceStats]:
     """Detect missing and misplaced docstrings.
 
@@ -175,6 +178,11 @@ def check_presence(
         source: Raw Python source text.
         file_path: Relative file path used in Finding construction.
         config: Presence configuration controlling ignore flags.
+        tree: Pre-parsed AST for *source*.  Parsed from *source* when
+            not provided, so callers that already hold a tree avoid a
+            second parse.
+        symbols: Pre-extracted symbols for *tree*.  Extracted from the
+            tree when not provided.
 
     Returns:
         A tuple of ``(findings, stats)`` where *findings* is a list of
@@ -182,16 +190,18 @@ def check_presence(
         undocumented symbols and *stats* is a :class:`PresenceStats`
         with coverage counts.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return [], PresenceStats(documented=0, total=0)
+    if tree is None:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return [], PresenceStats(documented=0, total=0)
 
     # Empty files have no symbols worth checking.
     if not tree.body:
         return [], PresenceStats(documented=0, total=0)
 
-    symbols = get_documented_symbols(tree)
+    if symbols is None:
+        symbols = get_documented_symbols(tree)
 
     # Overload stubs are not documentable — documentation belongs on the
     # implementation function.  Exclude them from missing-docstring checks
@@ -2,10 +2,17 @@
 
 Defines the ``typer.Typer`` app with subcommands for each check layer
 (``presence``, ``enrichment``, ``freshness``, ``coverage``, ``griffe``,
-``lsp``, ``mcp``), the ``fix`` scaffolding command, the combined
-``check`` entry point, and the ``config`` introspection command.  Check runners are in ``_runners``
-and the output pipeline is in ``_output``.  This module retains enums,
-discovery helpers, the app callback, and all typer subcommands.
+``lsp``, ``mcp``), the ``serve`` daemon, the ``fix`` scaffolding command, the combined
+``check`` entry point, and the ``config`` introspection command.  The
+app's root group records console-script arguments so the callback can
+forward check subcommands to a running daemon.  Check runners are in ``_runners``,
+the output pipeline is in ``_output``, and the ``check --watch`` loop is
+in ``_watch``.  This module retains enums,
+shared option aliases (including ``--jobs`` for pooled per-file checks
+and ``--stream`` for per-file output), discovery helpers, the app
+callback, and all typer subcommands.  Check functions other than
+presence are re-exported lazily, so each subcommand imports only the
+check modules it runs.
 
 Examples:
     Run all checks on changed files:
@@ -39,6 +46,7 @@ from __future__ import annotations
 
 import ast  # noqa: F401 – re-exported for test mocks
 import enum
+import importlib
 import importlib.metadata
 import importlib.util
 import os  # noqa: F401 – re-exported for test mocks
@@ -46,27 +54,15 @@ import subprocess  # noqa: F401 – re-exported for test mocks
 import sys
 import time
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
+from typer.core import TyperGroup
 
 from docvet.ast_utils import (
     get_documented_symbols,  # noqa: F401 – re-exported for test mocks
 )
 from docvet.checks import Finding
-from docvet.checks.coverage import (
-    check_coverage,  # noqa: F401 – re-exported for test mocks
-)
-from docvet.checks.enrichment import (
-    check_enrichment,  # noqa: F401 – re-exported for test mocks
-)
-from docvet.checks.freshness import (  # noqa: F401
-    check_freshness_diff,
-    check_freshness_drift,
-)
-from docvet.checks.griffe_compat import (
-    check_griffe_compat,  # noqa: F401 – re-exported for test mocks
-)
 from docvet.checks.presence import PresenceStats, check_presence  # noqa: F401
 from docvet.config import (
     DocvetConfig,
@@ -76,21 +72,74 @@ from docvet.config import (
     load_config,
 )
 from docvet.discovery import DiscoveryMode, discover_files
+from docvet.profiling import RunProfile, profile_scope, timed
 from docvet.reporting import (
     CheckQuality,  # noqa: F401 – re-exported for test mocks
     compute_quality,  # noqa: F401 – re-exported for test mocks
     determine_exit_code,  # noqa: F401 – re-exported for test mocks
     format_json,  # noqa: F401 – re-exported for test mocks
+    format_jsonl,  # noqa: F401 – re-exported for test mocks
+    format_jsonl_finding,  # noqa: F401 – re-exported for test mocks
+    format_jsonl_summary,  # noqa: F401 – re-exported for test mocks
     format_markdown,  # noqa: F401 – re-exported for test mocks
     format_quality_summary,  # noqa: F401 – re-exported for test mocks
     format_summary,
     format_terminal,  # noqa: F401 – re-exported for test mocks
+    format_terminal_footer,  # noqa: F401 – re-exported for test mocks
+    format_terminal_group,  # noqa: F401 – re-exported for test mocks
     format_verbose_header,  # noqa: F401 – re-exported for test mocks
     write_report,  # noqa: F401 – re-exported for test mocks
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from docvet.checks.coverage import check_coverage  # noqa: F401
+    from docvet.checks.enrichment import check_enrichment  # noqa: F401
+    from docvet.checks.freshness import (  # noqa: F401
+        check_freshness_diff,
+        check_freshness_drift,
+    )
+    from docvet.checks.griffe_compat import (
+        _ModuleTree,
+        check_griffe_compat,  # noqa: F401
+    )
+
 __all__: list[str] = []
 
+# Check entry points re-exported for test mocks but imported on first
+# access (see ``__getattr__``), so each subcommand only loads the check
+# modules it runs -- ``docvet presence`` never imports griffe.
+_LAZY_CHECKS: dict[str, str] = {
+    "check_coverage": "docvet.checks.coverage",
+    "check_enrichment": "docvet.checks.enrichment",
+    "check_freshness_diff": "docvet.checks.freshness",
+    "check_freshness_drift": "docvet.checks.freshness",
+    "check_griffe_compat": "docvet.checks.griffe_compat",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a lazily re-exported check function on first access.
+
+    Args:
+        name: The attribute being looked up on the package.
+
+    Returns:
+        The check function, cached on the package for later lookups.
+
+    Raises:
+        AttributeError: If *name* is not a lazily re-exported check.
+    """
+    module_name = _LAZY_CHECKS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
@@ -117,11 +166,18 @@ class OutputFormat(enum.StrEnum):
         ```python
         fmt = OutputFormat.JSON  # "json"
         ```
+
+        Select JSON Lines output for streaming ingestion:
+
+        ```python
+        fmt = OutputFormat.JSONL  # "jsonl"
+        ```
     """
 
     TERMINAL = "terminal"
     MARKDOWN = "markdown"
     JSON = "json"
+    JSONL = "jsonl"
 
 
 class FreshnessMode(enum.StrEnum):
@@ -164,12 +220,77 @@ FilesArgument = Annotated[
 ConfigOption = Annotated[
     Path | None, typer.Option("--config", help="Path to pyproject.toml.")
 ]
+NoCacheOption = Annotated[
+    bool,
+    typer.Option("--no-cache", help="Analyse every file, ignoring the result cache."),
+]
+JobsOption = Annotated[
+    str | None,
+    typer.Option(
+        "--jobs",
+        "-j",
+        help="Worker processes for per-file checks and griffe package loading,"
+        " or 'auto' for one per CPU.",
+    ),
+]
+
+StreamOption = Annotated[
+    bool,
+    typer.Option(
+        "--stream",
+        help="Write each file's findings as soon as it is checked"
+        " (terminal and jsonl formats).",
+    ),
+]
 
 # ---------------------------------------------------------------------------
 # App
 # ---------------------------------------------------------------------------
 
-app = typer.Typer(help="Comprehensive docstring quality vetting.")
+
+class _ConsoleGroup(TyperGroup):
+    """Root command group that records console arguments for forwarding.
+
+    A console-script run (no explicit *args*) stores ``sys.argv[1:]`` in
+    ``ctx.obj["console_argv"]``, so the app callback can hand check
+    subcommands to a running ``docvet serve`` daemon.  Test runners and
+    the daemon itself pass their arguments explicitly and never forward.
+
+    Examples:
+        ```python
+        app = typer.Typer(cls=_ConsoleGroup)
+        ```
+    """
+
+    def main(
+        self,
+        args: Sequence[str] | None = None,
+        prog_name: str | None = None,
+        complete_var: str | None = None,
+        standalone_mode: bool = True,
+        **extra: Any,
+    ) -> Any:
+        """Run the group, recording ``sys.argv`` for console invocations.
+
+        Args:
+            args: Arguments to parse, or *None* for ``sys.argv[1:]``.
+            prog_name: Program name shown in usage messages.
+            complete_var: Environment variable that triggers completion.
+            standalone_mode: Handle exceptions and exit like a script.
+
+        Other Parameters:
+            **extra: Further ``click.Command.main`` options, such as
+                ``obj``.
+
+        Returns:
+            The command result when not in standalone mode.
+        """
+        if args is None and "obj" not in extra:
+            extra["obj"] = {"console_argv": sys.argv[1:]}
+        return super().main(args, prog_name, complete_var, standalone_mode, **extra)
+
+
+app = typer.Typer(cls=_ConsoleGroup, help="Comprehensive docstring quality vetting.")
 
 
 # ---------------------------------------------------------------------------
@@ -235,6 +356,35 @@ def _resolve_discovery_mode(
     return DiscoveryMode.DIFF
 
 
+def _parse_jobs_option(value: str | None, default: int | str) -> int | str:
+    """Validate the ``--jobs`` option, falling back to the config value.
+
+    Args:
+        value: Raw ``--jobs`` value, or *None* when not passed.
+        default: The ``jobs`` value from configuration.
+
+    Returns:
+        A positive worker count or ``"auto"``.
+
+    Raises:
+        typer.BadParameter: If *value* is neither ``"auto"`` nor a
+            positive integer.
+    """
+    if value is None:
+        return default
+    if value == "auto":
+        return value
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        raise typer.BadParameter(
+            f"--jobs must be a positive integer or 'auto', got {value!r}."
+        )
+    return jobs
+
+
 def _discover_and_handle(
     ctx: typer.Context,
     mode: DiscoveryMode,
@@ -275,22 +425,74 @@ def _discover_and_handle(
     return discovered
 
 
+def _parsed_file_store(ctx: typer.Context) -> _ParsedFileStore:
+    """Create the run's parsed-file store.
+
+    Under the ``docvet serve`` daemon (``ctx.obj["resident"]``) the
+    store is backed by the daemon's resident files, so unchanged files
+    are neither re-read nor re-parsed between invocations.
+
+    Args:
+        ctx: Typer context, possibly carrying ``resident`` state.
+
+    Returns:
+        A store for this run.
+    """
+    resident = ctx.obj.get("resident")
+    return _ParsedFileStore(resident.files if resident is not None else None)
+
+
+def _griffe_tree(
+    ctx: typer.Context, config: DocvetConfig, *, targeted: bool
+) -> _ModuleTree | None:
+    """Return the daemon's resident griffe tree for a targeted run.
+
+    Args:
+        ctx: Typer context, possibly carrying ``resident`` state.
+        config: Loaded docvet configuration.
+        targeted: Whether griffe visits only the discovered modules.
+
+    Returns:
+        The resident tree for the configured source root, or *None*
+        outside the daemon and for whole-package runs.
+    """
+    resident = ctx.obj.get("resident")
+    if resident is None or not targeted:
+        return None
+    return resident.griffe_tree(config.project_root / config.src_root)
+
+
+from ._cache import _CACHE_DIR, _ResultCache  # noqa: E402
 from ._output import (  # noqa: E402
+    _FindingStream,  # noqa: F401 – re-exported for tests
+    _finish_stream,
     _format_coverage_line,  # noqa: F401 – re-exported for tests
+    _open_stream,
     _output_and_exit,
     _resolve_format,  # noqa: F401 – re-exported for tests
 )
 from ._runners import (  # noqa: E402
-    _get_git_blame,  # noqa: F401 – re-exported for tests
-    _get_git_diff,  # noqa: F401 – re-exported for tests
+    _check_file,  # noqa: F401 – re-exported for tests
+    _FileResults,
+    _finish_cache,
+    _get_git_blame_keys,  # noqa: F401 – re-exported for tests
+    _get_git_blame_timestamps,  # noqa: F401 – re-exported for tests
+    _get_git_diffs,  # noqa: F401 – re-exported for tests
+    _ParsedFileStore,
+    _resolve_jobs,
     _run_coverage,
     _run_enrichment,
     _run_fix,
     _run_freshness,
     _run_griffe,
+    _run_parallel,
     _run_presence,
+    _run_streaming,
+    _write_blame_latency,
     _write_timing,
 )
+from ._suppression import SuppressionMap  # noqa: E402
+from ._watch import _run_watch  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # App callback (global options)
@@ -360,13 +562,17 @@ def main(
         verbose: Enable verbose output.
         quiet: Suppress non-finding output on stderr.
         summary: Print quality percentages after findings.
-        fmt: Output format (terminal, markdown, or json).
+        fmt: Output format (terminal, markdown, json, or jsonl).
         output: Optional file path for report output.
         config: Explicit path to a ``pyproject.toml``.
         version: Show version and exit.
 
+    Console-script runs of a check subcommand are first offered to a
+    running ``docvet serve`` daemon for the project.
+
     Raises:
         typer.BadParameter: If the specified config file does not exist.
+        typer.Exit: With the exit code of a command the daemon ran.
     """
     ctx.ensure_object(dict)
     if ctx.resilient_parsing:
@@ -383,8 +589,20 @@ def main(
         typer.echo(ctx.get_help())
         return
 
+    console_argv = ctx.obj.pop("console_argv", None)
+    if console_argv is not None:
+        from docvet.daemon import forward
+
+        code = forward(console_argv)
+        if code is not None:
+            raise typer.Exit(code)
+
+    resident = ctx.obj.get("resident")
     try:
-        ctx.obj["docvet_config"] = load_config(config)
+        if resident is not None:
+            ctx.obj["docvet_config"] = resident.load_config(config)
+        else:
+            ctx.obj["docvet_config"] = load_config(config)
     except FileNotFoundError:
         raise typer.BadParameter(f"Config file not found: {config}") from None
 
@@ -413,6 +631,32 @@ def check(
     staged: StagedOption = False,
     all_files: AllOption = False,
     files: FilesOption = None,
+    jobs: JobsOption = None,
+    no_cache: NoCacheOption = False,
+    stream: StreamOption = False,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            help="Keep running and re-check files as they change.",
+        ),
+    ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Report time and call counts per phase, check, enrichment"
+            " rule, and slowest file.",
+        ),
+    ] = False,
+    profile_top: Annotated[
+        int,
+        typer.Option(
+            "--profile-top",
+            min=1,
+            help="Number of slowest files listed by --profile.",
+        ),
+    ] = 10,
 ) -> None:
     """Run all enabled checks.
 
@@ -425,11 +669,49 @@ def check(
     is only included in ``check_counts`` when the ``griffe`` package is
     importable and the docstring style is compatible. Coverage percentage is derived
     from :attr:`PresenceStats.percentage`. Displays a progress bar on
-    stderr when connected to a TTY. Uses three-tier verbosity:
+    stderr when connected to a TTY. The per-file runners share one
+    :class:`_ParsedFileStore`, so each file is read and parsed once per
+    run regardless of how many checks consume it. Uses three-tier verbosity:
     ``--quiet`` suppresses all non-finding stderr output, default shows
     the summary line with coverage percentage, ``--verbose`` adds
     per-check timing, file discovery count, and detailed coverage status.
 
+    With ``--jobs`` (or the ``jobs`` config key) above one, presence,
+    enrichment, and freshness run together in a process pool via
+    ``_run_parallel``; results are merged in discovery order so the
+    report is identical to a serial run, and verbose timing reports the
+    pooled phase as a single line. Whole-package griffe loading (``--all``)
+    uses the same worker count, one package per worker.
+
+    Presence and enrichment results are cached per file in
+    ``.docvet_cache/`` under the project root (see :class:`_ResultCache`),
+    so warm runs only re-analyse changed files. ``--no-cache`` bypasses
+    the cache; otherwise it is pruned to ``cache-max-size`` after the
+    run and ``--verbose`` reports its hit and miss counts.
+
+    With ``--stream``, per-file checks run through ``_run_streaming``
+    and each file's findings are written (after inline suppressions)
+    as soon as the file is done; coverage and griffe findings follow
+    once those checks finish.  Findings are not accumulated: the
+    summary line, ``--summary`` quality, and exit code come from the
+    stream's running tally, and the progress bar is hidden.
+
+    With ``--watch``, ``_run_watch`` checks once and then keeps every
+    file's results in memory, re-analysing only files whose mtime or
+    size changed and reporting the updated findings after each change
+    until interrupted.
+
+    With ``--profile``, the run records cumulative time and call counts
+    in a :class:`~docvet.profiling.RunProfile`: per phase (read, parse,
+    symbol extraction, section parsing, rule dispatch, reporting), per
+    check, per enrichment rule, and for the ``--profile-top`` slowest
+    files.  Per-file checks run serially in-process and the result
+    cache is bypassed, as with ``--no-cache``, so every file is analysed
+    and every rule call is attributed.  The profile is written as a table on stderr after
+    the report and, for JSON formats, added to the output as a
+    ``profile`` object (without the reporting phase, which is still in
+    progress when the output is written).
+
     Args:
         ctx: Typer invocation context.
         files_pos: Positional file paths to check.
@@ -438,6 +720,18 @@ def check(
         staged: Run on staged files.
         all_files: Run on entire codebase.
         files: Run on specific files via ``--files``.
+        jobs: Worker-process count or ``"auto"``; overrides the
+            ``jobs`` config key.
+        no_cache: Skip reading and writing the result cache.
+        stream: Write findings per file as they become available.
+        watch: Re-check changed files until interrupted.
+        profile: Record and report per-phase, per-check, per-rule, and
+            per-file timings.
+        profile_top: Number of slowest files in the profile.
+
+    Raises:
+        typer.BadParameter: If ``--watch`` is combined with ``--stream``,
+            or ``--profile`` with either of them.
     """
     files = _merge_file_args(files_pos, files)
     discovery_mode = _resolve_discovery_mode(staged, all_files, files)
@@ -445,121 +739,249 @@ def check(
     quiet = quiet or ctx.obj.get("quiet", False)
     ctx.obj["verbose"] = verbose
     ctx.obj["quiet"] = quiet
-    discovered = _discover_and_handle(ctx, discovery_mode, files)
-    config = ctx.obj["docvet_config"]
-    show_progress = sys.stderr.isatty()
-    file_count = len(discovered)
-
-    total_start = time.perf_counter()
-
-    # Presence (runs first — skip if disabled)
-    presence_findings: list[Finding] = []
-    agg_stats: PresenceStats | None = None
-    if config.presence.enabled:
-        start = time.perf_counter()
-        presence_findings, agg_stats = _run_presence(
-            discovered, config, show_progress=show_progress
+    if profile and (watch or stream):
+        raise typer.BadParameter("--profile cannot be used with --watch or --stream.")
+    if watch:
+        if stream:
+            raise typer.BadParameter("Use only one of: --watch or --stream.")
+        config = ctx.obj["docvet_config"]
+        _run_watch(
+            ctx,
+            config,
+            discovery_mode,
+            files,
+            jobs=_resolve_jobs(_parse_jobs_option(jobs, config.jobs)),
+            cache=None
+            if no_cache
+            else _ResultCache(config.project_root / _CACHE_DIR, config),
+        )
+    run_profile = RunProfile(top=profile_top) if profile else None
+    ctx.obj["profile"] = run_profile
+    with profile_scope(run_profile):
+        discovered = _discover_and_handle(ctx, discovery_mode, files)
+        config = ctx.obj["docvet_config"]
+        finding_stream = _open_stream(ctx) if stream else None
+        show_progress = sys.stderr.isatty() and finding_stream is None
+        file_count = len(discovered)
+        store = _parsed_file_store(ctx)
+        cache = (
+            None
+            if no_cache or run_profile is not None
+            else _ResultCache(config.project_root / _CACHE_DIR, config)
         )
-        elapsed = time.perf_counter() - start
-        _write_timing("presence", file_count, elapsed, verbose=verbose, quiet=quiet)
 
-    start = time.perf_counter()
-    enrichment_findings, enrichment_count = _run_enrichment(
-        discovered, config, show_progress=show_progress
-    )
-    elapsed = time.perf_counter() - start
-    _write_timing("enrichment", file_count, elapsed, verbose=verbose, quiet=quiet)
+        job_count = (
+            1
+            if run_profile is not None
+            else _resolve_jobs(_parse_jobs_option(jobs, config.jobs))
+        )
+        worker_count = min(job_count, file_count)
+
+        total_start = time.perf_counter()
+
+        presence_findings: list[Finding] = []
+        agg_stats: PresenceStats | None = None
+        suppressions: dict[str, SuppressionMap] | None = None
+        if finding_stream is not None or worker_count > 1:
+            start = time.perf_counter()
+            if finding_stream is not None:
+                results: _FileResults = _run_streaming(
+                    discovered,
+                    config,
+                    finding_stream,
+                    jobs=max(worker_count, 1),
+                    presence=config.presence.enabled,
+                    discovery_mode=discovery_mode,
+                    cache=cache,
+                )
+            else:
+                results = _run_parallel(
+                    discovered,
+                    config,
+                    jobs=worker_count,
+                    presence=config.presence.enabled,
+                    discovery_mode=discovery_mode,
+                    show_progress=show_progress,
+                    cache=cache,
+                )
+            elapsed = time.perf_counter() - start
+            # In-process checks already counted hits and misses on *cache*.
+            if cache is not None and worker_count > 1:
+                cache.hits += results.cache_hits
+                cache.misses += results.cache_misses
+            _write_timing(
+                f"per-file checks ({max(worker_count, 1)} jobs)",
+                file_count,
+                elapsed,
+                verbose=verbose,
+                quiet=quiet,
+            )
+            if config.presence.enabled:
+                presence_findings = results.presence
+                agg_stats = results.presence_stats
+            enrichment_findings = results.enrichment
+            freshness_findings = results.freshness
+            enrichment_count = freshness_count = results.symbol_count
+            suppressions = results.suppressions
+        else:
+            # Presence (runs first — skip if disabled)
+            if config.presence.enabled:
+                start = time.perf_counter()
+                presence_findings, agg_stats = _run_presence(
+                    discovered,
+                    config,
+                    show_progress=show_progress,
+                    store=store,
+                    cache=cache,
+                )
+                elapsed = time.perf_counter() - start
+                _write_timing(
+                    "presence", file_count, elapsed, verbose=verbose, quiet=quiet
+                )
 
-    start = time.perf_counter()
-    freshness_findings, freshness_count = _run_freshness(
-        discovered, config, discovery_mode=discovery_mode, show_progress=show_progress
-    )
-    elapsed = time.perf_counter() - start
-    _write_timing("freshness", file_count, elapsed, verbose=verbose, quiet=quiet)
+            start = time.perf_counter()
+            enrichment_findings, enrichment_count = _run_enrichment(
+                discovered,
+                config,
+                show_progress=show_progress,
+                store=store,
+                cache=cache,
+            )
+            elapsed = time.perf_counter() - start
+            _write_timing(
+                "enrichment", file_count, elapsed, verbose=verbose, quiet=quiet
+            )
 
-    start = time.perf_counter()
-    coverage_findings, coverage_count = _run_coverage(discovered, config)
-    elapsed = time.perf_counter() - start
-    _write_timing("coverage", file_count, elapsed, verbose=verbose, quiet=quiet)
-
-    griffe_installed = importlib.util.find_spec("griffe") is not None
-    griffe_skipped_style = config.docstring_style == "sphinx"
-    if griffe_skipped_style:
-        griffe_findings: list[Finding] = []
-        griffe_count = 0
-        if verbose:
-            sys.stderr.write(
-                "  griffe: skipped (incompatible with sphinx docstring style)\n"
+            start = time.perf_counter()
+            freshness_findings, freshness_count = _run_freshness(
+                discovered,
+                config,
+                discovery_mode=discovery_mode,
+                show_progress=show_progress,
+                store=store,
+                cache=cache,
             )
-    else:
+            elapsed = time.perf_counter() - start
+            _write_timing(
+                "freshness", file_count, elapsed, verbose=verbose, quiet=quiet
+            )
+
+        _finish_cache(cache, verbose=verbose, quiet=quiet)
+
         start = time.perf_counter()
-        griffe_findings, griffe_count = _run_griffe(
-            discovered, config, verbose=verbose, quiet=quiet
-        )
+        coverage_findings, coverage_count = _run_coverage(discovered, config)
         elapsed = time.perf_counter() - start
-        _write_timing(
-            "griffe",
-            file_count,
-            elapsed,
-            verbose=verbose,
-            quiet=quiet,
-            enabled=griffe_installed,
+        _write_timing("coverage", file_count, elapsed, verbose=verbose, quiet=quiet)
+        if finding_stream is not None:
+            finding_stream.emit({"coverage": coverage_findings})
+
+        griffe_installed = importlib.util.find_spec("griffe") is not None
+        griffe_skipped_style = config.docstring_style == "sphinx"
+        if griffe_skipped_style:
+            griffe_findings: list[Finding] = []
+            griffe_count = 0
+            if verbose:
+                sys.stderr.write(
+                    "  griffe: skipped (incompatible with sphinx docstring style)\n"
+                )
+        else:
+            start = time.perf_counter()
+            targeted = discovery_mode is not DiscoveryMode.ALL
+            griffe_findings, griffe_count = _run_griffe(
+                discovered,
+                config,
+                verbose=verbose,
+                quiet=quiet,
+                targeted=targeted,
+                jobs=job_count,
+                tree=_griffe_tree(ctx, config, targeted=targeted),
+            )
+            elapsed = time.perf_counter() - start
+            _write_timing(
+                "griffe",
+                file_count,
+                elapsed,
+                verbose=verbose,
+                quiet=quiet,
+                enabled=griffe_installed,
+            )
+        if finding_stream is not None:
+            finding_stream.emit({"griffe": griffe_findings})
+
+        total_elapsed = time.perf_counter() - total_start
+
+        checks: list[str] = []
+        if config.presence.enabled:
+            checks.append("presence")
+        checks.extend(["enrichment", "freshness", "coverage"])
+        if griffe_installed and not griffe_skipped_style:
+            checks.append("griffe")
+
+        coverage_pct: float | None = None
+        if agg_stats is not None:
+            coverage_pct = agg_stats.percentage
+
+        all_findings_flat = (
+            presence_findings
+            + enrichment_findings
+            + freshness_findings
+            + coverage_findings
+            + griffe_findings
         )
+        if not quiet:
+            sys.stderr.write(
+                format_summary(
+                    file_count,
+                    checks,
+                    all_findings_flat
+                    if finding_stream is None
+                    else finding_stream.tally,
+                    total_elapsed,
+                    coverage_pct=coverage_pct,
+                )
+            )
 
-    total_elapsed = time.perf_counter() - total_start
-
-    checks: list[str] = []
-    if config.presence.enabled:
-        checks.append("presence")
-    checks.extend(["enrichment", "freshness", "coverage"])
-    if griffe_installed and not griffe_skipped_style:
-        checks.append("griffe")
-
-    coverage_pct: float | None = None
-    if agg_stats is not None:
-        coverage_pct = agg_stats.percentage
-
-    all_findings_flat = (
-        presence_findings
-        + enrichment_findings
-        + freshness_findings
-        + coverage_findings
-        + griffe_findings
-    )
-    if not quiet:
-        sys.stderr.write(
-            format_summary(
+        findings_by_check = {
+            "presence": presence_findings,
+            "enrichment": enrichment_findings,
+            "freshness": freshness_findings,
+            "coverage": coverage_findings,
+            "griffe": griffe_findings,
+        }
+        check_counts: dict[str, int] = {
+            "enrichment": enrichment_count,
+            "freshness": freshness_count,
+            "coverage": coverage_count,
+        }
+        if griffe_installed and not griffe_skipped_style:
+            check_counts["griffe"] = griffe_count
+        if suppressions is None:
+            suppressions = store.suppressions(findings_by_check)
+        if finding_stream is not None:
+            _finish_stream(
+                ctx,
+                finding_stream,
+                config,
                 file_count,
                 checks,
-                all_findings_flat,
-                total_elapsed,
-                coverage_pct=coverage_pct,
+                presence_stats=agg_stats,
+                check_counts=check_counts,
             )
-        )
-
-    findings_by_check = {
-        "presence": presence_findings,
-        "enrichment": enrichment_findings,
-        "freshness": freshness_findings,
-        "coverage": coverage_findings,
-        "griffe": griffe_findings,
-    }
-    check_counts: dict[str, int] = {
-        "enrichment": enrichment_count,
-        "freshness": freshness_count,
-        "coverage": coverage_count,
-    }
-    if griffe_installed and not griffe_skipped_style:
-        check_counts["griffe"] = griffe_count
-    _output_and_exit(
-        ctx,
-        findings_by_check,
-        config,
-        file_count,
-        checks,
-        presence_stats=agg_stats,
-        check_counts=check_counts,
-    )
+        try:
+            with timed("phases", "report"):
+                _output_and_exit(
+                    ctx,
+                    findings_by_check,
+                    config,
+                    file_count,
+                    checks,
+                    presence_stats=agg_stats,
+                    check_counts=check_counts,
+                    suppressions=suppressions,
+                )
+        finally:
+            if run_profile is not None:
+                sys.stderr.write(run_profile.format_table())
 
 
 @app.command()
@@ -608,9 +1030,10 @@ def presence(
     discovered = _discover_and_handle(ctx, discovery_mode, files)
     config = ctx.obj["docvet_config"]
 
+    store = _parsed_file_store(ctx)
     start = time.perf_counter()
     findings, agg_stats = _run_presence(
-        discovered, config, show_progress=sys.stderr.isatty()
+        discovered, config, show_progress=sys.stderr.isatty(), store=store
     )
     elapsed = time.perf_counter() - start
     coverage_pct = agg_stats.percentage
@@ -625,13 +1048,15 @@ def presence(
             )
         )
 
+    findings_by_check = {"presence": findings}
     _output_and_exit(
         ctx,
-        {"presence": findings},
+        findings_by_check,
         config,
         len(discovered),
         ["presence"],
         presence_stats=agg_stats,
+        suppressions=store.suppressions(findings_by_check),
     )
 
 
@@ -681,9 +1106,10 @@ def enrichment(
     discovered = _discover_and_handle(ctx, discovery_mode, files)
     config = ctx.obj["docvet_config"]
 
+    store = _parsed_file_store(ctx)
     start = time.perf_counter()
     findings, symbol_count = _run_enrichment(
-        discovered, config, show_progress=sys.stderr.isatty()
+        discovered, config, show_progress=sys.stderr.isatty(), store=store
     )
     elapsed = time.perf_counter() - start
     if not quiet:
@@ -691,13 +1117,15 @@ def enrichment(
             format_summary(len(discovered), ["enrichment"], findings, elapsed)
         )
 
+    findings_by_check = {"enrichment": findings}
     _output_and_exit(
         ctx,
-        {"enrichment": findings},
+        findings_by_check,
         config,
         len(discovered),
         ["enrichment"],
         check_counts={"enrichment": symbol_count},
+        suppressions=store.suppressions(findings_by_check),
     )
 
 
@@ -723,14 +1151,20 @@ def freshness(
     mode: Annotated[
         FreshnessMode, typer.Option("--mode", help="Freshness check strategy.")
     ] = FreshnessMode.DIFF,
+    no_cache: NoCacheOption = False,
 ) -> None:
     """Detect stale docstrings.
 
     Displays a progress bar on stderr when connected to a TTY.
     Uses three-tier verbosity: ``--quiet`` suppresses all non-finding
     stderr output, default shows the summary line, ``--verbose`` adds
-    file discovery count. Passes symbol count to ``_output_and_exit``
-    for ``--summary`` quality percentage computation.
+    file discovery count, cache hit and miss counts, and, in drift
+    mode, a per-file blame latency breakdown. Passes symbol count to
+    ``_output_and_exit`` for ``--summary`` quality percentage
+    computation.  Drift mode caches blame timestamps in
+    ``.docvet_cache/`` keyed by the file's git blob SHA and the last
+    commit that touched it, so repeated scans only re-blame files whose
+    committed content or history changed.
 
     Args:
         ctx: Typer invocation context.
@@ -741,6 +1175,7 @@ def freshness(
         all_files: Run on entire codebase.
         files: Run on specific files via ``--files``.
         mode: Freshness strategy (diff or drift).
+        no_cache: Skip reading and writing the result cache.
     """
     files = _merge_file_args(files_pos, files)
     discovery_mode = _resolve_discovery_mode(staged, all_files, files)
@@ -751,6 +1186,9 @@ def freshness(
     discovered = _discover_and_handle(ctx, discovery_mode, files)
     config = ctx.obj["docvet_config"]
 
+    cache = None if no_cache else _ResultCache(config.project_root / _CACHE_DIR, config)
+    blame_latencies: dict[Path, tuple[float, float]] = {}
+    store = _parsed_file_store(ctx)
     start = time.perf_counter()
     findings, symbol_count = _run_freshness(
         discovered,
@@ -758,20 +1196,27 @@ def freshness(
         freshness_mode=mode,
         discovery_mode=discovery_mode,
         show_progress=sys.stderr.isatty(),
+        store=store,
+        cache=cache,
+        blame_latencies=blame_latencies,
     )
     elapsed = time.perf_counter() - start
+    _write_blame_latency(blame_latencies, verbose=verbose, quiet=quiet)
+    _finish_cache(cache, verbose=verbose, quiet=quiet)
     if not quiet:
         sys.stderr.write(
             format_summary(len(discovered), ["freshness"], findings, elapsed)
         )
 
+    findings_by_check = {"freshness": findings}
     _output_and_exit(
         ctx,
-        {"freshness": findings},
+        findings_by_check,
         config,
         len(discovered),
         ["freshness"],
         check_counts={"freshness": symbol_count},
+        suppressions=store.suppressions(findings_by_check),
     )
 
 
@@ -857,6 +1302,7 @@ def griffe(
     staged: StagedOption = False,
     all_files: AllOption = False,
     files: FilesOption = None,
+    jobs: JobsOption = None,
 ) -> None:
     """Check mkdocs rendering compatibility via griffe.
 
@@ -865,7 +1311,8 @@ def griffe(
     file discovery count. Passes file count to ``_output_and_exit``
     for ``--summary`` quality percentage computation. Auto-skips with
     exit code 0 when ``docstring-style`` is ``"sphinx"`` (griffe's
-    Google parser is incompatible with RST docstrings).
+    Google parser is incompatible with RST docstrings). With ``--all``
+    and ``--jobs`` above one, packages load in parallel worker processes.
 
     Args:
         ctx: Typer invocation context.
@@ -875,6 +1322,8 @@ def griffe(
         staged: Run on staged files.
         all_files: Run on entire codebase.
         files: Run on specific files via ``--files``.
+        jobs: Worker-process count or ``"auto"``; overrides the
+            ``jobs`` config key.
 
     Raises:
         typer.Exit: When ``docstring-style`` is ``"sphinx"`` (exit 0).
@@ -896,8 +1345,15 @@ def griffe(
         raise typer.Exit(0)
 
     start = time.perf_counter()
+    targeted = discovery_mode is not DiscoveryMode.ALL
     findings, griffe_file_count = _run_griffe(
-        discovered, config, verbose=verbose, quiet=quiet
+        discovered,
+        config,
+        verbose=verbose,
+        quiet=quiet,
+        targeted=targeted,
+        jobs=_resolve_jobs(_parse_jobs_option(jobs, config.jobs)),
+        tree=_griffe_tree(ctx, config, targeted=targeted),
     )
     elapsed = time.perf_counter() - start
     if not quiet:
@@ -959,6 +1415,58 @@ def mcp() -> None:
     mcp_start_server()
 
 
+@app.command()
+def serve(
+    ctx: typer.Context,
+    stop: Annotated[
+        bool, typer.Option("--stop", help="Stop the running daemon and exit.")
+    ] = False,
+    idle_timeout: Annotated[
+        float | None,
+        typer.Option(
+            "--idle-timeout",
+            min=0,
+            help="Exit after this many seconds without a request.",
+        ),
+    ] = None,
+) -> None:
+    """Run a resident daemon that serves check commands for this project.
+
+    Keeps imports, configuration, parsed files, and griffe module trees
+    warm and listens on a per-project Unix socket.  While it runs,
+    ``docvet check``, ``presence``, ``enrichment``, ``freshness``,
+    ``coverage``, and ``griffe`` invocations in the project are
+    forwarded to it; without a daemon, or while it is busy with another
+    command, they run in-process as usual.  Forwarded commands still pay
+    for starting Python and importing the CLI; the daemon saves the
+    configuration loading, check imports, and file parsing after that.
+    Set ``DOCVET_NO_DAEMON=1`` to bypass a running daemon.
+
+    Args:
+        ctx: Typer invocation context.
+        stop: Stop the running daemon instead of starting one.
+        idle_timeout: Seconds without a request before the daemon exits,
+            or *None* to run until stopped.
+
+    Raises:
+        typer.Exit: If no daemon was running for ``--stop``, or a daemon
+            cannot be started.
+    """
+    from docvet.daemon import start_server, stop_server
+
+    project_root = ctx.obj["docvet_config"].project_root
+    if stop:
+        if not stop_server(project_root):
+            typer.echo("docvet: no daemon running for this project", err=True)
+            raise typer.Exit(code=1)
+        return
+    try:
+        start_server(project_root, idle_timeout=idle_timeout)
+    except (RuntimeError, OSError) as exc:
+        typer.echo(f"docvet: {exc}", err=True)
+        raise typer.Exit(code=1) from None
+
+
 @app.command()
 def fix(
     ctx: typer.Context,
@@ -0,0 +1,345 @@
+"""On-disk cache of per-file check results.
+
+Stores presence and enrichment results for each file under
+``.docvet_cache/results/`` in the project root so warm runs only
+re-analyse files whose content changed.  Entries are content-addressed:
+the key hashes the file path and source text together with a per-check
+fingerprint of the docvet version, ``docstring_style``, and the relevant
+config section, so upgrading docvet or editing ``[tool.docvet]``
+invalidates stale results automatically.  Drift-mode blame timestamps
+are stored the same way, keyed by the file's git blob SHA and last
+touching commit instead of its source text.  Entries are JSON, written
+atomically, and evicted least-recently-used first once the directory
+grows past the configured size limit.
+
+See Also:
+    [`docvet.cli._runners`][]: Runners that consult the cache.
+    [`docvet.config`][]: ``cache-max-size`` configuration key.
+
+Examples:
+    Look up enrichment results before analysing a file:
+
+    ```python
+    cache = _ResultCache(project_root / _CACHE_DIR, config)
+    cached = cache.get_enrichment(file_path, source)
+    if cached is None:
+        ...  # analyse, then cache.put_enrichment(...)
+    cache.prune()
+    ```
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import importlib.metadata
+import json
+import os
+from pathlib import Path
+
+from docvet.checks import Finding
+from docvet.checks.presence import PresenceStats
+from docvet.config import DocvetConfig
+
+_CACHE_DIR = ".docvet_cache"
+"""Cache directory name, created in the project root."""
+
+_MEGABYTE = 1024 * 1024
+
+
+def _fingerprint(*parts: object) -> str:
+    """Hash JSON-serialisable *parts* into a stable hex digest.
+
+    Sets among the values to fingerprint are serialised sorted.
+
+    Returns:
+        A SHA-256 hex digest of the canonical JSON encoding.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=sorted)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _encode_findings(findings: list[Finding]) -> list[dict[str, object]]:
+    """Convert findings to JSON-ready dicts.
+
+    Args:
+        findings: Findings to encode.
+
+    Returns:
+        One dict per finding with the six ``Finding`` fields.
+    """
+    return [dataclasses.asdict(f) for f in findings]
+
+
+def _decode_findings(raw: list[dict[str, object]]) -> list[Finding]:
+    """Rebuild findings from cached dicts.
+
+    Args:
+        raw: Dicts produced by :func:`_encode_findings`.
+
+    Returns:
+        The reconstructed findings.
+    """
+    return [Finding(**entry) for entry in raw]  # type: ignore[arg-type]
+
+
+class _ResultCache:
+    """Content-addressed on-disk cache of per-file check results.
+
+    Attributes:
+        root (Path): Cache directory (normally ``.docvet_cache``).
+        max_size (int): Size limit for stored results in bytes.
+        hits (int): Lookups served from the cache during this run.
+        misses (int): Lookups that required re-analysis.
+
+    Examples:
+        Cache presence results for one file:
+
+        ```python
+        cache = _ResultCache(root, config)
+        cache.put_presence(path, source, findings, stats)
+        cache.get_presence(path, source)  # -> (findings, stats)
+        ```
+    """
+
+    def __init__(self, root: Path, config: DocvetConfig) -> None:
+        """Prepare a cache for *config*; no files are touched yet.
+
+        Args:
+            root: Cache directory.
+            config: Loaded docvet configuration, fingerprinted so that
+                results never leak across config changes.
+        """
+        self.root = root
+        self.max_size = config.cache_max_size * _MEGABYTE
+        self.hits = 0
+        self.misses = 0
+        version = importlib.metadata.version("docvet")
+        style = config.docstring_style
+        self._fingerprints = {
+            "presence": _fingerprint(
+                version, style, dataclasses.asdict(config.presence)
+            ),
+            "enrichment": _fingerprint(
+                version, style, dataclasses.asdict(config.enrichment)
+            ),
+            "symbols": _fingerprint(version),
+            "blame": _fingerprint(version),
+        }
+
+    def _entry_path(self, kind: str, file_path: Path, source: str) -> Path:
+        """Return the entry file for one check result.
+
+        Args:
+            kind: Entry kind (``"presence"``, ``"enrichment"``,
+                ``"symbols"``, or ``"blame"``).
+            file_path: Path of the analysed file.
+            source: Source text of the analysed file (the blame key for
+                blame entries).
+
+        Returns:
+            Path of the JSON entry inside the results directory.
+        """
+        content_hash = hashlib.sha256(source.encode()).hexdigest()
+        key = _fingerprint(self._fingerprints[kind], kind, str(file_path), content_hash)
+        return self.root / "results" / f"{key}.json"
+
+    def _load(self, kind: str, file_path: Path, source: str) -> dict | None:
+        """Read an entry, counting the hit or miss.
+
+        A hit refreshes the entry's modification time, which serves as
+        the recency stamp for LRU eviction.  The refresh is best effort:
+        an entry read from a read-only cache still counts as a hit.
+
+        Args:
+            kind: Entry kind.
+            file_path: Path of the analysed file.
+            source: Source text of the analysed file.
+
+        Returns:
+            The decoded entry, or *None* on a miss or unreadable entry.
+        """
+        path = self._entry_path(kind, file_path, source)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        self.hits += 1
+        return entry
+
+    def _store(self, kind: str, file_path: Path, source: str, entry: dict) -> None:
+        """Write an entry atomically; failures are silently ignored.
+
+        Args:
+            kind: Entry kind.
+            file_path: Path of the analysed file.
+            source: Source text of the analysed file.
+            entry: JSON-serialisable payload.
+        """
+        path = self._entry_path(kind, file_path, source)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            if not self.root.is_dir():
+                self.root.mkdir(parents=True, exist_ok=True)
+                (self.root / ".gitignore").write_text("*\n", encoding="utf-8")
+            path.parent.mkdir(exist_ok=True)
+            tmp.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def get_presence(
+        self, file_path: Path, source: str
+    ) -> tuple[list[Finding], PresenceStats] | None:
+        """Return cached presence results for a file.
+
+        Args:
+            file_path: Path of the analysed file.
+            source: Current source text of the file.
+
+        Returns:
+            ``(findings, stats)``, or *None* on a miss.
+        """
+        entry = self._load("presence", file_path, source)
+        if entry is None:
+            return None
+        stats = PresenceStats(documented=entry["documented"], total=entry["total"])
+        return _decode_findings(entry["findings"]), stats
+
+    def put_presence(
+        self,
+        file_path: Path,
+        source: str,
+        findings: list[Finding],
+        stats: PresenceStats,
+    ) -> None:
+        """Store presence results for a file.
+
+        Args:
+            file_path: Path of the analysed file.
+            source: Source text the results were computed from.
+            findings: Presence findings.
+            stats: Per-file coverage counts.
+        """
+        entry = {
+            "findings": _encode_findings(findings),
+            "documented": stats.documented,
+            "total": stats.total,
+        }
+        self._store("presence", file_path, source, entry)
+
+    def get_enrichment(
+        self, file_path: Path, source: str
+    ) -> tuple[list[Finding], int] | None:
+        """Return cached enrichment results for a file.
+
+        Args:
+            file_path: Path of the analysed file.
+            source: Current source text of the file.
+
+        Returns:
+            ``(findings, symbol_count)``, or *None* on a miss.
+        """
+        entry = self._load("enrichment", file_path, source)
+        if entry is None:
+            return None
+        return _decode_findings(entry["findings"]), entry["symbol_count"]
+
+    def put_enrichment(
+        self,
+        file_path: Path,
+        source: str,
+        findings: list[Finding],
+        symbol_count: int,
+    ) -> None:
+        """Store enrichment results for a file.
+
+        Args:
+            file_path: Path of the analysed file.
+            source: Source text the results were computed from.
+            findings: Enrichment findings.
+            symbol_count: Documented symbols analysed in the file.
+        """
+        entry = {"findings": _encode_findings(findings), "symbol_count": symbol_count}
+        self._store("enrichment", file_path, source, entry)
+
+    def get_symbol_count(self, file_path: Path, source: str) -> int | None:
+        """Return the cached documented-symbol count for a file.
+
+        Lets freshness skip parsing files with an empty diff.
+
+        Args:
+            file_path: Path of the analysed file.
+            source: Current source text of the file.
+
+        Returns:
+            The symbol count, or *None* on a miss.
+        """
+        entry = self._load("symbols", file_path, source)
+        return None if entry is None else entry["count"]
+
+    def put_symbol_count(self, file_path: Path, source: str, count: int) -> None:
+        """Store the documented-symbol count for a file.
+
+        Args:
+            file_path: Path of the analysed file.
+            source: Source text the count was computed from.
+            count: Number of documented symbols.
+        """
+        self._store("symbols", file_path, source, {"count": count})
+
+    def get_blame(self, file_path: Path, blame_key: str) -> dict[int, int] | None:
+        """Return cached blame timestamps for a committed file.
+
+        Blame only changes when a file's history does, so entries are
+        keyed by a key describing that history (the blob SHA and the
+        last commit touching the file) rather than by its source text.
+
+        Args:
+            file_path: Path of the blamed file.
+            blame_key: History key of the file's committed content.
+
+        Returns:
+            A dict mapping 1-based line numbers to Unix timestamps, or
+            *None* on a miss.
+        """
+        entry = self._load("blame", file_path, blame_key)
+        if entry is None:
+            return None
+        return {int(line): ts for line, ts in entry["timestamps"].items()}
+
+    def put_blame(
+        self, file_path: Path, blame_key: str, timestamps: dict[int, int]
+    ) -> None:
+        """Store blame timestamps for a committed file.
+
+        Args:
+            file_path: Path of the blamed file.
+            blame_key: History key the timestamps were computed for.
+            timestamps: Mapping of 1-based line numbers to Unix
+                timestamps.
+        """
+        self._store("blame", file_path, blame_key, {"timestamps": timestamps})
+
+    def prune(self) -> None:
+        """Evict least-recently-used entries beyond :attr:`max_size`.
+
+        Entries are ordered by modification time, which :meth:`_load`
+        refreshes on every hit.
+        """
+        try:
+            entries = [(p, p.stat()) for p in (self.root / "results").glob("*.json")]
+        except OSError:
+            return
+        total = sum(st.st_size for _, st in entries)
+        if total <= self.max_size:
+            return
+        for path, st in sorted(entries, key=lambda e: e[1].st_mtime):
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+            if total <= self.max_size:
+                break
@@ -2,7 +2,11 @@
 
 Handles the unified output pipeline for all CLI commands: applies inline
 suppression filters, resolves output format, dispatches to formatters,
-writes quality summaries, and exits with appropriate codes.
+writes quality summaries, and exits with appropriate codes.  For
+``check --stream``, :class:`_FindingStream` writes each file's findings
+(terminal lines or JSON Lines records) as soon as they are ready and
+keeps only running counts, and :func:`_finish_stream` closes the stream
+and exits.
 
 See Also:
     [`docvet.cli`][]: CLI application and subcommands.
@@ -22,6 +26,7 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
+from typing import TextIO
 
 import typer
 
@@ -34,7 +39,13 @@ from docvet.cli._suppression import (
     parse_suppression_directives,
 )
 from docvet.config import DocvetConfig
-from docvet.reporting import CheckQuality
+from docvet.reporting import CheckQuality, FindingTally
+
+_STREAM_FORMATS: frozenset[str] = frozenset({"terminal", "jsonl"})
+"""Output formats that ``check --stream`` can write incrementally."""
+
+_JSON_FORMATS: frozenset[str] = frozenset({"json", "jsonl"})
+"""Output formats that carry suppressed findings, quality, and profile data."""
 
 
 def _emit_findings(
@@ -48,24 +59,29 @@ def _emit_findings(
     min_coverage: float = 0.0,
     quality: dict[str, CheckQuality] | None = None,
     suppressed: list[Finding] | None = None,
+    profile: dict[str, object] | None = None,
 ) -> None:
     """Write findings to stdout or a file in the resolved format.
 
     Dispatches to the appropriate formatter based on ``resolved_fmt``.
-    JSON format always emits output (even with zero findings). For
-    non-JSON formats, output is skipped when there are no findings
-    (no file is written and nothing is printed to stdout).
+    JSON and JSON Lines formats always emit output (even with zero
+    findings); JSON Lines records are written one at a time rather than
+    joined into one string. For the other formats, output is skipped
+    when there are no findings (no file is written and nothing is
+    printed to stdout).
 
     Args:
-        resolved_fmt: One of ``"terminal"``, ``"markdown"``, or ``"json"``.
+        resolved_fmt: One of ``"terminal"``, ``"markdown"``, ``"json"``,
+            or ``"jsonl"``.
         all_findings: Flattened list of findings across all checks.
         output_path: File path to write to, or ``None`` for stdout.
         no_color: Whether to suppress ANSI color in terminal output.
-        file_count: Number of files checked (used by JSON format).
+        file_count: Number of files checked (used by JSON formats).
         presence_stats: Aggregate presence coverage stats for JSON output.
         min_coverage: Coverage threshold from config for JSON output.
         quality: Per-check quality data for JSON output, or *None*.
         suppressed: Suppressed findings for JSON output, or *None*.
+        profile: Run profile data for JSON output, or *None*.
     """
     if resolved_fmt == "json":
         json_output = _cli_pkg.format_json(
@@ -75,11 +91,27 @@ def _emit_findings(
             min_coverage=min_coverage,
             quality=quality,
             suppressed=suppressed,
+            profile=profile,
         )
         if output_path:
             Path(output_path).write_text(json_output)
         else:
             sys.stdout.write(json_output)
+    elif resolved_fmt == "jsonl":
+        records = _cli_pkg.format_jsonl(
+            all_findings,
+            file_count,
+            presence_stats=presence_stats,
+            min_coverage=min_coverage,
+            quality=quality,
+            suppressed=suppressed,
+            profile=profile,
+        )
+        if output_path:
+            with open(output_path, "w") as out:
+                out.writelines(records)
+        else:
+            sys.stdout.writelines(records)
     elif output_path and all_findings:
         _cli_pkg.write_report(all_findings, Path(output_path), fmt=resolved_fmt)
     elif all_findings:
@@ -124,7 +156,8 @@ def _resolve_format(fmt_opt: str | None, output_path: str | None) -> str:
         output_path: Output file path, or *None*.
 
     Returns:
-        Resolved format string: ``"terminal"``, ``"markdown"``, or ``"json"``.
+        Resolved format string: ``"terminal"``, ``"markdown"``,
+        ``"json"``, or ``"jsonl"``.
     """
     if fmt_opt is not None:
         return fmt_opt
@@ -133,19 +166,40 @@ def _resolve_format(fmt_opt: str | None, output_path: str | None) -> str:
     return "terminal"
 
 
+def _load_suppressions(file_path: str) -> SuppressionMap:
+    """Read *file_path* and parse its inline suppression directives.
+
+    Args:
+        file_path: Path of the file the findings belong to.
+
+    Returns:
+        The file's suppression map, or an empty map when the file
+        cannot be read or decoded.
+    """
+    try:
+        source = Path(file_path).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return SuppressionMap()
+    return parse_suppression_directives(source, file_path)
+
+
 def _apply_suppressions(
     findings_by_check: dict[str, list[Finding]],
+    suppressions: dict[str, SuppressionMap] | None = None,
 ) -> tuple[dict[str, list[Finding]], list[Finding]]:
     """Filter suppressed findings from all checks.
 
-    Reads source files to parse suppression directives, then partitions
-    findings into active and suppressed. Source files are cached to avoid
-    redundant reads when multiple checks produce findings in the same file.
-    Files that cannot be read or decoded are treated as having no
-    suppression directives.
+    Uses the suppression maps the analysis pass already parsed from
+    loaded sources, and reads only the remaining files from disk, then
+    partitions findings into active and suppressed. Each file is read at
+    most once even when multiple checks produce findings in it. Files
+    that cannot be read or decoded are treated as having no suppression
+    directives.
 
     Args:
         findings_by_check: Findings grouped by check name.
+        suppressions: Suppression maps keyed by file, collected during
+            analysis, or *None* to read every file.
 
     Returns:
         A tuple of ``(active_by_check, all_suppressed)`` where
@@ -153,20 +207,15 @@ def _apply_suppressions(
         findings removed, and *all_suppressed* is the flat list of
         all suppressed findings across all checks.
     """
-    # Collect unique file paths and cache source + suppression maps.
+    # Collect unique file paths and cache suppression maps.
     all_files: set[str] = set()
     for findings in findings_by_check.values():
         for f in findings:
             all_files.add(f.file)
 
-    suppression_cache: dict[str, SuppressionMap] = {}
-    for file_path in all_files:
-        try:
-            source = Path(file_path).read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            suppression_cache[file_path] = SuppressionMap()
-            continue
-        suppression_cache[file_path] = parse_suppression_directives(source, file_path)
+    suppression_cache = dict(suppressions or {})
+    for file_path in all_files - suppression_cache.keys():
+        suppression_cache[file_path] = _load_suppressions(file_path)
 
     # Filter each check's findings.
     active_by_check: dict[str, list[Finding]] = {}
@@ -199,6 +248,7 @@ def _output_and_exit(
     *,
     presence_stats: PresenceStats | None = None,
     check_counts: dict[str, int] | None = None,
+    suppressions: dict[str, SuppressionMap] | None = None,
 ) -> None:
     """Resolve output options, apply suppressions, emit findings, and exit.
 
@@ -210,7 +260,8 @@ def _output_and_exit(
     chain (explicit ``--format``, then ``--output`` implies markdown,
     then terminal default), delegates to :func:`_emit_findings` for
     format dispatch, and raises ``typer.Exit`` with the appropriate
-    exit code.
+    exit code.  A run profile in ``ctx.obj["profile"]`` (set by
+    ``check --profile``) is added to JSON and JSON Lines output.
 
     Args:
         ctx: Typer context carrying global options in ``ctx.obj``.
@@ -222,6 +273,8 @@ def _output_and_exit(
             when the presence check did not run.
         check_counts: Per-check item counts for quality computation,
             or *None* when ``--summary`` is not active.
+        suppressions: Suppression maps parsed during analysis, keyed by
+            file; files not covered are read from disk.
 
     Raises:
         typer.Exit: With code 0 when no fail-on findings, code 1 otherwise.
@@ -231,6 +284,7 @@ def _output_and_exit(
     quiet = ctx.obj.get("quiet", False)
     summary = ctx.obj.get("summary", False)
     fmt_opt = ctx.obj.get("format")
+    profile = ctx.obj.get("profile")
 
     # 1. Resolve no_color
     no_color = (
@@ -240,7 +294,9 @@ def _output_and_exit(
     )
 
     # 2. Apply suppressions before flattening
-    findings_by_check, all_suppressed = _apply_suppressions(findings_by_check)
+    findings_by_check, all_suppressed = _apply_suppressions(
+        findings_by_check, suppressions
+    )
 
     # 3. Flatten findings
     all_findings: list[Finding] = []
@@ -280,8 +336,11 @@ def _output_and_exit(
         file_count,
         presence_stats=presence_stats,
         min_coverage=config.presence.min_coverage,
-        quality=quality if resolved_fmt == "json" else None,
-        suppressed=all_suppressed if resolved_fmt == "json" else None,
+        quality=quality if resolved_fmt in _JSON_FORMATS else None,
+        suppressed=all_suppressed if resolved_fmt in _JSON_FORMATS else None,
+        profile=profile.to_dict()
+        if profile is not None and resolved_fmt in _JSON_FORMATS
+        else None,
     )
 
     # 9. Quality summary to stderr (after findings, before exit)
@@ -293,3 +352,255 @@ def _output_and_exit(
             findings_by_check, config, presence_stats=presence_stats
         )
     )
+
+
+# ---------------------------------------------------------------------------
+# Streaming output
+# ---------------------------------------------------------------------------
+
+
+class _FindingStream:
+    """Incremental findings writer for ``check --stream``.
+
+    Each :meth:`emit` call applies inline suppressions to one batch of
+    findings, writes the active ones grouped by file, and adds them to
+    a running :class:`~docvet.reporting.FindingTally`.  Only the tally
+    and the (usually few) suppressed findings are kept, so memory no
+    longer grows with the number of findings reported.  In JSON Lines
+    format, suppressed findings are written as ``"suppressed"`` records
+    next to the active ones, and :meth:`close` writes the ``"summary"``
+    record.
+
+    Attributes:
+        fmt (str): Output format; one of :data:`_STREAM_FORMATS`.
+        out (TextIO): Destination for the findings.
+        no_color (bool): Whether to suppress ANSI color codes.
+        tally (FindingTally): Counts of the active findings written.
+        suppressed (list[Finding]): Findings hidden by suppressions.
+
+    Examples:
+        Stream two batches to stdout:
+
+        ```python
+        stream = _FindingStream("terminal", sys.stdout, no_color=True)
+        stream.emit({"enrichment": findings_a})
+        stream.emit({"coverage": findings_b})
+        stream.close(file_count=12)
+        ```
+    """
+
+    def __init__(
+        self, fmt: str, out: TextIO, *, no_color: bool, close_out: bool = False
+    ) -> None:
+        """Create a stream writing *fmt* output to *out*.
+
+        Args:
+            fmt: Output format; one of :data:`_STREAM_FORMATS`.
+            out: Destination for the findings.
+            no_color: Whether to suppress ANSI color codes.
+            close_out: Close *out* in :meth:`close` (for ``--output``
+                files opened by :func:`_open_stream`).
+        """
+        self.fmt = fmt
+        self.out = out
+        self.no_color = no_color
+        self._close_out = close_out
+        self.tally = FindingTally()
+        self.suppressed: list[Finding] = []
+        self._written = False
+
+    def emit(
+        self,
+        findings_by_check: dict[str, list[Finding]],
+        suppressions: dict[str, SuppressionMap] | None = None,
+    ) -> None:
+        """Filter, write, and tally one batch of findings.
+
+        Findings are grouped by file and files are written in path
+        order.  Each file's suppression map is taken from
+        *suppressions* when the analysis pass provided it, otherwise
+        parsed from disk once per batch.  In terminal format each file
+        group is separated from the previous one by a blank line.
+
+        Args:
+            findings_by_check: The batch, grouped by check name.
+            suppressions: Suppression maps keyed by file, or *None*.
+        """
+        known = suppressions or {}
+        by_file: dict[str, dict[str, list[Finding]]] = {}
+        for check_name, findings in findings_by_check.items():
+            for f in findings:
+                by_file.setdefault(f.file, {}).setdefault(check_name, []).append(f)
+        for file_path in sorted(by_file):
+            smap = known.get(file_path)
+            if smap is None:
+                smap = _load_suppressions(file_path)
+            file_findings: list[Finding] = []
+            file_suppressed: list[Finding] = []
+            for check_name, findings in by_file[file_path].items():
+                active, suppressed = filter_findings(findings, file_path, smap)
+                self.tally.add(check_name, active)
+                file_findings.extend(active)
+                file_suppressed.extend(suppressed)
+            self.suppressed.extend(file_suppressed)
+            self._write(file_findings, file_suppressed)
+
+    def _write(self, findings: list[Finding], suppressed: list[Finding]) -> None:
+        """Write one file's findings.
+
+        Args:
+            findings: Active findings of a single file.
+            suppressed: Suppressed findings of the same file.
+        """
+        if self.fmt == "jsonl":
+            for f in sorted(findings, key=lambda f: f.line):
+                self.out.write(_cli_pkg.format_jsonl_finding(f))
+            for f in sorted(suppressed, key=lambda f: f.line):
+                self.out.write(_cli_pkg.format_jsonl_finding(f, suppressed=True))
+        elif findings:
+            if self._written:
+                self.out.write("\n")
+            self.out.write(
+                _cli_pkg.format_terminal_group(findings, no_color=self.no_color)
+            )
+            self._written = True
+        self.out.flush()
+
+    def close(
+        self,
+        *,
+        file_count: int,
+        presence_stats: PresenceStats | None = None,
+        min_coverage: float = 0.0,
+        quality: dict[str, CheckQuality] | None = None,
+    ) -> None:
+        """Write the closing summary and release the output.
+
+        Terminal format ends with the ``N findings (...)`` line when
+        anything was reported; JSON Lines always ends with a
+        ``"summary"`` record.
+
+        Args:
+            file_count: Number of files that were checked.
+            presence_stats: Aggregate presence coverage stats, or
+                *None* when the presence check did not run.
+            min_coverage: Coverage threshold from config.
+            quality: Per-check quality data, or *None* when
+                ``--summary`` was not used.
+        """
+        if self.fmt == "jsonl":
+            self.out.write(
+                _cli_pkg.format_jsonl_summary(
+                    self.tally,
+                    file_count,
+                    suppressed_count=len(self.suppressed),
+                    presence_stats=presence_stats,
+                    min_coverage=min_coverage,
+                    quality=quality,
+                )
+            )
+        elif self.tally.total:
+            self.out.write("\n" + _cli_pkg.format_terminal_footer(self.tally))
+        self.out.flush()
+        if self._close_out:
+            self.out.close()
+
+
+def _open_stream(ctx: typer.Context) -> _FindingStream:
+    """Create the findings stream for the global output options.
+
+    Resolves the output format and color setting the same way as
+    :func:`_output_and_exit`.  With ``--output`` the stream writes to
+    that file, otherwise to stdout.
+
+    Args:
+        ctx: Typer context carrying global options in ``ctx.obj``.
+
+    Returns:
+        A stream ready to receive findings.
+
+    Raises:
+        typer.BadParameter: If the resolved format cannot be streamed.
+    """
+    output_path = ctx.obj.get("output")
+    resolved_fmt = _resolve_format(ctx.obj.get("format"), output_path)
+    if resolved_fmt not in _STREAM_FORMATS:
+        supported = ", ".join(sorted(_STREAM_FORMATS))
+        msg = f"--stream does not support {resolved_fmt} output (use {supported})"
+        raise typer.BadParameter(msg)
+    no_color = (
+        os.environ.get("NO_COLOR", "") != ""
+        or not sys.stdout.isatty()
+        or output_path is not None
+    )
+    if output_path:
+        out = open(output_path, "w")  # noqa: SIM115 – closed by _FindingStream
+        return _FindingStream(resolved_fmt, out, no_color=no_color, close_out=True)
+    return _FindingStream(resolved_fmt, sys.stdout, no_color=no_color)
+
+
+def _finish_stream(
+    ctx: typer.Context,
+    stream: _FindingStream,
+    config: DocvetConfig,
+    file_count: int,
+    checks: list[str],
+    *,
+    presence_stats: PresenceStats | None = None,
+    check_counts: dict[str, int] | None = None,
+) -> None:
+    """Close a findings stream, write stderr details, and exit.
+
+    The streaming counterpart of :func:`_output_and_exit`: findings
+    were already written, so this closes the stream with its summary,
+    then writes the verbose header, coverage line, and suppressed
+    listing, and the ``--summary`` quality table, all computed from
+    the stream's tally.
+
+    Args:
+        ctx: Typer context carrying global options in ``ctx.obj``.
+        stream: The run's findings stream.
+        config: Loaded docvet configuration.
+        file_count: Number of files that were checked.
+        checks: List of check names that were run.
+        presence_stats: Aggregate presence coverage stats, or *None*
+            when the presence check did not run.
+        check_counts: Per-check item counts for quality computation.
+
+    Raises:
+        typer.Exit: With code 0 when no fail-on findings, code 1 otherwise.
+    """
+    verbose = ctx.obj.get("verbose", False)
+    quiet = ctx.obj.get("quiet", False)
+    summary = ctx.obj.get("summary", False)
+
+    quality = None
+    if summary and check_counts is not None:
+        quality = _cli_pkg.compute_quality(stream.tally, check_counts)
+    stream.close(
+        file_count=file_count,
+        presence_stats=presence_stats,
+        min_coverage=config.presence.min_coverage,
+        quality=quality if stream.fmt in _JSON_FORMATS else None,
+    )
+
+    if verbose and not quiet and len(checks) > 1:
+        sys.stderr.write(_cli_pkg.format_verbose_header(file_count, checks))
+    if verbose and not quiet and presence_stats is not None:
+        sys.stderr.write(
+            _format_coverage_line(presence_stats, config.presence.min_coverage)
+        )
+    if verbose and not quiet and stream.suppressed:
+        sys.stderr.write(f"Suppressed ({len(stream.suppressed)}):\n")
+        for sf in sorted(stream.suppressed, key=lambda f: (f.file, f.line)):
+            sys.stderr.write(
+                f"  {sf.file}:{sf.line}: {sf.rule} {sf.message} [suppressed]\n"
+            )
+    if summary and not quiet and quality is not None:
+        sys.stderr.write(_cli_pkg.format_quality_summary(quality))
+
+    raise typer.Exit(
+        _cli_pkg.determine_exit_code(
+            stream.tally, config, presence_stats=presence_stats
+        )
+    )
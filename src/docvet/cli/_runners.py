@@ -3,8 +3,26 @@
 Each ``_run_*`` function reads files, invokes the corresponding check
 module, and returns findings.  The ``_run_fix`` runner additionally
 writes scaffolded sections back to files (or collects diffs in dry-run
-mode).  Git helpers (``_get_git_diff``, ``_get_git_blame``) provide
-raw VCS data for the freshness runner.
+mode).  Per-file runners obtain sources through a ``_ParsedFileStore``,
+so when ``check`` hands one store to every runner each file is read,
+parsed, and walked for symbols only once.  When given a
+``_ResultCache``, the presence and enrichment runners reuse stored
+results for unchanged files without parsing them, the diff-mode
+freshness runner skips parsing files with an empty diff, and the
+drift-mode runner reuses blame timestamps for files whose git blob and
+last touching commit are unchanged.  ``_run_parallel`` instead fans presence, enrichment, and
+freshness out to a process pool and merges the per-file results in
+discovery order, and ``_run_streaming`` hands each file's findings to
+the output stream as soon as the file is done.  Inline suppression
+directives are parsed from the sources these runners already loaded
+(``_ParsedFileStore.suppressions`` or ``_FileResults.suppressions``), so
+the output pipeline does not read files with findings a second time.
+Under the ``docvet serve`` daemon the store is backed by resident
+``_ResidentFile`` entries, so unchanged files are not re-read or
+re-parsed between invocations.  Git helpers (``_get_git_diffs``,
+``_get_git_blame_timestamps``, ``_get_git_blame_keys``) provide VCS data for
+the freshness runner: diff mode runs one ``git diff`` for all files,
+and drift mode blames files on a bounded thread pool.
 
 See Also:
     [`docvet.cli`][]: CLI application and subcommands.
@@ -20,82 +38,859 @@ Examples:
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import importlib.util
+import os
 import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
 import docvet.cli as _cli_pkg
+from docvet.ast_utils import ParsedFile
 from docvet.checks import Finding
+from docvet.checks.freshness import _parse_blame_timestamps, _split_diff_by_file
 from docvet.checks.presence import PresenceStats
 from docvet.config import DocvetConfig
+from docvet.profiling import active_profile, timed, timed_files
 
 from . import DiscoveryMode, FreshnessMode
+from ._cache import _ResultCache
+from ._output import _FindingStream
+from ._suppression import SuppressionMap, parse_suppression_directives
 
+if TYPE_CHECKING:
+    from docvet.checks.griffe_compat import _ModuleTree
 
-def _get_git_diff(
-    file_path: Path,
-    project_root: Path,
-    discovery_mode: DiscoveryMode,
-) -> str:
-    """Get git diff output for a single file.
+_BLAME_MAX_WORKERS = 8
+"""Upper bound on concurrent ``git blame`` subprocesses in drift mode."""
+
+_BLAME_SLOWEST = 5
+"""Number of slowest files listed in the verbose blame breakdown."""
+
+_RESIDENT_FILES_MAX = 4096
+"""Most source files a ``docvet serve`` daemon keeps warm; least recently
+used entries are evicted first."""
 
-    Runs the appropriate ``git diff`` variant based on the discovery
-    mode and returns the raw unified diff output.
+
+def _get_git_diffs(
+    project_root: Path, discovery_mode: DiscoveryMode
+) -> dict[Path, str]:
+    """Get git diff output for every changed Python file in one call.
+
+    Runs a single ``git diff`` variant (based on the discovery mode)
+    over all ``*.py`` files and splits the output into per-file diffs.
+    The ``*.py`` pathspec covers every discoverable file without
+    passing each path on the command line.
 
     Args:
-        file_path: Absolute path to the file.
         project_root: Project root for git working directory.
         discovery_mode: Controls which git diff variant to run.
 
     Returns:
-        Raw unified diff output string. Returns an empty string if
-        the git command exits with a non-zero status.
+        A dict mapping resolved absolute file paths to their unified
+        diff output.  Unchanged files are absent.  Returns an empty
+        dict if the git command exits with a non-zero status.
     """
     if discovery_mode is DiscoveryMode.STAGED:
-        args = ["git", "diff", "--cached", "--", str(file_path)]
+        variant = ["--cached"]
     elif discovery_mode is DiscoveryMode.ALL:
-        args = ["git", "diff", "HEAD", "--", str(file_path)]
+        variant = ["HEAD"]
     else:
-        args = ["git", "diff", "--", str(file_path)]
+        variant = []
 
     result = _cli_pkg.subprocess.run(
-        args,
+        [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "diff",
+            *variant,
+            "--relative",
+            "--no-prefix",
+            "--",
+            "*.py",
+        ],
         capture_output=True,
         text=True,
         check=False,
         cwd=project_root,
     )
     if result.returncode != 0:
-        return ""
-    return result.stdout
+        return {}
+    root = project_root.resolve()
+    return {
+        (root / rel).resolve(): diff
+        for rel, diff in _split_diff_by_file(result.stdout).items()
+    }
 
 
-def _get_git_blame(file_path: Path, project_root: Path) -> str:
-    """Get git blame porcelain output for a single file.
+def _get_git_blame_timestamps(file_path: Path, project_root: Path) -> dict[int, int]:
+    """Get per-line blame timestamps for a single file.
 
-    Runs ``git blame --line-porcelain`` and returns the raw output
-    for drift/age analysis.
+    Runs ``git blame --porcelain`` and streams its output line by line
+    into ``_parse_blame_timestamps``, so the porcelain text is never
+    held in memory as one string.  The compact ``--porcelain`` format
+    prints each commit's headers once instead of once per line, which
+    makes the output (and the parsing work) several times smaller
+    than ``--line-porcelain`` on long files.
 
     Args:
         file_path: Absolute path to the file.
         project_root: Project root for git working directory.
 
     Returns:
-        Raw porcelain blame output string. Returns an empty string
-        if the git command exits with a non-zero status.
+        A dict mapping 1-based line numbers to Unix timestamps.  Returns
+        an empty dict if the git command exits with a non-zero status.
     """
-    result = _cli_pkg.subprocess.run(
-        ["git", "blame", "--line-porcelain", "--", str(file_path)],
+    with _cli_pkg.subprocess.Popen(
+        ["git", "blame", "--porcelain", "--", str(file_path)],
+        stdout=_cli_pkg.subprocess.PIPE,
+        stderr=_cli_pkg.subprocess.DEVNULL,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        cwd=project_root,
+    ) as proc:
+        timestamps = _parse_blame_timestamps(proc.stdout)
+    if proc.returncode != 0:
+        return {}
+    return timestamps
+
+
+def _get_git_last_commits(project_root: Path, paths: set[str]) -> dict[str, str]:
+    """Get the SHA of the last commit that touched each of *paths*.
+
+    Streams ``git log -m --name-only`` from ``HEAD`` and stops reading
+    once every path has been seen, so only the history back to the
+    oldest last-touching commit is walked.  ``-m`` lists merge commits
+    under the files they change relative to any parent.
+
+    Args:
+        project_root: Project root for git working directory.
+        paths: File paths relative to *project_root*.
+
+    Returns:
+        A dict mapping each found path to a commit SHA.  Paths without
+        a touching commit, or every path when git fails, are left out.
+    """
+    commits: dict[str, str] = {}
+    if not paths:
+        return commits
+    with _cli_pkg.subprocess.Popen(
+        [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "log",
+            "-m",
+            "--relative",
+            "--no-renames",
+            "--name-only",
+            "--format=%x00%H",
+            "--",
+            "*.py",
+        ],
+        stdout=_cli_pkg.subprocess.PIPE,
+        stderr=_cli_pkg.subprocess.DEVNULL,
+        text=True,
+        cwd=project_root,
+    ) as proc:
+        commit = ""
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line.startswith("\0"):
+                commit = line[1:]
+            elif line in paths and line not in commits:
+                commits[line] = commit
+                if len(commits) == len(paths):
+                    break
+        proc.kill()
+    return commits
+
+
+def _get_git_blame_keys(project_root: Path) -> dict[Path, str]:
+    """Get blame cache keys for committed, unmodified Python files.
+
+    Runs ``git ls-files -s`` for the blob SHA of every tracked ``*.py``
+    file and ``git diff --name-only HEAD`` to drop files whose index or
+    working-tree content differs from ``HEAD``.  Blame for the remaining
+    files depends only on their history, which the key captures as the
+    blob SHA plus the SHA of the last commit touching the file (see
+    :func:`_get_git_last_commits`).  The commit part keeps a revert to
+    an earlier blob, or rewritten history, from reusing timestamps
+    blamed on a different history.
+
+    Args:
+        project_root: Project root for git working directory.
+
+    Returns:
+        A dict mapping resolved absolute file paths to
+        ``"<blob sha>:<commit sha>"`` keys.  Returns an empty dict if
+        either git command fails.
+    """
+    ls_files = _cli_pkg.subprocess.run(
+        ["git", "-c", "core.quotePath=false", "ls-files", "-s", "--", "*.py"],
         capture_output=True,
         text=True,
         check=False,
         cwd=project_root,
     )
-    if result.returncode != 0:
-        return ""
-    return result.stdout
+    changed = _cli_pkg.subprocess.run(
+        [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "diff",
+            "--name-only",
+            "--relative",
+            "HEAD",
+            "--",
+            "*.py",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=project_root,
+    )
+    if ls_files.returncode != 0 or changed.returncode != 0:
+        return {}
+    dirty = set(changed.stdout.splitlines())
+    blobs: dict[str, str] = {}
+    for line in ls_files.stdout.splitlines():
+        # "<mode> <sha> <stage>\t<path>"; unmerged entries have stage > 0.
+        info, _, rel = line.partition("\t")
+        _mode, sha, stage = info.split()
+        if stage == "0" and rel not in dirty:
+            blobs[rel] = sha
+    commits = _get_git_last_commits(project_root, set(blobs))
+    root = project_root.resolve()
+    return {
+        (root / rel).resolve(): f"{sha}:{commits[rel]}"
+        for rel, sha in blobs.items()
+        if rel in commits
+    }
+
+
+def _blame_workers(file_count: int) -> int:
+    """Return the blame pool size for *file_count* files.
+
+    Each worker thread mostly waits on its ``git blame`` subprocess, so
+    the pool is sized by CPU count (git does the work) and capped at
+    ``_BLAME_MAX_WORKERS``.
+
+    Args:
+        file_count: Number of files to blame.
+
+    Returns:
+        The number of concurrent blame workers, at least one.
+    """
+    return max(1, min(os.cpu_count() or 1, _BLAME_MAX_WORKERS, file_count))
+
+
+def _timed_blame(
+    file_path: Path, project_root: Path
+) -> tuple[dict[int, int], tuple[float, float]]:
+    """Blame one file and record when the blame started and finished.
+
+    Args:
+        file_path: Absolute path to the file.
+        project_root: Project root for git working directory.
+
+    Returns:
+        A ``(timestamps, (start, end))`` pair of ``time.perf_counter``
+        readings.
+    """
+    start = time.perf_counter()
+    timestamps = _cli_pkg._get_git_blame_timestamps(file_path, project_root)
+    return timestamps, (start, time.perf_counter())
+
+
+def _write_blame_latency(
+    spans: dict[Path, tuple[float, float]],
+    *,
+    verbose: bool,
+    quiet: bool,
+) -> None:
+    """Write the per-file blame latency breakdown to stderr when verbose.
+
+    Prints the summed blame time and the blame pool's wall-clock time
+    (first blame started to last blame finished), then the slowest
+    ``_BLAME_SLOWEST`` files.
+
+    Args:
+        spans: ``(start, end)`` ``time.perf_counter`` readings of each
+            blame, keyed by file path.
+        verbose: Whether verbose mode is active.
+        quiet: Whether quiet mode is active.
+    """
+    if not (verbose and not quiet and spans):
+        return
+    latencies = {path: end - start for path, (start, end) in spans.items()}
+    total = sum(latencies.values())
+    wall = max(end for _, end in spans.values()) - min(
+        start for start, _ in spans.values()
+    )
+    sys.stderr.write(
+        f"blame: {len(latencies)} files, {total:.1f}s total, "
+        f"{wall:.1f}s wall ({_blame_workers(len(latencies))} workers)\n"
+    )
+    slowest = sorted(latencies.items(), key=lambda item: item[1], reverse=True)
+    for file_path, seconds in slowest[:_BLAME_SLOWEST]:
+        sys.stderr.write(f"  {seconds:.2f}s {file_path}\n")
+
+
+# ---------------------------------------------------------------------------
+# Parsed-file store
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class _ResidentFile:
+    """A source file kept warm across runs by the ``docvet serve`` daemon.
+
+    Attributes:
+        stamp (tuple[int, int]): ``(st_mtime_ns, st_size)`` of the file
+            when *source* was read.
+        source (str): The file's source text.
+        parsed (ParsedFile | None): The parsed file, ``None`` when the
+            file failed to parse or has not been parsed yet.
+        failed (bool): Whether parsing raised ``SyntaxError``.
+
+    Examples:
+        Back a store with entries that outlive the run:
+
+        ```python
+        resident: dict[Path, _ResidentFile] = {}
+        _ParsedFileStore(resident).get(path)
+        _ParsedFileStore(resident).get(path)  # not re-parsed if unchanged
+        ```
+    """
+
+    stamp: tuple[int, int]
+    source: str
+    parsed: ParsedFile | None = None
+    failed: bool = False
+
+
+class _ParsedFileStore:
+    """Per-run memo of read and parsed source files.
+
+    The first :meth:`get` for a path reads the file, parses it, and
+    caches the resulting :class:`~docvet.ast_utils.ParsedFile` (or
+    ``None`` when the file has a syntax error, after warning once on
+    stderr).  Later lookups from other runners reuse the cached entry,
+    including its lazily derived symbols, node index, and line map.
+
+    When given a *resident* mapping (kept by the ``docvet serve``
+    daemon), entries outlive the run: a file whose modification time
+    and size are unchanged reuses the source and parse from an earlier
+    run instead of being read and parsed again.  File reads and parses
+    are timed as the ``"read"`` and ``"parse"`` phases of an active run
+    profile.
+
+    Attributes:
+        files (dict[Path, ParsedFile | None]): Parsed entries keyed by
+            path; ``None`` marks files that failed to parse.
+        sources (dict[Path, str]): Source text keyed by path, filled by
+            :meth:`source` without parsing (for result-cache lookups).
+        suppression_maps (dict[Path, SuppressionMap]): Inline
+            suppression directives parsed from the stored sources.
+
+    Examples:
+        Share one store across runners:
+
+        ```python
+        store = _ParsedFileStore()
+        _run_presence(files, config, store=store)
+        _run_enrichment(files, config, store=store)
+        ```
+    """
+
+    def __init__(self, resident: dict[Path, _ResidentFile] | None = None) -> None:
+        """Create an empty store.
+
+        Args:
+            resident: Long-lived entries shared across runs, or *None*
+                to keep everything per run.
+        """
+        self.files: dict[Path, ParsedFile | None] = {}
+        self.sources: dict[Path, str] = {}
+        self.suppression_maps: dict[Path, SuppressionMap] = {}
+        self._resident = resident
+
+    @staticmethod
+    def _resident_entry(
+        resident: dict[Path, _ResidentFile], file_path: Path
+    ) -> _ResidentFile:
+        """Return the up-to-date resident entry for *file_path*.
+
+        *resident* is kept in least-recently-used order: a returned
+        entry moves to the end, and the oldest entries are evicted once
+        it holds more than :data:`_RESIDENT_FILES_MAX` files.
+
+        Args:
+            resident: Long-lived entries shared across runs.
+            file_path: Path of the Python file to read.
+
+        Returns:
+            The cached entry when the file is unchanged on disk,
+            otherwise a fresh entry holding the re-read source.
+
+        Raises:
+            OSError: If the file cannot be read; its entry is dropped.
+        """
+        entry = resident.pop(file_path, None)
+        stat = file_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if entry is None or entry.stamp != stamp:
+            source = file_path.read_text(encoding="utf-8")
+            entry = _ResidentFile(stamp, source)
+        resident[file_path] = entry
+        while len(resident) > _RESIDENT_FILES_MAX:
+            del resident[next(iter(resident))]
+        return entry
+
+    def source(self, file_path: Path) -> str:
+        """Return the source text of *file_path*, reading it on first use.
+
+        Args:
+            file_path: Path of the Python file to read.
+
+        Returns:
+            The file's source text.
+        """
+        if file_path not in self.sources:
+            with timed("phases", "read"):
+                if self._resident is None:
+                    self.sources[file_path] = file_path.read_text(encoding="utf-8")
+                else:
+                    entry = self._resident_entry(self._resident, file_path)
+                    self.sources[file_path] = entry.source
+        return self.sources[file_path]
+
+    def suppressions(
+        self, findings_by_check: dict[str, list[Finding]]
+    ) -> dict[str, SuppressionMap]:
+        """Return suppression maps for the stored files that have findings.
+
+        Directives are parsed from the already-loaded source, so the
+        output pipeline does not read those files again.  Files that
+        were never loaded (for example ``__init__.py`` files reported
+        by the coverage check) are left out.
+
+        Args:
+            findings_by_check: The run's findings grouped by check name.
+
+        Returns:
+            Suppression maps keyed by the findings' file strings.
+        """
+        paths = {str(path): path for path in self.sources}
+        result: dict[str, SuppressionMap] = {}
+        for findings in findings_by_check.values():
+            for f in findings:
+                path = paths.get(f.file)
+                if path is None or f.file in result:
+                    continue
+                smap = self.suppression_maps.get(path)
+                if smap is None:
+                    smap = self.suppression_maps[path] = parse_suppression_directives(
+                        self.sources[path], f.file
+                    )
+                result[f.file] = smap
+        return result
+
+    def get(self, file_path: Path) -> ParsedFile | None:
+        """Return the parsed file for *file_path*, parsing on first use.
+
+        Args:
+            file_path: Path of the Python file to read.
+
+        Returns:
+            The cached :class:`~docvet.ast_utils.ParsedFile`, or
+            ``None`` when the file failed to parse.
+        """
+        if file_path in self.files:
+            return self.files[file_path]
+        source = self.source(file_path)
+        entry = None
+        if self._resident is not None:
+            entry = self._resident.get(file_path)
+            if entry is not None and entry.source is not source:
+                entry = None
+        if entry is not None and (entry.parsed is not None or entry.failed):
+            parsed = entry.parsed
+        else:
+            try:
+                with timed("phases", "parse"):
+                    tree = _cli_pkg.ast.parse(source, filename=str(file_path))
+            except SyntaxError:
+                parsed = None
+            else:
+                parsed = ParsedFile(source=source, tree=tree)
+            if entry is not None:
+                entry.parsed, entry.failed = parsed, parsed is None
+        if parsed is None:
+            typer.echo(f"warning: {file_path}: failed to parse, skipping", err=True)
+        self.files[file_path] = parsed
+        return parsed
+
+
+# ---------------------------------------------------------------------------
+# Parallel per-file checks
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _FileResults:
+    """Findings and counts from the per-file checks.
+
+    Used both for a single file's results (returned by a pool worker)
+    and for the aggregate merged across files.
+
+    Attributes:
+        presence (list[Finding]): Presence findings.
+        presence_stats (PresenceStats): Docstring coverage counts.
+        enrichment (list[Finding]): Enrichment findings.
+        freshness (list[Finding]): Freshness findings.
+        symbol_count (int): Documented symbols analysed.
+        parsed (bool): ``False`` when the file failed to parse.
+        cache_hits (int): Result-cache lookups served from disk.
+        cache_misses (int): Result-cache lookups that missed.
+        suppressions (dict[str, SuppressionMap]): Inline suppression
+            directives of files with findings, parsed from the source
+            the checks already loaded.
+
+    Examples:
+        Merge per-file results in file order:
+
+        ```python
+        total = _FileResults()
+        for result in per_file:
+            total.merge(result)
+        ```
+    """
+
+    presence: list[Finding] = field(default_factory=list)
+    presence_stats: PresenceStats = field(
+        default_factory=lambda: PresenceStats(documented=0, total=0)
+    )
+    enrichment: list[Finding] = field(default_factory=list)
+    freshness: list[Finding] = field(default_factory=list)
+    symbol_count: int = 0
+    parsed: bool = True
+    cache_hits: int = 0
+    cache_misses: int = 0
+    suppressions: dict[str, SuppressionMap] = field(default_factory=dict)
+
+    def merge(self, other: _FileResults) -> None:
+        """Append *other*'s findings and add its counts to this result.
+
+        Coverage, symbol, and cache hit/miss counts are summed and
+        suppression maps are combined.
+
+        Args:
+            other: Results for the next file in discovery order.
+        """
+        self.presence.extend(other.presence)
+        self.presence_stats = PresenceStats(
+            documented=self.presence_stats.documented + other.presence_stats.documented,
+            total=self.presence_stats.total + other.presence_stats.total,
+        )
+        self.enrichment.extend(other.enrichment)
+        self.freshness.extend(other.freshness)
+        self.symbol_count += other.symbol_count
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.suppressions.update(other.suppressions)
+
+
+def _resolve_jobs(jobs: int | str) -> int:
+    """Resolve a ``jobs`` setting to a worker count.
+
+    Args:
+        jobs: A positive worker count or ``"auto"``.
+
+    Returns:
+        The number of worker processes, using one per CPU for
+        ``"auto"``.
+    """
+    if jobs == "auto":
+        return os.cpu_count() or 1
+    return int(jobs)
+
+
+def _check_file(
+    file_path: Path,
+    diff_output: str,
+    *,
+    config: DocvetConfig,
+    presence: bool,
+    cache: _ResultCache | None = None,
+) -> _FileResults:
+    """Run presence, enrichment, and freshness on one file.
+
+    Executed inside pool workers, so the file is read and parsed once
+    in the worker and only findings and counts cross the process
+    boundary.  With a *cache*, stored presence and enrichment results
+    are reused, and a file whose results are all cached and whose diff
+    is empty is not parsed at all.  The worker's cache hit and miss
+    counts are returned in the result, along with the file's inline
+    suppression directives when it has findings.
+
+    Args:
+        file_path: Path of the Python file to check.
+        diff_output: The file's section of the run's ``git diff``.
+        config: Loaded docvet configuration.
+        presence: Whether the presence check is enabled.
+        cache: On-disk result cache, or *None* to always analyse.
+
+    Returns:
+        The file's results, with ``parsed=False`` when the file has a
+        syntax error.
+    """
+    source = file_path.read_text(encoding="utf-8")
+    result = _FileResults()
+    cached_presence = cached_enrichment = None
+    if cache is not None:
+        hits, misses = cache.hits, cache.misses
+        if presence:
+            cached_presence = cache.get_presence(file_path, source)
+        cached_enrichment = cache.get_enrichment(file_path, source)
+        result.cache_hits = cache.hits - hits
+        result.cache_misses = cache.misses - misses
+    if cached_presence is not None:
+        result.presence, result.presence_stats = cached_presence
+    if cached_enrichment is not None:
+        result.enrichment, result.symbol_count = cached_enrichment
+
+    presence_pending = presence and cached_presence is None
+    if not (presence_pending or cached_enrichment is None or diff_output):
+        return _with_suppressions(result, file_path, source)
+
+    try:
+        tree = _cli_pkg.ast.parse(source, filename=str(file_path))
+    except SyntaxError:
+        return _FileResults(parsed=False)
+    parsed = ParsedFile(source=source, tree=tree)
+    result.symbol_count = len(parsed.symbols)
+    if presence_pending:
+        result.presence, result.presence_stats = _cli_pkg.check_presence(
+            source,
+            str(file_path),
+            config.presence,
+            tree=tree,
+            symbols=parsed.symbols,
+        )
+        if cache is not None:
+            cache.put_presence(
+                file_path, source, result.presence, result.presence_stats
+            )
+    if cached_enrichment is None:
+        result.enrichment = _cli_pkg.check_enrichment(
+            source,
+            tree,
+            config.enrichment,
+            str(file_path),
+            style=config.docstring_style,
+            symbols=parsed.symbols,
+            node_index=parsed.node_index,
+        )
+        if cache is not None:
+            cache.put_enrichment(
+                file_path, source, result.enrichment, result.symbol_count
+            )
+    result.freshness = _cli_pkg.check_freshness_diff(
+        str(file_path), diff_output, tree, line_map=parsed.line_map
+    )
+    return _with_suppressions(result, file_path, source)
+
+
+def _with_suppressions(
+    result: _FileResults, file_path: Path, source: str
+) -> _FileResults:
+    """Attach *file_path*'s suppression directives to *result*.
+
+    Only files with findings are parsed, matching the files the output
+    pipeline would otherwise read back from disk.
+
+    Args:
+        result: The file's check results.
+        file_path: Path of the checked file.
+        source: The file's already-loaded source text.
+
+    Returns:
+        *result*, with ``suppressions`` filled when it has findings.
+    """
+    if result.presence or result.enrichment or result.freshness:
+        result.suppressions[str(file_path)] = parse_suppression_directives(
+            source, str(file_path)
+        )
+    return result
+
+
+def _iter_file_results(
+    files: list[Path],
+    config: DocvetConfig,
+    *,
+    jobs: int,
+    presence: bool,
+    discovery_mode: DiscoveryMode,
+    show_progress: bool = False,
+    cache: _ResultCache | None = None,
+) -> Iterator[tuple[Path, _FileResults]]:
+    """Yield each file's per-file check results in discovery order.
+
+    The git diff for all files is taken once up front.  With more than
+    one job, files and their diffs are distributed to worker processes
+    in chunks; otherwise :func:`_check_file` runs in this process.
+    Results are yielded as soon as the next file in discovery order is
+    done, and files that fail to parse are reported on stderr and
+    skipped.
+
+    Args:
+        files: Discovered Python file paths.
+        config: Loaded docvet configuration.
+        jobs: Number of worker processes; ``1`` checks in-process.
+        presence: Whether the presence check is enabled.
+        discovery_mode: Controls which git diff variant to run.
+        show_progress: Display a progress bar on stderr.
+        cache: On-disk result cache, or *None* to always analyse.
+
+    Yields:
+        ``(file_path, result)`` pairs for every file that parsed.
+    """
+    diffs = _cli_pkg._get_git_diffs(config.project_root, discovery_mode)
+    worker = functools.partial(
+        _check_file, config=config, presence=presence, cache=cache
+    )
+    file_diffs = [diffs.get(file_path, "") for file_path in files]
+    with contextlib.ExitStack() as stack:
+        if jobs > 1:
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=min(jobs, len(files)))
+            )
+            chunksize = max(1, len(files) // (jobs * 4))
+            results = executor.map(worker, files, file_diffs, chunksize=chunksize)
+        else:
+            results = map(worker, files, file_diffs)
+        progress = stack.enter_context(
+            typer.progressbar(
+                zip(files, results, strict=True),
+                length=len(files),
+                label="checks",
+                file=sys.stderr,
+                hidden=not show_progress,
+            )
+        )
+        for file_path, result in progress:
+            if not result.parsed:
+                typer.echo(f"warning: {file_path}: failed to parse, skipping", err=True)
+                continue
+            yield file_path, result
+
+
+def _run_parallel(
+    files: list[Path],
+    config: DocvetConfig,
+    *,
+    jobs: int,
+    presence: bool,
+    discovery_mode: DiscoveryMode,
+    show_progress: bool = False,
+    cache: _ResultCache | None = None,
+) -> _FileResults:
+    """Run the per-file checks across a process pool.
+
+    Files are checked by :func:`_iter_file_results` in *jobs* worker
+    processes and the results are merged back in discovery order, so
+    findings, counts, and parse warnings come out exactly as in a
+    serial run.  Workers share the on-disk *cache* (entries are
+    written atomically) and report their hit and miss counts through
+    the merged result.
+
+    Args:
+        files: Discovered Python file paths.
+        config: Loaded docvet configuration.
+        jobs: Number of worker processes.
+        presence: Whether the presence check is enabled.
+        discovery_mode: Controls which git diff variant to run.
+        show_progress: Display a progress bar on stderr.
+        cache: On-disk result cache, or *None* to always analyse.
+
+    Returns:
+        The merged results for all files.
+    """
+    total = _FileResults()
+    for _file_path, result in _iter_file_results(
+        files,
+        config,
+        jobs=jobs,
+        presence=presence,
+        discovery_mode=discovery_mode,
+        show_progress=show_progress,
+        cache=cache,
+    ):
+        total.merge(result)
+    return total
+
+
+def _run_streaming(
+    files: list[Path],
+    config: DocvetConfig,
+    stream: _FindingStream,
+    *,
+    jobs: int,
+    presence: bool,
+    discovery_mode: DiscoveryMode,
+    cache: _ResultCache | None = None,
+) -> _FileResults:
+    """Run the per-file checks and hand each file's findings to *stream*.
+
+    Like :func:`_run_parallel`, but a file's presence, enrichment, and
+    freshness findings are emitted as soon as that file is checked and
+    are not kept: the returned result carries only the merged counts.
+
+    Args:
+        files: Discovered Python file paths.
+        config: Loaded docvet configuration.
+        stream: Writer that filters, reports, and tallies findings.
+        jobs: Number of worker processes; ``1`` checks in-process.
+        presence: Whether the presence check is enabled.
+        discovery_mode: Controls which git diff variant to run.
+        cache: On-disk result cache, or *None* to always analyse.
+
+    Returns:
+        Merged coverage, symbol, and cache counts with empty finding
+        lists.
+    """
+    total = _FileResults()
+    for _file_path, result in _iter_file_results(
+        files,
+        config,
+        jobs=jobs,
+        presence=presence,
+        discovery_mode=discovery_mode,
+        cache=cache,
+    ):
+        stream.emit(
+            {
+                "presence": result.presence,
+                "enrichment": result.enrichment,
+                "freshness": result.freshness,
+            },
+            suppressions=result.suppressions,
+        )
+        total.merge(
+            replace(result, presence=[], enrichment=[], freshness=[], suppressions={})
+        )
+    return total
 
 
 # ---------------------------------------------------------------------------
@@ -114,6 +909,9 @@ def _write_timing(
 ) -> None:
     """Write a per-check timing line to stderr when verbose.
 
+    Also records the check's time in the active run profile, if any,
+    regardless of verbosity.
+
     Args:
         name: Check name (e.g. ``"enrichment"``).
         file_count: Number of files that were checked.
@@ -123,52 +921,92 @@ def _write_timing(
         enabled: Extra gate — set to *False* to suppress output
             (used for griffe when not installed).
     """
+    profile = active_profile()
+    if enabled and profile is not None:
+        profile.record(profile.checks, name, elapsed)
     if enabled and verbose and not quiet:
         sys.stderr.write(f"{name}: {file_count} files in {elapsed:.1f}s\n")
 
 
+def _finish_cache(
+    cache: _ResultCache | None,
+    *,
+    verbose: bool,
+    quiet: bool,
+) -> None:
+    """Prune the result cache and report its hit and miss counts.
+
+    Args:
+        cache: The run's result cache, or *None* when caching is off.
+        verbose: Whether verbose mode is active.
+        quiet: Whether quiet mode is active.
+    """
+    if cache is None:
+        return
+    cache.prune()
+    if verbose and not quiet:
+        sys.stderr.write(f"cache: {cache.hits} hits, {cache.misses} misses\n")
+
+
 def _run_enrichment(
     files: list[Path],
     config: DocvetConfig,
     *,
     show_progress: bool = False,
+    store: _ParsedFileStore | None = None,
+    cache: _ResultCache | None = None,
 ) -> tuple[list[Finding], int]:
     """Run the enrichment check on discovered files.
 
     Reads each file, parses its AST, and runs all enabled enrichment
     rules. Passes ``config.docstring_style`` to the enrichment checker
     for style-aware section detection and rule gating. Files that fail
-    to parse are skipped with a warning.
+    to parse are skipped with a warning. Files with a *cache* entry for
+    their current content are not parsed; their stored findings and
+    symbol count are used instead.
 
     Args:
         files: Discovered Python file paths.
         config: Loaded docvet configuration.
         show_progress: Display a progress bar on stderr.
+        store: Parsed-file store shared with other runners.  A private
+            store is used when not provided.
+        cache: On-disk result cache, or *None* to always analyse.
 
     Returns:
         A tuple of ``(findings, symbol_count)`` where *symbol_count*
         is the total documented symbols analyzed across all files.
     """
+    if store is None:
+        store = _ParsedFileStore()
     all_findings: list[Finding] = []
     symbol_count = 0
     with typer.progressbar(
         files, label="enrichment", file=sys.stderr, hidden=not show_progress
     ) as progress:
-        for file_path in progress:
-            source = file_path.read_text(encoding="utf-8")
-            try:
-                tree = _cli_pkg.ast.parse(source, filename=str(file_path))
-            except SyntaxError:
-                typer.echo(f"warning: {file_path}: failed to parse, skipping", err=True)
-                continue
-            symbol_count += len(_cli_pkg.get_documented_symbols(tree))
-            findings = _cli_pkg.check_enrichment(
-                source,
-                tree,
-                config.enrichment,
-                str(file_path),
-                style=config.docstring_style,
-            )
+        for file_path in timed_files(progress):
+            cached = None
+            if cache is not None:
+                cached = cache.get_enrichment(file_path, store.source(file_path))
+            if cached is not None:
+                findings, count = cached
+            else:
+                parsed = store.get(file_path)
+                if parsed is None:
+                    continue
+                count = len(parsed.symbols)
+                findings = _cli_pkg.check_enrichment(
+                    parsed.source,
+                    parsed.tree,
+                    config.enrichment,
+                    str(file_path),
+                    style=config.docstring_style,
+                    symbols=parsed.symbols,
+                    node_index=parsed.node_index,
+                )
+                if cache is not None:
+                    cache.put_enrichment(file_path, parsed.source, findings, count)
+            symbol_count += count
             all_findings.extend(findings)
     return all_findings, symbol_count
 
@@ -178,39 +1016,57 @@ def _run_presence(
     config: DocvetConfig,
     *,
     show_progress: bool = False,
+    store: _ParsedFileStore | None = None,
+    cache: _ResultCache | None = None,
 ) -> tuple[list[Finding], PresenceStats]:
     """Run the presence check on discovered files.
 
     Reads each file, parses its AST, and checks for missing docstrings.
     Files that fail to parse are skipped with a warning. Aggregates
     per-file coverage statistics into a single :class:`PresenceStats`.
+    Files with a *cache* entry for their current content reuse the
+    stored findings and statistics without being parsed.
 
     Args:
         files: Discovered Python file paths.
         config: Loaded docvet configuration.
         show_progress: Display a progress bar on stderr.
+        store: Parsed-file store shared with other runners.  A private
+            store is used when not provided.
+        cache: On-disk result cache, or *None* to always analyse.
 
     Returns:
         A tuple of ``(findings, stats)`` where *findings* is a list of
         presence findings and *stats* is the aggregate coverage across
         all files.
     """
+    if store is None:
+        store = _ParsedFileStore()
     all_findings: list[Finding] = []
     total_documented = 0
     total_total = 0
     with typer.progressbar(
         files, label="presence", file=sys.stderr, hidden=not show_progress
     ) as progress:
-        for file_path in progress:
-            source = file_path.read_text(encoding="utf-8")
-            try:
-                _cli_pkg.ast.parse(source, filename=str(file_path))
-            except SyntaxError:
-                typer.echo(f"warning: {file_path}: failed to parse, skipping", err=True)
-                continue
-            findings, stats = _cli_pkg.check_presence(
-                source, str(file_path), config.presence
-            )
+        for file_path in timed_files(progress):
+            cached = None
+            if cache is not None:
+                cached = cache.get_presence(file_path, store.source(file_path))
+            if cached is not None:
+                findings, stats = cached
+            else:
+                parsed = store.get(file_path)
+                if parsed is None:
+                    continue
+                findings, stats = _cli_pkg.check_presence(
+                    parsed.source,
+                    str(file_path),
+                    config.presence,
+                    tree=parsed.tree,
+                    symbols=parsed.symbols,
+                )
+                if cache is not None:
+                    cache.put_presence(file_path, parsed.source, findings, stats)
             all_findings.extend(findings)
             total_documented += stats.documented
             total_total += stats.total
@@ -224,13 +1080,24 @@ def _run_freshness(
     discovery_mode: DiscoveryMode = DiscoveryMode.DIFF,
     *,
     show_progress: bool = False,
+    store: _ParsedFileStore | None = None,
+    cache: _ResultCache | None = None,
+    blame_latencies: dict[Path, tuple[float, float]] | None = None,
 ) -> tuple[list[Finding], int]:
     """Run the freshness check on discovered files.
 
-    For diff mode, reads each file, parses the AST, obtains its git
-    diff, and calls ``check_freshness_diff``. For drift mode, reads
-    each file, parses the AST, runs ``git blame --line-porcelain``,
-    and calls ``check_freshness_drift``.
+    For diff mode, runs one ``git diff`` for all files, then parses
+    each file and calls ``check_freshness_diff`` with its section of
+    the diff. For drift mode, parses
+    every file, blames the parseable ones concurrently on a bounded
+    thread pool (streaming each ``git blame --porcelain`` into
+    the timestamp parser), and calls ``check_freshness_drift`` in file
+    order. Findings depend on git state and are never cached, but in
+    diff mode a file with an empty diff takes its symbol count from
+    *cache* instead of being parsed, and in drift mode committed files
+    whose git blob and last touching commit are unchanged since an
+    earlier run reuse their cached blame timestamps instead of being
+    blamed again.
 
     Args:
         files: Discovered Python file paths.
@@ -238,51 +1105,94 @@ def _run_freshness(
         freshness_mode: The freshness check strategy (diff or drift).
         discovery_mode: Controls which git diff variant to run.
         show_progress: Display a progress bar on stderr.
+        store: Parsed-file store shared with other runners.  A private
+            store is used when not provided.
+        cache: On-disk result cache for symbol counts and blame
+            timestamps, or *None*.
+        blame_latencies: Filled with the ``(start, end)``
+            ``time.perf_counter`` readings of each drift-mode blame per
+            file actually blamed, when provided.
 
     Returns:
         A tuple of ``(findings, symbol_count)`` where *symbol_count*
         is the total documented symbols analyzed across all files.
     """
+    if store is None:
+        store = _ParsedFileStore()
     if freshness_mode is not FreshnessMode.DIFF:
         all_findings: list[Finding] = []
         symbol_count = 0
-        with typer.progressbar(
-            files, label="freshness", file=sys.stderr, hidden=not show_progress
-        ) as progress:
-            for file_path in progress:
-                source = file_path.read_text(encoding="utf-8")
-                try:
-                    tree = _cli_pkg.ast.parse(source, filename=str(file_path))
-                except SyntaxError:
-                    typer.echo(
-                        f"warning: {file_path}: failed to parse, skipping", err=True
+        parsed_files = {
+            file_path: parsed
+            for file_path in files
+            if (parsed := store.get(file_path)) is not None
+        }
+        blame_keys: dict[Path, str] = {}
+        cached: dict[Path, dict[int, int]] = {}
+        if cache is not None:
+            blame_keys = _cli_pkg._get_git_blame_keys(config.project_root)
+            for file_path in parsed_files:
+                blame_key = blame_keys.get(file_path)
+                if blame_key is not None:
+                    hit = cache.get_blame(file_path, blame_key)
+                    if hit is not None:
+                        cached[file_path] = hit
+        to_blame = [f for f in parsed_files if f not in cached]
+        blame = functools.partial(_timed_blame, project_root=config.project_root)
+        with ThreadPoolExecutor(max_workers=_blame_workers(len(to_blame))) as executor:
+            results = executor.map(blame, to_blame)
+            with typer.progressbar(
+                parsed_files.items(),
+                length=len(parsed_files),
+                label="freshness",
+                file=sys.stderr,
+                hidden=not show_progress,
+            ) as progress:
+                for file_path, parsed in timed_files(
+                    progress, key=lambda item: item[0]
+                ):
+                    timestamps = cached.get(file_path)
+                    if timestamps is None:
+                        timestamps, span = next(results)
+                        if blame_latencies is not None:
+                            blame_latencies[file_path] = span
+                        blame_key = blame_keys.get(file_path)
+                        if cache is not None and blame_key is not None:
+                            cache.put_blame(file_path, blame_key, timestamps)
+                    symbol_count += len(parsed.symbols)
+                    findings = _cli_pkg.check_freshness_drift(
+                        str(file_path),
+                        "",
+                        parsed.tree,
+                        config.freshness,
+                        line_map=parsed.line_map,
+                        timestamps=timestamps,
                     )
-                    continue
-                symbol_count += len(_cli_pkg.get_documented_symbols(tree))
-                blame_output = _cli_pkg._get_git_blame(file_path, config.project_root)
-                findings = _cli_pkg.check_freshness_drift(
-                    str(file_path), blame_output, tree, config.freshness
-                )
-                all_findings.extend(findings)
+                    all_findings.extend(findings)
         return all_findings, symbol_count
 
     all_findings: list[Finding] = []
     symbol_count = 0
+    diffs = _cli_pkg._get_git_diffs(config.project_root, discovery_mode)
     with typer.progressbar(
         files, label="freshness", file=sys.stderr, hidden=not show_progress
     ) as progress:
-        for file_path in progress:
-            source = file_path.read_text(encoding="utf-8")
-            try:
-                tree = _cli_pkg.ast.parse(source, filename=str(file_path))
-            except SyntaxError:
-                typer.echo(f"warning: {file_path}: failed to parse, skipping", err=True)
+        for file_path in timed_files(progress):
+            diff_output = diffs.get(file_path, "")
+            if not diff_output and cache is not None:
+                count = cache.get_symbol_count(file_path, store.source(file_path))
+                if count is not None:
+                    symbol_count += count
+                    continue
+            parsed = store.get(file_path)
+            if parsed is None:
                 continue
-            symbol_count += len(_cli_pkg.get_documented_symbols(tree))
-            diff_output = _cli_pkg._get_git_diff(
-                file_path, config.project_root, discovery_mode
+            symbol_count += len(parsed.symbols)
+            if cache is not None:
+                cache.put_symbol_count(file_path, parsed.source, len(parsed.symbols))
+            findings = _cli_pkg.check_freshness_diff(
+                str(file_path), diff_output, parsed.tree, line_map=parsed.line_map
             )
-            findings = _cli_pkg.check_freshness_diff(str(file_path), diff_output, tree)
             all_findings.extend(findings)
     return all_findings, symbol_count
 
@@ -312,6 +1222,9 @@ def _run_griffe(
     *,
     verbose: bool = False,
     quiet: bool = False,
+    targeted: bool = False,
+    jobs: int = 1,
+    tree: _ModuleTree | None = None,
 ) -> tuple[list[Finding], int]:
     """Run the griffe compatibility check on discovered files.
 
@@ -323,6 +1236,12 @@ def _run_griffe(
         config: Loaded docvet configuration.
         verbose: Whether verbose mode is enabled.
         quiet: Whether quiet mode is enabled.
+        targeted: Visit only the modules backing *files* instead of
+            loading whole packages (used for diff, staged, and
+            explicit file runs).
+        jobs: Worker processes for loading whole packages.
+        tree: Resident module tree to reuse in targeted mode (kept by
+            the ``docvet serve`` daemon).
 
     Returns:
         A tuple of ``(findings, file_count)`` where *file_count*
@@ -337,7 +1256,10 @@ def _run_griffe(
     src_root = config.project_root / config.src_root
     if not src_root.is_dir():
         return [], 0
-    return _cli_pkg.check_griffe_compat(src_root, files), len(files)
+    findings = _cli_pkg.check_griffe_compat(
+        src_root, files, targeted=targeted, jobs=jobs, tree=tree
+    )
+    return findings, len(files)
 
 
 # ---------------------------------------------------------------------------
@@ -9,13 +9,12 @@ produces warnings and empty brackets suppress nothing, rather than
 silently falling back to blanket suppression. Operates as a
 post-filter on the findings list — no ``_check_*`` functions are modified.
 
-The rule ID registry is imported from the MCP catalog when available.
-When the ``mcp`` extra is not installed, rule validation is skipped
-and suppression operates without unknown-rule warnings.
+The rule ID registry comes from the shared rule catalog in
+:mod:`docvet.checks._catalog`, which is plain data, so validating rule
+IDs never loads the MCP server or its ``mcp`` dependency.
 
 Attributes:
     KNOWN_RULES: Set of all valid docvet rule IDs for validation.
-        Empty when the ``mcp`` extra is not installed.
 
 Examples:
     Parse and filter in one pass:
@@ -41,15 +40,9 @@ import tokenize
 from dataclasses import dataclass, field
 
 from docvet.checks import Finding
-
-try:
-    from docvet.mcp._catalog import _RULE_TO_CHECK
-except ImportError:
-    # MCP extra not installed — rule validation unavailable.
-    _RULE_TO_CHECK: dict[str, str] = {}
+from docvet.checks._catalog import _RULE_TO_CHECK
 
 # Complete set of known rule IDs for validation.
-# Empty when the MCP extra is not installed; validation is skipped.
 KNOWN_RULES: frozenset[str] = frozenset(_RULE_TO_CHECK)
 
 # Regex for the directive payload after ``# docvet:``.
@@ -66,6 +59,11 @@ _DIRECTIVE_RE = re.compile(
     r"(?:\[\s*(?P<rules>[^\]]*)\s*\])?"
 )
 
+# Cheap whole-source prefilter: a file without a ``docvet:`` marker
+# (allowing the same whitespace as ``_DIRECTIVE_RE``) has no directives,
+# so tokenizing it can be skipped.
+_DIRECTIVE_HINT_RE = re.compile(r"docvet\s*:")
+
 
 @dataclass
 class SuppressionMap:
@@ -98,7 +96,8 @@ def parse_suppression_directives(
     """Parse suppression comments from Python source code.
 
     Uses the ``tokenize`` module to extract only real ``COMMENT`` tokens,
-    avoiding false positives from ``#`` inside string literals. Validates
+    avoiding false positives from ``#`` inside string literals.  Sources
+    without a ``docvet:`` marker anywhere are not tokenized. Validates
     rule IDs against the known rule set and emits warnings to stderr for
     unknown or invalid rules. Such rule IDs are recorded for forward-
     compatibility but only suppress findings when they match exactly.
@@ -120,7 +119,7 @@ def parse_suppression_directives(
     """
     result = SuppressionMap()
 
-    if not source:
+    if not source or not _DIRECTIVE_HINT_RE.search(source):
         return result
 
     try:
@@ -159,8 +158,8 @@ def _parse_rules(
 ) -> set[str] | None:
     """Parse and validate rule IDs from bracket content.
 
-    When :data:`KNOWN_RULES` is empty (MCP extra not installed),
-    validation is skipped and no unknown-rule warnings are emitted.
+    Rule IDs missing from :data:`KNOWN_RULES` produce an unknown-rule
+    warning but are still kept.
 
     Args:
         raw: Comma-separated rule string from the bracket group, or
@@ -180,7 +179,7 @@ def _parse_rules(
         rule = part.strip()
         if not rule:
             continue
-        if KNOWN_RULES and rule not in KNOWN_RULES:
+        if rule not in KNOWN_RULES:
             sys.stderr.write(
                 f"warning: {file_path}:{line_no}: "
                 f"unknown rule {rule!r} in suppression comment\n"
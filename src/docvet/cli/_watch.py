@@ -0,0 +1,706 @@
+"""Filesystem watch mode for ``docvet check --watch``.
+
+A :class:`_WatchSession` keeps every discovered file's presence,
+enrichment, freshness, and griffe results in memory and re-analyses only
+the files whose modification time or size changed, so the latency of a
+re-check follows the size of the edit rather than the size of the
+project.  Presence coverage counts and the documented-symbol count are
+kept as running totals, and coverage is recomputed only when files
+appear or disappear.
+
+Changes are detected with inotify on the directories holding discovered
+files when the platform provides it (Linux, ``--all`` and explicit file
+runs).  Otherwise discovery is re-run and every file is ``stat``-ed each
+``_POLL_INTERVAL`` seconds.  The git-based modes (default diff and
+``--staged``) always poll, because staging or committing changes the
+file set without touching any source file.
+
+See Also:
+    [`docvet.cli`][]: The ``check`` command that enters watch mode.
+    [`docvet.cli._runners`][]: Per-file runners reused for every re-check.
+
+Examples:
+    Re-check the project whenever a file is saved:
+
+    ```bash
+    docvet check --all --watch
+    ```
+"""
+
+from __future__ import annotations
+
+import ctypes
+import errno
+import importlib.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+
+import docvet.cli as _cli_pkg
+from docvet.checks import Finding
+from docvet.checks.presence import PresenceStats
+from docvet.config import DocvetConfig
+
+from . import DiscoveryMode
+from ._cache import _ResultCache
+from ._output import _output_and_exit
+from ._runners import _FileResults, _finish_cache, _iter_file_results
+from ._suppression import SuppressionMap
+
+if TYPE_CHECKING:
+    from docvet.checks.griffe_compat import _ModuleTree
+
+# Seconds between rescans when inotify is unavailable.
+_POLL_INTERVAL = 0.5
+
+# Seconds to keep collecting inotify events after the first one, so an
+# editor's write-then-rename save is re-checked once.
+_SETTLE_DELAY = 0.05
+
+# inotify(7) event flags.
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+# ``struct inotify_event`` header: wd, mask, cookie, name length.
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+# Returned by a trigger's ``wait`` when every file must be re-stat-ed.
+_RESCAN = None
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    """Return the ``(mtime_ns, size)`` stamp of *path*.
+
+    Args:
+        path: File to stat.
+
+    Returns:
+        The stamp, or *None* when the file no longer exists.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# ---------------------------------------------------------------------------
+# Incremental results
+# ---------------------------------------------------------------------------
+
+
+class _WatchSession:
+    """Per-file check results kept live across edits.
+
+    Attributes:
+        config (DocvetConfig): Loaded docvet configuration.
+        files (dict[Path, tuple[int, int]]): Discovered files in
+            discovery order, mapped to their ``(mtime_ns, size)`` stamp
+            when last checked.
+        presence_stats (PresenceStats): Running coverage counts over
+            all files.
+        symbol_count (int): Running count of analysed symbols.
+        coverage (list[Finding]): Coverage findings for the current
+            file set.
+
+    Examples:
+        Check everything once, then only what changed:
+
+        ```python
+        session = _WatchSession(config, DiscoveryMode.ALL, presence=True)
+        session.update(None)
+        session.update({Path("src/pkg/mod.py")})
+        session.findings_by_check()
+        ```
+    """
+
+    def __init__(
+        self,
+        config: DocvetConfig,
+        discovery_mode: DiscoveryMode,
+        *,
+        explicit: Iterable[Path] = (),
+        presence: bool,
+        griffe: bool = False,
+    ) -> None:
+        """Create an empty session.
+
+        Args:
+            config: Loaded docvet configuration.
+            discovery_mode: Mode used to (re)discover files.
+            explicit: File paths for ``FILES`` mode.
+            presence: Whether the presence check is enabled.
+            griffe: Whether to run griffe on changed files, against a
+                module tree kept for the whole session.
+        """
+        self.config = config
+        self.files: dict[Path, tuple[int, int]] = {}
+        self.presence_stats = PresenceStats(documented=0, total=0)
+        self.symbol_count = 0
+        self.coverage: list[Finding] = []
+        self._mode = discovery_mode
+        self._explicit = tuple(explicit)
+        self._presence = presence
+        self._requested: list[Path] | None = None
+        self._results: dict[Path, _FileResults] = {}
+        self._griffe: dict[Path, list[Finding]] = {}
+        self._tree: _ModuleTree | None = None
+        if griffe:
+            from docvet.checks.griffe_compat import _ModuleTree
+
+            self._tree = _ModuleTree(config.project_root / config.src_root)
+
+    def _discover(self) -> list[Path]:
+        """Return the current file set.
+
+        Explicit files are discovered once; afterwards the same paths
+        are re-stat-ed, so a deleted file returns when it is recreated
+        and no warning is repeated on every poll.
+
+        Returns:
+            Discovered file paths in discovery order.
+        """
+        if self._requested is not None:
+            return self._requested
+        discovered = _cli_pkg.discover_files(
+            self.config, self._mode, files=self._explicit
+        )
+        if self._mode is DiscoveryMode.FILES:
+            self._requested = discovered
+        return discovered
+
+    def update(
+        self,
+        touched: set[Path] | None,
+        *,
+        jobs: int = 1,
+        show_progress: bool = False,
+        cache: _ResultCache | None = None,
+    ) -> int:
+        """Re-check the files that changed since the last update.
+
+        A path in *touched* that is not yet part of the file set makes
+        an ``--all`` session re-run discovery, which applies the
+        ``exclude`` patterns to the new file.
+
+        Args:
+            touched: Paths reported by the change trigger, or *None* to
+                re-run discovery and compare every file's stamp.
+            jobs: Worker processes for the per-file checks.
+            show_progress: Display a progress bar on stderr.
+            cache: On-disk result cache, or *None* to always analyse.
+
+        Returns:
+            The number of files re-checked or dropped; ``0`` when
+            nothing changed.
+        """
+        if (
+            touched is not None
+            and self._mode is DiscoveryMode.ALL
+            and not touched.issubset(self.files)
+        ):
+            touched = None
+        if touched is None:
+            candidates = {path: _stamp(path) for path in self._discover()}
+        else:
+            candidates = dict(self.files)
+            candidates.update({p: _stamp(p) for p in touched if p in self.files})
+        stamps = {p: s for p, s in candidates.items() if s is not None}
+
+        removed = [path for path in self.files if path not in stamps]
+        changed = [path for path, s in stamps.items() if self.files.get(path) != s]
+        membership_changed = stamps.keys() != self.files.keys()
+        for path in removed + changed:
+            self._drop(path)
+        self.files = stamps
+
+        if changed:
+            for path, result in _iter_file_results(
+                changed,
+                self.config,
+                jobs=jobs if len(changed) > 1 else 1,
+                presence=self._presence,
+                discovery_mode=self._mode,
+                show_progress=show_progress,
+                cache=cache,
+            ):
+                self._add(path, result)
+            if self._tree is not None:
+                for path in changed:
+                    self._griffe[path], _ = _cli_pkg._run_griffe(
+                        [path], self.config, targeted=True, tree=self._tree
+                    )
+        if membership_changed:
+            self.coverage, _ = _cli_pkg._run_coverage(list(stamps), self.config)
+        return len(changed) + len(removed)
+
+    def _add(self, path: Path, result: _FileResults) -> None:
+        """Store *path*'s results and add its counts to the totals.
+
+        Args:
+            path: Checked file.
+            result: The file's per-file check results.
+        """
+        self._results[path] = result
+        self._count(result, 1)
+
+    def _drop(self, path: Path) -> None:
+        """Forget *path*'s results and subtract its counts.
+
+        Args:
+            path: File that changed or disappeared.
+        """
+        self._griffe.pop(path, None)
+        result = self._results.pop(path, None)
+        if result is not None:
+            self._count(result, -1)
+
+    def _count(self, result: _FileResults, sign: int) -> None:
+        """Add (``sign=1``) or subtract (``sign=-1``) one file's counts.
+
+        Args:
+            result: The file's per-file check results.
+            sign: ``1`` or ``-1``.
+        """
+        stats = result.presence_stats
+        self.presence_stats = PresenceStats(
+            documented=self.presence_stats.documented + sign * stats.documented,
+            total=self.presence_stats.total + sign * stats.total,
+        )
+        self.symbol_count += sign * result.symbol_count
+
+    def findings_by_check(self) -> dict[str, list[Finding]]:
+        """Collect the current findings in discovery order.
+
+        Returns:
+            Findings grouped by check name, as ``check`` reports them.
+        """
+        grouped: dict[str, list[Finding]] = {
+            "presence": [],
+            "enrichment": [],
+            "freshness": [],
+            "coverage": list(self.coverage),
+            "griffe": [],
+        }
+        for path in self.files:
+            result = self._results.get(path)
+            if result is not None:
+                grouped["presence"].extend(result.presence)
+                grouped["enrichment"].extend(result.enrichment)
+                grouped["freshness"].extend(result.freshness)
+            grouped["griffe"].extend(self._griffe.get(path, ()))
+        return grouped
+
+    def suppressions(self) -> dict[str, SuppressionMap]:
+        """Collect the suppression maps parsed while checking.
+
+        Returns:
+            Suppression maps of files with per-file findings, keyed by
+            file.
+        """
+        merged: dict[str, SuppressionMap] = {}
+        for result in self._results.values():
+            merged.update(result.suppressions)
+        return merged
+
+
+# ---------------------------------------------------------------------------
+# Change triggers
+# ---------------------------------------------------------------------------
+
+
+class _PollTrigger:
+    """Change trigger that sleeps, then asks for a full rescan.
+
+    Attributes:
+        name (str): Mechanism shown in the startup message.
+
+    Examples:
+        ```python
+        trigger = _PollTrigger()
+        trigger.wait()  # None after _POLL_INTERVAL seconds
+        ```
+    """
+
+    name = "polling"
+
+    def watch(self, dirs: Iterable[Path]) -> None:
+        """Ignore *dirs*; every poll rescans the whole file set.
+
+        Args:
+            dirs: Directories holding watched files.
+        """
+
+    def wait(self) -> set[Path] | None:
+        """Sleep for one poll interval.
+
+        Returns:
+            Always *None*: the caller must rescan.
+        """
+        time.sleep(_POLL_INTERVAL)
+        return _RESCAN
+
+    def close(self) -> None:
+        """Release nothing; polling holds no resources."""
+
+
+class _InotifyTrigger:
+    """Change trigger backed by a Linux inotify descriptor.
+
+    Watches are added per directory (inotify is not recursive) for the
+    directories that hold discovered files.  Events for files are
+    reported as touched paths; directory changes and queue overflows
+    ask the caller for a full rescan.
+
+    Attributes:
+        name (str): Mechanism shown in the startup message.
+
+    Examples:
+        ```python
+        trigger = _InotifyTrigger.open()
+        if trigger is not None:
+            trigger.watch({Path("src/pkg")})
+            touched = trigger.wait()
+        ```
+    """
+
+    name = "inotify"
+
+    def __init__(self, fd: int, libc: ctypes.CDLL) -> None:
+        """Wrap an initialised inotify descriptor.
+
+        Args:
+            fd: Non-blocking inotify file descriptor.
+            libc: The C library providing ``inotify_add_watch``.
+        """
+        self._fd = fd
+        self._libc = libc
+        self._dirs: dict[int, Path] = {}
+
+    @classmethod
+    def open(cls) -> _InotifyTrigger | None:
+        """Create an inotify trigger when the platform supports it.
+
+        Returns:
+            The trigger, or *None* on platforms without inotify or when
+            the descriptor cannot be created.
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            init = libc.inotify_init1
+            add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError):
+            return None
+        add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        return cls(fd, libc)
+
+    def watch(self, dirs: Iterable[Path]) -> None:
+        """Add watches for the directories not watched yet.
+
+        Args:
+            dirs: Directories holding watched files.
+
+        Raises:
+            OSError: If a watch cannot be added, typically because the
+                ``fs.inotify.max_user_watches`` limit is reached.
+        """
+        watched = set(self._dirs.values())
+        for directory in dirs:
+            if directory in watched:
+                continue
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), _WATCH_MASK
+            )
+            if wd < 0:
+                code = ctypes.get_errno()
+                if code == errno.ENOENT:
+                    continue
+                raise OSError(code, os.strerror(code), str(directory))
+            self._dirs[wd] = directory
+
+    def wait(self) -> set[Path] | None:
+        """Block until files change, then collect a settled batch.
+
+        Returns:
+            The ``.py`` paths that were written, created, moved, or
+            deleted, or *None* when a directory changed or events were
+            lost and the caller must rescan.
+        """
+        select.select([self._fd], [], [])
+        touched: set[Path] = set()
+        rescan = False
+        while select.select([self._fd], [], [], _SETTLE_DELAY)[0]:
+            rescan = self._read(touched) or rescan
+        return _RESCAN if rescan else touched
+
+    def _read(self, touched: set[Path]) -> bool:
+        """Read pending events into *touched*.
+
+        Args:
+            touched: Set that receives the changed ``.py`` paths.
+
+        Returns:
+            ``True`` when an event requires a full rescan.
+        """
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return False
+        rescan = False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                rescan = True
+            elif mask & (_IN_Q_OVERFLOW | _IN_ISDIR):
+                rescan = True
+            elif wd in self._dirs and name.endswith(".py"):
+                touched.add(self._dirs[wd] / name)
+        return rescan
+
+    def close(self) -> None:
+        """Close the inotify descriptor, removing all watches."""
+        os.close(self._fd)
+
+
+def _watch_dirs(session: _WatchSession, mode: DiscoveryMode) -> set[Path]:
+    """Return the directories to watch for *session*'s files.
+
+    Explicit file runs watch each file's directory.  ``--all`` runs
+    also watch the ancestors up to the source root, so new files and
+    packages are noticed.
+
+    Args:
+        session: The watch session.
+        mode: The session's discovery mode.
+
+    Returns:
+        Directories to watch.
+    """
+    if mode is not DiscoveryMode.ALL:
+        return {path.parent for path in session.files}
+    root = session.config.project_root / session.config.src_root
+    dirs: set[Path] = {root}
+    for path in session.files:
+        directory = path.parent
+        while directory not in dirs:
+            dirs.add(directory)
+            if directory == root or directory.parent == directory:
+                break
+            directory = directory.parent
+    return dirs
+
+
+def _open_trigger(
+    session: _WatchSession, mode: DiscoveryMode
+) -> _InotifyTrigger | _PollTrigger:
+    """Pick the change trigger for *session*.
+
+    Args:
+        session: The watch session, after its first update.
+        mode: The session's discovery mode.
+
+    Returns:
+        An inotify trigger watching the session's directories, or a
+        polling trigger for git-based modes and when inotify is
+        unavailable.
+    """
+    if mode not in (DiscoveryMode.ALL, DiscoveryMode.FILES):
+        return _PollTrigger()
+    trigger = _InotifyTrigger.open()
+    if trigger is None:
+        return _PollTrigger()
+    return _rewatch(trigger, session, mode)
+
+
+def _rewatch(
+    trigger: _InotifyTrigger | _PollTrigger,
+    session: _WatchSession,
+    mode: DiscoveryMode,
+) -> _InotifyTrigger | _PollTrigger:
+    """Extend *trigger*'s watches to the session's current directories.
+
+    Args:
+        trigger: The active change trigger.
+        session: The watch session.
+        mode: The session's discovery mode.
+
+    Returns:
+        *trigger*, or a polling trigger when inotify watches run out.
+    """
+    if isinstance(trigger, _PollTrigger):
+        return trigger
+    try:
+        trigger.watch(_watch_dirs(session, mode))
+    except OSError as exc:
+        trigger.close()
+        typer.echo(
+            f"warning: inotify watch failed ({exc.strerror}), polling for changes",
+            err=True,
+        )
+        return _PollTrigger()
+    return trigger
+
+
+# ---------------------------------------------------------------------------
+# Watch loop
+# ---------------------------------------------------------------------------
+
+
+def _report(
+    ctx: typer.Context,
+    session: _WatchSession,
+    checks: list[str],
+    elapsed: float,
+) -> int:
+    """Write the summary and findings for the session's current state.
+
+    Args:
+        ctx: Typer context carrying global options in ``ctx.obj``.
+        session: The watch session.
+        checks: Names of the checks that ran.
+        elapsed: Seconds spent on the latest update.
+
+    Returns:
+        The exit code ``check`` would return for these findings.
+    """
+    config = session.config
+    findings_by_check = session.findings_by_check()
+    presence_stats = session.presence_stats if config.presence.enabled else None
+    file_count = len(session.files)
+    if not ctx.obj.get("quiet"):
+        sys.stderr.write(
+            _cli_pkg.format_summary(
+                file_count,
+                checks,
+                [f for findings in findings_by_check.values() for f in findings],
+                elapsed,
+                coverage_pct=None
+                if presence_stats is None
+                else presence_stats.percentage,
+            )
+        )
+    check_counts = {
+        "enrichment": session.symbol_count,
+        "freshness": session.symbol_count,
+        "coverage": len({path.parent for path in session.files}),
+    }
+    if "griffe" in checks:
+        check_counts["griffe"] = file_count
+    try:
+        _output_and_exit(
+            ctx,
+            findings_by_check,
+            config,
+            file_count,
+            checks,
+            presence_stats=presence_stats,
+            check_counts=check_counts,
+            suppressions=session.suppressions(),
+        )
+    except typer.Exit as exc:
+        return exc.exit_code
+    return 0  # pragma: no cover - _output_and_exit always raises
+
+
+def _run_watch(
+    ctx: typer.Context,
+    config: DocvetConfig,
+    discovery_mode: DiscoveryMode,
+    files: list[str] | None,
+    *,
+    jobs: int,
+    cache: _ResultCache | None,
+) -> None:
+    """Check once, then re-check changed files until interrupted.
+
+    The first pass checks every discovered file (using *jobs* workers
+    and the result cache); later passes re-check only changed files
+    in-process and report the full, updated set of findings.
+
+    Args:
+        ctx: Typer context carrying global options in ``ctx.obj``.
+        config: Loaded docvet configuration.
+        discovery_mode: The resolved discovery mode.
+        files: Raw file paths from positional args or ``--files``, or
+            *None*.
+        jobs: Worker processes for the first pass.
+        cache: On-disk result cache for the first pass, or *None*.
+
+    Raises:
+        typer.Exit: On Ctrl+C, with the exit code of the last report.
+    """
+    verbose = ctx.obj.get("verbose", False)
+    quiet = ctx.obj.get("quiet", False)
+    griffe_installed = importlib.util.find_spec("griffe") is not None
+    griffe = griffe_installed and config.docstring_style != "sphinx"
+    if not griffe_installed:
+        # Surfaces the same "griffe not installed" notice as ``check``.
+        _cli_pkg._run_griffe([], config, verbose=verbose, quiet=quiet)
+
+    checks: list[str] = []
+    if config.presence.enabled:
+        checks.append("presence")
+    checks.extend(["enrichment", "freshness", "coverage"])
+    if griffe:
+        checks.append("griffe")
+
+    session = _WatchSession(
+        config,
+        discovery_mode,
+        explicit=[Path(f) for f in files] if files else (),
+        presence=config.presence.enabled,
+        griffe=griffe,
+    )
+    start = time.perf_counter()
+    session.update(None, jobs=jobs, show_progress=sys.stderr.isatty(), cache=cache)
+    _finish_cache(cache, verbose=verbose, quiet=quiet)
+    code = _report(ctx, session, checks, time.perf_counter() - start)
+
+    trigger = _open_trigger(session, discovery_mode)
+    if not quiet:
+        typer.echo(
+            f"Watching {len(session.files)} file(s) for changes "
+            f"({trigger.name}); press Ctrl+C to stop.",
+            err=True,
+        )
+    try:
+        while True:
+            touched = trigger.wait()
+            start = time.perf_counter()
+            changed = session.update(touched)
+            if not changed:
+                continue
+            trigger = _rewatch(trigger, session, discovery_mode)
+            if not quiet:
+                typer.echo(f"\nRe-checked {changed} changed file(s)", err=True)
+            code = _report(ctx, session, checks, time.perf_counter() - start)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        trigger.close()
+    raise typer.Exit(code)
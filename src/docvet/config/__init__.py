@@ -17,6 +17,9 @@ and other rule toggles.
 Validation keys in ``_VALID_ENRICHMENT_KEYS`` are kept alphabetically.
 ``PresenceConfig`` fields include
 ``check_overload_docstrings`` for the overload-has-docstring rule.
+The top-level ``jobs`` key (a positive int or ``"auto"``) sets the
+worker-process count for per-file checks, and ``cache-max-size`` caps
+the on-disk result cache in megabytes.
 ``user_set_keys`` tracks which enrichment toggles were explicitly
 set by the user (for sphinx auto-disable logic).
 
@@ -266,6 +269,11 @@ class DocvetConfig:
         freshness (FreshnessConfig): Freshness check settings.
         enrichment (EnrichmentConfig): Enrichment check settings.
         presence (PresenceConfig): Presence check settings.
+        jobs (int | str): Worker processes for per-file checks, or
+            ``"auto"`` for one per CPU. Defaults to ``1`` (serial).
+        cache_max_size (int): Size limit in megabytes for the
+            ``.docvet_cache`` result cache; least recently used entries
+            are evicted beyond it. Defaults to ``64``.
         project_root (Path): Resolved project root directory.
 
     Examples:
@@ -301,6 +309,8 @@ class DocvetConfig:
     freshness: FreshnessConfig = field(default_factory=FreshnessConfig)
     enrichment: EnrichmentConfig = field(default_factory=EnrichmentConfig)
     presence: PresenceConfig = field(default_factory=PresenceConfig)
+    jobs: int | str = 1
+    cache_max_size: int = 64
     project_root: Path = field(default_factory=Path.cwd)
 
 
@@ -320,6 +330,8 @@ _VALID_TOP_KEYS: frozenset[str] = frozenset(
         "freshness",
         "enrichment",
         "presence",
+        "jobs",
+        "cache-max-size",
     }
 )
 
@@ -501,6 +513,37 @@ def _validate_string_list(
         _validate_check_names(data[key], section)  # type: ignore[arg-type]
 
 
+def _validate_jobs(value: object, section: str) -> None:
+    """Validate a ``jobs`` value: a positive int or ``"auto"``.
+
+    Args:
+        value: The raw config value.
+        section: Section label for error messages.
+    """
+    if value == "auto":
+        return
+    _validate_type(value, int, "jobs", section)
+    if value < 1:  # type: ignore[operator]
+        msg = f"docvet: 'jobs' in {section} must be >= 1 or \"auto\", got {value}"
+        print(msg, file=sys.stderr)
+        sys.exit(1)
+
+
+def _validate_positive_int(value: object, key: str, section: str) -> None:
+    """Validate that *value* is an int of at least 1.
+
+    Args:
+        value: The raw config value.
+        key: TOML key name for error messages.
+        section: Section label for error messages.
+    """
+    _validate_type(value, int, key, section)
+    if value < 1:  # type: ignore[operator]
+        msg = f"docvet: '{key}' in {section} must be >= 1, got {value}"
+        print(msg, file=sys.stderr)
+        sys.exit(1)
+
+
 # ---------------------------------------------------------------------------
 # Discovery
 # ---------------------------------------------------------------------------
@@ -646,7 +689,9 @@ def _parse_docvet_section(
     Validates ``docstring-style`` against ``_VALID_DOCSTRING_STYLES``.
     List-of-string fields (``exclude``, ``extend-exclude``,
     ``fail-on``, ``warn-on``) are validated via
-    :func:`_validate_string_list`.
+    :func:`_validate_string_list`, ``jobs`` via
+    :func:`_validate_jobs`, and ``cache-max-size`` via
+    :func:`_validate_positive_int`.
 
     Args:
         data: Mutable copy of the raw TOML ``[tool.docvet]`` section.
@@ -699,6 +744,12 @@ def _parse_docvet_section(
         _validate_string_list(converted, "fail_on", "fail-on", check_names=True)
     if "warn_on" in converted:
         _validate_string_list(converted, "warn_on", "warn-on", check_names=True)
+    if "jobs" in converted:
+        _validate_jobs(converted["jobs"], _TOOL_SECTION)
+    if "cache_max_size" in converted:
+        _validate_positive_int(
+            converted["cache_max_size"], "cache-max-size", _TOOL_SECTION
+        )
 
     return converted
 
@@ -848,7 +899,8 @@ def load_config(path: Path | None = None) -> DocvetConfig:
     passes it through to the config. Delegates ``fail-on``/``warn-on``
     resolution (including overlap detection and filtering) to
     :func:`_resolve_fail_warn`. Nested ``presence`` section is parsed
-    via :func:`_parse_presence`.
+    via :func:`_parse_presence`. ``jobs`` passes through unchanged
+    (a positive int or ``"auto"``), as does ``cache-max-size``.
 
     Args:
         path: Explicit path to a ``pyproject.toml``. When *None*,
@@ -884,6 +936,8 @@ def load_config(path: Path | None = None) -> DocvetConfig:
     raw_freshness = parsed.get("freshness")
     raw_enrichment = parsed.get("enrichment")
     raw_presence = parsed.get("presence")
+    raw_jobs = parsed.get("jobs")
+    raw_cache_max_size = parsed.get("cache_max_size")
 
     base_exclude: list[str] = (
         [str(x) for x in raw_exclude]
@@ -915,5 +969,11 @@ def load_config(path: Path | None = None) -> DocvetConfig:
             if isinstance(raw_presence, PresenceConfig)
             else PresenceConfig()
         ),
+        jobs=raw_jobs if isinstance(raw_jobs, int | str) else defaults.jobs,
+        cache_max_size=(
+            raw_cache_max_size
+            if isinstance(raw_cache_max_size, int)
+            else defaults.cache_max_size
+        ),
         project_root=project_root,
     )
@@ -151,7 +151,8 @@ def format_config_toml(
     """Format effective config as copy-paste-ready TOML.
 
     Renders the top-level ``[tool.docvet]`` keys (including
-    ``docstring-style``) inline, then delegates each nested section
+    ``docstring-style``, ``jobs``, and ``cache-max-size``) inline, then
+    delegates each nested section
     (freshness, enrichment — including ``require-returns``,
     ``require-param-agreement``, ``require-deprecation-notice``,
     ``exclude-args-kwargs``, ``check-extra-raises``,
@@ -179,6 +180,8 @@ def format_config_toml(
         ("exclude", "exclude"),
         ("fail_on", "fail-on"),
         ("warn_on", "warn-on"),
+        ("jobs", "jobs"),
+        ("cache_max_size", "cache-max-size"),
     ]
     for attr, kebab in top_fields:
         value = getattr(config, attr)
@@ -0,0 +1,703 @@
+"""Resident daemon that serves repeated CLI invocations over a Unix socket.
+
+``docvet serve`` keeps one interpreter alive with every module imported,
+loaded configurations, parsed source files, and griffe module trees
+warm.  The app callback in :mod:`docvet.cli` offers console-script runs
+of check subcommands to :func:`forward`, which sends them to a running
+daemon for the project and prints its captured output, or returns so
+the CLI runs in-process when no daemon answers.  Forwarding happens
+only after ``docvet.cli`` and Typer are imported, so a forwarded run
+still pays interpreter startup and that import; it saves the work that
+follows: loading configuration, importing the check modules, reading
+and parsing files, and building griffe module trees.  The gain grows
+with the number of files checked rather than trimming startup time.
+
+The wire protocol is one JSON object per line.  The daemon greets each
+connection it accepts; the client then sends the argument vector,
+working directory, terminal state, and ``GIT_*`` environment (so hooks
+that set ``GIT_INDEX_FILE`` or ``GIT_DIR`` check what they would
+in-process); the daemon runs the command with stdout and stderr
+captured and replies with both streams and the exit code.  Requests
+are served one at a time because each one changes the working
+directory and environment of the daemon process.  A client that is not
+greeted promptly, because another request is running, runs in-process
+instead of queueing, and once greeted it waits for its reply, so no
+command runs twice.  A client that sends nothing after the greeting
+is dropped.  A daemon built from a different docvet version replies
+with a fallback marker, so an upgraded client never runs against stale
+code.
+
+Set ``DOCVET_NO_DAEMON`` to any non-empty value to disable forwarding.
+
+Attributes:
+    NO_DAEMON_ENV: Environment variable that disables forwarding.
+
+Examples:
+    Start a daemon for the current project, then run checks as usual:
+
+    ```bash
+    $ docvet serve &
+    $ docvet check --staged
+    ```
+
+    Stop it again:
+
+    ```bash
+    $ docvet serve --stop
+    ```
+
+See Also:
+    [`docvet.cli`][]: CLI application with the ``serve`` subcommand.
+    [`docvet.lsp`][]: Editor integration that keeps per-document state.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib.metadata
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+import traceback
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import click
+
+    from docvet.checks.griffe_compat import _ModuleTree
+    from docvet.cli._runners import _ResidentFile
+    from docvet.config import DocvetConfig
+
+__all__ = ["forward", "start_server", "stop_server"]
+
+NO_DAEMON_ENV = "DOCVET_NO_DAEMON"
+
+# Subcommands forwarded to a running daemon.  Servers, ``fix`` (which
+# writes files), and ``config`` always run in-process.
+_FORWARDED_COMMANDS = frozenset(
+    {"check", "presence", "enrichment", "freshness", "coverage", "griffe"}
+)
+
+# Global options that consume the following argument as their value.
+_VALUE_OPTIONS = frozenset({"--format", "--output", "--config"})
+
+# How long a client waits to connect before running in-process.
+_CONNECT_TIMEOUT = 0.5
+
+# How long a client waits for the daemon to take its connection before
+# running in-process.  An idle daemon greets a new connection at once;
+# one busy with another request does not, and the client falls back
+# instead of queueing work the daemon would later run for nobody.
+_READY_TIMEOUT = 0.5
+
+# How long the daemon waits for an accepted client to send its request.
+# Requests are served one at a time, so a stalled client must not hold
+# the daemon.
+_REQUEST_TIMEOUT = 5.0
+
+
+# ---------------------------------------------------------------------------
+# Socket location and framing
+# ---------------------------------------------------------------------------
+
+
+def _socket_path(project_root: Path) -> Path:
+    """Return the daemon socket path for a project.
+
+    Sockets live in the temporary directory rather than the project,
+    because Unix socket paths are limited to about 100 bytes.
+
+    Args:
+        project_root: Resolved project root directory.
+
+    Returns:
+        A per-user, per-project socket path.
+    """
+    digest = hashlib.sha256(str(project_root).encode()).hexdigest()[:16]
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"docvet-{uid}-{digest}.sock"
+
+
+def _config_option(argv: list[str]) -> str | None:
+    """Return the value of a global ``--config`` option in *argv*.
+
+    Args:
+        argv: Command-line arguments after the program name.
+
+    Returns:
+        The option value, or *None* when ``--config`` is absent.
+    """
+    for i, arg in enumerate(argv):
+        if arg.startswith("--config="):
+            return arg.partition("=")[2]
+        if arg == "--config" and i + 1 < len(argv):
+            return argv[i + 1]
+    return None
+
+
+def _subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in *argv*, skipping global options.
+
+    Args:
+        argv: Command-line arguments after the program name.
+
+    Returns:
+        The first positional argument, or *None* when there is none.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in _VALUE_OPTIONS:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _project_root(argv: list[str], cwd: Path) -> Path:
+    """Resolve the project root the CLI would load configuration from.
+
+    Mirrors :func:`docvet.config.load_config`: the directory of an
+    explicit ``--config`` file, else of the nearest ``pyproject.toml``,
+    else the working directory.
+
+    Args:
+        argv: Command-line arguments after the program name.
+        cwd: The invocation's working directory.
+
+    Returns:
+        The resolved project root.
+    """
+    from docvet.config import _find_pyproject
+
+    explicit = _config_option(argv)
+    if explicit is not None:
+        return (cwd / explicit).parent.resolve()
+    pyproject = _find_pyproject(cwd)
+    if pyproject is None:
+        return cwd.resolve()
+    return pyproject.parent.resolve()
+
+
+def _send(conn: socket.socket, message: dict[str, object]) -> None:
+    """Write one JSON message line to *conn*.
+
+    Args:
+        conn: Connected socket.
+        message: JSON-serialisable message.
+    """
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _receive(conn: socket.socket) -> dict[str, object]:
+    """Read one JSON message line from *conn*.
+
+    Args:
+        conn: Connected socket.
+
+    Returns:
+        The decoded message.
+
+    Raises:
+        ConnectionError: If the peer closed the connection before
+            sending a complete line.
+    """
+    with conn.makefile("rb") as reader:
+        line = reader.readline()
+    if not line.endswith(b"\n"):
+        msg = "daemon closed the connection"
+        raise ConnectionError(msg)
+    return json.loads(line)
+
+
+def _connect(path: Path) -> socket.socket | None:
+    """Connect to the daemon socket at *path* if one is listening.
+
+    Args:
+        path: Socket path from :func:`_socket_path`.
+
+    Returns:
+        The connected socket, or *None* when no daemon owned by this
+        user is listening.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        if hasattr(os, "getuid") and path.stat().st_uid != os.getuid():
+            return None
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except OSError:
+        return None
+    try:
+        conn.settimeout(_CONNECT_TIMEOUT)
+        conn.connect(str(path))
+    except OSError:
+        conn.close()
+        return None
+    return conn
+
+
+def _git_environ() -> dict[str, str]:
+    """Return the ``GIT_*`` variables of this process's environment.
+
+    Hooks run git with variables such as ``GIT_INDEX_FILE`` and
+    ``GIT_DIR`` set, and the checks' git subprocesses must see the
+    client's values rather than the daemon's.
+
+    Returns:
+        Every environment variable whose name starts with ``GIT_``.
+    """
+    return {k: v for k, v in os.environ.items() if k.startswith("GIT_")}
+
+
+@contextlib.contextmanager
+def _client_environ(no_color: str, git_env: dict[str, str]) -> Iterator[None]:
+    """Apply a client's ``NO_COLOR`` and ``GIT_*`` variables for a run.
+
+    The daemon's own ``GIT_*`` variables are removed for the duration,
+    so a variable the client does not set never leaks into its run.
+    The previous environment is restored on exit.
+
+    Args:
+        no_color: The client's ``NO_COLOR`` value.
+        git_env: The client's ``GIT_*`` variables.
+
+    Yields:
+        Control to the run.
+    """
+    saved = _git_environ()
+    saved_no_color = os.environ.get("NO_COLOR")
+    for key in saved:
+        del os.environ[key]
+    os.environ.update(git_env)
+    os.environ["NO_COLOR"] = no_color
+    try:
+        yield
+    finally:
+        for key in _git_environ():
+            del os.environ[key]
+        os.environ.update(saved)
+        if saved_no_color is None:
+            os.environ.pop("NO_COLOR", None)
+        else:
+            os.environ["NO_COLOR"] = saved_no_color
+
+
+def _await_ready(conn: socket.socket, timeout: float | None) -> bool:
+    """Wait for the daemon's greeting on a new connection.
+
+    The daemon greets each connection when it starts serving it.  Once
+    greeted, the connection's timeout is cleared: the daemon is working
+    on this client's request, so the client waits for the reply rather
+    than abandoning work in progress.
+
+    Args:
+        conn: Socket returned by :func:`_connect`.
+        timeout: Seconds to wait, or *None* to wait until the daemon
+            finishes its current request.
+
+    Returns:
+        ``True`` when the daemon greeted the connection in time.
+    """
+    try:
+        conn.settimeout(timeout)
+        greeting = _receive(conn)
+        conn.settimeout(None)
+    except (OSError, ValueError):
+        return False
+    return bool(greeting.get("ready"))
+
+
+def _version() -> str:
+    """Return the installed docvet version.
+
+    Returns:
+        The distribution version string.
+    """
+    return importlib.metadata.version("docvet")
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run *argv* on the project's daemon and replay its output.
+
+    Called from the app callback for console-script invocations.
+
+    Args:
+        argv: Command-line arguments after the program name.
+
+    Returns:
+        The command's exit code, or *None* when the command must run
+        in-process (forwarding disabled, not a check subcommand, a
+        long-running ``--watch``, no daemon listening, a daemon busy
+        with another request, or a version mismatch).
+    """
+    if (
+        os.environ.get(NO_DAEMON_ENV)
+        or _subcommand(argv) not in _FORWARDED_COMMANDS
+        or "--watch" in argv
+    ):
+        return None
+    cwd = Path.cwd()
+    conn = _connect(_socket_path(_project_root(argv, cwd)))
+    if conn is None:
+        return None
+    request = {
+        "version": _version(),
+        "argv": argv,
+        "cwd": str(cwd),
+        "stdout_tty": sys.stdout.isatty(),
+        "no_color": os.environ.get("NO_COLOR", ""),
+        "git_env": _git_environ(),
+    }
+    with conn:
+        if not _await_ready(conn, _READY_TIMEOUT):
+            return None
+        try:
+            _send(conn, request)
+            reply = _receive(conn)
+        except (OSError, ValueError):
+            return None
+    if "exit_code" not in reply:
+        return None
+    sys.stdout.write(str(reply["stdout"]))
+    sys.stdout.flush()
+    sys.stderr.write(str(reply["stderr"]))
+    return int(reply["exit_code"])  # type: ignore[call-overload]
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class _CapturedOutput(io.StringIO):
+    """In-memory stdout or stderr that reports the client's terminal state.
+
+    Attributes:
+        tty (bool): Value returned by :meth:`isatty`.
+
+    Examples:
+        ```python
+        out = _CapturedOutput(tty=True)
+        out.isatty()  # True, so terminal output keeps its colors
+        ```
+    """
+
+    def __init__(self, *, tty: bool) -> None:
+        """Create an empty buffer.
+
+        Args:
+            tty: Whether the client's stream is a terminal.
+        """
+        super().__init__()
+        self.tty = tty
+
+    def isatty(self) -> bool:
+        """Report whether the client's stream is a terminal.
+
+        Returns:
+            The *tty* flag given at construction.
+        """
+        return self.tty
+
+
+class _ResidentState:
+    """Warm state a daemon keeps across requests.
+
+    Commands reach it through ``ctx.obj["resident"]``: the app callback
+    loads configuration through :meth:`load_config`, check runners back
+    their ``_ParsedFileStore`` with :attr:`files`, and targeted griffe
+    runs reuse :meth:`griffe_tree`.
+
+    Attributes:
+        files (dict[Path, _ResidentFile]): Source and parse results by
+            path, revalidated against the file's mtime and size, in
+            least-recently-used order and capped in size.  Entries for
+            deleted files are dropped before each run.
+
+    Examples:
+        ```python
+        state = _ResidentState()
+        code, out, err = state.run(["check", "--staged"], Path.cwd())
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Create empty resident state."""
+        self.files: dict[Path, _ResidentFile] = {}
+        self._configs: dict[object, tuple[tuple[object, ...], DocvetConfig, str]] = {}
+        self._trees: dict[Path, _ModuleTree] = {}
+        self._command: click.Command | None = None
+
+    def load_config(self, path: Path | None) -> DocvetConfig:
+        """Return the configuration for *path*, loading it when changed.
+
+        Configurations are keyed by the ``pyproject.toml`` they come
+        from (or the working directory when there is none) and reloaded
+        when anything :func:`docvet.config.load_config` reads changes:
+        the file's modification time and size, and whether the project
+        has a ``src/`` directory, from which the default ``src-root``
+        is derived.  Warnings printed while loading are replayed on
+        every request, as an in-process run would print them.
+
+        Args:
+            path: Explicit ``--config`` path, or *None* for discovery
+                from the working directory.
+
+        Returns:
+            The loaded configuration.
+        """
+        import docvet.cli as _cli_pkg
+        from docvet.config import _find_pyproject_path
+
+        pyproject = _find_pyproject_path(path)
+        if pyproject is None:
+            root = Path.cwd().resolve()
+            key: object = (None, root)
+            stamp: tuple[object, ...] = ()
+        else:
+            root = pyproject.parent.resolve()
+            key = pyproject.resolve()
+            stat = pyproject.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        stamp = (*stamp, (root / "src").is_dir())
+        cached = self._configs.get(key)
+        if cached is None or cached[0] != stamp:
+            captured = io.StringIO()
+            try:
+                with contextlib.redirect_stderr(captured):
+                    config = _cli_pkg.load_config(path)
+            finally:
+                sys.stderr.write(captured.getvalue())
+            self._configs[key] = (stamp, config, captured.getvalue())
+            return config
+        _, config, warnings = cached
+        sys.stderr.write(warnings)
+        return config
+
+    def griffe_tree(self, src_root: Path) -> _ModuleTree:
+        """Return the resident griffe module tree for *src_root*.
+
+        Args:
+            src_root: Root source directory containing Python packages.
+
+        Returns:
+            The tree, created on first use.
+        """
+        from docvet.checks.griffe_compat import _ModuleTree
+
+        resolved = src_root.resolve()
+        tree = self._trees.get(resolved)
+        if tree is None:
+            tree = self._trees[resolved] = _ModuleTree(resolved)
+        return tree
+
+    def run(
+        self,
+        argv: list[str],
+        cwd: Path,
+        *,
+        stdout_tty: bool = False,
+        no_color: str = "",
+        git_env: dict[str, str] | None = None,
+    ) -> tuple[int, str, str]:
+        """Run one CLI invocation with its output captured.
+
+        Resident entries for files deleted since the last run are
+        dropped first.
+
+        Args:
+            argv: Command-line arguments after the program name.
+            cwd: Working directory to run the command in.
+            stdout_tty: Whether the client's stdout is a terminal
+                (enables colored terminal output).
+            no_color: The client's ``NO_COLOR`` value.
+            git_env: The client's ``GIT_*`` variables, which replace the
+                daemon's own for the run.
+
+        Returns:
+            A ``(exit_code, stdout, stderr)`` tuple.
+        """
+        if self._command is None:
+            import typer
+
+            from docvet.cli import app
+
+            self._command = typer.main.get_command(app)
+        for path in [path for path in self.files if not path.exists()]:
+            del self.files[path]
+        stdout = _CapturedOutput(tty=stdout_tty)
+        # Never a terminal: progress bars would only be replayed at once.
+        stderr = _CapturedOutput(tty=False)
+        previous_cwd = os.getcwd()
+        code = 0
+        try:
+            os.chdir(cwd)
+            with (
+                _client_environ(no_color, git_env or {}),
+                contextlib.redirect_stdout(stdout),
+                contextlib.redirect_stderr(stderr),
+            ):
+                try:
+                    self._command.main(
+                        args=argv,
+                        prog_name="docvet",
+                        obj={"resident": self},
+                        standalone_mode=True,
+                    )
+                except SystemExit as exc:
+                    code = _exit_code(exc)
+                except Exception:
+                    traceback.print_exc()
+                    code = 1
+        except OSError as exc:
+            stderr.write(f"docvet: {exc}\n")
+            code = 1
+        finally:
+            os.chdir(previous_cwd)
+        return code, stdout.getvalue(), stderr.getvalue()
+
+
+def _exit_code(exc: SystemExit) -> int:
+    """Convert a ``SystemExit`` into a process exit status.
+
+    Args:
+        exc: The exception raised by the command.
+
+    Returns:
+        ``0`` for ``None``, the integer code, or ``1`` for a message
+        (which is printed to stderr, as the interpreter would).
+    """
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def _handle(conn: socket.socket, state: _ResidentState, version: str) -> bool:
+    """Greet the client on *conn*, then serve its request.
+
+    Args:
+        conn: Accepted client connection.
+        state: The daemon's resident state.
+        version: The daemon's docvet version.
+
+    Returns:
+        ``False`` when the client asked the daemon to stop.
+    """
+    try:
+        _send(conn, {"ready": True})
+        request = _receive(conn)
+    except (OSError, ValueError):
+        return True
+    if request.get("op") == "stop":
+        _send(conn, {"stopped": True})
+        return False
+    if request.get("version") != version:
+        _send(conn, {"fallback": "version mismatch"})
+        return True
+    git_env = request.get("git_env")
+    if not isinstance(git_env, dict):
+        git_env = {}
+    code, out, err = state.run(
+        [str(arg) for arg in request.get("argv", [])],  # type: ignore[union-attr]
+        Path(str(request.get("cwd", "."))),
+        stdout_tty=bool(request.get("stdout_tty")),
+        no_color=str(request.get("no_color", "")),
+        git_env={
+            str(k): str(v) for k, v in git_env.items() if str(k).startswith("GIT_")
+        },
+    )
+    with contextlib.suppress(OSError):
+        _send(conn, {"exit_code": code, "stdout": out, "stderr": err})
+    return True
+
+
+def start_server(project_root: Path, *, idle_timeout: float | None = None) -> None:
+    """Serve CLI requests for *project_root* until stopped.
+
+    Binds the project's socket (replacing a stale one left by a crashed
+    daemon), accepts connections one at a time, and removes the socket
+    on exit.  Each accepted connection is greeted before its request is
+    read, so clients queued behind a running request can tell the
+    daemon is busy and run in-process; a connection they abandoned is
+    dropped without running anything.  A client that sends no request
+    within :data:`_REQUEST_TIMEOUT` seconds of the greeting is dropped.
+
+    Args:
+        project_root: Resolved project root directory.
+        idle_timeout: Seconds without a request after which the daemon
+            exits, or *None* to run until stopped.
+
+    Raises:
+        RuntimeError: If Unix sockets are unavailable or a daemon is
+            already listening for the project.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        msg = "docvet serve requires Unix domain sockets"
+        raise RuntimeError(msg)
+    path = _socket_path(project_root)
+    existing = _connect(path)
+    if existing is not None:
+        existing.close()
+        msg = f"a docvet daemon is already running on {path}"
+        raise RuntimeError(msg)
+    path.unlink(missing_ok=True)
+
+    state = _ResidentState()
+    version = _version()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(path))
+        os.chmod(path, 0o600)
+        server.listen()
+        server.settimeout(idle_timeout)
+        running = True
+        while running:
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                break
+            with conn:
+                conn.settimeout(_REQUEST_TIMEOUT)
+                running = _handle(conn, state, version)
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+
+
+def stop_server(project_root: Path) -> bool:
+    """Ask the daemon for *project_root* to exit.
+
+    Waits for a request in progress to finish first.
+
+    Args:
+        project_root: Resolved project root directory.
+
+    Returns:
+        ``True`` when a daemon acknowledged the request, ``False`` when
+        none was listening.
+    """
+    conn = _connect(_socket_path(project_root))
+    if conn is None:
+        return False
+    with conn:
+        if not _await_ready(conn, None):
+            return False
+        try:
+            _send(conn, {"op": "stop"})
+            return bool(_receive(conn).get("stopped"))
+        except (OSError, ValueError):
+            return False
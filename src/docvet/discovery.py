@@ -5,12 +5,13 @@ mode: git diff (default), staged files, explicit file list, or full
 codebase scan.  All modes return a sorted ``list[Path]`` of absolute
 file paths.
 
-Exclude patterns support four dispatch branches following ``.gitignore``
-semantics, each handled by a dedicated matcher: trailing-slash directory
-patterns (``build/``) via :func:`_matches_trailing_slash`, double-star
-recursive globs (``**/test_*.py``) via :func:`_matches_double_star`,
-path-level ``fnmatch`` patterns (``scripts/gen_*.py``), and
-component-level patterns (``tests``).
+Exclude patterns support four kinds following ``.gitignore`` semantics:
+trailing-slash directory patterns (``build/``), double-star recursive
+globs (``**/test_*.py``), path-level ``fnmatch`` patterns
+(``scripts/gen_*.py``), and component-level patterns (``tests``).
+:class:`_ExcludeMatcher` compiles them once per configuration into set
+lookups and combined regexes, so filtering costs the same per path no
+matter how many patterns are configured.
 
 Examples:
     Discover staged files via the CLI:
@@ -34,6 +35,9 @@ from __future__ import annotations
 
 import enum
 import fnmatch
+import functools
+import os
+import re
 import subprocess
 import sys
 from collections.abc import Iterable, Sequence
@@ -43,6 +47,15 @@ from docvet.config import DocvetConfig
 
 __all__: list[str] = []
 
+# Characters that make a pattern a glob rather than a literal name.
+_GLOB_CHARS = frozenset("*?[")
+
+# Whether ``fnmatch.fnmatch`` folds case on this platform (Windows).
+_FOLDS_CASE = os.path.normcase("Aa") != "Aa"
+
+# Distinct exclude lists seen in one process; normally just one.
+_EXCLUDE_CACHE_SIZE = 32
+
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
@@ -122,86 +135,185 @@ def _run_git(args: list[str], cwd: Path, *, warn: bool = True) -> list[str] | No
     return [line.strip() for line in result.stdout.splitlines() if line.strip()]
 
 
-def _matches_trailing_slash(
-    normalized: str, parts: tuple[str, ...], pattern: str
-) -> bool:
-    """Match a path against a trailing-slash directory pattern.
+def _double_star_variants(pattern: str) -> list[str]:
+    """Expand a ``**`` pattern into its full-path ``fnmatch`` forms.
 
-    Simple patterns (``build/``) match at any depth — the directory name
-    can appear anywhere in the path.  Path patterns (``vendor/legacy/``)
-    are root-anchored — the prefix must appear at the start of the path.
+    ``fnmatch`` treats ``**`` as ``*`` (matches any characters including
+    ``/``), which handles the 1+ directory-segment case.  The extra forms
+    add zero-segment fallbacks so that leading ``**/`` also matches
+    root-level files and middle ``/**/`` also matches adjacent
+    directories.
 
     Note:
-        Patterns combining trailing slash with double-star (e.g.
-        ``build/**/``) are not supported and will not match; use
-        ``build/`` instead for recursive directory exclusion.
+        Only the first ``/**/`` occurrence is collapsed for the
+        zero-segment fallback.  Patterns with multiple ``**`` where
+        all match zero segments (e.g. ``**/src/**/test.py`` matching
+        ``src/test.py``) are not supported.
 
     Args:
-        normalized: Forward-slash-normalized relative path.
-        parts: Path components from ``PurePosixPath.parts``.
-        pattern: Exclude pattern ending with ``/``.
+        pattern: Glob pattern containing ``**``.
 
     Returns:
-        *True* if the path matches the trailing-slash pattern.
+        The pattern followed by its zero-segment variants.
     """
-    dirname = pattern.rstrip("/")
-    if "/" in dirname:
-        return normalized.startswith(dirname + "/")
-    return dirname in parts[:-1]
+    variants = [pattern]
+    if pattern.startswith("**/"):
+        variants.append(pattern[3:])
+    if "/**/" in pattern:
+        variants.append(pattern.replace("/**/", "/", 1))
+    return variants
 
 
-def _matches_double_star(normalized: str, pattern: str) -> bool:
-    """Match a path against a pattern containing ``**``.
-
-    ``fnmatch.fnmatch`` treats ``**`` as ``*`` (matches any characters
-    including ``/``), which handles the 1+ directory-segment case.  This
-    helper adds zero-segment fallbacks so that leading ``**/`` also
-    matches root-level files and middle ``/**/`` also matches adjacent
-    directories.
-
-    Note:
-        Only the first ``/**/`` occurrence is collapsed for the
-        zero-segment fallback.  Patterns with multiple ``**`` where
-        all match zero segments (e.g. ``**/src/**/test.py`` matching
-        ``src/test.py``) are not supported.
+def _compile_alternation(patterns: list[str]) -> re.Pattern[str] | None:
+    """Join glob patterns into one ``fnmatch.translate`` alternation.
 
     Args:
-        normalized: Forward-slash-normalized relative path.
-        pattern: Glob pattern containing ``**``.
+        patterns: Glob patterns, already case-normalized.
 
     Returns:
-        *True* if the path matches the pattern.
+        A compiled regex that fully matches any of *patterns*, or
+        *None* when *patterns* is empty.
     """
-    if fnmatch.fnmatch(normalized, pattern):
-        return True
-    if pattern.startswith("**/") and fnmatch.fnmatch(normalized, pattern[3:]):
-        return True
-    if "/**/" in pattern and fnmatch.fnmatch(
-        normalized, pattern.replace("/**/", "/", 1)
-    ):
-        return True
-    return False
-
-
-def _is_excluded(rel_path: str, exclude: list[str]) -> bool:
-    """Check whether a relative path matches any exclude pattern.
+    if not patterns:
+        return None
+    unique = dict.fromkeys(patterns)
+    return re.compile("|".join(fnmatch.translate(p) for p in unique))
+
+
+class _ExcludeMatcher:
+    """Exclude patterns compiled once and matched per path.
 
-    Follows ``.gitignore`` semantics with four pattern dispatch branches:
+    Follows ``.gitignore`` semantics with four pattern kinds, each kept
+    in its own lookup structure:
 
     1. **Trailing-slash** (``build/``): match directory components only.
-       Simple names match at any depth; paths with ``/`` are root-anchored.
-    2. **Double-star** (``**/test_*.py``): delegate to
-       :func:`_matches_double_star` for recursive glob matching.
+       Simple names match at any depth via a set lookup; paths with
+       ``/`` are root-anchored prefixes.
+    2. **Double-star** (``**/test_*.py``): the pattern and its
+       zero-segment variants join the full-path regex.
     3. **Path-level** (``scripts/gen_*.py``): ``fnmatch`` against the full
-       relative path.
-    4. **Component-level** (``tests``): ``fnmatch`` against each individual
-       path component.
+       relative path, via the same full-path regex.
+    4. **Component-level** (``tests``): literal names are a set lookup;
+       globs join a regex matched against each path component.
+
+    Matching is therefore a handful of lookups per path regardless of
+    how many patterns are configured.  Glob patterns fold case like
+    ``fnmatch.fnmatch`` (``os.path.normcase``); trailing-slash patterns
+    compare exactly.
 
     Note:
-        Dispatch order matters: trailing-slash is checked before
-        double-star.  Patterns combining both (e.g. ``build/**/``)
-        route to the trailing-slash branch and will not match; use
-        ``build/`` for recursive directory exclusion.
+        Patterns combining trailing slash with double-star (e.g.
+        ``build/**/``) are treated as trailing-slash patterns and will
+        not match; use ``build/`` for recursive directory exclusion.
+
+    Attributes:
+        dir_names (frozenset[str]): Trailing-slash names matched against
+            directory components.
+        dir_prefixes (tuple[str, ...]): Root-anchored trailing-slash
+            prefixes, each ending in ``/``.
+        path_regex (re.Pattern[str] | None): Alternation of the
+            path-level and double-star globs.
+        component_names (frozenset[str]): Literal component patterns.
+        component_regex (re.Pattern[str] | None): Alternation of the
+            glob component patterns.
+
+    Args:
+        patterns: Exclude patterns from configuration.
+
+    Examples:
+        ```python
+        matcher = _ExcludeMatcher(["tests", "build/", "**/gen_*.py"])
+        matcher.matches("src/pkg/gen_api.py")  # True
+        ```
+    """
+
+    __slots__ = (
+        "dir_names",
+        "dir_prefixes",
+        "path_regex",
+        "component_names",
+        "component_regex",
+    )
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        dir_names: set[str] = set()
+        dir_prefixes: list[str] = []
+        path_globs: list[str] = []
+        component_names: set[str] = set()
+        component_globs: list[str] = []
+        for raw in patterns:
+            if raw.endswith("/"):
+                dirname = raw.rstrip("/")
+                if "/" in dirname:
+                    dir_prefixes.append(dirname + "/")
+                else:
+                    dir_names.add(dirname)
+                continue
+            pattern = os.path.normcase(raw)
+            if "**" in pattern:
+                path_globs.extend(_double_star_variants(pattern))
+            elif "/" in pattern:
+                path_globs.append(pattern)
+            if "/" in pattern:
+                # Components never contain "/", so only the full-path
+                # match can apply.
+                continue
+            if _GLOB_CHARS.isdisjoint(pattern):
+                component_names.add(pattern)
+            else:
+                component_globs.append(pattern)
+        self.dir_names = frozenset(dir_names)
+        self.dir_prefixes = tuple(dir_prefixes)
+        self.path_regex = _compile_alternation(path_globs)
+        self.component_names = frozenset(component_names)
+        self.component_regex = _compile_alternation(component_globs)
+
+    def matches(self, rel_path: str) -> bool:
+        """Check whether a relative path matches any compiled pattern.
+
+        Args:
+            rel_path: File path relative to the project root.  Backslash
+                separators are normalized to forward slashes.
+
+        Returns:
+            *True* if the path matches any exclude pattern.
+        """
+        normalized = rel_path.replace("\\", "/")
+        if self.dir_prefixes and normalized.startswith(self.dir_prefixes):
+            return True
+        parts = [p for p in normalized.split("/") if p and p != "."]
+        if self.dir_names and not self.dir_names.isdisjoint(parts[:-1]):
+            return True
+        if _FOLDS_CASE:
+            normalized = os.path.normcase(normalized)
+            parts = [os.path.normcase(p) for p in parts]
+        if self.path_regex is not None and self.path_regex.match(normalized):
+            return True
+        if self.component_names and not self.component_names.isdisjoint(parts):
+            return True
+        regex = self.component_regex
+        return regex is not None and any(regex.match(c) for c in parts)
+
+
+@functools.lru_cache(maxsize=_EXCLUDE_CACHE_SIZE)
+def _compile_excludes(exclude: tuple[str, ...]) -> _ExcludeMatcher:
+    """Return the memoized matcher for a tuple of exclude patterns.
+
+    Args:
+        exclude: Exclude patterns from configuration.
+
+    Returns:
+        The compiled matcher for *exclude*.
+    """
+    return _ExcludeMatcher(exclude)
+
+
+def _is_excluded(rel_path: str, exclude: Sequence[str]) -> bool:
+    """Check whether a relative path matches any exclude pattern.
+
+    Convenience wrapper around :class:`_ExcludeMatcher` that compiles
+    *exclude* on first use.  Loops over many paths should compile once
+    with :func:`_compile_excludes` and call ``matches`` directly.
 
     Args:
         rel_path: File path relative to the project root (forward slashes).
@@ -210,20 +322,7 @@ def _is_excluded(rel_path: str, exclude: list[str]) -> bool:
     Returns:
         *True* if the path matches any exclude pattern.
     """
-    normalized = rel_path.replace("\\", "/")
-    parts = PurePosixPath(normalized).parts
-    for pattern in exclude:
-        if (
-            (
-                pattern.endswith("/")
-                and _matches_trailing_slash(normalized, parts, pattern)
-            )
-            or ("**" in pattern and _matches_double_star(normalized, pattern))
-            or ("/" in pattern and fnmatch.fnmatch(normalized, pattern))
-            or any(fnmatch.fnmatch(c, pattern) for c in parts)
-        ):
-            return True
-    return False
+    return _compile_excludes(tuple(exclude)).matches(rel_path)
 
 
 def _collect_python_files(
@@ -244,6 +343,7 @@ def _collect_python_files(
     Returns:
         Sorted list of absolute paths to valid ``.py`` files.
     """
+    excluded = _compile_excludes(tuple(config.exclude)).matches
     paths: list[Path] = []
     for raw_path in path_iter:
         if raw_path.is_symlink():
@@ -255,7 +355,7 @@ def _collect_python_files(
             rel = PurePosixPath(abs_path.relative_to(config.project_root)).as_posix()
         except ValueError:
             continue
-        if _is_excluded(rel, config.exclude):
+        if excluded(rel):
             continue
         paths.append(abs_path)
     return sorted(paths)
@@ -367,9 +467,10 @@ def discover_files(
     if lines is None:
         return []
 
+    excluded = _compile_excludes(tuple(config.exclude)).matches
     discovered: list[Path] = []
     for rel in lines:
-        if not rel.endswith(".py") or _is_excluded(rel, config.exclude):
+        if not rel.endswith(".py") or excluded(rel):
             continue
         abs_path = config.project_root / rel
         if abs_path.is_symlink():
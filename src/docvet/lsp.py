@@ -1,19 +1,30 @@
 """LSP server for real-time docstring diagnostics.
 
 Provides a pygls-based Language Server Protocol server that publishes
-docstring quality diagnostics on ``textDocument/didOpen`` and
-``textDocument/didSave`` events. The server runs enrichment, coverage,
-and griffe compatibility checks on individual files, converting
+docstring quality diagnostics on ``textDocument/didOpen``,
+``textDocument/didChange``, and ``textDocument/didSave`` events. The
+server runs enrichment, coverage, and griffe compatibility checks on
+individual files, converting
 :class:`~docvet.checks.Finding` objects to LSP ``Diagnostic`` instances
 with appropriate severity, source, and documentation links. Internal
 helpers thread the ``ls`` server instance explicitly for testability
 rather than accessing the module-level ``server`` global.
 
+Each open document keeps a :class:`_DocumentState` holding its AST,
+symbols, and enrichment findings per symbol. Edits are debounced and
+re-check only the symbols whose source lines changed; findings for
+untouched symbols are reused and shifted to their new line. Coverage
+and griffe checks refresh on open and save only. Griffe modules stay
+resident per source root, so a save re-visits just the saved module
+instead of reloading every package.
+
 Freshness checks are excluded because they require git context that is
 not available in single-file LSP mode.
 
 Attributes:
     DOCS_BASE_URL: Base URL for rule documentation pages.
+    CHANGE_DEBOUNCE_SECONDS: Quiet period after the last edit before
+        diagnostics are recomputed.
     server: The pygls ``LanguageServer`` instance.
 
 Examples:
@@ -38,18 +49,24 @@ See Also:
 from __future__ import annotations
 
 import ast
+import asyncio
+import dataclasses
+from dataclasses import dataclass, field
 from pathlib import Path
 from urllib.parse import unquote, urlparse
 
 from lsprotocol import types
 from pygls.lsp.server import LanguageServer
 
-from docvet.checks import Finding, check_coverage, check_enrichment, check_griffe_compat
+from docvet.ast_utils import Symbol, build_node_index, get_documented_symbols
+from docvet.checks import Finding, check_coverage, check_enrichment
+from docvet.checks.griffe_compat import _ModuleTree
 from docvet.config import DocvetConfig, load_config
 
 __all__ = ["start_server"]
 
 DOCS_BASE_URL = "https://alberto-codes.github.io/docvet/rules"
+CHANGE_DEBOUNCE_SECONDS = 0.3
 
 _CATEGORY_TO_SEVERITY: dict[str, types.DiagnosticSeverity] = {
     "required": types.DiagnosticSeverity.Warning,
@@ -59,9 +76,40 @@ _CATEGORY_TO_SEVERITY: dict[str, types.DiagnosticSeverity] = {
 server = LanguageServer(
     name="docvet",
     version="1",
-    text_document_sync_kind=types.TextDocumentSyncKind.Full,
+    text_document_sync_kind=types.TextDocumentSyncKind.Incremental,
 )
 
+# Enrichment findings of one symbol, keyed by the symbol's kind and
+# source text, with the ``def``/``class`` line they were computed at.
+_SymbolKey = tuple[str, str]
+_SymbolFindings = dict[_SymbolKey, tuple[int, list[Finding]]]
+
+
+@dataclass
+class _DocumentState:
+    """Analysis state retained for an open document.
+
+    Attributes:
+        tree (ast.Module): AST of the last successfully parsed source.
+        symbols (list[Symbol]): Symbols extracted from *tree*.
+        symbol_findings (dict[tuple[str, str], tuple[int, list[Finding]]]):
+            Enrichment findings per symbol, keyed by the symbol's kind
+            and source text, paired with the line they were computed at.
+        file_findings (list[Finding]): Coverage and griffe findings from
+            the last open or save.
+
+    Examples:
+        ```python
+        tree = ast.parse(source)
+        state = _DocumentState(tree=tree, symbols=get_documented_symbols(tree))
+        ```
+    """
+
+    tree: ast.Module
+    symbols: list[Symbol]
+    symbol_findings: _SymbolFindings = field(default_factory=dict)
+    file_findings: list[Finding] = field(default_factory=list)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -139,6 +187,121 @@ def _resolve_src_root(ls: LanguageServer, config: DocvetConfig) -> Path:
     return base / config.src_root
 
 
+def _documents(ls: LanguageServer) -> dict[str, _DocumentState]:
+    """Return the per-document state table attached to the server.
+
+    Args:
+        ls: The language server instance.
+
+    Returns:
+        A mapping of document URI to its retained analysis state.
+    """
+    return ls.docvet_documents  # type: ignore[attr-defined]
+
+
+def _symbol_key(symbol: Symbol, lines: list[str]) -> _SymbolKey:
+    """Build the memo key identifying a symbol by its source text.
+
+    Two symbols share a key only when their decorators, signature, and
+    body are character-for-character identical, so an edit anywhere in
+    a symbol's line range invalidates it while edits elsewhere merely
+    move it.
+
+    Args:
+        symbol: The symbol to key.
+        lines: The document source split into lines.
+
+    Returns:
+        A ``(kind, source text)`` tuple.
+    """
+    segment = "\n".join(lines[symbol.definition_start - 1 : symbol.end_line])
+    return symbol.kind, segment
+
+
+def _check_griffe(
+    ls: LanguageServer,
+    src_root: Path,
+    file_path: Path,
+    source: str,
+) -> list[Finding]:
+    """Check one file against the server's resident griffe module tree.
+
+    Args:
+        ls: The language server instance.
+        src_root: The resolved source root.
+        file_path: Local path of the document.
+        source: The full document text.
+
+    Returns:
+        Griffe compatibility findings for the file.
+    """
+    trees: dict[Path, _ModuleTree] = ls.docvet_griffe  # type: ignore[attr-defined]
+    tree = trees.get(src_root)
+    if tree is None:
+        tree = trees[src_root] = _ModuleTree(src_root)
+    return tree.check(file_path, source)
+
+
+def _check_symbols(
+    source: str,
+    tree: ast.Module,
+    symbols: list[Symbol],
+    config: DocvetConfig,
+    file_path: Path,
+    previous: _SymbolFindings,
+) -> tuple[_SymbolFindings, list[Finding]]:
+    """Run enrichment on changed symbols and reuse findings for the rest.
+
+    Symbols whose key is present in *previous* are not re-checked;
+    their findings are shifted by the distance the symbol moved.
+    Symbols without a docstring are skipped, as in
+    :func:`~docvet.checks.check_enrichment`.
+
+    Args:
+        source: The full document text.
+        tree: Parsed AST of *source*.
+        symbols: Symbols extracted from *tree*.
+        config: The loaded docvet configuration.
+        file_path: Local path of the document.
+        previous: Findings per symbol from the prior pass.
+
+    Returns:
+        A tuple of the findings per symbol for the current source and
+        the flattened enrichment findings in symbol order.
+    """
+    lines = source.splitlines()
+    node_index = build_node_index(tree)
+    current: _SymbolFindings = {}
+    findings: list[Finding] = []
+    for symbol in symbols:
+        if not symbol.docstring:
+            continue
+        key = _symbol_key(symbol, lines)
+        entry = current.get(key) or previous.get(key)
+        if entry is None:
+            entry = (
+                symbol.line,
+                check_enrichment(
+                    source,
+                    tree,
+                    config.enrichment,
+                    str(file_path),
+                    style=config.docstring_style,
+                    symbols=[symbol],
+                    node_index=node_index,
+                ),
+            )
+        line, symbol_findings = entry
+        if line != symbol.line:
+            delta = symbol.line - line
+            symbol_findings = [
+                dataclasses.replace(f, line=f.line + delta) for f in symbol_findings
+            ]
+        current.setdefault(key, (symbol.line, symbol_findings))
+        findings.extend(symbol_findings)
+    return current, findings
+
+
 def _check_file(
     ls: LanguageServer,
     uri: str,
@@ -152,6 +315,10 @@ def _check_file(
     to LSP diagnostics. Returns an empty list if the source has syntax
     errors or the file is not a Python file.
 
+    The AST, symbols, and findings are retained as the document's
+    :class:`_DocumentState` so :func:`_recheck_file` can re-run
+    enrichment incrementally on later edits.
+
     Args:
         ls: The language server instance.
         uri: The document URI.
@@ -168,21 +335,78 @@ def _check_file(
     try:
         tree = ast.parse(source)
     except SyntaxError:
+        _documents(ls).pop(uri, None)
         return []
 
-    findings: list[Finding] = []
-
-    findings.extend(check_enrichment(source, tree, config.enrichment, str(file_path)))
+    symbols = get_documented_symbols(tree)
+    previous = _documents(ls).get(uri)
+    symbol_findings, findings = _check_symbols(
+        source,
+        tree,
+        symbols,
+        config,
+        file_path,
+        previous.symbol_findings if previous is not None else {},
+    )
 
+    file_findings: list[Finding] = []
     src_root = _resolve_src_root(ls, config)
-    findings.extend(check_coverage(src_root, [file_path]))
+    file_findings.extend(check_coverage(src_root, [file_path]))
 
     try:
-        findings.extend(check_griffe_compat(src_root, [file_path]))
+        file_findings.extend(_check_griffe(ls, src_root, file_path, source))
     except (ImportError, OSError):
         pass
 
-    return [_finding_to_diagnostic(f) for f in findings]
+    _documents(ls)[uri] = _DocumentState(tree, symbols, symbol_findings, file_findings)
+    return [_finding_to_diagnostic(f) for f in findings + file_findings]
+
+
+def _recheck_file(
+    ls: LanguageServer,
+    uri: str,
+    source: str,
+    config: DocvetConfig,
+) -> list[types.Diagnostic] | None:
+    """Re-run enrichment for edited symbols of an open document.
+
+    Re-parses *source* and re-checks only symbols whose source lines
+    changed since the last pass. Coverage and griffe findings from the
+    last open or save are carried over unchanged. Falls back to a full
+    :func:`_check_file` when the document has no retained state.
+
+    Args:
+        ls: The language server instance.
+        uri: The document URI.
+        source: The full document text.
+        config: The loaded docvet configuration.
+
+    Returns:
+        A list of LSP Diagnostic objects for the file, or ``None`` when
+        the source does not parse and the previous diagnostics should
+        stay in place.
+    """
+    state = _documents(ls).get(uri)
+    if state is None:
+        return _check_file(ls, uri, source, config)
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    symbols = get_documented_symbols(tree)
+    state.symbol_findings, findings = _check_symbols(
+        source,
+        tree,
+        symbols,
+        config,
+        _uri_to_path(uri),
+        state.symbol_findings,
+    )
+    state.tree = tree
+    state.symbols = symbols
+    return [_finding_to_diagnostic(f) for f in findings + state.file_findings]
 
 
 def _publish_diagnostics(
@@ -230,6 +454,54 @@ def did_open(
     _publish_diagnostics(ls, params.text_document.uri, params.text_document.text)
 
 
+@server.feature(types.TEXT_DOCUMENT_DID_CHANGE)
+async def did_change(
+    ls: LanguageServer,
+    params: types.DidChangeTextDocumentParams,
+) -> None:
+    """Handle ``textDocument/didChange`` with debounced incremental checks.
+
+    Waits :data:`CHANGE_DEBOUNCE_SECONDS` and drops the update if a
+    newer edit arrived meanwhile, so a burst of keystrokes triggers one
+    re-check. Diagnostics are left untouched while the buffer does not
+    parse.
+
+    Args:
+        ls: The language server instance.
+        params: The change notification parameters.
+    """
+    uri = params.text_document.uri
+    version = params.text_document.version
+    await asyncio.sleep(CHANGE_DEBOUNCE_SECONDS)
+    doc = ls.workspace.get_text_document(uri)
+    if doc.version != version:
+        return
+    config: DocvetConfig = ls.docvet_config  # type: ignore[attr-defined]
+    diagnostics = _recheck_file(ls, uri, doc.source, config)
+    if diagnostics is None:
+        return
+    ls.text_document_publish_diagnostics(
+        types.PublishDiagnosticsParams(
+            uri=uri,
+            diagnostics=diagnostics,
+        )
+    )
+
+
+@server.feature(types.TEXT_DOCUMENT_DID_CLOSE)
+def did_close(
+    ls: LanguageServer,
+    params: types.DidCloseTextDocumentParams,
+) -> None:
+    """Handle ``textDocument/didClose`` by dropping the document state.
+
+    Args:
+        ls: The language server instance.
+        params: The close notification parameters.
+    """
+    _documents(ls).pop(params.text_document.uri, None)
+
+
 @server.feature(
     types.TEXT_DOCUMENT_DID_SAVE,
     types.SaveOptions(include_text=True),
@@ -263,7 +535,8 @@ def start_server() -> None:
     """Start the LSP server on stdio.
 
     Loads docvet configuration and attaches it to the server instance,
-    then starts the pygls server in stdio mode.
+    along with empty per-document and griffe module tables, then starts
+    the pygls server in stdio mode.
 
     Examples:
         Typically invoked by the ``docvet lsp`` CLI command:
@@ -275,4 +548,6 @@ def start_server() -> None:
         ```
     """
     server.docvet_config = load_config()  # type: ignore[attr-defined]
+    server.docvet_documents = {}  # type: ignore[attr-defined]
+    server.docvet_griffe = {}  # type: ignore[attr-defined]
     server.start_io()
@@ -12,8 +12,9 @@ Follows the same architectural pattern as :mod:`docvet.lsp`: a
 module-level server instance, a single public ``start_server()``
 function, and internal helpers for check dispatch and serialization.
 Freshness checks are excluded by default because they require git
-context; griffe is excluded when not installed. Per-file git diffs
-prevent cross-file hunk contamination in freshness mode, and
+context; griffe is excluded when not installed. Freshness runs one
+``git diff`` for all files and splits it per file, which prevents
+cross-file hunk contamination, and
 ``SystemExit`` from invalid configuration is caught and returned as
 a structured error rather than crashing the server.
 
@@ -47,11 +48,15 @@ See Also:
 from __future__ import annotations
 
 import ast
+import functools
 import json
 import logging
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from docvet.ast_utils import ParsedFile
 from docvet.checks import (
     Finding,
     PresenceStats,
@@ -59,7 +64,7 @@ from docvet.checks import (
     check_enrichment,
     check_presence,
 )
-from docvet.checks.freshness import check_freshness_diff
+from docvet.checks.freshness import _split_diff_by_file, check_freshness_diff
 from docvet.config import _VALID_CHECK_NAMES, DocvetConfig, load_config
 from docvet.discovery import DiscoveryMode, discover_files
 
@@ -88,8 +93,10 @@ _DEFAULT_MCP_CHECKS: frozenset[str] = frozenset(
     if name != "freshness" and (_GRIFFE_AVAILABLE or name != "griffe")
 )
 
-from ._catalog import _RULE_CATALOG, _RULE_TO_CHECK  # noqa: E402
-from ._catalog import RuleCatalogEntry as RuleCatalogEntry  # noqa: E402
+from docvet.checks._catalog import _RULE_CATALOG, _RULE_TO_CHECK  # noqa: E402
+from docvet.checks._catalog import (  # noqa: E402
+    RuleCatalogEntry as RuleCatalogEntry,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -131,6 +138,84 @@ def _serialize_finding(finding: Finding) -> dict[str, str | int]:
     }
 
 
+def _check_one_file(
+    file_path: Path,
+    config: DocvetConfig,
+    checks: frozenset[str],
+) -> tuple[list[Finding], PresenceStats | None] | None:
+    """Run the per-file checks (presence, enrichment) on one file.
+
+    Parses the file into an AST once and shares the tree and extracted
+    symbols between the requested checks.  Safe to call from worker
+    threads: enrichment scopes its docstring style per call.
+
+    Args:
+        file_path: Absolute path to a Python file.
+        config: The loaded docvet configuration.
+        checks: Set of check names to run.
+
+    Returns:
+        A tuple of ``(findings, presence_stats)`` where *presence_stats*
+        is ``None`` when the presence check did not run, or ``None``
+        when the file cannot be read or parsed.
+    """
+    try:
+        source = file_path.read_text(encoding="utf-8")
+    except OSError:
+        logger.warning("Cannot read file: %s", file_path)
+        return None
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        logger.warning("Cannot parse file: %s", file_path)
+        return None
+
+    rel_path = str(file_path)
+    parsed = ParsedFile(source=source, tree=tree)
+    findings: list[Finding] = []
+    presence_stats: PresenceStats | None = None
+
+    if "presence" in checks:
+        pf, presence_stats = check_presence(
+            source,
+            rel_path,
+            config.presence,
+            tree=tree,
+            symbols=parsed.symbols,
+        )
+        findings.extend(pf)
+
+    if "enrichment" in checks:
+        findings.extend(
+            check_enrichment(
+                source,
+                tree,
+                config.enrichment,
+                rel_path,
+                style=config.docstring_style,
+                symbols=parsed.symbols,
+                node_index=parsed.node_index,
+            )
+        )
+
+    return findings, presence_stats
+
+
+def _thread_count(jobs: int | str, file_count: int) -> int:
+    """Resolve the ``jobs`` setting to a worker thread count.
+
+    Args:
+        jobs: A positive worker count or ``"auto"``.
+        file_count: Number of files to check.
+
+    Returns:
+        The number of threads to use, never more than *file_count*;
+        ``1`` means run serially.
+    """
+    workers = (os.cpu_count() or 1) if jobs == "auto" else int(jobs)
+    return max(1, min(workers, file_count))
+
+
 def _run_per_file_checks(
     files: list[Path],
     config: DocvetConfig,
@@ -138,9 +223,12 @@ def _run_per_file_checks(
 ) -> tuple[list[Finding], PresenceStats | None]:
     """Run per-file checks (presence, enrichment) on all files.
 
-    Parses each file into an AST and dispatches to the requested
-    per-file checks. Aggregates presence stats across all files when
-    the presence check is enabled.
+    Dispatches each file to :func:`_check_one_file`.  When the config's
+    ``jobs`` allows more than one worker, files are checked on a thread
+    pool inside the server process (worthwhile on free-threaded
+    builds); results are merged in file order either way, so the
+    output is identical to a serial run.  Aggregates presence stats
+    across all files when the presence check is enabled.
 
     Args:
         files: List of absolute paths to Python files.
@@ -155,27 +243,21 @@ def _run_per_file_checks(
     findings: list[Finding] = []
     all_presence_stats: list[PresenceStats] = []
 
-    for file_path in files:
-        try:
-            source = file_path.read_text(encoding="utf-8")
-        except OSError:
-            logger.warning("Cannot read file: %s", file_path)
-            continue
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
-            logger.warning("Cannot parse file: %s", file_path)
-            continue
-
-        rel_path = str(file_path)
-
-        if "presence" in checks:
-            pf, ps = check_presence(source, rel_path, config.presence)
-            findings.extend(pf)
-            all_presence_stats.append(ps)
+    workers = _thread_count(config.jobs, len(files))
+    worker = functools.partial(_check_one_file, config=config, checks=checks)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(worker, files))
+    else:
+        results = [worker(file_path) for file_path in files]
 
-        if "enrichment" in checks:
-            findings.extend(check_enrichment(source, tree, config.enrichment, rel_path))
+    for result in results:
+        if result is None:
+            continue
+        file_findings, file_stats = result
+        findings.extend(file_findings)
+        if file_stats is not None:
+            all_presence_stats.append(file_stats)
 
     presence_stats: PresenceStats | None = None
     if "presence" in checks and all_presence_stats:
@@ -192,10 +274,11 @@ def _run_freshness(
 ) -> tuple[list[Finding], str | None]:
     """Run the freshness diff check on files with git context.
 
-    Verifies git is available, then retrieves a per-file diff for each
-    file and runs freshness checks. Per-file diffs prevent cross-file
-    hunk contamination. Returns findings and an optional error message
-    when git is unavailable.
+    Verifies git is available, then runs a single ``git diff HEAD`` for
+    all files and splits it into per-file diffs before running the
+    freshness checks. Splitting per file prevents cross-file hunk
+    contamination. Returns findings and an optional error message when
+    git is unavailable.
 
     Args:
         files: List of absolute paths to Python files.
@@ -218,6 +301,29 @@ def _run_freshness(
             "not a git repository or git is not installed"
         )
 
+    result = subprocess.run(
+        [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "diff",
+            "HEAD",
+            "--relative",
+            "--no-prefix",
+            "--",
+            "*.py",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=str(config.project_root),
+    )
+    root = config.project_root.resolve()
+    diffs = {
+        (root / rel).resolve(): diff
+        for rel, diff in _split_diff_by_file(result.stdout).items()
+    }
+
     findings: list[Finding] = []
     for file_path in files:
         try:
@@ -225,15 +331,8 @@ def _run_freshness(
             tree = ast.parse(source)
         except (OSError, SyntaxError):
             continue
-        # Per-file diff to avoid cross-file hunk contamination
-        result = subprocess.run(
-            ["git", "diff", "HEAD", "--", str(file_path)],
-            capture_output=True,
-            text=True,
-            check=False,
-            cwd=str(config.project_root),
-        )
-        findings.extend(check_freshness_diff(str(file_path), result.stdout, tree))
+        diff_output = diffs.get(file_path.resolve(), "")
+        findings.extend(check_freshness_diff(str(file_path), diff_output, tree))
     return findings, None
 
 
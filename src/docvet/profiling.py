@@ -0,0 +1,320 @@
+"""Run profiling for ``docvet check --profile``.
+
+Collects cumulative wall time and call counts while a check runs:
+per pipeline phase (file reads, parsing, symbol extraction, docstring
+section parsing, enrichment rule dispatch, reporting), per check, per
+enrichment rule, and per file.  The active :class:`RunProfile` is held
+in a context variable set by :func:`profile_scope`, so the checks record
+into it without threading a profile argument through every runner and
+rule signature.  When no profile is active, :func:`timed` and
+:func:`active_profile` cost one context variable lookup.
+
+Examples:
+    Profile a run and print the table:
+
+    ```python
+    profile = RunProfile()
+    with profile_scope(profile):
+        check_enrichment(source, tree, config, "app.py")
+    sys.stderr.write(profile.format_table())
+    ```
+
+See Also:
+    [`docvet.cli`][]: The ``check --profile`` option.
+    [`docvet.reporting`][]: Adds ``profile.to_dict()`` to JSON output.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TypeVar
+
+__all__ = [
+    "PHASES",
+    "RunProfile",
+    "TimingStat",
+    "active_profile",
+    "profile_scope",
+    "timed",
+    "timed_files",
+]
+
+PHASES: tuple[str, ...] = ("read", "parse", "symbols", "sections", "rules", "report")
+"""Pipeline phases in the order they are reported."""
+
+# Profile of the run in progress, or ``None`` when not profiling.  A
+# context variable so concurrent daemon requests never share a profile.
+_active: ContextVar[RunProfile | None] = ContextVar("docvet_profile", default=None)
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class TimingStat:
+    """Cumulative time and call count for one profiled operation.
+
+    Attributes:
+        calls (int): Number of recorded calls.
+        seconds (float): Total wall time of those calls in seconds.
+
+    Examples:
+        ```python
+        stat = TimingStat()
+        stat.calls, stat.seconds = 3, 0.25
+        ```
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+
+
+def _rows(
+    items: list[tuple[str, TimingStat]], key: str = "name"
+) -> list[dict[str, object]]:
+    """Convert timing entries to JSON records.
+
+    Args:
+        items: ``(name, stat)`` pairs.
+        key: Record key for the entry name.
+
+    Returns:
+        One ``{key, calls, seconds}`` record per entry.
+    """
+    return [
+        {key: name, "calls": stat.calls, "seconds": round(stat.seconds, 6)}
+        for name, stat in items
+    ]
+
+
+class RunProfile:
+    """Timings collected during one profiled run.
+
+    Each table maps a name to its :class:`TimingStat`.  File times are
+    the sum over every per-file check that touched the file, so the
+    slowest files are the ones that cost the most across the run.
+
+    Attributes:
+        phases (dict[str, TimingStat]): Pipeline phases from
+            :data:`PHASES`.
+        checks (dict[str, TimingStat]): Whole-check wall time keyed by
+            check name.
+        rules (dict[str, TimingStat]): Enrichment rule calls keyed by
+            rule function name without its ``_check_`` prefix.
+        files (dict[str, TimingStat]): Per-file check time keyed by
+            file path.
+        top (int): How many of the slowest files are reported.
+
+    Examples:
+        ```python
+        profile = RunProfile(top=5)
+        profile.record(profile.rules, "missing_raises", 0.002)
+        profile.to_dict()["rules"][0]["name"]  # "missing_raises"
+        ```
+    """
+
+    def __init__(self, top: int = 10) -> None:
+        """Create an empty profile.
+
+        Args:
+            top: Number of slowest files to report.
+        """
+        self.phases: dict[str, TimingStat] = {}
+        self.checks: dict[str, TimingStat] = {}
+        self.rules: dict[str, TimingStat] = {}
+        self.files: dict[str, TimingStat] = {}
+        self.top = top
+
+    @staticmethod
+    def record(table: dict[str, TimingStat], name: str, seconds: float) -> None:
+        """Add one call of *seconds* to *name* in *table*.
+
+        Args:
+            table: One of the profile's timing tables.
+            name: Entry to add the call to.
+            seconds: Wall time of the call.
+        """
+        stat = table.get(name)
+        if stat is None:
+            stat = table[name] = TimingStat()
+        stat.calls += 1
+        stat.seconds += seconds
+
+    def slowest_files(self) -> list[tuple[str, TimingStat]]:
+        """Return the :attr:`top` files with the most check time.
+
+        Returns:
+            ``(path, stat)`` pairs, slowest first.
+        """
+        ranked = sorted(self.files.items(), key=lambda item: -item[1].seconds)
+        return ranked[: self.top]
+
+    def _ordered_phases(self) -> list[tuple[str, TimingStat]]:
+        """Return the recorded phases in :data:`PHASES` order.
+
+        Returns:
+            ``(phase, stat)`` pairs for the phases that were recorded.
+        """
+        return [(name, self.phases[name]) for name in PHASES if name in self.phases]
+
+    @staticmethod
+    def _by_time(table: dict[str, TimingStat]) -> list[tuple[str, TimingStat]]:
+        """Return the entries of *table*, most time first.
+
+        Args:
+            table: One of the profile's timing tables.
+
+        Returns:
+            ``(name, stat)`` pairs sorted by descending time.
+        """
+        return sorted(table.items(), key=lambda item: -item[1].seconds)
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the profile as JSON-serialisable data.
+
+        Phases are listed in pipeline order; checks and rules by
+        descending time; files are limited to the slowest :attr:`top`.
+
+        Returns:
+            A mapping with ``phases``, ``checks``, ``rules``, and
+            ``slowest_files`` lists of ``name``, ``calls``, and
+            ``seconds`` records (``file`` instead of ``name`` for files).
+        """
+        return {
+            "phases": _rows(self._ordered_phases()),
+            "checks": _rows(self._by_time(self.checks)),
+            "rules": _rows(self._by_time(self.rules)),
+            "slowest_files": _rows(self.slowest_files(), key="file"),
+        }
+
+    def format_table(self) -> str:
+        """Render the profile as plain-text tables for stderr.
+
+        Returns:
+            One titled table per non-empty section, each row showing
+            the name, call count, total milliseconds, and mean
+            milliseconds per call.
+        """
+        sections = [
+            ("phase", self._ordered_phases()),
+            ("check", self._by_time(self.checks)),
+            ("rule", self._by_time(self.rules)),
+            (f"file (slowest {self.top})", self.slowest_files()),
+        ]
+        lines = ["Profile:"]
+        for title, items in sections:
+            if not items:
+                continue
+            width = max(len(title), *(len(name) for name, _ in items))
+            lines.append(
+                f"  {title:<{width}} {'calls':>8} {'total ms':>10} {'mean ms':>9}"
+            )
+            for name, stat in items:
+                total_ms = stat.seconds * 1000
+                mean_ms = total_ms / stat.calls if stat.calls else 0.0
+                lines.append(
+                    f"  {name:<{width}} {stat.calls:>8} {total_ms:>10.2f} "
+                    f"{mean_ms:>9.3f}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def active_profile() -> RunProfile | None:
+    """Return the profile of the run in progress.
+
+    Returns:
+        The profile set by the innermost :func:`profile_scope`, or
+        ``None`` when the run is not being profiled.
+    """
+    return _active.get()
+
+
+@contextmanager
+def profile_scope(profile: RunProfile | None) -> Iterator[RunProfile | None]:
+    """Record timings into *profile* for the enclosed block.
+
+    Restores the previous profile on exit, so scopes nest.  Passing
+    ``None`` disables profiling inside the block.
+
+    Args:
+        profile: Profile to record into, or ``None``.
+
+    Yields:
+        The *profile* that was activated.
+
+    Examples:
+        ```python
+        with profile_scope(RunProfile()) as profile:
+            run_checks()
+        ```
+    """
+    token = _active.set(profile)
+    try:
+        yield profile
+    finally:
+        _active.reset(token)
+
+
+@contextmanager
+def timed(table: str, name: str) -> Iterator[None]:
+    """Time the enclosed block into a table of the active profile.
+
+    Does nothing when no profile is active.
+
+    Args:
+        table: Attribute name of the table: ``"phases"``, ``"checks"``,
+            ``"rules"``, or ``"files"``.
+        name: Entry to add the call to.
+
+    Yields:
+        Control to the enclosed block.
+
+    Examples:
+        ```python
+        with timed("phases", "parse"):
+            tree = ast.parse(source)
+        ```
+    """
+    profile = _active.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.record(getattr(profile, table), name, time.perf_counter() - start)
+
+
+def timed_files(items: Iterable[_T], key: Callable[[_T], object] = str) -> Iterator[_T]:
+    """Yield *items*, timing the loop body of each into the files table.
+
+    The time between handing out an item and being asked for the next
+    one is recorded under ``str(key(item))``, so a runner profiles its
+    per-file work by wrapping the loop iterable.  Yields the items
+    unchanged when no profile is active.
+
+    Args:
+        items: Per-file loop items, usually paths.
+        key: Maps an item to its file path.
+
+    Yields:
+        Each item of *items*.
+
+    Examples:
+        ```python
+        for file_path in timed_files(files):
+            check(file_path)
+        ```
+    """
+    profile = _active.get()
+    if profile is None:
+        yield from items
+        return
+    for item in items:
+        start = time.perf_counter()
+        yield item
+        profile.record(profile.files, str(key(item)), time.perf_counter() - start)
@@ -1,14 +1,17 @@
 """Markdown, terminal, JSON, and summary report generation for docstring findings.
 
-Renders check findings as terminal output (default), markdown reports, or
-structured JSON for programmatic consumption. Computes per-check quality
+Renders check findings as terminal output (default), markdown reports,
+structured JSON, or JSON Lines (one record per finding plus a closing
+summary record) for programmatic consumption. Computes per-check quality
 percentages via :func:`compute_quality` and formats them for terminal
 display via :func:`format_quality_summary`. Produces an unconditional
 summary line for stderr (with optional coverage percentage from the
 presence check), groups findings by file, calculates summary statistics
 (with required, recommended, and scaffold category breakdowns), and
 determines the CLI exit code based on finding severity and coverage
-threshold enforcement.
+threshold enforcement.  :class:`FindingTally` keeps the same counts
+incrementally, so ``check --stream`` can write the summary line, quality
+percentages, and exit code without holding every finding in memory.
 
 Examples:
     Generate a terminal report via the CLI:
@@ -29,6 +32,12 @@ Examples:
     $ docvet check --all --format json
     ```
 
+    Stream JSON Lines records into an ingestion pipeline:
+
+    ```bash
+    $ docvet check --all --format jsonl --stream
+    ```
+
 See Also:
     [`docvet.cli`][]: Subcommands that invoke report rendering.
     [`docvet.checks`][]: Check functions that produce findings.
@@ -39,7 +48,7 @@ from __future__ import annotations
 import dataclasses
 import json
 from collections import Counter
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from itertools import groupby
 from pathlib import Path
 
@@ -95,8 +104,98 @@ class CheckQuality:
     unit: str
 
 
+@dataclasses.dataclass
+class FindingTally:
+    """Running counts of findings, updated one batch at a time.
+
+    Lets the streaming output path report the summary line, quality
+    percentages, and exit code without keeping the findings
+    themselves.  Only the keys needed for unique-item counts are
+    retained: ``(file, symbol)`` pairs for enrichment and freshness,
+    file paths for every other check.
+
+    Attributes:
+        by_check (Counter[str]): Finding count per check name.
+        by_category (Counter[str]): Finding count per category.
+        items (dict[str, set[object]]): Unique items with findings,
+            keyed by check name.
+
+    Examples:
+        Tally findings as each file completes:
+
+        ```python
+        tally = FindingTally()
+        tally.add("enrichment", findings)
+        tally.total  # findings seen so far
+        ```
+    """
+
+    by_check: Counter[str] = dataclasses.field(default_factory=Counter)
+    by_category: Counter[str] = dataclasses.field(default_factory=Counter)
+    items: dict[str, set[object]] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def from_checks(cls, findings_by_check: dict[str, list[Finding]]) -> FindingTally:
+        """Build a tally from findings already grouped by check.
+
+        Args:
+            findings_by_check: Findings grouped by check name.
+
+        Returns:
+            A tally holding the counts of every check.
+        """
+        tally = cls()
+        for check_name, findings in findings_by_check.items():
+            tally.add(check_name, findings)
+        return tally
+
+    @property
+    def total(self) -> int:
+        """Total number of findings tallied.
+
+        Returns:
+            The sum of the per-check counts.
+        """
+        return self.by_check.total()
+
+    def add(self, check_name: str, findings: Sequence[Finding]) -> None:
+        """Count a batch of findings produced by one check.
+
+        Args:
+            check_name: The check that produced *findings*.
+            findings: The batch to count.
+        """
+        items = self.items.setdefault(check_name, set())
+        self.by_check[check_name] += len(findings)
+        for f in findings:
+            self.by_category[f.category] += 1
+            if check_name in _SYMBOL_BASED_CHECKS:
+                items.add((f.file, f.symbol))
+            else:
+                items.add(f.file)
+
+
+def _category_breakdown(counts: Counter[str]) -> str:
+    """Format the per-category counts shown after a finding total.
+
+    Args:
+        counts: Finding count per category.
+
+    Returns:
+        ``"N required, M recommended"``, with ``", K scaffold"``
+        appended when the scaffold count is greater than zero.
+    """
+    parts = [
+        f"{counts['required']} required",
+        f"{counts['recommended']} recommended",
+    ]
+    if counts.get("scaffold"):
+        parts.append(f"{counts['scaffold']} scaffold")
+    return ", ".join(parts)
+
+
 def compute_quality(
-    findings_by_check: dict[str, list[Finding]],
+    findings_by_check: dict[str, list[Finding]] | FindingTally,
     check_counts: dict[str, int],
 ) -> dict[str, CheckQuality]:
     """Compute per-check quality percentages.
@@ -106,7 +205,8 @@ def compute_quality(
     are distinct ``file`` values.
 
     Args:
-        findings_by_check: Findings grouped by check name.
+        findings_by_check: Findings grouped by check name, or a
+            :class:`FindingTally` accumulated while streaming.
         check_counts: Total items checked per check (e.g. symbol count
             for enrichment, directory count for coverage).
 
@@ -114,14 +214,15 @@ def compute_quality(
         Quality data keyed by check name, only for checks present
         in *check_counts*.
     """
+    tally = (
+        findings_by_check
+        if isinstance(findings_by_check, FindingTally)
+        else FindingTally.from_checks(findings_by_check)
+    )
     result: dict[str, CheckQuality] = {}
     for check_name in check_counts:
-        findings = findings_by_check.get(check_name, [])
+        items_with_findings = len(tally.items.get(check_name, ()))
         items_checked = check_counts[check_name]
-        if check_name in _SYMBOL_BASED_CHECKS:
-            items_with_findings = len({(f.file, f.symbol) for f in findings})
-        else:
-            items_with_findings = len({f.file for f in findings})
         if items_checked == 0:
             pct = 100
         else:
@@ -184,6 +285,48 @@ def _colorize(text: str, color: str, *, no_color: bool) -> str:
     return typer.style(text, fg=color)
 
 
+def format_terminal_group(
+    findings: Sequence[Finding], *, no_color: bool = False
+) -> str:
+    """Format the findings of one file as terminal lines.
+
+    Each finding is printed as ``file:line: rule message [category]``
+    in line order, without the trailing summary line.  Used by
+    :func:`format_terminal` and by the streaming output path, which
+    writes each file's group as soon as it is checked.
+
+    Args:
+        findings: Findings that all belong to the same file.
+        no_color: If True, suppress ANSI color codes.
+
+    Returns:
+        One line per finding, each ending with a newline.
+    """
+    lines: list[str] = []
+    for finding in sorted(findings, key=lambda f: f.line):
+        tag = _colorize(
+            f"[{finding.category}]",
+            _COLORS[finding.category],
+            no_color=no_color,
+        )
+        lines.append(
+            f"{finding.file}:{finding.line}: {finding.rule} {finding.message} {tag}\n"
+        )
+    return "".join(lines)
+
+
+def format_terminal_footer(tally: FindingTally) -> str:
+    """Format the terminal summary line from running counts.
+
+    Args:
+        tally: Counts of the findings that were reported.
+
+    Returns:
+        ``"N findings (...)"`` ending with a newline.
+    """
+    return f"{tally.total} findings ({_category_breakdown(tally.by_category)})\n"
+
+
 def format_terminal(findings: list[Finding], *, no_color: bool = False) -> str:
     """Format findings for terminal output.
 
@@ -203,31 +346,13 @@ def format_terminal(findings: list[Finding], *, no_color: bool = False) -> str:
         return ""
 
     sorted_findings = sorted(findings, key=lambda f: (f.file, f.line))
-    lines: list[str] = []
-
-    for _file_path, group in groupby(sorted_findings, key=lambda f: f.file):
-        if lines:
-            lines.append("")
-        for finding in group:
-            tag = _colorize(
-                f"[{finding.category}]",
-                _COLORS[finding.category],
-                no_color=no_color,
-            )
-            lines.append(
-                f"{finding.file}:{finding.line}: {finding.rule} {finding.message} {tag}"
-            )
-
-    counts = Counter(f.category for f in findings)
-    lines.append("")
-    parts = [
-        f"{counts['required']} required",
-        f"{counts['recommended']} recommended",
+    groups = [
+        format_terminal_group(list(group), no_color=no_color)
+        for _file_path, group in groupby(sorted_findings, key=lambda f: f.file)
     ]
-    if counts.get("scaffold"):
-        parts.append(f"{counts['scaffold']} scaffold")
-    lines.append(f"{len(findings)} findings ({', '.join(parts)})")
-    return "\n".join(lines) + "\n"
+    tally = FindingTally()
+    tally.add("", findings)
+    return "\n".join(groups) + "\n" + format_terminal_footer(tally)
 
 
 def format_markdown(findings: list[Finding]) -> str:
@@ -262,16 +387,51 @@ def format_markdown(findings: list[Finding]) -> str:
 
     counts = Counter(f.category for f in findings)
     lines.append("")
-    parts = [
-        f"{counts['required']} required",
-        f"{counts['recommended']} recommended",
-    ]
-    if counts.get("scaffold"):
-        parts.append(f"{counts['scaffold']} scaffold")
-    lines.append(f"**{len(findings)} findings** ({', '.join(parts)})")
+    lines.append(f"**{len(findings)} findings** ({_category_breakdown(counts)})")
     return "\n".join(lines) + "\n"
 
 
+def _finding_record(finding: Finding) -> dict[str, object]:
+    """Convert a finding to its JSON object form.
+
+    Args:
+        finding: The finding to convert.
+
+    Returns:
+        The six ``Finding`` fields plus the derived ``severity``.
+    """
+    return {
+        "file": finding.file,
+        "line": finding.line,
+        "symbol": finding.symbol,
+        "rule": finding.rule,
+        "message": finding.message,
+        "category": finding.category,
+        "severity": _CATEGORY_TO_SEVERITY[finding.category],
+    }
+
+
+def _presence_coverage(stats: PresenceStats, min_coverage: float) -> dict[str, object]:
+    """Build the ``presence_coverage`` object of the JSON summaries.
+
+    Args:
+        stats: Aggregate presence coverage stats.
+        min_coverage: Coverage threshold from config.
+
+    Returns:
+        Documented/total counts, percentage, threshold, and pass/fail
+        status.
+    """
+    pct = stats.percentage
+    return {
+        "documented": stats.documented,
+        "total": stats.total,
+        "percentage": round(pct, 1),
+        "threshold": min_coverage,
+        "passed": pct >= min_coverage,
+    }
+
+
 def format_json(
     findings: list[Finding],
     file_count: int,
@@ -280,6 +440,7 @@ def format_json(
     min_coverage: float = 0.0,
     quality: dict[str, CheckQuality] | None = None,
     suppressed: list[Finding] | None = None,
+    profile: dict[str, object] | None = None,
 ) -> str:
     """Format findings as a structured JSON object.
 
@@ -294,8 +455,9 @@ def format_json(
     percentage, threshold, and pass/fail status. When *quality* is
     provided, a ``quality`` object is added with per-check percentage
     breakdowns. When *suppressed* is provided, a ``suppressed`` array
-    is added alongside ``findings``. Always returns a valid JSON object,
-    even when there are no findings.
+    is added alongside ``findings``. When *profile* is provided (from
+    ``check --profile``), it is added as a ``profile`` object. Always
+    returns a valid JSON object, even when there are no findings.
 
     Args:
         findings: List of findings to format.
@@ -308,6 +470,8 @@ def format_json(
             was not used.
         suppressed: Suppressed findings list, or *None* when
             suppression data is not requested.
+        profile: Run profile data from
+            :meth:`~docvet.profiling.RunProfile.to_dict`, or *None*.
 
     Returns:
         JSON string with ``indent=2`` formatting.
@@ -327,18 +491,7 @@ def format_json(
     counts = Counter(f.category for f in findings)
 
     obj: dict[str, object] = {
-        "findings": [
-            {
-                "file": f.file,
-                "line": f.line,
-                "symbol": f.symbol,
-                "rule": f.rule,
-                "message": f.message,
-                "category": f.category,
-                "severity": _CATEGORY_TO_SEVERITY[f.category],
-            }
-            for f in sorted_findings
-        ],
+        "findings": [_finding_record(f) for f in sorted_findings],
         "summary": {
             "total": len(findings),
             "by_category": {
@@ -351,36 +504,151 @@ def format_json(
     }
     if suppressed is not None:
         sorted_suppressed = sorted(suppressed, key=lambda f: (f.file, f.line))
-        obj["suppressed"] = [
-            {
-                "file": f.file,
-                "line": f.line,
-                "symbol": f.symbol,
-                "rule": f.rule,
-                "message": f.message,
-                "category": f.category,
-                "severity": _CATEGORY_TO_SEVERITY[f.category],
-            }
-            for f in sorted_suppressed
-        ]
+        obj["suppressed"] = [_finding_record(f) for f in sorted_suppressed]
     if presence_stats is not None:
-        pct = presence_stats.percentage
-        obj["presence_coverage"] = {
-            "documented": presence_stats.documented,
-            "total": presence_stats.total,
-            "percentage": round(pct, 1),
-            "threshold": min_coverage,
-            "passed": pct >= min_coverage,
-        }
+        obj["presence_coverage"] = _presence_coverage(presence_stats, min_coverage)
     if quality is not None:
         obj["quality"] = {name: dataclasses.asdict(cq) for name, cq in quality.items()}
+    if profile is not None:
+        obj["profile"] = profile
     return json.dumps(obj, indent=2, ensure_ascii=False) + "\n"
 
 
+def format_jsonl_finding(finding: Finding, *, suppressed: bool = False) -> str:
+    """Format one finding as a JSON Lines record.
+
+    The record has the same fields as a ``findings`` entry of
+    :func:`format_json`, preceded by a ``type`` of ``"finding"`` (or
+    ``"suppressed"`` for a finding hidden by an inline directive).
+
+    Args:
+        finding: The finding to format.
+        suppressed: Whether the finding was suppressed.
+
+    Returns:
+        A compact single-line JSON object ending with a newline.
+    """
+    record = {"type": "suppressed" if suppressed else "finding"}
+    record.update(_finding_record(finding))
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def format_jsonl_summary(
+    tally: FindingTally,
+    file_count: int,
+    *,
+    suppressed_count: int = 0,
+    presence_stats: PresenceStats | None = None,
+    min_coverage: float = 0.0,
+    quality: dict[str, CheckQuality] | None = None,
+    profile: dict[str, object] | None = None,
+) -> str:
+    """Format the closing JSON Lines summary record.
+
+    Mirrors the ``summary`` object of :func:`format_json` with a
+    ``type`` of ``"summary"``, the number of suppressed findings, and
+    the optional ``presence_coverage``, ``quality``, and ``profile``
+    objects.
+
+    Args:
+        tally: Counts of the findings that were reported.
+        file_count: Number of files that were checked.
+        suppressed_count: Number of suppressed findings.
+        presence_stats: Aggregate presence coverage stats, or *None*
+            when the presence check did not run.
+        min_coverage: Coverage threshold from config.
+        quality: Per-check quality data, or *None* when ``--summary``
+            was not used.
+        profile: Run profile data, or *None*.
+
+    Returns:
+        A compact single-line JSON object ending with a newline.
+    """
+    counts = tally.by_category
+    record: dict[str, object] = {
+        "type": "summary",
+        "total": tally.total,
+        "by_category": {
+            "required": counts.get("required", 0),
+            "recommended": counts.get("recommended", 0),
+            "scaffold": counts.get("scaffold", 0),
+        },
+        "files_checked": file_count,
+        "suppressed": suppressed_count,
+    }
+    if presence_stats is not None:
+        record["presence_coverage"] = _presence_coverage(presence_stats, min_coverage)
+    if quality is not None:
+        record["quality"] = {
+            name: dataclasses.asdict(cq) for name, cq in quality.items()
+        }
+    if profile is not None:
+        record["profile"] = profile
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def format_jsonl(
+    findings: list[Finding],
+    file_count: int,
+    *,
+    presence_stats: PresenceStats | None = None,
+    min_coverage: float = 0.0,
+    quality: dict[str, CheckQuality] | None = None,
+    suppressed: list[Finding] | None = None,
+    profile: dict[str, object] | None = None,
+) -> Iterator[str]:
+    """Format findings as JSON Lines, one record per line.
+
+    Yields a ``"finding"`` record per finding sorted by file and line,
+    then a ``"suppressed"`` record per suppressed finding, and always
+    ends with one ``"summary"`` record (even when there are no
+    findings).  Records are produced lazily, so a consumer can write
+    or parse them without building the whole report in memory.
+
+    Args:
+        findings: List of findings to format.
+        file_count: Number of files that were checked.
+        presence_stats: Aggregate presence coverage stats, or *None*
+            when the presence check did not run.
+        min_coverage: Coverage threshold from config.
+        quality: Per-check quality data, or *None* when ``--summary``
+            was not used.
+        suppressed: Suppressed findings, or *None*.
+        profile: Run profile data for the summary record, or *None*.
+
+    Yields:
+        One JSON object per line, each ending with a newline.
+
+    Examples:
+        Write findings to a stream:
+
+        ```python
+        out.writelines(format_jsonl(findings, file_count))
+        # {"type":"finding","file":"a.py",...}
+        # {"type":"summary","total":1,...}
+        ```
+    """
+    tally = FindingTally()
+    tally.add("", findings)
+    for f in sorted(findings, key=lambda f: (f.file, f.line)):
+        yield format_jsonl_finding(f)
+    for f in sorted(suppressed or [], key=lambda f: (f.file, f.line)):
+        yield format_jsonl_finding(f, suppressed=True)
+    yield format_jsonl_summary(
+        tally,
+        file_count,
+        suppressed_count=len(suppressed or []),
+        presence_stats=presence_stats,
+        min_coverage=min_coverage,
+        quality=quality,
+        profile=profile,
+    )
+
+
 def format_summary(
     file_count: int,
     checks: Sequence[str],
-    findings: list[Finding],
+    findings: list[Finding] | FindingTally,
     elapsed: float,
     *,
     coverage_pct: float | None = None,
@@ -396,7 +664,8 @@ def format_summary(
     Args:
         file_count: Number of files that were checked.
         checks: List of check names that were run.
-        findings: All findings across all checks.
+        findings: All findings across all checks, or a
+            :class:`FindingTally` accumulated while streaming.
         elapsed: Total elapsed time in seconds.
         coverage_pct: Docstring coverage percentage from the presence
             check. When not *None*, appended to the detail string.
@@ -423,15 +692,12 @@ def format_summary(
         ```
     """
     check_list = ", ".join(checks)
-    if findings:
-        counts = Counter(f.category for f in findings)
-        parts = [
-            f"{counts['required']} required",
-            f"{counts['recommended']} recommended",
-        ]
-        if counts.get("scaffold"):
-            parts.append(f"{counts['scaffold']} scaffold")
-        detail = f"{len(findings)} findings ({', '.join(parts)})"
+    if isinstance(findings, FindingTally):
+        total, counts = findings.total, findings.by_category
+    else:
+        total, counts = len(findings), Counter(f.category for f in findings)
+    if total:
+        detail = f"{total} findings ({_category_breakdown(counts)})"
     else:
         detail = "no findings"
     if coverage_pct is not None:
@@ -466,10 +732,10 @@ def write_report(
     Args:
         findings: List of findings to write.
         output: Path to write the report to.
-        fmt: Output format — ``"markdown"``, ``"terminal"``, or
-            ``"json"``.
+        fmt: Output format — ``"markdown"``, ``"terminal"``,
+            ``"json"``, or ``"jsonl"``.
         file_count: Number of files checked. Only used when
-            *fmt* is ``"json"`` (for the summary object).
+            *fmt* is ``"json"`` or ``"jsonl"`` (for the summary).
 
     Raises:
         ValueError: If fmt is not a recognized format.
@@ -480,14 +746,19 @@ def write_report(
         content = format_terminal(findings, no_color=True)
     elif fmt == "json":
         content = format_json(findings, file_count)
+    elif fmt == "jsonl":
+        content = "".join(format_jsonl(findings, file_count))
     else:
-        msg = f"Unknown format: {fmt!r}. Expected 'markdown', 'terminal', or 'json'"
+        msg = (
+            f"Unknown format: {fmt!r}. Expected 'markdown', 'terminal',"
+            " 'json', or 'jsonl'"
+        )
         raise ValueError(msg)
     output.write_text(content)
 
 
 def determine_exit_code(
-    findings_by_check: dict[str, list[Finding]],
+    findings_by_check: dict[str, list[Finding]] | FindingTally,
     config: DocvetConfig,
     *,
     presence_stats: PresenceStats | None = None,
@@ -500,7 +771,8 @@ def determine_exit_code(
     Returns 0 otherwise.
 
     Args:
-        findings_by_check: Findings grouped by check name.
+        findings_by_check: Findings grouped by check name, or a
+            :class:`FindingTally` accumulated while streaming.
         config: The docvet configuration with fail_on list.
         presence_stats: Aggregate presence coverage stats, or *None*
             when the presence check did not run.
@@ -510,7 +782,11 @@ def determine_exit_code(
         threshold, 0 otherwise.
     """
     for check in config.fail_on:
-        if findings_by_check.get(check, []):
+        if isinstance(findings_by_check, FindingTally):
+            failed = findings_by_check.by_check[check] > 0
+        else:
+            failed = bool(findings_by_check.get(check, []))
+        if failed:
             return 1
     if presence_stats is not None and config.presence.min_coverage > 0.0:
         if presence_stats.percentage < config.presence.min_coverage:
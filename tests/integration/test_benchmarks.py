@@ -0,0 +1,132 @@
+"""Integration tests for the benchmark suite and its project generator."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+
+import pytest
+
+from benchmarks.run import RUNNERS, compare, main, measure_memory, run_benchmarks
+from benchmarks.synthetic import SyntheticSpec, generate
+
+pytestmark = pytest.mark.integration
+
+_SPEC = SyntheticSpec(
+    packages=2,
+    modules=3,
+    classes=1,
+    methods=1,
+    functions=4,
+    defect_ratio=0.5,
+    drift_ratio=0.5,
+    diff_ratio=0.5,
+)
+
+
+@pytest.fixture(scope="module")
+def project(tmp_path_factory):
+    root = tmp_path_factory.mktemp("synthetic")
+    generate(root, _SPEC)
+    return root
+
+
+def _git(root, *args):
+    return subprocess.run(
+        ["git", *args], cwd=root, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def test_generate_writes_every_file(tmp_path):
+    files = generate(tmp_path, _SPEC)
+
+    assert len(files) == _SPEC.file_count
+    assert all(path.is_file() for path in files)
+    assert 'docstring-style = "google"' in (tmp_path / "pyproject.toml").read_text()
+
+
+def test_generate_is_deterministic(tmp_path):
+    first = generate(tmp_path / "a", _SPEC)
+    second = generate(tmp_path / "b", _SPEC)
+
+    assert [p.read_text() for p in first] == [p.read_text() for p in second]
+
+
+def test_generate_builds_drift_and_diff_history(project):
+    assert _git(project, "log", "--format=%s").splitlines() == [
+        "Change bodies",
+        "Initial",
+    ]
+    assert _git(project, "diff", "--name-only").strip()
+
+
+def test_generate_sphinx_style(tmp_path):
+    files = generate(tmp_path, SyntheticSpec(packages=1, modules=1, style="sphinx"))
+
+    assert ":param value:" in files[-1].read_text()
+
+
+def test_spec_rejects_unknown_style():
+    with pytest.raises(ValueError, match="style must be one of"):
+        SyntheticSpec(style="numpy")
+
+
+def test_run_benchmarks_times_every_runner(project):
+    results = run_benchmarks(project, repeat=1)
+
+    assert results["files"] == _SPEC.file_count
+    assert list(results["results"]) == list(RUNNERS)
+    for timing in results["results"].values():
+        assert len(timing["runs_s"]) == 1
+        assert timing["median_s"] >= 0
+    assert results["results"]["freshness-diff"]["findings"] > 0
+    assert results["results"]["freshness-drift"]["findings"] > 0
+    assert results["results"]["presence"]["findings"] > 0
+
+
+def test_compare_reports_only_regressions():
+    baseline = {"results": {"presence": {"median_s": 1.0}, "fix": {"median_s": 1.0}}}
+    results = {
+        "results": {
+            "presence": {"median_s": 1.5},
+            "fix": {"median_s": 1.1},
+            "griffe": {"median_s": 9.0},
+        }
+    }
+
+    messages = compare(results, baseline, max_regression=0.2)
+
+    assert messages == ["presence: 1.500s vs 1.000s baseline (+50%)"]
+
+
+def test_measure_memory_reports_peak_rss(project):
+    memory = measure_memory(project, repeat=1)
+
+    assert memory["command"] == ["docvet", "check", "--all", "--no-cache"]
+    assert len(memory["runs_mib"]) == 1
+    assert memory["peak_rss_mib"] > 1
+
+
+def test_compare_reports_memory_growth():
+    baseline = {"results": {}, "memory": {"peak_rss_mib": 100.0}}
+    results = {"results": {}, "memory": {"peak_rss_mib": 130.0}}
+
+    messages = compare(results, baseline, max_regression=0.2)
+
+    assert messages == ["peak RSS: 130.0 MiB vs 100.0 MiB baseline (+30%)"]
+
+
+def test_main_writes_results_and_fails_on_regression(project, tmp_path):
+    output = tmp_path / "results.json"
+    args = ["--project", str(project), "--repeat", "1", "--runner", "coverage"]
+
+    assert main([*args, "--output", str(output)]) == 0
+    saved = json.loads(output.read_text())
+    assert list(saved["results"]) == ["coverage"]
+    assert saved["spec"] is None
+
+    saved["results"]["coverage"]["median_s"] = 1e-9
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(saved))
+
+    assert main([*args, "--baseline", str(baseline)]) == 1
@@ -0,0 +1,83 @@
+"""Integration tests for the drift-mode blame cache against real git history."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+
+import pytest
+
+from docvet.cli import FreshnessMode, _run_freshness
+from docvet.cli._cache import _ResultCache
+from docvet.config import DocvetConfig, FreshnessConfig
+
+pytestmark = pytest.mark.integration
+
+_OLD_DATE = "2020-01-01T00:00:00+00:00"
+
+_ORIGINAL = '''\
+"""Module."""
+
+
+def f():
+    """Return one."""
+    return 1
+'''
+
+_EDITED = '''\
+"""Module."""
+
+
+def f():
+    """Return one, always."""
+    return 1
+'''
+
+
+def _commit(repo, message, date=None):
+    env = dict(os.environ)
+    if date is not None:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date
+    subprocess.run(
+        ["git", "commit", "-qam", message],
+        cwd=repo,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _drift(repo, cache):
+    config = DocvetConfig(
+        project_root=repo,
+        freshness=FreshnessConfig(drift_threshold=30, age_threshold=365),
+    )
+    findings, _ = _run_freshness(
+        [(repo / "m.py").resolve()],
+        config,
+        freshness_mode=FreshnessMode.DRIFT,
+        cache=cache,
+    )
+    return sorted((f.line, f.rule) for f in findings)
+
+
+def test_revert_to_earlier_blob_is_blamed_again(git_repo):
+    module = git_repo / "m.py"
+    module.write_text(_ORIGINAL, encoding="utf-8")
+    subprocess.run(["git", "add", "m.py"], cwd=git_repo, check=True)
+    _commit(git_repo, "b", date=_OLD_DATE)
+    cache = _ResultCache(
+        git_repo / ".docvet_cache", DocvetConfig(project_root=git_repo)
+    )
+    assert (4, "stale-age") in _drift(git_repo, cache)
+
+    # Edit the docstring, then restore b's exact blob: the docstring is
+    # now blamed to today even though the blob SHA matches the cache.
+    module.write_text(_EDITED, encoding="utf-8")
+    _commit(git_repo, "c")
+    module.write_text(_ORIGINAL, encoding="utf-8")
+    _commit(git_repo, "d")
+
+    warm = _drift(git_repo, cache)
+    assert warm == _drift(git_repo, None)
+    assert (4, "stale-age") not in warm
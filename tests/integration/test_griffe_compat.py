@@ -8,7 +8,10 @@ import pytest
 
 griffe = pytest.importorskip("griffe")
 
-from docvet.checks.griffe_compat import check_griffe_compat  # noqa: E402
+from docvet.checks.griffe_compat import (  # noqa: E402
+    _ModuleTree,
+    check_griffe_compat,
+)
 
 pytestmark = pytest.mark.integration
 
@@ -99,7 +102,108 @@ class TestGriffeCompatSmoke:
         well_doc_findings = [f for f in findings if f.symbol == "well_documented"]
         assert len(well_doc_findings) == 0
 
+    def test_targeted_mode_matches_package_load(self) -> None:
+        """Targeted loading reports the same findings as a package load."""
+        bad_file = FIXTURES_DIR / "griffe_pkg" / "bad_docstrings.py"
+
+        targeted = check_griffe_compat(FIXTURES_DIR, [bad_file], targeted=True)
+
+        assert sorted(targeted, key=repr) == sorted(
+            check_griffe_compat(FIXTURES_DIR, [bad_file]), key=repr
+        )
+
     def test_empty_files_with_real_griffe(self) -> None:
         """Empty files list returns empty with real griffe installed."""
         findings = check_griffe_compat(FIXTURES_DIR, [])
         assert findings == []
+
+
+class TestParallelLoading:
+    """Package loading in real worker processes."""
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        """Worker processes return the same findings in the same order."""
+        files = []
+        for name in ("alpha", "beta", "gamma"):
+            pkg = tmp_path / name
+            pkg.mkdir()
+            (pkg / "__init__.py").write_text("")
+            mod = pkg / "mod.py"
+            mod.write_text(
+                f'def {name}(x):\n    """Do.\n\n    Args:\n        y: Y.\n    """\n'
+            )
+            files.append(mod)
+
+        parallel = check_griffe_compat(tmp_path, files, jobs=3)
+
+        assert parallel == check_griffe_compat(tmp_path, files)
+        assert [f.symbol for f in parallel if f.rule == "griffe-unknown-param"] == [
+            "alpha",
+            "beta",
+            "gamma",
+        ]
+
+
+class TestModuleTree:
+    """Resident module tree used by the LSP server."""
+
+    def test_matches_full_package_load(self) -> None:
+        """A per-file visit yields the same findings as check_griffe_compat."""
+        bad_file = FIXTURES_DIR / "griffe_pkg" / "bad_docstrings.py"
+
+        tree_findings = _ModuleTree(FIXTURES_DIR).check(bad_file)
+
+        assert sorted(tree_findings, key=repr) == sorted(
+            check_griffe_compat(FIXTURES_DIR, [bad_file]), key=repr
+        )
+
+    def test_recheck_uses_edited_source(self, tmp_path: Path) -> None:
+        """Re-checking with new text replaces the resident module."""
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text('"""Pkg."""\n')
+        mod = pkg / "mod.py"
+        mod.write_text(
+            'def f(x: int) -> None:\n    """Do.\n\n    Args:\n        x: X.\n    """\n'
+        )
+        tree = _ModuleTree(tmp_path)
+
+        assert tree.check(mod) == []
+        edited = mod.read_text().replace("x: X.", "y: Y.")
+        findings = tree.check(mod, edited)
+
+        assert [f.rule for f in findings] == [
+            "griffe-missing-type",
+            "griffe-unknown-param",
+        ]
+        assert tree._modules[("pkg",)].members["mod"] is tree._modules[("pkg", "mod")]
+
+    def test_package_init_edit_keeps_submodules(self, tmp_path: Path) -> None:
+        """Re-visiting a package __init__ keeps its loaded submodules."""
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text('"""Pkg."""\n')
+        (pkg / "mod.py").write_text('"""Mod."""\n')
+        tree = _ModuleTree(tmp_path)
+        tree.check(pkg / "mod.py")
+
+        tree.check(pkg / "__init__.py", '"""Edited."""\n')
+
+        assert "mod" in tree._modules[("pkg",)].members
+
+    def test_file_outside_package_returns_empty(self, tmp_path: Path) -> None:
+        """Top-level modules are not part of any package and are skipped."""
+        loose = tmp_path / "loose.py"
+        loose.write_text('def f(x):\n    """Do.\n\n    Args:\n        y: Y.\n    """\n')
+
+        assert _ModuleTree(tmp_path).check(loose) == []
+
+    def test_syntax_error_returns_empty(self, tmp_path: Path) -> None:
+        """An unparseable buffer produces no findings."""
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        mod = pkg / "mod.py"
+        mod.write_text("x = 1\n")
+
+        assert _ModuleTree(tmp_path).check(mod, "def f(\n") == []
@@ -0,0 +1,116 @@
+"""Tests for the shared single-pass function body facts.
+
+Covers ``_body_facts`` collection of raises, returns, yields, receives,
+warns, deprecation warns, and ``self.*`` assignments, scope isolation at
+nested function/class boundaries, and per-node memoization.
+"""
+
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from docvet.checks.enrichment import _body_facts, _BodyFacts, _facts
+from docvet.checks.enrichment._facts import _collect_body_facts
+
+pytestmark = pytest.mark.unit
+
+
+def _first_def(source: str) -> ast.AST:
+    """Parse *source* and return its first top-level statement."""
+    return ast.parse(source).body[0]
+
+
+def test_body_facts_collects_every_fact_in_one_walk():
+    node = _first_def(
+        """\
+def handler(self, value):
+    self.value = value
+    if value is None:
+        raise ValueError("missing")
+    warnings.warn("old", DeprecationWarning)
+    received = yield value
+    return received
+"""
+    )
+
+    facts = _body_facts(node)
+
+    assert facts == _BodyFacts(
+        raises=frozenset({"ValueError"}),
+        returns_value=True,
+        yields=True,
+        receives=True,
+        warns=True,
+        deprecation_warns=True,
+        self_assignments=True,
+    )
+
+
+def test_body_facts_when_plain_function_returns_empty_facts():
+    node = _first_def("def noop():\n    return None\n")
+
+    facts = _body_facts(node)
+
+    assert facts.raises == frozenset()
+    assert not (
+        facts.returns_value
+        or facts.yields
+        or facts.receives
+        or facts.warns
+        or facts.deprecation_warns
+        or facts.self_assignments
+    )
+
+
+def test_body_facts_ignores_nested_scopes():
+    node = _first_def(
+        """\
+def outer():
+    def inner():
+        raise KeyError
+        yield 1
+
+    class Local:
+        def __init__(self):
+            self.x = 1
+
+    return inner
+"""
+    )
+
+    facts = _body_facts(node)
+
+    assert facts.raises == frozenset()
+    assert facts.yields is False
+    assert facts.self_assignments is False
+    assert facts.returns_value is True
+
+
+def test_body_facts_when_warn_without_category_is_not_deprecation():
+    node = _first_def("def f():\n    warnings.warn('careful')\n")
+
+    facts = _body_facts(node)
+
+    assert facts.warns is True
+    assert facts.deprecation_warns is False
+
+
+def test_body_facts_is_memoized_per_node(mocker):
+    node = _first_def("def f():\n    raise KeyError\n")
+    spy = mocker.spy(_facts, "_collect_body_facts")
+
+    first = _body_facts(node)
+    second = _body_facts(node)
+
+    assert first is second
+    assert spy.call_count == 1
+
+
+def test_collect_body_facts_records_bare_reraise():
+    node = _first_def(
+        "def f():\n    try:\n        pass\n    except Exception:\n        raise\n"
+    )
+
+    assert _collect_body_facts(node).raises == frozenset({"(re-raise)"})
@@ -11,6 +11,7 @@ import pytest
 from docvet.checks import Finding
 from docvet.checks.enrichment import (
     _RULE_DISPATCH,
+    _RULE_KINDS,
     _SECTION_HEADERS,
     _build_node_index,
     _check_missing_attributes,
@@ -31,6 +32,7 @@ from docvet.checks.enrichment import (
     _is_protocol,
     _is_typeddict,
     _parse_sections,
+    _rule_plan,
     check_enrichment,
 )
 from docvet.config import EnrichmentConfig
@@ -538,6 +540,50 @@ def test_all_config_toggle_fields_are_in_rule_dispatch():
     )
 
 
+def test_rule_kinds_only_reference_dispatched_rules():
+    dispatched = {check_fn for _, check_fn in _RULE_DISPATCH}
+    assert set(_RULE_KINDS) <= dispatched
+
+
+def test_rule_plan_skips_class_rules_for_functions():
+    plan = _rule_plan(EnrichmentConfig(), "google")
+
+    function_fns = {check_fn for _, check_fn in plan["function"]}
+    class_fns = {check_fn for _, check_fn in plan["class"]}
+
+    assert _check_missing_typed_attributes not in function_fns
+    assert _check_missing_raises in function_fns
+    assert _check_missing_typed_attributes in class_fns
+    assert _check_missing_raises not in class_fns
+
+
+def test_rule_plan_preserves_dispatch_order():
+    plan = _rule_plan(EnrichmentConfig(), "google")
+    order = [check_fn for _, check_fn in _RULE_DISPATCH]
+
+    for steps in plan.values():
+        positions = [order.index(check_fn) for _, check_fn in steps]
+        assert positions == sorted(positions)
+
+
+def test_rule_plan_excludes_disabled_and_sphinx_auto_disabled_rules():
+    config = EnrichmentConfig(require_raises=False)
+
+    google = _rule_plan(config, "google")
+    sphinx = _rule_plan(config, "sphinx")
+
+    assert "require_raises" not in {attr for attr, _ in google["function"]}
+    assert "require_yields" in {attr for attr, _ in google["function"]}
+    assert "require_yields" not in {attr for attr, _ in sphinx["function"]}
+
+
+def test_rule_plan_is_cached_for_equivalent_configs():
+    first = _rule_plan(EnrichmentConfig(), "google")
+    second = _rule_plan(EnrichmentConfig(), "google")
+
+    assert first is second
+
+
 # ---------------------------------------------------------------------------
 # check_enrichment orchestrator tests
 # ---------------------------------------------------------------------------
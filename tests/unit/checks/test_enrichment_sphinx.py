@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import ast
+import threading
 
 import pytest
 
 from docvet.checks.enrichment import (
     _SPHINX_SECTION_MAP,
     _parse_sections,
+    _run_style,
+    _style_scope,
     check_enrichment,
 )
 from docvet.config import EnrichmentConfig
@@ -446,3 +449,67 @@ See Also:
     config = EnrichmentConfig()
     findings = check_enrichment(source, tree, config, "mod.py", style="google")
     assert not any(f.rule == "missing-cross-references" for f in findings)
+
+
+# ---------------------------------------------------------------------------
+# Run style scoping
+# ---------------------------------------------------------------------------
+
+_MIXED_STYLE_SOURCE = '''\
+def connect(host, port):
+    """Connect to a server.
+
+    Args:
+        host: The hostname.
+
+    :param host: The hostname.
+    :param port: The port number.
+    """
+'''
+
+
+def _param_rules(style: str) -> list[str]:
+    tree = ast.parse(_MIXED_STYLE_SOURCE)
+    findings = check_enrichment(
+        _MIXED_STYLE_SOURCE, tree, EnrichmentConfig(), "t.py", style=style
+    )
+    return sorted(f.rule for f in findings if "param" in f.rule)
+
+
+def test_check_enrichment_restores_run_style():
+    check_enrichment("", ast.parse(""), EnrichmentConfig(), "t.py", style="sphinx")
+
+    assert _run_style.get() == "google"
+
+
+def test_style_scope_nests_and_restores():
+    with _style_scope("sphinx"):
+        with _style_scope("google"):
+            assert _run_style.get() == "google"
+        assert _run_style.get() == "sphinx"
+
+    assert _run_style.get() == "google"
+
+
+def test_concurrent_runs_keep_their_own_style():
+    expected = {style: _param_rules(style) for style in ("google", "sphinx")}
+    assert expected["google"] != expected["sphinx"]
+    barrier = threading.Barrier(8)
+    mismatches: list[str] = []
+
+    def run(style: str) -> None:
+        barrier.wait()
+        for _ in range(50):
+            if _param_rules(style) != expected[style]:
+                mismatches.append(style)
+
+    threads = [
+        threading.Thread(target=run, args=(style,))
+        for style in ("google", "sphinx") * 4
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mismatches == []
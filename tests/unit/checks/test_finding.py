@@ -270,3 +270,40 @@ def test_finding_rejects_invalid_category():
             message="test message",
             category="invalid",  # type: ignore[arg-type]
         )
+
+
+def test_finding_is_slotted():
+    finding = Finding("a.py", 1, "foo", "missing-raises", "msg", "required")
+
+    assert not hasattr(finding, "__dict__")
+
+
+def test_finding_interns_file_rule_and_category():
+    first = Finding(
+        "".join(["src/", "a.py"]),
+        1,
+        "f",
+        "".join(["missing-", "raises"]),
+        "m",
+        "required",
+    )
+    second = Finding(
+        "".join(["src/", "a.py"]),
+        2,
+        "g",
+        "".join(["missing-", "raises"]),
+        "m",
+        "required",
+    )
+
+    assert first.file is second.file
+    assert first.rule is second.rule
+    assert first.category is second.category
+
+
+def test_finding_round_trips_through_pickle():
+    import pickle
+
+    finding = Finding("src\\a.py", 3, "foo", "missing-raises", "msg", "required")
+
+    assert pickle.loads(pickle.dumps(finding)) == finding
@@ -20,6 +20,7 @@ from docvet.checks.freshness import (
     _diff_line_delta,
     _parse_blame_timestamps,
     _parse_diff_hunks,
+    _split_diff_by_file,
     check_freshness_diff,
     check_freshness_drift,
 )
@@ -347,6 +348,68 @@ class TestParseDiffHunks:
         assert result == {2, 6}
 
 
+# ---------------------------------------------------------------------------
+# _split_diff_by_file tests
+# ---------------------------------------------------------------------------
+
+_MULTI_FILE_DIFF = """\
+diff --git a.py a.py
+index 1111111..2222222 100644
+--- a.py
++++ a.py
+@@ -1 +1 @@
+-x = 1
++x = 2
+diff --git new.py new.py
+new file mode 100644
+index 0000000..3333333
+--- /dev/null
++++ new.py
+@@ -0,0 +1 @@
++y = 1
+diff --git gone.py gone.py
+deleted file mode 100644
+index 4444444..0000000
+--- gone.py
++++ /dev/null
+@@ -1 +0,0 @@
+-z = 1
+diff --git img.png img.png
+index 5555555..6666666 100644
+Binary files img.png and img.png differ
+diff --git my file.py my file.py
+index 7777777..8888888 100644
+--- my file.py\t
++++ my file.py\t
+@@ -1 +1 @@
+-+++ old
+++++ new
+"""
+
+
+class TestSplitDiffByFile:
+    def test_keys_sections_by_new_path(self) -> None:
+        result = _split_diff_by_file(_MULTI_FILE_DIFF)
+        assert list(result) == ["a.py", "new.py", "my file.py"]
+
+    def test_sections_do_not_leak_across_files(self) -> None:
+        result = _split_diff_by_file(_MULTI_FILE_DIFF)
+        assert _parse_diff_hunks(result["a.py"]) == {1}
+        assert result["a.py"].startswith("diff --git a.py")
+        assert "new.py" not in result["a.py"]
+
+    def test_new_file_section_keeps_dev_null_marker(self) -> None:
+        result = _split_diff_by_file(_MULTI_FILE_DIFF)
+        assert _parse_diff_hunks(result["new.py"]) == set()
+
+    def test_single_file_matches_whole_output(self) -> None:
+        single = _MULTI_FILE_DIFF.split("diff --git new.py")[0]
+        assert _split_diff_by_file(single) == {"a.py": single}
+
+    def test_empty_input_returns_empty_dict(self) -> None:
+        assert _split_diff_by_file("") == {}
+
+
 # ---------------------------------------------------------------------------
 # _build_finding tests (AC 7)
 # ---------------------------------------------------------------------------
@@ -1030,6 +1093,41 @@ class TestParseBlameTimestamps:
         """Whitespace-only input returns empty dict."""
         assert _parse_blame_timestamps("   \n\n   ") == {}
 
+    def test_streamed_lines_match_string_input(self) -> None:
+        """An iterable of newline-terminated lines parses like the string."""
+        lines = iter(_BLAME_MULTI_ENTRY.splitlines(keepends=True))
+        assert _parse_blame_timestamps(lines) == _parse_blame_timestamps(
+            _BLAME_MULTI_ENTRY
+        )
+
+    def test_compact_porcelain_reuses_commit_headers(self) -> None:
+        """Repeated commits in --porcelain output take their first author-time."""
+        blame = """\
+1234567890123456789012345678901234567890 1 1 2
+author Test Author
+author-time 1707500000
+summary Initial commit
+filename test.py
+\tdef greet(name):
+1234567890123456789012345678901234567890 2 2
+\t    \"\"\"Say hello.\"\"\"
+abcdef7890123456789012345678901234567890 3 3 1
+author Test Author
+author-time 1707700000
+summary Add return
+filename test.py
+\t    return name
+1234567890123456789012345678901234567890 4 4 1
+\t
+"""
+        result = _parse_blame_timestamps(blame)
+        assert result == {
+            1: 1707500000,
+            2: 1707500000,
+            3: 1707700000,
+            4: 1707500000,
+        }
+
     def test_header_fields_silently_skipped(self) -> None:
         """AC 4: Only line numbers and timestamps extracted, not author names etc."""
         result = _parse_blame_timestamps(_BLAME_SINGLE_ENTRY)
@@ -1568,6 +1666,22 @@ class TestCheckFreshnessDrift:
             == []
         )
 
+    def test_pre_parsed_timestamps_match_blame_output(self) -> None:
+        tree = ast.parse(_DRIFT_SOURCE)
+        config = FreshnessConfig()
+        blame = _build_blame((4, _BASE_TS + 73 * _DAY), (5, _BASE_TS))
+        expected = check_freshness_drift("test.py", blame, tree, config, now=_BASE_TS)
+        findings = check_freshness_drift(
+            "test.py",
+            "",
+            tree,
+            config,
+            now=_BASE_TS,
+            timestamps=_parse_blame_timestamps(blame),
+        )
+        assert findings == expected
+        assert findings
+
     def test_deterministic_output(self) -> None:
         # AC 15: identical inputs → identical output
         tree = ast.parse(_DRIFT_SOURCE)
@@ -10,8 +10,10 @@ import pytest
 
 from docvet.checks.griffe_compat import (
     _build_finding_from_record,
+    _check_package_isolated,
     _classify_warning,
     _collect_object_findings,
+    _module_parts,
     _resolve_file_set,
     _walk_objects,
     _WarningCollector,
@@ -660,6 +662,120 @@ class TestCheckGriffeCompat:
         check_griffe_compat(src_root, [a_mod, z_mod])
         assert load_order == ["a_pkg", "z_pkg"]
 
+    def test_skips_packages_without_target_files(self, tmp_path: Path, mocker) -> None:
+        """Packages holding none of the files are never loaded."""
+        src_root = _setup_package_dir(tmp_path, "a_pkg", "b_pkg", "c_pkg")
+        mock_griffe = mocker.patch("docvet.checks.griffe_compat.griffe")
+        mock_griffe.LoadingError = Exception
+        mock_griffe.load.return_value.is_alias = True
+
+        check_griffe_compat(src_root, [src_root / "b_pkg" / "mod.py"])
+
+        assert [c.args[0] for c in mock_griffe.load.call_args_list] == ["b_pkg"]
+
+    def test_targeted_mode_visits_modules_not_packages(
+        self, tmp_path: Path, mocker
+    ) -> None:
+        """Targeted mode checks each file through a module tree."""
+        src_root = _setup_package_dir(tmp_path, "a_pkg", "b_pkg")
+        mod_path = src_root / "b_pkg" / "mod.py"
+        mock_griffe = mocker.patch("docvet.checks.griffe_compat.griffe")
+        mock_tree = mocker.patch("docvet.checks.griffe_compat._ModuleTree")
+        mock_tree.return_value.check.return_value = []
+
+        check_griffe_compat(src_root, [mod_path], targeted=True)
+
+        mock_griffe.load.assert_not_called()
+        mock_tree.assert_called_once_with(src_root)
+        mock_tree.return_value.check.assert_called_once_with(mod_path.resolve())
+
+    def test_targeted_mode_reuses_given_tree(self, tmp_path: Path, mocker) -> None:
+        """A resident tree is used instead of building a new one."""
+        src_root = _setup_package_dir(tmp_path, "a_pkg")
+        mod_path = src_root / "a_pkg" / "mod.py"
+        mocker.patch("docvet.checks.griffe_compat.griffe")
+        mock_tree = mocker.patch("docvet.checks.griffe_compat._ModuleTree")
+        resident = mocker.MagicMock()
+        resident.check.return_value = []
+
+        check_griffe_compat(src_root, [mod_path], targeted=True, tree=resident)
+
+        mock_tree.assert_not_called()
+        resident.check.assert_called_once_with(mod_path.resolve())
+
+
+class TestParallelPackageLoading:
+    """Tests for check_griffe_compat with jobs > 1."""
+
+    def test_dispatches_one_package_per_worker(self, tmp_path: Path, mocker) -> None:
+        src_root = _setup_package_dir(tmp_path, "a_pkg", "b_pkg", "c_pkg")
+        files = [src_root / "a_pkg" / "mod.py", src_root / "c_pkg" / "mod.py"]
+        mocker.patch("docvet.checks.griffe_compat.griffe")
+        mock_pool = mocker.patch("docvet.checks.griffe_compat.ProcessPoolExecutor")
+        executor = mock_pool.return_value.__enter__.return_value
+        a_finding = MagicMock(name="a")
+        c_finding = MagicMock(name="c")
+        executor.map.return_value = iter([[a_finding], [c_finding]])
+
+        result = check_griffe_compat(src_root, files, jobs=8)
+
+        mock_pool.assert_called_once_with(max_workers=2)
+        fn, names, *_ = executor.map.call_args.args
+        assert fn is _check_package_isolated
+        assert list(names) == ["a_pkg", "c_pkg"]
+        assert result == [a_finding, c_finding]
+
+    def test_single_package_stays_in_process(self, tmp_path: Path, mocker) -> None:
+        src_root = _setup_package_dir(tmp_path, "a_pkg", "b_pkg")
+        mock_griffe = mocker.patch("docvet.checks.griffe_compat.griffe")
+        mock_griffe.load.return_value.is_alias = True
+        mock_pool = mocker.patch("docvet.checks.griffe_compat.ProcessPoolExecutor")
+
+        check_griffe_compat(src_root, [src_root / "a_pkg" / "mod.py"], jobs=4)
+
+        mock_pool.assert_not_called()
+        mock_griffe.load.assert_called_once()
+
+    def test_isolated_worker_detaches_its_collector(
+        self, tmp_path: Path, mocker
+    ) -> None:
+        src_root = _setup_package_dir(tmp_path, "a_pkg")
+        mock_griffe = mocker.patch("docvet.checks.griffe_compat.griffe")
+        mock_griffe.load.return_value.is_alias = True
+        griffe_logger = logging.getLogger("griffe")
+        handlers_before = list(griffe_logger.handlers)
+
+        assert _check_package_isolated("a_pkg", src_root, set()) == []
+        assert griffe_logger.handlers == handlers_before
+
+
+class TestModuleParts:
+    """Tests for _module_parts."""
+
+    def test_module_in_nested_package(self, tmp_path: Path) -> None:
+        src_root = _setup_package_dir(tmp_path, "pkg")
+        sub = src_root / "pkg" / "sub"
+        sub.mkdir()
+        (sub / "__init__.py").touch()
+        assert _module_parts(sub / "mod.py", src_root) == ("pkg", "sub", "mod")
+
+    def test_package_init_maps_to_package(self, tmp_path: Path) -> None:
+        src_root = _setup_package_dir(tmp_path, "pkg")
+        assert _module_parts(src_root / "pkg" / "__init__.py", src_root) == ("pkg",)
+
+    def test_directory_without_init_returns_none(self, tmp_path: Path) -> None:
+        src_root = _setup_package_dir(tmp_path, "pkg")
+        (src_root / "pkg" / "plain").mkdir()
+        assert _module_parts(src_root / "pkg" / "plain" / "m.py", src_root) is None
+
+    def test_top_level_module_returns_none(self, tmp_path: Path) -> None:
+        src_root = _setup_package_dir(tmp_path, "pkg")
+        assert _module_parts(src_root / "loose.py", src_root) is None
+
+    def test_outside_src_root_returns_none(self, tmp_path: Path) -> None:
+        src_root = _setup_package_dir(tmp_path, "pkg")
+        assert _module_parts(tmp_path / "other" / "m.py", src_root) is None
+
     def test_handler_removed_in_finally(self, tmp_path: Path, mocker) -> None:
         """Handler removed from griffe logger even on exception (AC #15)."""
         src_root = _setup_package_dir(tmp_path, "mypkg")
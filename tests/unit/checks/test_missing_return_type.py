@@ -12,6 +12,7 @@ from docvet.checks.enrichment import (
     _build_node_index,
     _check_missing_return_type,
     _parse_sections,
+    _style_scope,
     check_enrichment,
 )
 from docvet.config import EnrichmentConfig
@@ -418,17 +419,10 @@ def compute(x):
     sections = _parse_sections(symbol.docstring, style="sphinx")
     config = EnrichmentConfig(require_return_type=True)
 
-    # Simulate sphinx mode by setting the module variable
-    import docvet.checks.enrichment as enr
-
-    old_style = enr._active_style
-    enr._active_style = "sphinx"
-    try:
+    with _style_scope("sphinx"):
         result = _check_missing_return_type(
             symbol, sections, node_index, config, "test.py"
         )
-    finally:
-        enr._active_style = old_style
 
     assert result is None
 
@@ -447,16 +441,10 @@ def compute(x):
     sections = _parse_sections(symbol.docstring, style="sphinx")
     config = EnrichmentConfig(require_return_type=True)
 
-    import docvet.checks.enrichment as enr
-
-    old_style = enr._active_style
-    enr._active_style = "sphinx"
-    try:
+    with _style_scope("sphinx"):
         result = _check_missing_return_type(
             symbol, sections, node_index, config, "test.py"
         )
-    finally:
-        enr._active_style = old_style
 
     assert result is not None
     assert result.rule == "missing-return-type"
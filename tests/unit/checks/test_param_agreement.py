@@ -20,6 +20,7 @@ from docvet.checks.enrichment import (
     _extract_signature_params,
     _parse_args_entries,
     _parse_sections,
+    _style_scope,
     check_enrichment,
 )
 from docvet.config import EnrichmentConfig
@@ -27,15 +28,6 @@ from docvet.config import EnrichmentConfig
 pytestmark = pytest.mark.unit
 
 
-@pytest.fixture(autouse=True)
-def _reset_active_style():
-    """Reset module-level _active_style after each test."""
-    import docvet.checks.enrichment as enrichment_mod
-
-    yield
-    enrichment_mod._active_style = "google"
-
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -637,17 +629,10 @@ def connect(host, port, timeout):
     sections = _parse_sections(symbol.docstring, style="sphinx")
     config = EnrichmentConfig()
 
-    # Manually set _active_style to sphinx for direct check function calls.
-    import docvet.checks.enrichment as enrichment_mod
-
-    original_style = enrichment_mod._active_style
-    try:
-        enrichment_mod._active_style = "sphinx"
+    with _style_scope("sphinx"):
         result = _check_missing_param_in_docstring(
             symbol, sections, node_index, config, "test.py"
         )
-    finally:
-        enrichment_mod._active_style = original_style
 
     assert result is not None
     assert result.rule == "missing-param-in-docstring"
@@ -669,16 +654,10 @@ def connect(host):
     sections = _parse_sections(symbol.docstring, style="sphinx")
     config = EnrichmentConfig()
 
-    import docvet.checks.enrichment as enrichment_mod
-
-    original_style = enrichment_mod._active_style
-    try:
-        enrichment_mod._active_style = "sphinx"
+    with _style_scope("sphinx"):
         result = _check_extra_param_in_docstring(
             symbol, sections, node_index, config, "test.py"
         )
-    finally:
-        enrichment_mod._active_style = original_style
 
     assert result is not None
     assert result.rule == "extra-param-in-docstring"
@@ -0,0 +1,98 @@
+"""Tests for the shared per-docstring section index.
+
+Covers ``ParsedDocstring`` summary, section spans (Google colon and NumPy
+underline boundaries), ``Args``/``Raises`` entries in both styles,
+``Examples`` code block formats, and ``_parse_docstring`` memoization.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from docvet.checks.enrichment import ParsedDocstring, _parse_docstring
+
+pytestmark = pytest.mark.unit
+
+_GOOGLE_DOCSTRING = """\
+Fetch a record.
+
+Args:
+    key (str): Record key.
+        Continuation line.
+    *args: Extra values.
+
+Raises:
+    KeyError: If the key is missing.
+
+Examples:
+    >>> fetch("a")
+"""
+
+
+def test_summary_skips_leading_blank_lines():
+    parsed = ParsedDocstring("\n\n  Fetch a record.  \n\nMore text.")
+
+    assert parsed.summary == "Fetch a record."
+
+
+def test_summary_when_blank_returns_none():
+    assert ParsedDocstring("   \n").summary is None
+
+
+def test_section_content_stops_at_next_section():
+    parsed = ParsedDocstring(_GOOGLE_DOCSTRING)
+
+    assert parsed.section_content("Raises") == (
+        "    KeyError: If the key is missing.\n"
+    )
+    assert parsed.section_content("Returns") is None
+
+
+def test_section_content_stops_at_numpy_underline():
+    parsed = ParsedDocstring("Summary.\n\nNotes:\n    A note.\nReturns\n-------\nint\n")
+
+    assert parsed.section_content("Notes") == "    A note."
+
+
+def test_entries_reads_base_indent_names_only():
+    parsed = ParsedDocstring(_GOOGLE_DOCSTRING)
+
+    assert parsed.entries("Args") == frozenset({"key", "args"})
+    assert parsed.entries("Raises") == frozenset({"KeyError"})
+
+
+def test_entries_in_sphinx_style_scans_field_lists():
+    parsed = ParsedDocstring("Fetch.\n\n:param key: Key.\n:raises KeyError: Missing.\n")
+
+    assert parsed.entries("Args", style="sphinx") == frozenset({"key"})
+    assert parsed.entries("Raises", style="sphinx") == frozenset({"KeyError"})
+
+
+def test_sections_are_cached_per_style():
+    parsed = ParsedDocstring(_GOOGLE_DOCSTRING)
+
+    assert parsed.sections() == frozenset({"Args", "Raises", "Examples"})
+    assert parsed.sections() is parsed.sections()
+    assert parsed.sections("sphinx") == frozenset({"Examples"})
+
+
+def test_code_blocks_records_doctest_and_rst_formats():
+    parsed = ParsedDocstring(
+        "Summary.\n\nExamples:\n    >>> run()\n\n    Usage::\n\n        run()\n"
+    )
+
+    assert parsed.code_blocks == frozenset({"doctest", "rst"})
+
+
+def test_code_blocks_when_fenced_only_is_empty():
+    parsed = ParsedDocstring(
+        "Summary.\n\nExamples:\n    ```python\n    run()\n    ```\n"
+    )
+
+    assert parsed.code_blocks == frozenset()
+
+
+def test_parse_docstring_memoizes_by_text():
+    text = "Summary.\n\nArgs:\n    x: A value.\n"
+
+    assert _parse_docstring(text) is _parse_docstring(text)
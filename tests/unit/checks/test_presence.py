@@ -648,6 +648,39 @@ class C:
         assert stats.documented + len(findings) == stats.total
 
 
+class TestCheckPresencePreParsed:
+    """Tests for reusing a caller-supplied tree and symbol list."""
+
+    def test_pre_parsed_tree_matches_source_parse(self, mocker) -> None:
+        import ast
+
+        source = '"""Module."""\n\n\ndef undocumented():\n    pass\n'
+        tree = ast.parse(source)
+        expected = check_presence(source, "a.py", PresenceConfig())
+        spy = mocker.patch("docvet.checks.presence.ast.parse")
+
+        result = check_presence(source, "a.py", PresenceConfig(), tree=tree)
+
+        spy.assert_not_called()
+        assert result == expected
+
+    def test_pre_extracted_symbols_are_used(self) -> None:
+        import ast
+
+        from docvet.ast_utils import get_documented_symbols
+
+        source = '"""Module."""\n\n\ndef undocumented():\n    pass\n'
+        tree = ast.parse(source)
+        module_only = get_documented_symbols(tree)[:1]
+
+        findings, stats = check_presence(
+            source, "a.py", PresenceConfig(), tree=tree, symbols=module_only
+        )
+
+        assert findings == []
+        assert stats.total == 1
+
+
 class TestNoDoubleCounting:
     """Regression guard: enrichment skips undocumented symbols (AC 3)."""
 
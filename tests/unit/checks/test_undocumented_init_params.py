@@ -11,6 +11,7 @@ from docvet.checks.enrichment import (
     _build_node_index,
     _check_undocumented_init_params,
     _parse_sections,
+    _style_scope,
     check_enrichment,
 )
 from docvet.config import EnrichmentConfig
@@ -306,17 +307,10 @@ def test_sphinx_param_in_class_docstring_no_finding():
     # Sphinx mode: _parse_sections maps :param -> "Args"
     sphinx_sections = _parse_sections(symbol.docstring, style="sphinx")
     config = EnrichmentConfig(require_init_params=True)
-    # We need to simulate sphinx mode for _active_style
-    import docvet.checks.enrichment as _mod
-
-    old_style = _mod._active_style
-    _mod._active_style = "sphinx"
-    try:
+    with _style_scope("sphinx"):
         finding = _check_undocumented_init_params(
             symbol, sphinx_sections, node_index, config, "server.py"
         )
-    finally:
-        _mod._active_style = old_style
     assert finding is None
 
 
@@ -335,16 +329,10 @@ def test_sphinx_param_in_init_docstring_no_finding():
     '''
     symbol, sections, node_index = _make_class_symbol_and_index(source)
     config = EnrichmentConfig(require_init_params=True)
-    import docvet.checks.enrichment as _mod
-
-    old_style = _mod._active_style
-    _mod._active_style = "sphinx"
-    try:
+    with _style_scope("sphinx"):
         finding = _check_undocumented_init_params(
             symbol, sections, node_index, config, "server.py"
         )
-    finally:
-        _mod._active_style = old_style
     assert finding is None
 
 
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import ast
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
 from docvet.ast_utils import (
+    ParsedFile,
+    build_node_index,
     get_body_range,
     get_docstring_range,
     get_documented_symbols,
@@ -38,6 +41,12 @@ class TestGetDocumentedSymbols:
         assert len(funcs) == 1
         assert funcs[0].name == "greet"
 
+    def test_symbols_are_slotted(self, parse_source):
+        tree = parse_source('def greet():\n    """Say hello."""\n')
+        symbols = get_documented_symbols(tree)
+        assert symbols
+        assert all(not hasattr(s, "__dict__") for s in symbols)
+
     def test_function_no_docstring_has_none(self, parse_source):
         tree = parse_source(
             dedent("""\
@@ -469,3 +478,40 @@ class TestModuleDisplayName:
     )
     def test_conversion(self, file_path: str, expected: str) -> None:
         assert module_display_name(file_path) == expected
+
+
+class TestParsedFile:
+    """Tests for the ``ParsedFile`` shared parse container."""
+
+    _SOURCE = dedent("""\
+        \"\"\"Module.\"\"\"
+
+        class Foo:
+            \"\"\"Foo.\"\"\"
+
+            def bar(self):
+                \"\"\"Bar.\"\"\"
+        """)
+
+    def test_symbols_are_computed_once(self):
+        parsed = ParsedFile(source=self._SOURCE, tree=ast.parse(self._SOURCE))
+        assert parsed.symbols is parsed.symbols
+        assert [s.name for s in parsed.symbols] == ["<module>", "Foo", "bar"]
+
+    def test_node_index_matches_build_node_index(self):
+        tree = ast.parse(self._SOURCE)
+        parsed = ParsedFile(source=self._SOURCE, tree=tree)
+        assert parsed.node_index == build_node_index(tree)
+
+    def test_line_map_matches_map_lines_to_symbols(self):
+        tree = ast.parse(self._SOURCE)
+        parsed = ParsedFile(source=self._SOURCE, tree=tree)
+        assert parsed.line_map == map_lines_to_symbols(tree)
+
+    def test_line_map_reuses_cached_symbols(self, mocker):
+        parsed = ParsedFile(source=self._SOURCE, tree=ast.parse(self._SOURCE))
+        symbols = parsed.symbols
+        spy = mocker.patch("docvet.ast_utils.get_documented_symbols")
+        line_map = parsed.line_map
+        spy.assert_not_called()
+        assert line_map[6] is symbols[2]
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import io
 import json
 import re
+import subprocess
 from pathlib import Path
 from typing import Any
 from unittest.mock import ANY, MagicMock
@@ -12,15 +14,25 @@ import pytest
 import typer
 from typer.testing import CliRunner
 
+from docvet.ast_utils import get_documented_symbols
+from docvet.checks import Finding
 from docvet.checks.presence import PresenceStats
 from docvet.cli import (
     FreshnessMode,
+    _check_file,
+    _FileResults,
+    _FindingStream,
     _merge_file_args,
+    _parse_jobs_option,
+    _ParsedFileStore,
     _run_coverage,
     _run_enrichment,
     _run_freshness,
     _run_griffe,
+    _run_parallel,
     _run_presence,
+    _run_streaming,
+    _write_blame_latency,
     app,
 )
 from docvet.config import DocvetConfig, PresenceConfig, load_config
@@ -42,6 +54,11 @@ def _non_timing_lines(output: str) -> list[str]:
     return [line for line in output.splitlines() if not line.startswith("Vetted ")]
 
 
+def _presence_finding(file: str) -> Finding:
+    """Return a presence finding located in *file*."""
+    return Finding(file, 1, "x", "missing-docstring", "msg", "required")
+
+
 # ---------------------------------------------------------------------------
 # Autouse fixture — mock config loading and file discovery for all tests
 # ---------------------------------------------------------------------------
@@ -59,6 +76,8 @@ def _mock_config_and_discovery(mocker):
     mocker.patch("docvet.cli._run_freshness", return_value=([], 0))
     mocker.patch("docvet.cli._run_coverage", return_value=([], 0))
     mocker.patch("docvet.cli._run_griffe", return_value=([], 0))
+    # Result caching is covered in test_cli_cache; keep it out of the repo.
+    mocker.patch("docvet.cli._ResultCache", return_value=None)
 
 
 # ---------------------------------------------------------------------------
@@ -498,14 +517,25 @@ def test_check_when_invoked_passes_config_to_run_stubs(mocker):
     mock_griffe = mocker.patch("docvet.cli._run_griffe", return_value=([], 0))
     runner.invoke(app, ["check"])
     mock_enrichment.assert_called_once_with(
-        fake_files, fake_config, show_progress=False
+        fake_files, fake_config, show_progress=False, store=ANY, cache=ANY
     )
     mock_freshness.assert_called_once_with(
-        fake_files, fake_config, discovery_mode=DiscoveryMode.DIFF, show_progress=False
+        fake_files,
+        fake_config,
+        discovery_mode=DiscoveryMode.DIFF,
+        show_progress=False,
+        store=ANY,
+        cache=ANY,
     )
     mock_coverage.assert_called_once_with(fake_files, fake_config)
     mock_griffe.assert_called_once_with(
-        fake_files, fake_config, verbose=False, quiet=False
+        fake_files,
+        fake_config,
+        verbose=False,
+        quiet=False,
+        targeted=True,
+        jobs=1,
+        tree=None,
     )
 
 
@@ -542,6 +572,9 @@ def test_freshness_when_invoked_with_drift_passes_freshness_mode(mocker):
         freshness_mode=FreshnessMode.DRIFT,
         discovery_mode=DiscoveryMode.DIFF,
         show_progress=False,
+        store=ANY,
+        cache=ANY,
+        blame_latencies=ANY,
     )
 
 
@@ -579,7 +612,13 @@ def test_griffe_when_invoked_calls_discover_and_run_griffe(mocker):
     runner.invoke(app, ["griffe"])
     mock_discover.assert_called_once_with(ANY, DiscoveryMode.DIFF, files=())
     mock_run.assert_called_once_with(
-        [Path("/fake/file.py")], ANY, verbose=False, quiet=False
+        [Path("/fake/file.py")],
+        ANY,
+        verbose=False,
+        quiet=False,
+        targeted=True,
+        jobs=1,
+        tree=None,
     )
 
 
@@ -717,6 +756,8 @@ def test_run_enrichment_passes_config_enrichment_and_str_file_path(mocker):
         fake_config.enrichment,
         str(file_path),
         style=fake_config.docstring_style,
+        symbols=ANY,
+        node_index=ANY,
     )
 
 
@@ -791,15 +832,14 @@ def test_run_freshness_passes_file_path_diff_output_and_tree(mocker):
     mocker.patch.object(Path, "read_text", return_value="x = 1\n")
     mock_subprocess = mocker.patch("docvet.cli.subprocess.run")
     mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "diff --git a/f.py b/f.py\n"
+    diff = "diff --git file.py file.py\n--- file.py\n+++ file.py\n"
+    mock_subprocess.return_value.stdout = diff
     mock_check = mocker.patch("docvet.cli.check_freshness_diff", return_value=[])
-    file_path = Path("/fake/file.py")
+    file_path = (DocvetConfig().project_root / "file.py").resolve()
     mocker.patch("docvet.cli.discover_files", return_value=[file_path])
     result = runner.invoke(app, ["freshness"])
     assert result.exit_code == 0
-    mock_check.assert_called_once_with(
-        str(file_path), "diff --git a/f.py b/f.py\n", ANY
-    )
+    mock_check.assert_called_once_with(str(file_path), diff, ANY, line_map=ANY)
 
 
 # ---------------------------------------------------------------------------
@@ -810,7 +850,9 @@ def test_run_freshness_passes_file_path_diff_output_and_tree(mocker):
 def test_run_freshness_drift_calls_check_freshness_drift_per_file(mocker):
     mocker.patch("docvet.cli._run_freshness", side_effect=_run_freshness)
     mocker.patch.object(Path, "read_text", return_value="x = 1\n")
-    mock_blame = mocker.patch("docvet.cli._get_git_blame", return_value="blame data")
+    mock_blame = mocker.patch(
+        "docvet.cli._get_git_blame_timestamps", return_value={1: 100}
+    )
     mock_check = mocker.patch("docvet.cli.check_freshness_drift", return_value=[])
     mock_diff_check = mocker.patch("docvet.cli.check_freshness_diff", return_value=[])
     file_path = Path("/fake/file.py")
@@ -818,7 +860,9 @@ def test_run_freshness_drift_calls_check_freshness_drift_per_file(mocker):
     result = runner.invoke(app, ["freshness", "--mode", "drift"])
     assert result.exit_code == 0
     mock_blame.assert_called_once_with(file_path, ANY)
-    mock_check.assert_called_once_with(str(file_path), "blame data", ANY, ANY)
+    mock_check.assert_called_once_with(
+        str(file_path), "", ANY, ANY, line_map=ANY, timestamps={1: 100}
+    )
     mock_diff_check.assert_not_called()
 
 
@@ -838,7 +882,7 @@ def test_run_freshness_drift_prints_findings_in_correct_format(mocker):
         ),
     ]
     mocker.patch("docvet.cli.check_freshness_drift", return_value=findings)
-    mocker.patch("docvet.cli._get_git_blame", return_value="blame data")
+    mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={1: 100})
     mocker.patch.object(Path, "read_text", return_value="def do_stuff(): pass\n")
     mocker.patch("docvet.cli.discover_files", return_value=[Path("src/app.py")])
     result = runner.invoke(app, ["freshness", "--mode", "drift"])
@@ -850,7 +894,7 @@ def test_run_freshness_drift_prints_findings_in_correct_format(mocker):
 def test_run_freshness_drift_no_findings_produces_no_output(mocker):
     mocker.patch("docvet.cli._run_freshness", side_effect=_run_freshness)
     mocker.patch("docvet.cli.check_freshness_drift", return_value=[])
-    mocker.patch("docvet.cli._get_git_blame", return_value="blame data")
+    mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={1: 100})
     mocker.patch.object(Path, "read_text", return_value="x = 1\n")
     result = runner.invoke(app, ["freshness", "--mode", "drift"])
     assert result.exit_code == 0
@@ -866,14 +910,19 @@ def test_run_freshness_drift_passes_config_freshness_to_check(mocker):
     )
     mocker.patch("docvet.cli.load_config", return_value=fake_config)
     mocker.patch.object(Path, "read_text", return_value="x = 1\n")
-    mocker.patch("docvet.cli._get_git_blame", return_value="blame data")
+    mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={1: 100})
     mock_check = mocker.patch("docvet.cli.check_freshness_drift", return_value=[])
     file_path = Path("/fake/file.py")
     mocker.patch("docvet.cli.discover_files", return_value=[file_path])
     result = runner.invoke(app, ["freshness", "--mode", "drift"])
     assert result.exit_code == 0
     mock_check.assert_called_once_with(
-        str(file_path), "blame data", ANY, fake_config.freshness
+        str(file_path),
+        "",
+        ANY,
+        fake_config.freshness,
+        line_map=ANY,
+        timestamps={1: 100},
     )
 
 
@@ -894,8 +943,8 @@ def test_run_freshness_drift_processes_multiple_files(mocker):
     mocker.patch("docvet.cli._run_freshness", side_effect=_run_freshness)
     mocker.patch.object(Path, "read_text", return_value="x = 1\n")
     mocker.patch(
-        "docvet.cli._get_git_blame",
-        side_effect=lambda fp, _root: f"blame-{fp.stem}",
+        "docvet.cli._get_git_blame_timestamps",
+        side_effect=lambda fp, _root: {1: ord(fp.stem)},
     )
     mock_check = mocker.patch("docvet.cli.check_freshness_drift", return_value=[])
     files = [Path("/a.py"), Path("/b.py"), Path("/c.py")]
@@ -904,24 +953,66 @@ def test_run_freshness_drift_processes_multiple_files(mocker):
     assert result.exit_code == 0
     assert mock_check.call_count == 3
     for file_path in files:
-        mock_check.assert_any_call(str(file_path), f"blame-{file_path.stem}", ANY, ANY)
+        mock_check.assert_any_call(
+            str(file_path),
+            "",
+            ANY,
+            ANY,
+            line_map=ANY,
+            timestamps={1: ord(file_path.stem)},
+        )
 
 
 # ---------------------------------------------------------------------------
-# _get_git_diff tests
-# ---------------------------------------------------------------------------
-
-
-def test_get_git_diff_when_diff_mode_runs_git_diff(mocker):
-    from docvet.cli import _get_git_diff
+# _get_git_diffs tests
+# ---------------------------------------------------------------------------
+
+_TWO_FILE_DIFF = """\
+diff --git a.py a.py
+index 1111111..2222222 100644
+--- a.py
++++ a.py
+@@ -1 +1 @@
+-x = 1
++x = 2
+diff --git pkg/b.py pkg/b.py
+index 3333333..4444444 100644
+--- pkg/b.py
++++ pkg/b.py
+@@ -1 +1,2 @@
+ y = 1
++z = 2
+"""
+
+
+@pytest.mark.parametrize(
+    ("mode", "variant"),
+    [
+        (DiscoveryMode.DIFF, []),
+        (DiscoveryMode.FILES, []),
+        (DiscoveryMode.STAGED, ["--cached"]),
+        (DiscoveryMode.ALL, ["HEAD"]),
+    ],
+)
+def test_get_git_diffs_runs_one_git_diff_variant(mocker, mode, variant):
+    from docvet.cli import _get_git_diffs
 
     mock_subprocess = mocker.patch("docvet.cli.subprocess.run")
     mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "diff output"
-    result = _get_git_diff(Path("/f.py"), Path("/project"), DiscoveryMode.DIFF)
-    assert result == "diff output"
+    mock_subprocess.return_value.stdout = ""
+    _get_git_diffs(Path("/project"), mode)
     mock_subprocess.assert_called_once_with(
-        ["git", "diff", "--", str(Path("/f.py"))],
+        [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "diff",
+            *variant,
+            "--relative",
+            "--no-prefix",
+            "--",
+            "*.py",
+        ],
         capture_output=True,
         text=True,
         check=False,
@@ -929,107 +1020,139 @@ def test_get_git_diff_when_diff_mode_runs_git_diff(mocker):
     )
 
 
-def test_get_git_diff_when_files_mode_runs_git_diff(mocker):
-    from docvet.cli import _get_git_diff
+def test_get_git_diffs_splits_output_per_file(mocker, tmp_path):
+    from docvet.cli import _get_git_diffs
 
     mock_subprocess = mocker.patch("docvet.cli.subprocess.run")
     mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "diff output"
-    result = _get_git_diff(Path("/f.py"), Path("/project"), DiscoveryMode.FILES)
-    assert result == "diff output"
-    mock_subprocess.assert_called_once_with(
-        ["git", "diff", "--", str(Path("/f.py"))],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=Path("/project"),
-    )
+    mock_subprocess.return_value.stdout = _TWO_FILE_DIFF
+    result = _get_git_diffs(tmp_path, DiscoveryMode.DIFF)
+    root = tmp_path.resolve()
+    assert list(result) == [root / "a.py", root / "pkg" / "b.py"]
+    assert "+x = 2" in result[root / "a.py"]
+    assert "pkg/b.py" not in result[root / "a.py"]
+    assert result[root / "pkg" / "b.py"].startswith("diff --git pkg/b.py")
 
 
-def test_get_git_diff_when_staged_mode_runs_git_diff_cached(mocker):
-    from docvet.cli import _get_git_diff
+def test_get_git_diffs_when_git_fails_returns_empty_dict(mocker):
+    from docvet.cli import _get_git_diffs
 
     mock_subprocess = mocker.patch("docvet.cli.subprocess.run")
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "cached diff"
-    result = _get_git_diff(Path("/f.py"), Path("/project"), DiscoveryMode.STAGED)
-    assert result == "cached diff"
-    mock_subprocess.assert_called_once_with(
-        ["git", "diff", "--cached", "--", str(Path("/f.py"))],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=Path("/project"),
+    mock_subprocess.return_value.returncode = 128
+    mock_subprocess.return_value.stdout = ""
+    assert _get_git_diffs(Path("/project"), DiscoveryMode.DIFF) == {}
+
+
+def test_run_freshness_diff_runs_git_diff_once_for_all_files(mocker, tmp_path):
+    files = []
+    for name in ("a.py", "b.py", "c.py"):
+        path = tmp_path / name
+        path.write_text("x = 1\n")
+        files.append(path.resolve())
+    mock_diffs = mocker.patch(
+        "docvet.cli._get_git_diffs", return_value={files[1]: "b diff"}
     )
+    mock_check = mocker.patch("docvet.cli.check_freshness_diff", return_value=[])
+    _run_freshness(files, DocvetConfig(project_root=tmp_path))
+    mock_diffs.assert_called_once_with(tmp_path, DiscoveryMode.DIFF)
+    assert [c.args[1] for c in mock_check.call_args_list] == ["", "b diff", ""]
 
 
-def test_get_git_diff_when_all_mode_runs_git_diff_head(mocker):
-    from docvet.cli import _get_git_diff
+# ---------------------------------------------------------------------------
+# _get_git_blame_timestamps tests
+# ---------------------------------------------------------------------------
 
-    mock_subprocess = mocker.patch("docvet.cli.subprocess.run")
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "head diff"
-    result = _get_git_diff(Path("/f.py"), Path("/project"), DiscoveryMode.ALL)
-    assert result == "head diff"
-    mock_subprocess.assert_called_once_with(
-        ["git", "diff", "HEAD", "--", str(Path("/f.py"))],
-        capture_output=True,
+_PORCELAIN = (
+    "1234567890123456789012345678901234567890 1 1 1\n"
+    "author-time 1707500000\n"
+    "\tdef greet(name):\n"
+)
+
+
+def _mock_popen(mocker, stdout, returncode):
+    mock_popen = mocker.patch("docvet.cli.subprocess.Popen")
+    proc = mock_popen.return_value
+    proc.__enter__.return_value = proc
+    proc.stdout = iter(stdout.splitlines(keepends=True))
+    proc.returncode = returncode
+    return mock_popen
+
+
+def test_get_git_blame_timestamps_runs_correct_command(mocker):
+    from docvet.cli import _get_git_blame_timestamps
+
+    mock_popen = _mock_popen(mocker, _PORCELAIN, 0)
+    _get_git_blame_timestamps(Path("/f.py"), Path("/project"))
+    mock_popen.assert_called_once_with(
+        ["git", "blame", "--porcelain", "--", str(Path("/f.py"))],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
-        check=False,
+        encoding="utf-8",
+        errors="replace",
         cwd=Path("/project"),
     )
 
 
-def test_get_git_diff_when_git_fails_returns_empty_string(mocker):
-    from docvet.cli import _get_git_diff
+def test_get_git_blame_timestamps_parses_streamed_output(mocker):
+    from docvet.cli import _get_git_blame_timestamps
 
-    mock_subprocess = mocker.patch("docvet.cli.subprocess.run")
-    mock_subprocess.return_value.returncode = 128
-    mock_subprocess.return_value.stdout = ""
-    result = _get_git_diff(Path("/f.py"), Path("/project"), DiscoveryMode.DIFF)
-    assert result == ""
+    _mock_popen(mocker, _PORCELAIN, 0)
+    result = _get_git_blame_timestamps(Path("/f.py"), Path("/project"))
+    assert result == {1: 1707500000}
 
 
-# ---------------------------------------------------------------------------
-# _get_git_blame tests
-# ---------------------------------------------------------------------------
+def test_get_git_blame_timestamps_returns_empty_on_failure(mocker):
+    from docvet.cli import _get_git_blame_timestamps
 
+    _mock_popen(mocker, "", 128)
+    result = _get_git_blame_timestamps(Path("/f.py"), Path("/project"))
+    assert result == {}
 
-def test_get_git_blame_runs_correct_command(mocker):
-    from docvet.cli import _get_git_blame
 
-    mock_subprocess = mocker.patch("docvet.cli.subprocess.run")
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "blame output"
-    result = _get_git_blame(Path("/f.py"), Path("/project"))
-    assert result == "blame output"
-    mock_subprocess.assert_called_once_with(
-        ["git", "blame", "--line-porcelain", "--", str(Path("/f.py"))],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=Path("/project"),
+def test_run_freshness_drift_records_blame_latency_per_file(mocker):
+    mocker.patch.object(Path, "read_text", return_value="x = 1\n")
+    mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={})
+    files = [Path("/a.py"), Path("/b.py")]
+    latencies: dict[Path, tuple[float, float]] = {}
+    _run_freshness(
+        files,
+        DocvetConfig(),
+        freshness_mode=FreshnessMode.DRIFT,
+        blame_latencies=latencies,
     )
+    assert list(latencies) == files
+    assert all(end >= start for start, end in latencies.values())
 
 
-def test_get_git_blame_returns_stdout_on_success(mocker):
-    from docvet.cli import _get_git_blame
+def test_blame_latency_wall_time_spans_only_the_blames(capsys):
+    spans = {Path("/a.py"): (10.0, 11.0), Path("/b.py"): (10.5, 12.0)}
 
-    mock_subprocess = mocker.patch("docvet.cli.subprocess.run")
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "porcelain blame data\n"
-    result = _get_git_blame(Path("/f.py"), Path("/project"))
-    assert result == "porcelain blame data\n"
+    _write_blame_latency(spans, verbose=True, quiet=False)
 
+    err = capsys.readouterr().err
+    assert "blame: 2 files, 2.5s total, 2.0s wall" in err
+    assert err.splitlines()[1] == "  1.50s /b.py"
 
-def test_get_git_blame_returns_empty_on_failure(mocker):
-    from docvet.cli import _get_git_blame
 
-    mock_subprocess = mocker.patch("docvet.cli.subprocess.run")
-    mock_subprocess.return_value.returncode = 128
-    mock_subprocess.return_value.stdout = ""
-    result = _get_git_blame(Path("/f.py"), Path("/project"))
-    assert result == ""
+def test_freshness_drift_verbose_reports_blame_latency(mocker):
+    mocker.patch("docvet.cli._run_freshness", side_effect=_run_freshness)
+    mocker.patch.object(Path, "read_text", return_value="x = 1\n")
+    mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={})
+    mocker.patch("docvet.cli.discover_files", return_value=[Path("/a.py")])
+    result = runner.invoke(app, ["freshness", "--mode", "drift", "--verbose"])
+    assert result.exit_code == 0
+    assert "blame: 1 files," in result.output
+    assert "s /a.py" in result.output
+
+
+def test_freshness_drift_quiet_omits_blame_latency(mocker):
+    mocker.patch("docvet.cli._run_freshness", side_effect=_run_freshness)
+    mocker.patch.object(Path, "read_text", return_value="x = 1\n")
+    mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={})
+    mocker.patch("docvet.cli.discover_files", return_value=[Path("/a.py")])
+    result = runner.invoke(app, ["freshness", "--mode", "drift", "--verbose", "-q"])
+    assert "blame:" not in result.output
 
 
 def test_freshness_subcommand_passes_discovery_mode_to_run_freshness(mocker):
@@ -1041,6 +1164,9 @@ def test_freshness_subcommand_passes_discovery_mode_to_run_freshness(mocker):
         freshness_mode=FreshnessMode.DIFF,
         discovery_mode=DiscoveryMode.STAGED,
         show_progress=False,
+        store=ANY,
+        cache=ANY,
+        blame_latencies=ANY,
     )
 
 
@@ -1048,7 +1174,12 @@ def test_check_subcommand_passes_discovery_mode_to_run_freshness(mocker):
     mock_freshness = mocker.patch("docvet.cli._run_freshness", return_value=([], 0))
     runner.invoke(app, ["check", "--all"])
     mock_freshness.assert_called_once_with(
-        ANY, ANY, discovery_mode=DiscoveryMode.ALL, show_progress=False
+        ANY,
+        ANY,
+        discovery_mode=DiscoveryMode.ALL,
+        show_progress=False,
+        store=ANY,
+        cache=ANY,
     )
 
 
@@ -1059,9 +1190,16 @@ def test_check_subcommand_passes_show_progress_true_when_tty(mocker):
     mock_enrichment = mocker.patch("docvet.cli._run_enrichment", return_value=([], 0))
     mock_freshness = mocker.patch("docvet.cli._run_freshness", return_value=([], 0))
     runner.invoke(app, ["check"])
-    mock_enrichment.assert_called_once_with(ANY, ANY, show_progress=True)
+    mock_enrichment.assert_called_once_with(
+        ANY, ANY, show_progress=True, store=ANY, cache=ANY
+    )
     mock_freshness.assert_called_once_with(
-        ANY, ANY, discovery_mode=DiscoveryMode.DIFF, show_progress=True
+        ANY,
+        ANY,
+        discovery_mode=DiscoveryMode.DIFF,
+        show_progress=True,
+        store=ANY,
+        cache=ANY,
     )
 
 
@@ -1071,7 +1209,7 @@ def test_enrichment_subcommand_passes_show_progress_true_when_tty(mocker):
     mock_sys.stdout.isatty.return_value = True
     mock_enrichment = mocker.patch("docvet.cli._run_enrichment", return_value=([], 0))
     runner.invoke(app, ["enrichment"])
-    mock_enrichment.assert_called_once_with(ANY, ANY, show_progress=True)
+    mock_enrichment.assert_called_once_with(ANY, ANY, show_progress=True, store=ANY)
 
 
 def test_freshness_subcommand_passes_show_progress_true_when_tty(mocker):
@@ -1086,6 +1224,9 @@ def test_freshness_subcommand_passes_show_progress_true_when_tty(mocker):
         freshness_mode=FreshnessMode.DIFF,
         discovery_mode=DiscoveryMode.DIFF,
         show_progress=True,
+        store=ANY,
+        cache=ANY,
+        blame_latencies=ANY,
     )
 
 
@@ -1235,7 +1376,7 @@ def test_run_griffe_passes_correct_src_root_path(tmp_path, mocker):
     mocker.patch("docvet.cli.discover_files", return_value=[src_dir / "app.py"])
     result = runner.invoke(app, ["griffe"])
     assert result.exit_code == 0
-    mock_check.assert_called_once_with(src_dir, ANY)
+    mock_check.assert_called_once_with(src_dir, ANY, targeted=True, jobs=1, tree=None)
 
 
 def test_run_griffe_with_default_config_uses_project_root_dot(tmp_path, mocker):
@@ -1247,7 +1388,9 @@ def test_run_griffe_with_default_config_uses_project_root_dot(tmp_path, mocker):
     mocker.patch("docvet.cli.discover_files", return_value=[tmp_path / "app.py"])
     result = runner.invoke(app, ["griffe"])
     assert result.exit_code == 0
-    mock_check.assert_called_once_with(tmp_path / ".", ANY)
+    mock_check.assert_called_once_with(
+        tmp_path / ".", ANY, targeted=True, jobs=1, tree=None
+    )
 
 
 def test_run_griffe_passes_discovered_files(tmp_path, mocker):
@@ -1260,7 +1403,41 @@ def test_run_griffe_passes_discovered_files(tmp_path, mocker):
     mock_check = mocker.patch("docvet.cli.check_griffe_compat", return_value=[])
     result = runner.invoke(app, ["griffe"])
     assert result.exit_code == 0
-    mock_check.assert_called_once_with(ANY, files)
+    mock_check.assert_called_once_with(ANY, files, targeted=True, jobs=1, tree=None)
+
+
+def test_run_griffe_targets_modules_for_files_mode(tmp_path, mocker):
+    mocker.patch("docvet.cli._run_griffe", side_effect=_run_griffe)
+    mocker.patch("docvet.cli.importlib.util.find_spec", return_value=MagicMock())
+    fake_config = DocvetConfig(project_root=tmp_path)
+    mocker.patch("docvet.cli.load_config", return_value=fake_config)
+    files = [tmp_path / "pkg" / "mod.py"]
+    mocker.patch("docvet.cli.discover_files", return_value=files)
+    mock_check = mocker.patch("docvet.cli.check_griffe_compat", return_value=[])
+    result = runner.invoke(app, ["griffe", "--files", str(files[0])])
+    assert result.exit_code == 0
+    mock_check.assert_called_once_with(ANY, files, targeted=True, jobs=1, tree=None)
+
+
+def test_run_griffe_loads_whole_packages_for_all_mode(tmp_path, mocker):
+    mocker.patch("docvet.cli._run_griffe", side_effect=_run_griffe)
+    mocker.patch("docvet.cli.importlib.util.find_spec", return_value=MagicMock())
+    fake_config = DocvetConfig(project_root=tmp_path)
+    mocker.patch("docvet.cli.load_config", return_value=fake_config)
+    mocker.patch("docvet.cli.discover_files", return_value=[tmp_path / "a.py"])
+    mock_check = mocker.patch("docvet.cli.check_griffe_compat", return_value=[])
+    result = runner.invoke(app, ["griffe", "--all"])
+    assert result.exit_code == 0
+    mock_check.assert_called_once_with(ANY, ANY, targeted=False, jobs=1, tree=None)
+
+
+def test_griffe_subcommand_passes_jobs_to_run_griffe(mocker):
+    mocker.patch("docvet.cli.importlib.util.find_spec", return_value=MagicMock())
+    mock_run = mocker.patch("docvet.cli._run_griffe", return_value=([], 0))
+    runner.invoke(app, ["griffe", "--all", "--jobs", "4"])
+    mock_run.assert_called_once_with(
+        ANY, ANY, verbose=False, quiet=False, targeted=False, jobs=4, tree=None
+    )
 
 
 def test_run_griffe_when_griffe_not_installed_skips_silently(mocker):
@@ -1335,7 +1512,9 @@ def test_check_command_includes_griffe_findings(tmp_path, mocker):
 def test_check_passes_verbose_to_run_griffe(mocker):
     mock_griffe = mocker.patch("docvet.cli._run_griffe", return_value=([], 0))
     runner.invoke(app, ["--verbose", "check"])
-    mock_griffe.assert_called_once_with(ANY, ANY, verbose=True, quiet=False)
+    mock_griffe.assert_called_once_with(
+        ANY, ANY, verbose=True, quiet=False, targeted=True, jobs=1, tree=None
+    )
 
 
 def test_griffe_when_invoked_with_all_calls_discover_with_all_mode(mocker):
@@ -1424,7 +1603,7 @@ def test_run_enrichment_direct_multiple_files_accumulates_findings(mocker):
 
     call_count = 0
 
-    def _fake_check(source, tree, enrichment_config, file_path, *, style="google"):
+    def _fake_check(source, tree, enrichment_config, file_path, *, style="google", **_):
         nonlocal call_count
         call_count += 1
         return [
@@ -1497,7 +1676,7 @@ def test_run_freshness_drift_direct_returns_list_of_findings(mocker):
         ),
     ]
     mocker.patch("docvet.cli.check_freshness_drift", return_value=findings)
-    mocker.patch("docvet.cli._get_git_blame", return_value="blame data")
+    mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={1: 100})
     mocker.patch.object(Path, "read_text", return_value="def do_stuff(): pass\n")
     result, count = _run_freshness(
         [Path("src/app.py")], DocvetConfig(), freshness_mode=FreshnessMode.DRIFT
@@ -1533,7 +1712,7 @@ def test_run_freshness_drift_direct_mixed_files_skips_syntax_errors(mocker):
         return "def func(): pass\n"
 
     mocker.patch.object(Path, "read_text", _fake_read)
-    mocker.patch("docvet.cli._get_git_blame", return_value="blame data")
+    mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={1: 100})
     mocker.patch("docvet.cli.check_freshness_drift", return_value=good_findings)
     result, _count = _run_freshness(
         [Path("good.py"), Path("bad.py")],
@@ -2247,7 +2426,9 @@ def test_griffe_subcommand_quiet_passes_quiet_to_run_griffe(mocker):
     mocker.patch("docvet.cli.importlib.util.find_spec", return_value=MagicMock())
     mock_run = mocker.patch("docvet.cli._run_griffe", return_value=([], 0))
     runner.invoke(app, ["griffe", "--all", "-q"])
-    mock_run.assert_called_once_with(ANY, ANY, verbose=False, quiet=True)
+    mock_run.assert_called_once_with(
+        ANY, ANY, verbose=False, quiet=True, targeted=False, jobs=1, tree=None
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -2465,6 +2646,37 @@ def test_check_with_format_json_empty_findings_returns_empty_array():
     assert parsed["summary"]["total"] == 0
 
 
+def test_check_with_format_jsonl_writes_one_record_per_line(mocker, make_finding):
+    """--format jsonl writes a record per finding and a closing summary."""
+    findings = [
+        make_finding(file="b.py", line=3),
+        make_finding(file="a.py", line=1, category="recommended"),
+    ]
+    mocker.patch("docvet.cli._run_enrichment", return_value=(findings, 4))
+    result = runner.invoke(app, ["--format", "jsonl", "check"])
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [(r["type"], r.get("file")) for r in records] == [
+        ("finding", "a.py"),
+        ("finding", "b.py"),
+        ("summary", None),
+    ]
+    assert records[-1]["by_category"] == {
+        "required": 1,
+        "recommended": 1,
+        "scaffold": 0,
+    }
+
+
+def test_check_with_format_jsonl_writes_to_output_file(tmp_path):
+    """--format jsonl with --output writes records even with no findings."""
+    output = tmp_path / "report.jsonl"
+    result = runner.invoke(app, ["--format", "jsonl", "--output", str(output), "check"])
+    assert result.exit_code == 0
+    lines = output.read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["type"] == "summary"
+
+
 def test_check_with_format_json_exit_code_1_when_findings(mocker):
     """AC#3: --format json returns exit code 1 when findings exist."""
     from docvet.checks import Finding
@@ -2488,6 +2700,394 @@ def test_check_with_format_text_output_unchanged():
     assert '{"findings"' not in result.output
 
 
+# ---------------------------------------------------------------------------
+# Shared parsed-file store
+# ---------------------------------------------------------------------------
+
+
+class TestParsedFileStore:
+    """Tests for the per-run ``_ParsedFileStore`` shared by runners."""
+
+    def test_get_parses_each_file_once(self, mocker):
+        mocker.patch.object(Path, "read_text", return_value="x = 1\n")
+        spy = mocker.patch("docvet.cli.ast.parse", wraps=__import__("ast").parse)
+        store = _ParsedFileStore()
+        first = store.get(Path("/a.py"))
+        second = store.get(Path("/a.py"))
+        assert first is second
+        assert spy.call_count == 1
+
+    def test_get_warns_once_for_syntax_error(self, mocker, capsys):
+        mocker.patch.object(Path, "read_text", return_value="def bad(:\n")
+        store = _ParsedFileStore()
+        assert store.get(Path("/bad.py")) is None
+        assert store.get(Path("/bad.py")) is None
+        err = capsys.readouterr().err
+        assert err.count("failed to parse, skipping") == 1
+
+    def test_resident_entries_are_reused_across_stores(self, tmp_path, mocker):
+        path = tmp_path / "mod.py"
+        path.write_text("x = 1\n")
+        spy = mocker.patch("docvet.cli.ast.parse", wraps=__import__("ast").parse)
+        resident: dict = {}
+
+        first = _ParsedFileStore(resident).get(path)
+        second = _ParsedFileStore(resident).get(path)
+
+        assert first is second
+        assert spy.call_count == 1
+
+    def test_resident_entry_reparsed_when_file_changes(self, tmp_path, mocker):
+        path = tmp_path / "mod.py"
+        path.write_text("x = 1\n")
+        spy = mocker.patch("docvet.cli.ast.parse", wraps=__import__("ast").parse)
+        resident: dict = {}
+        _ParsedFileStore(resident).get(path)
+
+        path.write_text("x = 1\ny = 2\n")
+        store = _ParsedFileStore(resident)
+
+        assert store.source(path) == "x = 1\ny = 2\n"
+        assert store.get(path) is not None
+        assert spy.call_count == 2
+
+    def test_resident_entries_evicted_least_recently_used(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("docvet.cli._runners._RESIDENT_FILES_MAX", 2)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.py"
+            path.write_text("x = 1\n")
+            paths.append(path)
+        a, b, c = paths
+        resident: dict = {}
+
+        store = _ParsedFileStore(resident)
+        store.get(a)
+        store.get(b)
+        _ParsedFileStore(resident).get(a)
+        _ParsedFileStore(resident).get(c)
+
+        assert list(resident) == [a, c]
+
+    def test_resident_entry_dropped_when_file_deleted(self, tmp_path):
+        path = tmp_path / "mod.py"
+        path.write_text("x = 1\n")
+        resident: dict = {}
+        _ParsedFileStore(resident).get(path)
+
+        path.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            _ParsedFileStore(resident).source(path)
+        assert resident == {}
+
+    def test_resident_syntax_error_warns_every_run(self, tmp_path, capsys):
+        path = tmp_path / "bad.py"
+        path.write_text("def bad(:\n")
+        resident: dict = {}
+
+        assert _ParsedFileStore(resident).get(path) is None
+        assert _ParsedFileStore(resident).get(path) is None
+
+        assert capsys.readouterr().err.count("failed to parse, skipping") == 2
+
+    def test_check_parses_each_file_once_across_runners(self, mocker):
+        mocker.patch("docvet.cli._run_presence", side_effect=_run_presence)
+        mocker.patch("docvet.cli._run_enrichment", side_effect=_run_enrichment)
+        mocker.patch("docvet.cli._run_freshness", side_effect=_run_freshness)
+        mocker.patch.object(Path, "read_text", return_value='"""Doc."""\n')
+        mocker.patch("docvet.cli.subprocess.run")
+        spy = mocker.patch("docvet.cli.ast.parse", wraps=__import__("ast").parse)
+        mock_symbols = mocker.patch(
+            "docvet.ast_utils.get_documented_symbols",
+            wraps=get_documented_symbols,
+        )
+        result = runner.invoke(app, ["check", "--no-cache"])
+        assert result.exit_code == 0
+        assert spy.call_count == 1
+        assert mock_symbols.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Parallel per-file checks (--jobs)
+# ---------------------------------------------------------------------------
+
+
+class TestParallelCheck:
+    """Tests for ``check --jobs`` and the ``_run_parallel`` runner."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [(None, 3), ("auto", "auto"), ("2", 2)]
+    )
+    def test_parse_jobs_option(self, value, expected):
+        assert _parse_jobs_option(value, 3) == expected
+
+    @pytest.mark.parametrize("value", ["0", "-1", "many"])
+    def test_parse_jobs_option_rejects_invalid(self, value):
+        with pytest.raises(typer.BadParameter):
+            _parse_jobs_option(value, 1)
+
+    def test_check_with_jobs_uses_pool_instead_of_runners(self, mocker):
+        files = [Path("/a.py"), Path("/b.py")]
+        mocker.patch("docvet.cli.discover_files", return_value=files)
+        mock_parallel = mocker.patch(
+            "docvet.cli._run_parallel", return_value=_FileResults(symbol_count=4)
+        )
+        mock_enrichment = mocker.patch(
+            "docvet.cli._run_enrichment", return_value=([], 0)
+        )
+        result = runner.invoke(app, ["check", "--jobs", "2"])
+        assert result.exit_code == 0
+        mock_parallel.assert_called_once_with(
+            files,
+            ANY,
+            jobs=2,
+            presence=True,
+            discovery_mode=DiscoveryMode.DIFF,
+            show_progress=False,
+            cache=ANY,
+        )
+        mock_enrichment.assert_not_called()
+
+    def test_check_jobs_capped_at_file_count_runs_serially(self, mocker):
+        mock_parallel = mocker.patch("docvet.cli._run_parallel")
+        mock_enrichment = mocker.patch(
+            "docvet.cli._run_enrichment", return_value=([], 0)
+        )
+        result = runner.invoke(app, ["check", "--jobs", "8"])
+        assert result.exit_code == 0
+        mock_parallel.assert_not_called()
+        mock_enrichment.assert_called_once()
+
+    def test_check_file_returns_suppressions_only_for_files_with_findings(
+        self, tmp_path
+    ):
+        flagged = tmp_path / "flagged.py"
+        flagged.write_text("def f():  # docvet: ignore[missing-raises]\n    pass\n")
+        clean = tmp_path / "clean.py"
+        clean.write_text("x = 1\n")
+        config = DocvetConfig(project_root=tmp_path)
+
+        flagged_result = _check_file(flagged, "", config=config, presence=True)
+        clean_result = _check_file(clean, "", config=config, presence=False)
+
+        assert flagged_result.suppressions[str(flagged)].line_directives == {
+            1: {"missing-raises"}
+        }
+        assert clean_result.suppressions == {}
+
+    def test_store_suppressions_parse_loaded_sources(self, tmp_path, mocker):
+        path = tmp_path / "a.py"
+        path.write_text("x = 1  # docvet: ignore-file\n")
+        store = _ParsedFileStore()
+        store.source(path)
+        read = mocker.patch.object(Path, "read_text")
+        findings_by_check = {
+            "presence": [
+                _presence_finding(str(path)),
+                _presence_finding("/elsewhere/__init__.py"),
+            ]
+        }
+
+        maps = store.suppressions(findings_by_check)
+
+        assert list(maps) == [str(path)]
+        assert maps[str(path)].file_blanket is True
+        read.assert_not_called()
+
+    def test_check_file_reports_parse_failure(self, mocker):
+        mocker.patch.object(Path, "read_text", return_value="def bad(:\n")
+        result = _check_file(Path("/bad.py"), "", config=DocvetConfig(), presence=True)
+        assert result.parsed is False
+
+    def test_run_parallel_matches_serial_runners(self, tmp_path, capsys):
+        sources = {
+            "a.py": 'def f():\n    """Do f."""\n    raise ValueError\n',
+            "b.py": "def g():\n    return 1\n",
+            "c.py": "def bad(:\n",
+            "d.py": '"""Mod."""\n\nclass K:\n    """K."""\n\n    x = 1\n',
+        }
+        files = []
+        for name, source in sources.items():
+            path = tmp_path / name
+            path.write_text(source)
+            files.append(path)
+        config = DocvetConfig(project_root=tmp_path)
+
+        store = _ParsedFileStore()
+        presence, stats = _run_presence(files, config, store=store)
+        enrichment, count = _run_enrichment(files, config, store=store)
+        serial_err = capsys.readouterr().err
+
+        results = _run_parallel(
+            files,
+            config,
+            jobs=2,
+            presence=True,
+            discovery_mode=DiscoveryMode.ALL,
+        )
+        parallel_err = capsys.readouterr().err
+
+        assert results.presence == presence
+        assert results.presence_stats == stats
+        assert results.enrichment == enrichment
+        assert results.symbol_count == count
+        assert results.freshness == []
+        assert parallel_err == serial_err
+
+
+class TestStreamingCheck:
+    """Tests for ``check --stream`` and the ``_run_streaming`` runner."""
+
+    def test_check_with_stream_uses_streaming_runner(self, mocker):
+        mock_streaming = mocker.patch(
+            "docvet.cli._run_streaming", return_value=_FileResults(symbol_count=2)
+        )
+        mock_enrichment = mocker.patch(
+            "docvet.cli._run_enrichment", return_value=([], 0)
+        )
+        result = runner.invoke(app, ["check", "--stream"])
+        assert result.exit_code == 0
+        mock_streaming.assert_called_once_with(
+            [Path("/fake/file.py")],
+            ANY,
+            ANY,
+            jobs=1,
+            presence=True,
+            discovery_mode=DiscoveryMode.DIFF,
+            cache=ANY,
+        )
+        mock_enrichment.assert_not_called()
+
+    def test_check_stream_rejects_json_format(self):
+        result = runner.invoke(app, ["--format", "json", "check", "--stream"])
+        assert result.exit_code == 2
+        assert "--stream does not support json output" in _strip_ansi(result.output)
+
+    def test_check_stream_exit_code_from_streamed_findings(self, mocker, make_finding):
+        finding = make_finding(file="/fake/file.py", rule="missing-raises")
+        mocker.patch(
+            "docvet.cli.load_config", return_value=DocvetConfig(fail_on=["coverage"])
+        )
+        mocker.patch("docvet.cli._run_coverage", return_value=([finding], 1))
+        mocker.patch.object(Path, "read_text", return_value="x = 1\n")
+        mocker.patch(
+            "docvet.cli._run_streaming", return_value=_FileResults(symbol_count=1)
+        )
+        result = runner.invoke(app, ["check", "--stream"], catch_exceptions=False)
+        assert result.exit_code == 1
+        assert "/fake/file.py:1: missing-raises" in result.output
+        assert "1 findings (1 required, 0 recommended)" in result.output
+
+    def test_finding_stream_writes_groups_and_filters_suppressed(
+        self, tmp_path, make_finding
+    ):
+        a = tmp_path / "a.py"
+        a.write_text("def f():  # docvet: ignore[missing-raises]\n    pass\n")
+        b = tmp_path / "b.py"
+        b.write_text("def g():\n    pass\n")
+        out = io.StringIO()
+        stream = _FindingStream("terminal", out, no_color=True)
+
+        stream.emit(
+            {
+                "enrichment": [
+                    make_finding(file=str(b), line=1, rule="missing-returns"),
+                    make_finding(file=str(a), line=1, rule="missing-raises"),
+                    make_finding(file=str(a), line=2, rule="missing-yields"),
+                ]
+            }
+        )
+        stream.close(file_count=2)
+
+        assert out.getvalue() == (
+            f"{a}:2: missing-yields test message [required]\n"
+            "\n"
+            f"{b}:1: missing-returns test message [required]\n"
+            "\n"
+            "2 findings (2 required, 0 recommended)\n"
+        )
+        assert [f.rule for f in stream.suppressed] == ["missing-raises"]
+        assert stream.tally.by_check == {"enrichment": 2}
+
+    def test_finding_stream_jsonl_writes_records_and_summary(
+        self, tmp_path, make_finding
+    ):
+        source = tmp_path / "a.py"
+        source.write_text("def f():  # docvet: ignore[missing-raises]\n    pass\n")
+        out = io.StringIO()
+        stream = _FindingStream("jsonl", out, no_color=True)
+
+        stream.emit(
+            {
+                "enrichment": [
+                    make_finding(file=str(source), line=2, rule="missing-yields"),
+                    make_finding(file=str(source), line=1, rule="missing-raises"),
+                ]
+            }
+        )
+        stream.close(file_count=1)
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [(r["type"], r.get("rule")) for r in records] == [
+            ("finding", "missing-yields"),
+            ("suppressed", "missing-raises"),
+            ("summary", None),
+        ]
+        assert records[-1]["total"] == 1
+        assert records[-1]["suppressed"] == 1
+        assert records[-1]["files_checked"] == 1
+
+    def test_check_stream_jsonl_ends_with_summary_record(self, mocker):
+        mocker.patch(
+            "docvet.cli._run_streaming", return_value=_FileResults(symbol_count=1)
+        )
+        result = runner.invoke(
+            app, ["--format", "jsonl", "--summary", "check", "--stream"]
+        )
+        assert result.exit_code == 0
+        summary = json.loads(result.stdout.splitlines()[-1])
+        assert summary["type"] == "summary"
+        assert summary["total"] == 0
+        assert "enrichment" in summary["quality"]
+
+    def test_run_streaming_matches_parallel_results(self, tmp_path, capsys):
+        sources = {
+            "a.py": 'def f():\n    """Do f."""\n    raise ValueError\n',
+            "b.py": "def g():\n    return 1\n",
+            "c.py": "def bad(:\n",
+        }
+        files = []
+        for name, source in sources.items():
+            path = tmp_path / name
+            path.write_text(source)
+            files.append(path)
+        config = DocvetConfig(project_root=tmp_path)
+        merged = _run_parallel(
+            files, config, jobs=2, presence=True, discovery_mode=DiscoveryMode.ALL
+        )
+        parallel_err = capsys.readouterr().err
+        out = io.StringIO()
+        stream = _FindingStream("terminal", out, no_color=True)
+
+        results = _run_streaming(
+            files,
+            config,
+            stream,
+            jobs=1,
+            presence=True,
+            discovery_mode=DiscoveryMode.ALL,
+        )
+
+        assert results.presence == results.enrichment == []
+        assert results.presence_stats == merged.presence_stats
+        assert results.symbol_count == merged.symbol_count
+        assert stream.tally.by_check["presence"] == len(merged.presence)
+        assert stream.tally.by_check["enrichment"] == len(merged.enrichment)
+        assert capsys.readouterr().err == parallel_err
+        assert out.getvalue().index("a.py:") < out.getvalue().index("b.py:")
+
+
 # ---------------------------------------------------------------------------
 # Presence subcommand and integration tests (Story 28.2)
 # ---------------------------------------------------------------------------
@@ -2638,6 +3238,8 @@ class TestPresenceInCheck:
             [Path("/fake/file.py")],
             DocvetConfig(),
             show_progress=False,
+            store=ANY,
+            cache=ANY,
         )
 
     def test_presence_disabled_skips_the_check(self, mocker):
@@ -0,0 +1,357 @@
+"""Unit tests for the on-disk per-file result cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from typer.testing import CliRunner
+
+from docvet.checks import Finding
+from docvet.checks.presence import PresenceStats
+from docvet.cli import (
+    FreshnessMode,
+    _get_git_blame_keys,
+    _run_enrichment,
+    _run_freshness,
+    _run_presence,
+    app,
+)
+from docvet.cli._cache import _ResultCache
+from docvet.config import DocvetConfig, EnrichmentConfig
+
+pytestmark = pytest.mark.unit
+
+runner = CliRunner()
+
+_SOURCE = '''\
+"""Module."""
+
+
+def add(a, b):
+    """Add numbers."""
+    return a + b
+'''
+
+_FINDING = Finding(
+    file="pkg/mod.py",
+    line=4,
+    symbol="add",
+    rule="missing-returns",
+    message="Function 'add' returns a value but has no Returns: section",
+    category="required",
+)
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def config(tmp_path):
+    return DocvetConfig(project_root=tmp_path)
+
+
+@pytest.fixture
+def cache(tmp_path, config):
+    return _ResultCache(tmp_path / ".docvet_cache", config)
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text(_SOURCE, encoding="utf-8")
+    return path
+
+
+# ---------------------------------------------------------------------------
+# _ResultCache
+# ---------------------------------------------------------------------------
+
+
+class TestResultCache:
+    def test_round_trips_presence_results(self, cache):
+        stats = PresenceStats(documented=2, total=3)
+        cache.put_presence(Path("mod.py"), _SOURCE, [_FINDING], stats)
+        assert cache.get_presence(Path("mod.py"), _SOURCE) == ([_FINDING], stats)
+
+    def test_round_trips_enrichment_results(self, cache):
+        cache.put_enrichment(Path("mod.py"), _SOURCE, [_FINDING], 2)
+        assert cache.get_enrichment(Path("mod.py"), _SOURCE) == ([_FINDING], 2)
+
+    def test_round_trips_symbol_count(self, cache):
+        cache.put_symbol_count(Path("mod.py"), _SOURCE, 5)
+        assert cache.get_symbol_count(Path("mod.py"), _SOURCE) == 5
+
+    def test_round_trips_blame_timestamps(self, cache):
+        cache.put_blame(Path("mod.py"), "abc123", {1: 100, 12: 200})
+        assert cache.get_blame(Path("mod.py"), "abc123") == {1: 100, 12: 200}
+
+    def test_blame_keyed_by_history(self, cache):
+        cache.put_blame(Path("mod.py"), "abc123:c1", {1: 100})
+        assert cache.get_blame(Path("mod.py"), "abc123:c2") is None
+
+    def test_counts_hits_and_misses(self, cache):
+        assert cache.get_enrichment(Path("mod.py"), _SOURCE) is None
+        cache.put_enrichment(Path("mod.py"), _SOURCE, [], 0)
+        cache.get_enrichment(Path("mod.py"), _SOURCE)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_hit_when_recency_stamp_cannot_be_refreshed(self, cache, mocker):
+        cache.put_enrichment(Path("mod.py"), _SOURCE, [_FINDING], 2)
+        mocker.patch("docvet.cli._cache.os.utime", side_effect=PermissionError)
+
+        assert cache.get_enrichment(Path("mod.py"), _SOURCE) == ([_FINDING], 2)
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_changed_content_misses(self, cache):
+        cache.put_enrichment(Path("mod.py"), _SOURCE, [], 2)
+        assert cache.get_enrichment(Path("mod.py"), _SOURCE + "\n") is None
+
+    def test_changed_config_misses(self, tmp_path, cache):
+        cache.put_enrichment(Path("mod.py"), _SOURCE, [], 2)
+        other = _ResultCache(
+            cache.root,
+            DocvetConfig(
+                project_root=tmp_path,
+                enrichment=EnrichmentConfig(require_returns=False),
+            ),
+        )
+        assert other.get_enrichment(Path("mod.py"), _SOURCE) is None
+
+    def test_changed_style_misses(self, tmp_path, cache):
+        cache.put_presence(Path("mod.py"), _SOURCE, [], PresenceStats(1, 1))
+        other = _ResultCache(
+            cache.root, DocvetConfig(project_root=tmp_path, docstring_style="sphinx")
+        )
+        assert other.get_presence(Path("mod.py"), _SOURCE) is None
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        cache.put_enrichment(Path("mod.py"), _SOURCE, [], 2)
+        (entry,) = (cache.root / "results").glob("*.json")
+        entry.write_text("{not json", encoding="utf-8")
+        assert cache.get_enrichment(Path("mod.py"), _SOURCE) is None
+
+    def test_first_write_creates_gitignore(self, cache):
+        cache.put_symbol_count(Path("mod.py"), _SOURCE, 1)
+        assert (cache.root / ".gitignore").read_text(encoding="utf-8") == "*\n"
+
+    def test_prune_evicts_least_recently_used(self, cache):
+        for index in range(3):
+            cache.put_symbol_count(Path(f"m{index}.py"), _SOURCE, index)
+        entries = sorted((cache.root / "results").glob("*.json"))
+        size = entries[0].stat().st_size
+        for age, path in enumerate(entries):
+            os.utime(path, (age, age))
+        cache.get_symbol_count(Path("m0.py"), _SOURCE)
+        cache.max_size = 2 * size
+
+        cache.prune()
+
+        assert cache.get_symbol_count(Path("m0.py"), _SOURCE) == 0
+        assert len(list((cache.root / "results").glob("*.json"))) == 2
+
+    def test_prune_without_cache_dir_is_noop(self, cache):
+        cache.prune()
+        assert not cache.root.exists()
+
+
+# ---------------------------------------------------------------------------
+# Runners
+# ---------------------------------------------------------------------------
+
+
+class TestRunnersWithCache:
+    def test_warm_enrichment_run_skips_analysis(
+        self, mocker, config, cache, source_file
+    ):
+        cold = _run_enrichment([source_file], config, cache=cache)
+        spy = mocker.patch("docvet.cli.check_enrichment")
+        parse = mocker.patch("docvet.cli.ast.parse")
+
+        warm = _run_enrichment([source_file], config, cache=cache)
+
+        assert warm == cold
+        spy.assert_not_called()
+        parse.assert_not_called()
+
+    def test_warm_presence_run_reuses_stats(self, mocker, config, cache, source_file):
+        cold = _run_presence([source_file], config, cache=cache)
+        spy = mocker.patch("docvet.cli.check_presence")
+
+        warm = _run_presence([source_file], config, cache=cache)
+
+        assert warm == cold
+        spy.assert_not_called()
+
+    def test_freshness_with_empty_diff_uses_cached_symbol_count(
+        self, mocker, config, cache, source_file
+    ):
+        mocker.patch("docvet.cli._get_git_diffs", return_value={})
+        cold = _run_freshness([source_file], config, cache=cache)
+        parse = mocker.patch("docvet.cli.ast.parse")
+
+        warm = _run_freshness([source_file], config, cache=cache)
+
+        assert warm == cold == ([], 2)
+        parse.assert_not_called()
+
+    def test_syntax_error_is_not_cached(self, tmp_path, config, cache, capsys):
+        bad = tmp_path / "bad.py"
+        bad.write_text("def (\n", encoding="utf-8")
+        _run_enrichment([bad], config, cache=cache)
+        _run_enrichment([bad], config, cache=cache)
+        assert capsys.readouterr().err.count("failed to parse") == 2
+        assert cache.hits == 0
+
+
+# ---------------------------------------------------------------------------
+# Drift-mode blame cache
+# ---------------------------------------------------------------------------
+
+
+def _git_result(stdout, returncode=0):
+    return Mock(stdout=stdout, returncode=returncode)
+
+
+class TestGetGitBlameKeys:
+    def test_keys_clean_files_by_blob_and_last_commit(self, mocker, tmp_path):
+        run = mocker.patch(
+            "docvet.cli.subprocess.run",
+            side_effect=[
+                _git_result(
+                    "100644 aaa 0\tmod.py\n"
+                    "100644 bbb 0\tdirty.py\n"
+                    "100644 ccc 1\tconflict.py\n"
+                    "100644 ddd 2\tconflict.py\n",
+                ),
+                _git_result("dirty.py\n"),
+            ],
+        )
+        popen = mocker.patch("docvet.cli.subprocess.Popen")
+        log = popen.return_value.__enter__.return_value
+        log.stdout = iter(["\0c2\n", "\n", "mod.py\n", "\0c1\n", "mod.py\n"])
+
+        assert _get_git_blame_keys(tmp_path) == {
+            (tmp_path / "mod.py").resolve(): "aaa:c2"
+        }
+        assert run.call_args_list[0].args[0][3:5] == ["ls-files", "-s"]
+        log.kill.assert_called_once()
+
+    def test_git_failure_returns_empty_dict(self, mocker, tmp_path):
+        mocker.patch(
+            "docvet.cli.subprocess.run",
+            side_effect=[_git_result("", 128), _git_result("")],
+        )
+        assert _get_git_blame_keys(tmp_path) == {}
+
+
+class TestDriftBlameCache:
+    @pytest.fixture
+    def other_file(self, tmp_path):
+        path = tmp_path / "other.py"
+        path.write_text(_SOURCE, encoding="utf-8")
+        return path
+
+    def test_warm_run_only_blames_changed_blobs(
+        self, mocker, config, cache, source_file, other_file
+    ):
+        blobs = mocker.patch(
+            "docvet.cli._get_git_blame_keys",
+            return_value={source_file: "aaa", other_file: "bbb"},
+        )
+        blame = mocker.patch(
+            "docvet.cli._get_git_blame_timestamps", return_value={4: 100}
+        )
+        cold = _run_freshness(
+            [source_file, other_file],
+            config,
+            freshness_mode=FreshnessMode.DRIFT,
+            cache=cache,
+        )
+        assert blame.call_count == 2
+
+        blobs.return_value = {source_file: "aaa", other_file: "ccc"}
+        blame.reset_mock()
+        warm = _run_freshness(
+            [source_file, other_file],
+            config,
+            freshness_mode=FreshnessMode.DRIFT,
+            cache=cache,
+        )
+
+        assert warm == cold
+        blame.assert_called_once_with(other_file, config.project_root)
+
+    def test_uncommitted_file_is_always_blamed(
+        self, mocker, config, cache, source_file
+    ):
+        mocker.patch("docvet.cli._get_git_blame_keys", return_value={})
+        blame = mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={})
+        for _ in range(2):
+            _run_freshness(
+                [source_file], config, freshness_mode=FreshnessMode.DRIFT, cache=cache
+            )
+        assert blame.call_count == 2
+        assert not cache.root.exists()
+
+    def test_cached_files_report_no_blame_latency(
+        self, mocker, config, cache, source_file
+    ):
+        mocker.patch(
+            "docvet.cli._get_git_blame_keys", return_value={source_file: "aaa"}
+        )
+        mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={})
+        _run_freshness(
+            [source_file], config, freshness_mode=FreshnessMode.DRIFT, cache=cache
+        )
+        latencies: dict[Path, tuple[float, float]] = {}
+        _run_freshness(
+            [source_file],
+            config,
+            freshness_mode=FreshnessMode.DRIFT,
+            cache=cache,
+            blame_latencies=latencies,
+        )
+        assert latencies == {}
+
+
+# ---------------------------------------------------------------------------
+# check command
+# ---------------------------------------------------------------------------
+
+
+class TestCheckCache:
+    @pytest.fixture(autouse=True)
+    def _project(self, mocker, config, source_file):
+        mocker.patch("docvet.cli.load_config", return_value=config)
+        mocker.patch("docvet.cli.discover_files", return_value=[source_file])
+        mocker.patch("docvet.cli._get_git_diffs", return_value={})
+        mocker.patch("docvet.cli._run_coverage", return_value=([], 0))
+        mocker.patch("docvet.cli._run_griffe", return_value=([], 0))
+
+    def test_verbose_reports_hits_and_misses(self):
+        cold = runner.invoke(app, ["check", "--verbose"])
+        warm = runner.invoke(app, ["check", "--verbose"])
+        assert "cache: 0 hits, 3 misses" in cold.output
+        assert "cache: 3 hits, 0 misses" in warm.output
+
+    def test_no_cache_leaves_project_untouched(self, tmp_path):
+        result = runner.invoke(app, ["check", "--verbose", "--no-cache"])
+        assert result.exit_code == 0
+        assert "cache:" not in result.output
+        assert not (tmp_path / ".docvet_cache").exists()
+
+    def test_freshness_drift_verbose_reports_hits_and_misses(self, mocker):
+        mocker.patch("docvet.cli._get_git_blame_keys", return_value={})
+        mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={})
+        result = runner.invoke(app, ["freshness", "--mode", "drift", "--verbose"])
+        assert "cache: 0 hits, 0 misses" in result.output
+
+    def test_warm_run_output_matches_cold_run(self):
+        cold = runner.invoke(app, ["check"])
+        warm = runner.invoke(app, ["check"])
+        assert warm.stdout == cold.stdout
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import sys
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -142,7 +142,7 @@ class TestRunFreshnessProgressBar:
         self, mocker, mock_progressbar, simple_py_file, config
     ):
         mocker.patch("docvet.cli.check_freshness_diff", return_value=[])
-        mocker.patch("docvet.cli._get_git_diff", return_value="")
+        mocker.patch("docvet.cli._get_git_diffs", return_value={})
 
         _run_freshness(
             [simple_py_file],
@@ -163,7 +163,7 @@ class TestRunFreshnessProgressBar:
         self, mocker, mock_progressbar, simple_py_file, config
     ):
         mocker.patch("docvet.cli.check_freshness_diff", return_value=[])
-        mocker.patch("docvet.cli._get_git_diff", return_value="")
+        mocker.patch("docvet.cli._get_git_diffs", return_value={})
 
         _run_freshness(
             [simple_py_file],
@@ -184,7 +184,7 @@ class TestRunFreshnessProgressBar:
         self, mocker, mock_progressbar, simple_py_file, config
     ):
         mocker.patch("docvet.cli.check_freshness_drift", return_value=[])
-        mocker.patch("docvet.cli._get_git_blame", return_value="")
+        mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={})
 
         _run_freshness(
             [simple_py_file],
@@ -195,7 +195,8 @@ class TestRunFreshnessProgressBar:
         )
 
         mock_progressbar.assert_called_once_with(
-            [simple_py_file],
+            ANY,
+            length=1,
             label="freshness",
             file=sys.stderr,
             hidden=False,
@@ -205,7 +206,7 @@ class TestRunFreshnessProgressBar:
         self, mocker, mock_progressbar, simple_py_file, config
     ):
         mocker.patch("docvet.cli.check_freshness_drift", return_value=[])
-        mocker.patch("docvet.cli._get_git_blame", return_value="")
+        mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={})
 
         _run_freshness(
             [simple_py_file],
@@ -216,7 +217,8 @@ class TestRunFreshnessProgressBar:
         )
 
         mock_progressbar.assert_called_once_with(
-            [simple_py_file],
+            ANY,
+            length=1,
             label="freshness",
             file=sys.stderr,
             hidden=True,
@@ -226,7 +228,7 @@ class TestRunFreshnessProgressBar:
         self, mocker, mock_progressbar, simple_py_file, config
     ):
         mocker.patch("docvet.cli.check_freshness_diff", return_value=[])
-        mocker.patch("docvet.cli._get_git_diff", return_value="")
+        mocker.patch("docvet.cli._get_git_diffs", return_value={})
 
         _run_freshness(
             [simple_py_file],
@@ -250,7 +252,10 @@ class TestRunFreshnessProgressBar:
             category="required",
         )
         mocker.patch("docvet.cli.check_freshness_diff", return_value=[finding])
-        mocker.patch("docvet.cli._get_git_diff", return_value="fake diff")
+        mocker.patch(
+            "docvet.cli._get_git_diffs",
+            return_value={simple_py_file: "fake diff"},
+        )
 
         findings_with, _ = _run_freshness(
             [simple_py_file],
@@ -282,7 +287,7 @@ class TestRunFreshnessProgressBar:
             category="recommended",
         )
         mocker.patch("docvet.cli.check_freshness_drift", return_value=[finding])
-        mocker.patch("docvet.cli._get_git_blame", return_value="fake blame")
+        mocker.patch("docvet.cli._get_git_blame_timestamps", return_value={3: 0})
 
         findings_with, _ = _run_freshness(
             [simple_py_file],
@@ -622,6 +622,48 @@ class TestApplySuppressions:
         assert len(suppressed) == 0
 
 
+class TestDirectivePrefilter:
+    """Tests for skipping tokenization of sources without directives."""
+
+    def test_source_without_marker_is_not_tokenized(self, mocker) -> None:
+        """A source with no ``docvet:`` marker never reaches tokenize."""
+        from docvet.cli import _suppression
+
+        spy = mocker.spy(_suppression.tokenize, "generate_tokens")
+        result = _suppression.parse_suppression_directives(
+            "def foo():  # noqa: D103\n    pass\n", "test.py"
+        )
+
+        assert result == _suppression.SuppressionMap()
+        spy.assert_not_called()
+
+    def test_marker_with_spacing_still_parsed(self) -> None:
+        """The prefilter allows the whitespace the directive regex accepts."""
+        from docvet.cli._suppression import parse_suppression_directives
+
+        source = "def foo():  # docvet : ignore[missing-raises]\n    pass\n"
+        result = parse_suppression_directives(source, "test.py")
+
+        assert result.line_directives == {1: {"missing-raises"}}
+
+    def test_apply_suppressions_uses_known_maps_without_reading(self, mocker) -> None:
+        """Maps collected during analysis are used instead of re-reading."""
+        import pathlib
+
+        from docvet.cli._output import _apply_suppressions
+        from docvet.cli._suppression import SuppressionMap
+
+        read = mocker.patch.object(pathlib.Path, "read_text")
+        known = {"a.py": SuppressionMap(line_directives={1: {"missing-raises"}})}
+        findings_by_check = {"enrichment": [_finding(file="a.py", line=1)]}
+
+        active, suppressed = _apply_suppressions(findings_by_check, known)
+
+        assert active == {"enrichment": []}
+        assert len(suppressed) == 1
+        read.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # JSON suppressed array (Task 5.7 partial)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,300 @@
+"""Unit tests for ``docvet check --watch`` and its incremental session."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from docvet.checks import Finding
+from docvet.cli import _runners, app
+from docvet.cli._watch import (
+    _InotifyTrigger,
+    _PollTrigger,
+    _watch_dirs,
+    _WatchSession,
+)
+from docvet.config import DocvetConfig
+from docvet.discovery import DiscoveryMode
+
+pytestmark = pytest.mark.unit
+
+runner = CliRunner()
+
+_UNDOCUMENTED = "def f():\n    pass\n"
+
+_DOCUMENTED = '''\
+"""Module."""
+
+
+def f():
+    """Do nothing useful at all."""
+'''
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def config(tmp_path):
+    return DocvetConfig(project_root=tmp_path)
+
+
+@pytest.fixture
+def files(tmp_path, mocker):
+    mocker.patch("docvet.cli._get_git_diffs", return_value={})
+    paths = [tmp_path / "a.py", tmp_path / "b.py"]
+    for path in paths:
+        path.write_text(_UNDOCUMENTED, encoding="utf-8")
+    return paths
+
+
+def _touch(path, text):
+    """Rewrite *path* and move its mtime forward so the stamp changes."""
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _rules(session):
+    return sorted(
+        (os.path.basename(f.file), f.rule)
+        for findings in session.findings_by_check().values()
+        for f in findings
+    )
+
+
+# ---------------------------------------------------------------------------
+# _WatchSession
+# ---------------------------------------------------------------------------
+
+
+class TestWatchSession:
+    def test_first_update_checks_every_file(self, config, files, mocker):
+        mocker.patch("docvet.cli.discover_files", return_value=files)
+        session = _WatchSession(config, DiscoveryMode.ALL, presence=True)
+
+        assert session.update(None) == 2
+        assert list(session.files) == files
+        assert session.presence_stats.total == 4
+        assert session.presence_stats.documented == 0
+        assert ("a.py", "missing-docstring") in _rules(session)
+
+    def test_unchanged_files_are_not_rechecked(self, config, files, mocker):
+        mocker.patch("docvet.cli.discover_files", return_value=files)
+        session = _WatchSession(config, DiscoveryMode.ALL, presence=True)
+        session.update(None)
+        spy = mocker.spy(_runners, "_check_file")
+
+        assert session.update(None) == 0
+        spy.assert_not_called()
+
+    def test_edit_rechecks_only_that_file(self, config, files, mocker):
+        mocker.patch("docvet.cli.discover_files", return_value=files)
+        session = _WatchSession(config, DiscoveryMode.ALL, presence=True)
+        session.update(None)
+        spy = mocker.spy(_runners, "_check_file")
+
+        _touch(files[0], _DOCUMENTED)
+
+        assert session.update({files[0]}) == 1
+        assert [call.args[0] for call in spy.call_args_list] == [files[0]]
+        assert session.presence_stats.documented == 2
+        assert session.presence_stats.total == 4
+        assert ("a.py", "missing-docstring") not in _rules(session)
+        assert ("b.py", "missing-docstring") in _rules(session)
+
+    def test_removed_file_is_dropped_from_totals(self, config, files, mocker):
+        discover = mocker.patch("docvet.cli.discover_files", return_value=files)
+        session = _WatchSession(config, DiscoveryMode.ALL, presence=True)
+        session.update(None)
+
+        files[1].unlink()
+        discover.return_value = files[:1]
+
+        assert session.update(None) == 1
+        assert list(session.files) == files[:1]
+        assert session.presence_stats.total == 2
+        assert all(name == "a.py" for name, _ in _rules(session))
+
+    def test_unknown_touched_path_triggers_discovery(self, config, files, mocker):
+        discover = mocker.patch("docvet.cli.discover_files", return_value=files)
+        session = _WatchSession(config, DiscoveryMode.ALL, presence=True)
+        session.update(None)
+        new = files[0].parent / "c.py"
+        new.write_text(_UNDOCUMENTED, encoding="utf-8")
+        discover.return_value = [*files, new]
+
+        assert session.update({new}) == 1
+        assert discover.call_count == 2
+        assert new in session.files
+
+    def test_known_touched_path_skips_discovery(self, config, files, mocker):
+        discover = mocker.patch("docvet.cli.discover_files", return_value=files)
+        session = _WatchSession(config, DiscoveryMode.ALL, presence=True)
+        session.update(None)
+
+        _touch(files[1], _DOCUMENTED)
+        session.update({files[1]})
+
+        assert discover.call_count == 1
+
+    def test_explicit_files_are_discovered_once(self, config, files, mocker):
+        discover = mocker.patch("docvet.cli.discover_files", return_value=files)
+        session = _WatchSession(
+            config, DiscoveryMode.FILES, explicit=files, presence=True
+        )
+        session.update(None)
+
+        files[0].unlink()
+        assert session.update(None) == 1
+        files[0].write_text(_UNDOCUMENTED, encoding="utf-8")
+        assert session.update(None) == 1
+
+        assert discover.call_count == 1
+        assert list(session.files) == files
+
+    def test_coverage_rerun_only_when_file_set_changes(self, config, files, mocker):
+        discover = mocker.patch("docvet.cli.discover_files", return_value=files)
+        coverage = mocker.patch("docvet.cli._run_coverage", return_value=([], 1))
+        session = _WatchSession(config, DiscoveryMode.ALL, presence=True)
+        session.update(None)
+
+        _touch(files[0], _DOCUMENTED)
+        session.update(None)
+        assert coverage.call_count == 1
+
+        discover.return_value = files[:1]
+        session.update(None)
+        assert coverage.call_count == 2
+
+    def test_griffe_runs_on_changed_files_with_one_tree(self, config, files, mocker):
+        mocker.patch("docvet.cli.discover_files", return_value=files)
+        finding = Finding(
+            file=str(files[0]),
+            line=1,
+            symbol="f",
+            rule="griffe-format-warning",
+            message="bad",
+            category="recommended",
+        )
+        griffe = mocker.patch(
+            "docvet.cli._run_griffe",
+            side_effect=lambda paths, *a, **kw: (
+                ([finding], 1) if paths == [files[0]] else ([], 1)
+            ),
+        )
+        session = _WatchSession(config, DiscoveryMode.ALL, presence=True, griffe=True)
+        session.update(None)
+        _touch(files[1], _DOCUMENTED)
+        session.update(None)
+
+        assert [call.args[0] for call in griffe.call_args_list] == [
+            [files[0]],
+            [files[1]],
+            [files[1]],
+        ]
+        trees = {id(call.kwargs["tree"]) for call in griffe.call_args_list}
+        assert len(trees) == 1
+        assert session.findings_by_check()["griffe"] == [finding]
+
+
+# ---------------------------------------------------------------------------
+# Change triggers
+# ---------------------------------------------------------------------------
+
+
+class TestWatchDirs:
+    def test_all_mode_watches_ancestors_up_to_source_root(self, config, tmp_path):
+        session = _WatchSession(config, DiscoveryMode.ALL, presence=True)
+        session.files = {tmp_path / "pkg" / "sub" / "mod.py": (0, 0)}
+
+        assert _watch_dirs(session, DiscoveryMode.ALL) == {
+            tmp_path,
+            tmp_path / "pkg",
+            tmp_path / "pkg" / "sub",
+        }
+
+    def test_files_mode_watches_parent_directories(self, config, tmp_path):
+        session = _WatchSession(config, DiscoveryMode.FILES, presence=True)
+        session.files = {tmp_path / "pkg" / "mod.py": (0, 0)}
+
+        assert _watch_dirs(session, DiscoveryMode.FILES) == {tmp_path / "pkg"}
+
+
+@pytest.fixture
+def inotify():
+    trigger = _InotifyTrigger.open()
+    if trigger is None:
+        pytest.skip("inotify is not available")
+    yield trigger
+    trigger.close()
+
+
+class TestInotifyTrigger:
+    def test_reports_written_python_files(self, inotify, tmp_path):
+        inotify.watch({tmp_path})
+        (tmp_path / "mod.py").write_text("x = 1\n")
+        (tmp_path / "notes.txt").write_text("ignored\n")
+
+        assert inotify.wait() == {tmp_path / "mod.py"}
+
+    def test_new_directory_requests_rescan(self, inotify, tmp_path):
+        inotify.watch({tmp_path})
+        (tmp_path / "pkg").mkdir()
+
+        assert inotify.wait() is None
+
+
+def test_poll_trigger_requests_rescan(mocker):
+    sleep = mocker.patch("docvet.cli._watch.time.sleep")
+
+    assert _PollTrigger().wait() is None
+    sleep.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# check --watch
+# ---------------------------------------------------------------------------
+
+
+class TestCheckWatch:
+    @pytest.fixture(autouse=True)
+    def _project(self, mocker, config, files):
+        mocker.patch("docvet.cli.load_config", return_value=config)
+        mocker.patch("docvet.cli.discover_files", return_value=files)
+        mocker.patch("docvet.cli._run_coverage", return_value=([], 0))
+        mocker.patch("docvet.cli._run_griffe", return_value=([], 0))
+
+    def test_reports_again_after_each_change(self, mocker, files):
+        events = iter([{files[0]}, set()])
+
+        def wait():
+            touched = next(events, None)
+            if touched is None:
+                raise KeyboardInterrupt
+            if touched:
+                _touch(files[0], _DOCUMENTED)
+            return touched
+
+        trigger = mocker.Mock(wait=wait)
+        mocker.patch("docvet.cli._watch._open_trigger", return_value=trigger)
+        mocker.patch("docvet.cli._watch._rewatch", return_value=trigger)
+
+        result = runner.invoke(app, ["check", "--watch", "--no-cache"])
+
+        assert result.output.count("Vetted 2 files") == 2
+        assert "Re-checked 1 changed file(s)" in result.output
+        assert result.stdout.count("b.py:1: missing-docstring Module") == 2
+        assert result.stdout.count("a.py:1: missing-docstring Module") == 1
+        assert result.exit_code == 0
+        trigger.close.assert_called_once()
+
+    def test_rejects_stream(self):
+        result = runner.invoke(app, ["check", "--watch", "--stream"])
+
+        assert result.exit_code == 2
+        assert "--watch or --stream" in result.output
@@ -1531,3 +1531,64 @@ def test_format_config_toml_roundtrip_with_user_keys():
     docvet = parsed["tool"]["docvet"]
     assert docvet["fail-on"] == ["enrichment"]
     assert docvet["enrichment"]["require-raises"] is False
+
+
+# ---------------------------------------------------------------------------
+# jobs
+# ---------------------------------------------------------------------------
+
+
+def test_docvet_defaults_jobs_is_serial():
+    assert DocvetConfig().jobs == 1
+
+
+@pytest.mark.parametrize("value", ["4", '"auto"'])
+def test_load_config_jobs_accepts_int_and_auto(
+    tmp_path, monkeypatch, write_pyproject, value
+):
+    monkeypatch.chdir(tmp_path)
+    write_pyproject(f"[tool.docvet]\njobs = {value}\n")
+    cfg = load_config()
+    assert cfg.jobs == tomllib.loads(f"v = {value}")["v"]
+
+
+@pytest.mark.parametrize("value", ["0", "-2", '"many"', "true", "1.5"])
+def test_load_config_invalid_jobs_exits(
+    tmp_path, monkeypatch, write_pyproject, capsys, value
+):
+    monkeypatch.chdir(tmp_path)
+    write_pyproject(f"[tool.docvet]\njobs = {value}\n")
+    with pytest.raises(SystemExit):
+        load_config()
+    assert "'jobs'" in capsys.readouterr().err
+
+
+def test_format_config_toml_includes_jobs():
+    output = format_config_toml(DocvetConfig(jobs="auto"), {"jobs": "auto"})
+    assert 'jobs = "auto"  # (user)' in output
+
+
+# ---------------------------------------------------------------------------
+# cache-max-size
+# ---------------------------------------------------------------------------
+
+
+def test_docvet_defaults_cache_max_size():
+    assert DocvetConfig().cache_max_size == 64
+
+
+def test_load_config_reads_cache_max_size(tmp_path, monkeypatch, write_pyproject):
+    monkeypatch.chdir(tmp_path)
+    write_pyproject("[tool.docvet]\ncache-max-size = 8\n")
+    assert load_config().cache_max_size == 8
+
+
+@pytest.mark.parametrize("value", ["0", '"big"', "true"])
+def test_load_config_invalid_cache_max_size_exits(
+    tmp_path, monkeypatch, write_pyproject, capsys, value
+):
+    monkeypatch.chdir(tmp_path)
+    write_pyproject(f"[tool.docvet]\ncache-max-size = {value}\n")
+    with pytest.raises(SystemExit):
+        load_config()
+    assert "'cache-max-size'" in capsys.readouterr().err
@@ -0,0 +1,348 @@
+"""Tests for the resident daemon and its forwarding client.
+
+Covers argument parsing for the subcommand and ``--config``, project
+root resolution, the in-process fallbacks of ``forward``, console-script
+forwarding from the app callback, captured runs and configuration
+memoization in ``_ResidentState``, and a round trip through a live
+socket server.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from docvet import daemon
+from docvet.cli import app
+from docvet.config import DocvetConfig
+from docvet.daemon import (
+    NO_DAEMON_ENV,
+    _config_option,
+    _project_root,
+    _ResidentState,
+    _socket_path,
+    _subcommand,
+    forward,
+    start_server,
+    stop_server,
+)
+
+pytestmark = pytest.mark.unit
+
+_UNDOCUMENTED = "def f():\n    pass\n"
+
+requires_unix_sockets = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A project with one undocumented module, used as the working dir."""
+    (tmp_path / "pyproject.toml").write_text("[tool.docvet]\nexclude = []\n")
+    (tmp_path / "mod.py").write_text(_UNDOCUMENTED)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(NO_DAEMON_ENV, raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def server(project):
+    """A daemon serving *project* from a background thread."""
+    root = project.resolve()
+    thread = threading.Thread(target=start_server, args=(root,), daemon=True)
+    thread.start()
+    path = _socket_path(root)
+    deadline = time.monotonic() + 5
+    while not path.exists():
+        if time.monotonic() > deadline:  # pragma: no cover - diagnostics only
+            pytest.fail("daemon did not start")
+        time.sleep(0.01)
+    yield root
+    stop_server(root)
+    thread.join(timeout=5)
+
+
+class TestArgumentParsing:
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            (["check", "--all"], "check"),
+            (["--format", "json", "presence"], "presence"),
+            (["--config", "sub/pyproject.toml", "-v", "griffe"], "griffe"),
+            (["--version"], None),
+            ([], None),
+        ],
+    )
+    def test_subcommand_skips_global_options(self, argv, expected):
+        assert _subcommand(argv) == expected
+
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            (["--config", "a.toml", "check"], "a.toml"),
+            (["--config=b.toml", "check"], "b.toml"),
+            (["check", "--all"], None),
+        ],
+    )
+    def test_config_option(self, argv, expected):
+        assert _config_option(argv) == expected
+
+
+class TestProjectRoot:
+    def test_uses_nearest_pyproject(self, project):
+        nested = project / "pkg" / "sub"
+        nested.mkdir(parents=True)
+
+        assert _project_root(["check"], nested) == project.resolve()
+
+    def test_uses_explicit_config_directory(self, tmp_path):
+        other = tmp_path / "other"
+        other.mkdir()
+
+        root = _project_root(["--config", "other/pyproject.toml", "check"], tmp_path)
+
+        assert root == other.resolve()
+
+    def test_socket_path_differs_per_project(self, tmp_path):
+        assert _socket_path(tmp_path / "a") != _socket_path(tmp_path / "b")
+
+
+class TestForwardFallback:
+    def test_disabled_by_environment(self, project, monkeypatch, mocker):
+        monkeypatch.setenv(NO_DAEMON_ENV, "1")
+        connect = mocker.patch("docvet.daemon._connect")
+
+        assert forward(["check"]) is None
+        connect.assert_not_called()
+
+    @pytest.mark.parametrize("argv", [["fix", "mod.py"], ["lsp"], ["--version"]])
+    def test_non_check_commands_run_in_process(self, project, mocker, argv):
+        connect = mocker.patch("docvet.daemon._connect")
+
+        assert forward(argv) is None
+        connect.assert_not_called()
+
+    def test_sends_git_environment(self, project, monkeypatch, mocker):
+        monkeypatch.setenv("GIT_INDEX_FILE", "/tmp/hook-index")
+        mocker.patch("docvet.daemon._connect", return_value=socket.socket())
+        mocker.patch("docvet.daemon._await_ready", return_value=True)
+        send = mocker.patch("docvet.daemon._send")
+        mocker.patch(
+            "docvet.daemon._receive",
+            return_value={"exit_code": 0, "stdout": "", "stderr": ""},
+        )
+
+        assert forward(["check", "--staged"]) == 0
+        request = send.call_args.args[1]
+        assert request["git_env"]["GIT_INDEX_FILE"] == "/tmp/hook-index"
+
+    def test_no_daemon_listening(self, project):
+        assert forward(["presence", "mod.py"]) is None
+
+
+class TestConsoleForwarding:
+    def test_console_run_is_offered_to_daemon(self, project, monkeypatch, mocker):
+        monkeypatch.setattr(sys, "argv", ["docvet", "presence", "mod.py"])
+        fwd = mocker.patch("docvet.daemon.forward", return_value=3)
+
+        with pytest.raises(SystemExit) as exc_info:
+            app()
+
+        assert exc_info.value.code == 3
+        fwd.assert_called_once_with(["presence", "mod.py"])
+
+    def test_runs_in_process_when_no_daemon_answers(
+        self, project, monkeypatch, mocker, capsys
+    ):
+        monkeypatch.setattr(sys, "argv", ["docvet", "presence", "mod.py"])
+        mocker.patch("docvet.daemon.forward", return_value=None)
+
+        with pytest.raises(SystemExit) as exc_info:
+            app()
+
+        assert exc_info.value.code == 0
+        assert "missing-docstring" in capsys.readouterr().out
+
+    def test_explicit_arguments_never_forward(self, project, mocker):
+        fwd = mocker.patch("docvet.daemon.forward")
+
+        result = CliRunner().invoke(app, ["presence", "mod.py"])
+
+        assert result.exit_code == 0
+        fwd.assert_not_called()
+
+
+class TestResidentState:
+    def test_run_captures_output_and_exit_code(self, project):
+        state = _ResidentState()
+
+        code, out, err = state.run(["presence", "mod.py"], project)
+
+        assert code == 0
+        assert "missing-docstring" in out
+        assert "Traceback" not in err
+
+    def test_run_restores_working_directory(self, project, tmp_path_factory):
+        elsewhere = tmp_path_factory.mktemp("elsewhere")
+        state = _ResidentState()
+
+        state.run(["presence", "mod.py"], project)
+        state.run(["--version"], elsewhere)
+
+        assert Path.cwd() == project
+
+    def test_load_config_memoized_until_pyproject_changes(self, project, mocker):
+        load = mocker.patch("docvet.cli.load_config", return_value=DocvetConfig())
+        state = _ResidentState()
+
+        state.load_config(None)
+        state.load_config(None)
+        (project / "pyproject.toml").write_text("[tool.docvet]\nexclude = ['build']\n")
+        state.load_config(None)
+
+        assert load.call_count == 2
+
+    def test_load_config_reloaded_when_src_directory_appears(self, project):
+        state = _ResidentState()
+
+        assert state.load_config(None).src_root == "."
+        (project / "src").mkdir()
+
+        assert state.load_config(None).src_root == "src"
+
+    def test_load_config_keeps_one_entry_per_pyproject(self, project, mocker):
+        mocker.patch("docvet.cli.load_config", return_value=DocvetConfig())
+        state = _ResidentState()
+
+        for size in range(3):
+            (project / "pyproject.toml").write_text("[tool.docvet]\n" + "#" * size)
+            state.load_config(None)
+
+        assert len(state._configs) == 1
+
+    def test_load_config_replays_warnings(self, project, mocker, capsys):
+        def warn(path):
+            sys.stderr.write("docvet: unknown key\n")
+            return DocvetConfig()
+
+        mocker.patch("docvet.cli.load_config", side_effect=warn)
+        state = _ResidentState()
+
+        state.load_config(None)
+        state.load_config(None)
+
+        assert capsys.readouterr().err.count("docvet: unknown key") == 2
+
+    def test_run_applies_client_git_environment(self, project, monkeypatch, mocker):
+        monkeypatch.setenv("GIT_AUTHOR_NAME", "daemon")
+        monkeypatch.delenv("GIT_INDEX_FILE", raising=False)
+        seen = {}
+
+        def record(path):
+            seen.update(daemon._git_environ())
+            return DocvetConfig()
+
+        mocker.patch("docvet.cli.load_config", side_effect=record)
+        state = _ResidentState()
+
+        state.run(["presence", "mod.py"], project, git_env={"GIT_INDEX_FILE": "idx"})
+
+        assert seen == {"GIT_INDEX_FILE": "idx"}
+        assert os.environ["GIT_AUTHOR_NAME"] == "daemon"
+        assert "GIT_INDEX_FILE" not in os.environ
+
+    def test_run_drops_deleted_files(self, project):
+        (project / "gone.py").write_text(_UNDOCUMENTED)
+        state = _ResidentState()
+        state.run(["presence", "mod.py", "gone.py"], project)
+
+        (project / "gone.py").unlink()
+        state.run(["presence", "mod.py"], project)
+
+        assert [path.name for path in state.files] == ["mod.py"]
+
+    def test_griffe_tree_reused_per_source_root(self, project):
+        state = _ResidentState()
+
+        assert state.griffe_tree(project) is state.griffe_tree(project)
+
+
+@requires_unix_sockets
+class TestServer:
+    def test_forward_replays_daemon_output(self, server, capsys):
+        code = forward(["presence", "mod.py"])
+
+        assert code == 0
+        assert "missing-docstring" in capsys.readouterr().out
+
+    def test_second_server_for_same_project_is_refused(self, server):
+        with pytest.raises(RuntimeError, match="already running"):
+            start_server(server)
+
+    def test_version_mismatch_falls_back(self, server, mocker):
+        mocker.patch.object(daemon, "_version", return_value="0.0.0-other")
+
+        assert forward(["presence", "mod.py"]) is None
+
+    def test_stalled_client_does_not_block_requests(self, server, monkeypatch):
+        monkeypatch.setattr(daemon, "_REQUEST_TIMEOUT", 0.2)
+        monkeypatch.setattr(daemon, "_READY_TIMEOUT", 5.0)
+        stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stalled.connect(str(_socket_path(server)))
+
+        with stalled:
+            assert forward(["presence", "mod.py"]) == 0
+
+    def test_busy_daemon_sends_second_client_in_process(
+        self, server, monkeypatch, mocker
+    ):
+        monkeypatch.setattr(daemon, "_READY_TIMEOUT", 0.2)
+        started, release = threading.Event(), threading.Event()
+        real_run = _ResidentState.run
+
+        def slow_run(state, *args, **kwargs):
+            started.set()
+            release.wait(5)
+            return real_run(state, *args, **kwargs)
+
+        run = mocker.patch.object(
+            _ResidentState, "run", autospec=True, side_effect=slow_run
+        )
+        first: list[int | None] = []
+        client = threading.Thread(
+            target=lambda: first.append(forward(["presence", "mod.py"]))
+        )
+        client.start()
+        assert started.wait(5)
+
+        assert forward(["presence", "mod.py"]) is None
+        release.set()
+        client.join(timeout=5)
+        assert stop_server(server) is True
+
+        assert first == [0]
+        assert run.call_count == 1
+
+    def test_ungreeted_connection_falls_back(self, project, monkeypatch):
+        monkeypatch.setattr(daemon, "_READY_TIMEOUT", 0.2)
+        path = _socket_path(project.resolve())
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(path))
+        listener.listen()
+
+        try:
+            assert forward(["presence", "mod.py"]) is None
+        finally:
+            listener.close()
+            path.unlink()
+
+    def test_stop_server_without_daemon(self, tmp_path):
+        assert stop_server(tmp_path.resolve()) is False
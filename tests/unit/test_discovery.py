@@ -7,8 +7,15 @@ from pathlib import Path
 
 import pytest
 
+from docvet import discovery
 from docvet.config import DocvetConfig
-from docvet.discovery import DiscoveryMode, _is_excluded, _run_git, discover_files
+from docvet.discovery import (
+    DiscoveryMode,
+    _ExcludeMatcher,
+    _is_excluded,
+    _run_git,
+    discover_files,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -578,3 +585,55 @@ def test_is_excluded_mixed_simple_and_advanced_from_extend_exclude():
     assert _is_excluded("a/b/test_foo.py", merged) is True
     assert _is_excluded("scripts/gen_docs.py", merged) is True
     assert _is_excluded("src/docvet/cli.py", merged) is False
+
+
+# ---------------------------------------------------------------------------
+# _ExcludeMatcher — compiled once per exclude list
+# ---------------------------------------------------------------------------
+
+
+def test_exclude_matcher_literal_component_uses_name_lookup():
+    matcher = _ExcludeMatcher(["tests", "node_modules"])
+
+    assert matcher.matches("pkg/node_modules/dep.py") is True
+    assert matcher.matches("pkg/tests_helpers.py") is False
+
+
+def test_exclude_matcher_glob_component_matches_any_depth():
+    matcher = _ExcludeMatcher(["*_pb2.py", "t?sts"])
+
+    assert matcher.matches("src/api/user_pb2.py") is True
+    assert matcher.matches("tsts/foo.py") is False
+    assert matcher.matches("tosts/foo.py") is True
+
+
+def test_exclude_matcher_normalizes_backslashes():
+    matcher = _ExcludeMatcher(["vendor/legacy/", "scripts/gen_*.py"])
+
+    assert matcher.matches("vendor\\legacy\\old.py") is True
+    assert matcher.matches("scripts\\gen_docs.py") is True
+
+
+def test_exclude_matcher_with_no_patterns_matches_nothing():
+    assert _ExcludeMatcher([]).matches("src/docvet/cli.py") is False
+
+
+def test_discover_files_compiles_excludes_once_per_call(tmp_path, make_config, mocker):
+    for name in ("a.py", "b.py", "c.py"):
+        (tmp_path / name).write_text("# module")
+    mocker.patch(
+        "docvet.discovery.subprocess.run",
+        return_value=subprocess.CompletedProcess(
+            args=["git", "ls-files"],
+            returncode=0,
+            stdout="a.py\nb.py\nc.py\n",
+            stderr="",
+        ),
+    )
+    discovery._compile_excludes.cache_clear()
+    spy = mocker.spy(discovery, "_ExcludeMatcher")
+
+    result = discover_files(make_config(exclude=["tests"]), DiscoveryMode.ALL)
+
+    assert len(result) == 3
+    assert spy.call_count == 1
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -11,15 +12,19 @@ pygls = pytest.importorskip("pygls")
 
 from lsprotocol import types  # noqa: E402
 
-from docvet.checks import Finding  # noqa: E402
+from docvet.checks import Finding, check_enrichment  # noqa: E402
 from docvet.config import DocvetConfig  # noqa: E402
 from docvet.lsp import (  # noqa: E402
     DOCS_BASE_URL,
     _check_file,
+    _check_griffe,
     _finding_to_diagnostic,
     _publish_diagnostics,
+    _recheck_file,
     _resolve_src_root,
     _uri_to_path,
+    did_change,
+    did_close,
     did_open,
     did_save,
 )
@@ -71,6 +76,8 @@ def mock_server(config: DocvetConfig) -> MagicMock:
     """A mocked LanguageServer with docvet_config attached."""
     ls = MagicMock()
     ls.docvet_config = config
+    ls.docvet_documents = {}
+    ls.docvet_griffe = {}
     ls.workspace.folders = {}
     return ls
 
@@ -155,7 +162,7 @@ class TestCheckFile:
         with (
             patch("docvet.lsp.check_enrichment") as mock_enrich,
             patch("docvet.lsp.check_coverage", return_value=[]),
-            patch("docvet.lsp.check_griffe_compat", return_value=[]),
+            patch("docvet.lsp._check_griffe", return_value=[]),
         ):
             finding = Finding("app.py", 2, "foo", "missing-raises", "msg", "required")
             mock_enrich.return_value = [finding]
@@ -171,7 +178,7 @@ class TestCheckFile:
         with (
             patch("docvet.lsp.check_enrichment", return_value=[]),
             patch("docvet.lsp.check_coverage", return_value=[]),
-            patch("docvet.lsp.check_griffe_compat") as mock_griffe,
+            patch("docvet.lsp._check_griffe") as mock_griffe,
         ):
             finding = Finding(
                 "app.py", 1, "foo", "griffe-unknown-param", "msg", "recommended"
@@ -190,7 +197,7 @@ class TestCheckFile:
             patch("docvet.lsp.check_enrichment", return_value=[]),
             patch("docvet.lsp.check_coverage", return_value=[]),
             patch(
-                "docvet.lsp.check_griffe_compat",
+                "docvet.lsp._check_griffe",
                 side_effect=ImportError("no griffe"),
             ),
         ):
@@ -205,7 +212,7 @@ class TestCheckFile:
         with (
             patch("docvet.lsp.check_enrichment", return_value=[]),
             patch("docvet.lsp.check_coverage") as mock_cov,
-            patch("docvet.lsp.check_griffe_compat", return_value=[]),
+            patch("docvet.lsp._check_griffe", return_value=[]),
         ):
             finding = Finding("src/pkg", 1, "pkg", "missing-init", "msg", "required")
             mock_cov.return_value = [finding]
@@ -221,7 +228,7 @@ class TestCheckFile:
         with (
             patch("docvet.lsp.check_enrichment", return_value=[]),
             patch("docvet.lsp.check_coverage", return_value=[]),
-            patch("docvet.lsp.check_griffe_compat", return_value=[]),
+            patch("docvet.lsp._check_griffe", return_value=[]),
         ):
             result = _check_file(mock_server, uri, source, config)
         assert result == []
@@ -242,6 +249,170 @@ class TestCheckFile:
         assert result == []
 
 
+class TestCheckGriffe:
+    """Tests for the resident griffe tree lookup."""
+
+    def test_reuses_tree_per_src_root(self, mock_server: MagicMock) -> None:
+        src_root = Path("/fake/project/src")
+        file_path = src_root / "pkg" / "mod.py"
+        with patch("docvet.lsp._ModuleTree") as mock_tree_cls:
+            mock_tree_cls.return_value.check.return_value = []
+            _check_griffe(mock_server, src_root, file_path, "x = 1\n")
+            _check_griffe(mock_server, src_root, file_path, "x = 2\n")
+        mock_tree_cls.assert_called_once_with(src_root)
+        mock_tree_cls.return_value.check.assert_called_with(file_path, "x = 2\n")
+
+
+# ---------------------------------------------------------------------------
+# Incremental re-check on didChange
+# ---------------------------------------------------------------------------
+
+_TWO_FUNCS = (
+    'def foo():\n    """Foo."""\n    raise ValueError("x")\n'
+    "\n\n"
+    'def bar():\n    """Bar."""\n    raise KeyError("y")\n'
+)
+
+
+class TestRecheckFile:
+    """Tests for _recheck_file incremental enrichment."""
+
+    @pytest.fixture(autouse=True)
+    def _no_file_checks(self):
+        with (
+            patch("docvet.lsp.check_coverage", return_value=[]),
+            patch("docvet.lsp._check_griffe", return_value=[]),
+        ):
+            yield
+
+    def test_open_retains_document_state(
+        self, mock_server: MagicMock, config: DocvetConfig
+    ) -> None:
+        uri = "file:///fake/project/src/app.py"
+        _check_file(mock_server, uri, _TWO_FUNCS, config)
+        state = mock_server.docvet_documents[uri]
+        assert [s.name for s in state.symbols] == ["<module>", "foo", "bar"]
+        assert len(state.symbol_findings) == 2
+
+    def test_edit_rechecks_only_touched_symbol(
+        self, mock_server: MagicMock, config: DocvetConfig
+    ) -> None:
+        uri = "file:///fake/project/src/app.py"
+        _check_file(mock_server, uri, _TWO_FUNCS, config)
+        edited = _TWO_FUNCS.replace('"""Bar."""', '"""Bar.\n\n    Raises:\n    """')
+        with patch("docvet.lsp.check_enrichment", wraps=check_enrichment) as spy:
+            result = _recheck_file(mock_server, uri, edited, config)
+        assert spy.call_count == 1
+        assert [s.name for s in spy.call_args.kwargs["symbols"]] == ["bar"]
+        assert result is not None
+        raises = [d.range.start.line for d in result if d.code == "missing-raises"]
+        assert raises == [0]
+
+    def test_unchanged_symbol_findings_shift_with_edit_above(
+        self, mock_server: MagicMock, config: DocvetConfig
+    ) -> None:
+        uri = "file:///fake/project/src/app.py"
+        _check_file(mock_server, uri, _TWO_FUNCS, config)
+        edited = "import os\n\n" + _TWO_FUNCS
+        with patch("docvet.lsp.check_enrichment") as mock_enrich:
+            result = _recheck_file(mock_server, uri, edited, config)
+        mock_enrich.assert_not_called()
+        assert result is not None
+        raises = [d.range.start.line for d in result if d.code == "missing-raises"]
+        assert raises == [2, 7]
+
+    def test_syntax_error_keeps_previous_diagnostics(
+        self, mock_server: MagicMock, config: DocvetConfig
+    ) -> None:
+        uri = "file:///fake/project/src/app.py"
+        _check_file(mock_server, uri, _TWO_FUNCS, config)
+        assert _recheck_file(mock_server, uri, "def foo(\n", config) is None
+        assert uri in mock_server.docvet_documents
+
+    def test_carries_over_file_findings(
+        self, mock_server: MagicMock, config: DocvetConfig
+    ) -> None:
+        uri = "file:///fake/project/src/app.py"
+        finding = Finding("src/pkg", 1, "pkg", "missing-init", "msg", "required")
+        with patch("docvet.lsp.check_coverage", return_value=[finding]):
+            _check_file(mock_server, uri, "x = 1\n", config)
+        result = _recheck_file(mock_server, uri, "x = 2\n", config)
+        assert result is not None
+        assert [d.code for d in result] == ["missing-init"]
+
+    def test_falls_back_to_full_check_without_state(
+        self, mock_server: MagicMock, config: DocvetConfig
+    ) -> None:
+        uri = "file:///fake/project/src/app.py"
+        with patch("docvet.lsp._check_file", return_value=[]) as mock_check:
+            _recheck_file(mock_server, uri, "x = 1\n", config)
+        mock_check.assert_called_once_with(mock_server, uri, "x = 1\n", config)
+
+
+class TestDidChange:
+    """Tests for the debounced didChange handler."""
+
+    @staticmethod
+    def _params(version: int) -> types.DidChangeTextDocumentParams:
+        return types.DidChangeTextDocumentParams(
+            text_document=types.VersionedTextDocumentIdentifier(
+                uri="file:///fake/project/src/app.py",
+                version=version,
+            ),
+            content_changes=[],
+        )
+
+    def test_publishes_latest_version(self, mock_server: MagicMock) -> None:
+        mock_doc = MagicMock(version=2, source="x = 1\n")
+        mock_server.workspace.get_text_document.return_value = mock_doc
+        with (
+            patch("docvet.lsp.CHANGE_DEBOUNCE_SECONDS", 0),
+            patch("docvet.lsp._recheck_file", return_value=[]) as mock_recheck,
+        ):
+            asyncio.run(did_change(mock_server, self._params(2)))
+        mock_recheck.assert_called_once_with(
+            mock_server,
+            "file:///fake/project/src/app.py",
+            "x = 1\n",
+            mock_server.docvet_config,
+        )
+        mock_server.text_document_publish_diagnostics.assert_called_once()
+
+    def test_skips_superseded_version(self, mock_server: MagicMock) -> None:
+        mock_doc = MagicMock(version=3, source="x = 1\n")
+        mock_server.workspace.get_text_document.return_value = mock_doc
+        with (
+            patch("docvet.lsp.CHANGE_DEBOUNCE_SECONDS", 0),
+            patch("docvet.lsp._recheck_file") as mock_recheck,
+        ):
+            asyncio.run(did_change(mock_server, self._params(2)))
+        mock_recheck.assert_not_called()
+        mock_server.text_document_publish_diagnostics.assert_not_called()
+
+    def test_unparseable_buffer_publishes_nothing(self, mock_server: MagicMock) -> None:
+        mock_doc = MagicMock(version=2, source="def foo(\n")
+        mock_server.workspace.get_text_document.return_value = mock_doc
+        with (
+            patch("docvet.lsp.CHANGE_DEBOUNCE_SECONDS", 0),
+            patch("docvet.lsp._recheck_file", return_value=None),
+        ):
+            asyncio.run(did_change(mock_server, self._params(2)))
+        mock_server.text_document_publish_diagnostics.assert_not_called()
+
+
+class TestDidClose:
+    """Tests for the didClose handler."""
+
+    def test_drops_document_state(self, mock_server: MagicMock) -> None:
+        uri = "file:///fake/project/src/app.py"
+        mock_server.docvet_documents[uri] = MagicMock()
+        params = types.DidCloseTextDocumentParams(
+            text_document=types.TextDocumentIdentifier(uri=uri),
+        )
+        did_close(mock_server, params)
+        assert mock_server.docvet_documents == {}
+
+
 # ---------------------------------------------------------------------------
 # _resolve_src_root
 # ---------------------------------------------------------------------------
@@ -27,6 +27,8 @@ from docvet.mcp import (  # noqa: E402
     _build_summary,
     _load_config_for_path,
     _run_checks,
+    _run_freshness,
+    _run_per_file_checks,
     _serialize_finding,
     docvet_check,
     docvet_rules,
@@ -459,6 +461,30 @@ class TestFreshnessGitUnavailable:
         assert any("freshness" in e for e in result["errors"])
 
 
+class TestFreshnessSingleDiff:
+    def test_one_git_diff_is_split_across_files(self, tmp_path: Path):
+        files = []
+        for name in ("a.py", "b.py"):
+            path = tmp_path / name
+            path.write_text("def f():\n    return 1\n", encoding="utf-8")
+            files.append(path)
+        diff = (
+            "diff --git b.py b.py\n--- b.py\n+++ b.py\n"
+            "@@ -1,2 +1,2 @@\n def f():\n-    return 0\n+    return 1\n"
+        )
+        config = DocvetConfig(project_root=tmp_path)
+        with (
+            patch("docvet.mcp.subprocess.run") as mock_run,
+            patch("docvet.mcp.check_freshness_diff", return_value=[]) as mock_check,
+        ):
+            mock_run.return_value.stdout = diff
+            findings, error = _run_freshness(files, config)
+
+        assert (findings, error) == ([], None)
+        assert mock_run.call_count == 2  # rev-parse + one diff
+        assert [c.args[1] for c in mock_check.call_args_list] == ["", diff]
+
+
 # ---------------------------------------------------------------------------
 # Task 6.11 — griffe with package unavailable
 # ---------------------------------------------------------------------------
@@ -639,6 +665,49 @@ class TestRunChecks:
         assert stats is None  # presence not requested
 
 
+class TestPerFileThreadPool:
+    def test_thread_pool_matches_serial_order(
+        self, isolated_tmp: Path, config: DocvetConfig
+    ):
+        files = []
+        for i in range(6):
+            p = isolated_tmp / f"mod{i}.py"
+            p.write_text(
+                f'def f{i}():\n    """Do it."""\n    raise ValueError\n',
+                encoding="utf-8",
+            )
+            files.append(p)
+        checks = frozenset(["presence", "enrichment"])
+
+        serial = _run_per_file_checks(files, config, checks)
+        threaded = _run_per_file_checks(files, replace(config, jobs=3), checks)
+
+        assert threaded == serial
+        file_order = list(dict.fromkeys(f.file for f in threaded[0]))
+        assert file_order == [str(p) for p in files]
+
+    def test_thread_pool_used_only_when_jobs_allow(
+        self, py_file: Path, config: DocvetConfig
+    ):
+        with patch("docvet.mcp.ThreadPoolExecutor") as executor:
+            _run_per_file_checks([py_file], replace(config, jobs=4), frozenset())
+            _run_per_file_checks([py_file, py_file], config, frozenset())
+
+        executor.assert_not_called()
+
+    def test_enrichment_uses_configured_style(self, isolated_tmp: Path):
+        p = isolated_tmp / "sphinx.py"
+        p.write_text(
+            'def f(a):\n    """Do it.\n\n    :param a: A value.\n    """\n',
+            encoding="utf-8",
+        )
+        config = DocvetConfig(project_root=isolated_tmp, docstring_style="sphinx")
+
+        findings, _ = _run_per_file_checks([p], config, frozenset(["enrichment"]))
+
+        assert not any("param" in f.rule for f in findings)
+
+
 class TestLoadConfigForPath:
     def test_finds_pyproject_in_parent(self, tmp_path: Path):
         pyproject = tmp_path / "pyproject.toml"
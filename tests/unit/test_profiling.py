@@ -0,0 +1,218 @@
+"""Unit tests for run profiling and ``docvet check --profile``."""
+
+from __future__ import annotations
+
+import ast
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from docvet.checks.enrichment import check_enrichment
+from docvet.cli import app
+from docvet.config import EnrichmentConfig
+from docvet.profiling import (
+    RunProfile,
+    TimingStat,
+    active_profile,
+    profile_scope,
+    timed,
+    timed_files,
+)
+
+pytestmark = pytest.mark.unit
+
+runner = CliRunner()
+
+_SOURCE = '''\
+"""Module."""
+
+
+def parse(text):
+    """Parse the text.
+
+    Args:
+        text: Input text.
+    """
+    if not text:
+        raise ValueError("empty")
+    return text.split()
+'''
+
+
+# ---------------------------------------------------------------------------
+# RunProfile
+# ---------------------------------------------------------------------------
+
+
+class TestRunProfile:
+    def test_record_accumulates_calls_and_time(self):
+        profile = RunProfile()
+
+        profile.record(profile.rules, "missing_raises", 0.25)
+        profile.record(profile.rules, "missing_raises", 0.5)
+
+        assert profile.rules == {"missing_raises": TimingStat(calls=2, seconds=0.75)}
+
+    def test_slowest_files_keeps_top_n_by_time(self):
+        profile = RunProfile(top=2)
+        for name, seconds in [("a.py", 0.1), ("b.py", 0.3), ("c.py", 0.2)]:
+            profile.record(profile.files, name, seconds)
+
+        assert [name for name, _ in profile.slowest_files()] == ["b.py", "c.py"]
+
+    def test_to_dict_orders_phases_by_pipeline_and_rules_by_time(self):
+        profile = RunProfile()
+        profile.record(profile.phases, "rules", 0.1)
+        profile.record(profile.phases, "read", 0.2)
+        profile.record(profile.rules, "fast", 0.1)
+        profile.record(profile.rules, "slow", 0.9)
+        profile.record(profile.files, "a.py", 0.5)
+
+        data = profile.to_dict()
+
+        assert [row["name"] for row in data["phases"]] == ["read", "rules"]
+        assert [row["name"] for row in data["rules"]] == ["slow", "fast"]
+        assert data["slowest_files"] == [{"file": "a.py", "calls": 1, "seconds": 0.5}]
+        assert data["checks"] == []
+
+    def test_format_table_lists_nonempty_sections(self):
+        profile = RunProfile()
+        profile.record(profile.checks, "enrichment", 0.004)
+        profile.record(profile.checks, "enrichment", 0.002)
+
+        table = profile.format_table()
+
+        assert table.splitlines()[0] == "Profile:"
+        assert "rule" not in table
+        row = table.splitlines()[-1].split()
+        assert row == ["enrichment", "2", "6.00", "3.000"]
+
+
+# ---------------------------------------------------------------------------
+# Scopes and timers
+# ---------------------------------------------------------------------------
+
+
+class TestProfileScope:
+    def test_scope_sets_and_restores_active_profile(self):
+        outer, inner = RunProfile(), RunProfile()
+
+        with profile_scope(outer):
+            with profile_scope(inner):
+                assert active_profile() is inner
+            assert active_profile() is outer
+        assert active_profile() is None
+
+    def test_timed_records_into_named_table(self):
+        with profile_scope(RunProfile()) as profile:
+            with timed("phases", "parse"):
+                pass
+
+        assert profile.phases["parse"].calls == 1
+
+    def test_timed_without_profile_does_nothing(self):
+        with timed("phases", "parse"):
+            pass
+
+        assert active_profile() is None
+
+    def test_timed_files_records_each_item(self):
+        with profile_scope(RunProfile()) as profile:
+            items = list(timed_files([("a.py", 1), ("b.py", 2)], key=lambda i: i[0]))
+
+        assert items == [("a.py", 1), ("b.py", 2)]
+        assert set(profile.files) == {"a.py", "b.py"}
+
+
+# ---------------------------------------------------------------------------
+# Enrichment instrumentation
+# ---------------------------------------------------------------------------
+
+
+class TestEnrichmentProfile:
+    def test_records_each_rule_call_and_section_parse(self):
+        with profile_scope(RunProfile()) as profile:
+            findings = check_enrichment(
+                _SOURCE, ast.parse(_SOURCE), EnrichmentConfig(), "m.py"
+            )
+
+        assert profile.rules["missing_raises"].calls == 1
+        assert profile.phases["sections"].calls == 2
+        assert profile.phases["rules"].calls == sum(
+            stat.calls for stat in profile.rules.values()
+        )
+        assert {"missing-raises", "missing-returns"} <= {f.rule for f in findings}
+
+    def test_findings_match_unprofiled_run(self):
+        tree = ast.parse(_SOURCE)
+        plain = check_enrichment(_SOURCE, tree, EnrichmentConfig(), "m.py")
+        with profile_scope(RunProfile()):
+            profiled = check_enrichment(_SOURCE, tree, EnrichmentConfig(), "m.py")
+
+        assert profiled == plain
+
+
+# ---------------------------------------------------------------------------
+# check --profile
+# ---------------------------------------------------------------------------
+
+
+class TestCheckProfile:
+    @pytest.fixture(autouse=True)
+    def _project(self, tmp_path, mocker, monkeypatch):
+        (tmp_path / "pyproject.toml").write_text("[tool.docvet]\n", encoding="utf-8")
+        (tmp_path / "m.py").write_text(_SOURCE, encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        mocker.patch("docvet.cli._get_git_diffs", return_value={})
+        mocker.patch("docvet.cli._run_griffe", return_value=([], 0))
+
+    def test_writes_profile_table_to_stderr(self):
+        result = runner.invoke(app, ["check", "--all", "--no-cache", "--profile"])
+
+        assert "Profile:" in result.stderr
+        assert "missing_raises" in result.stderr
+        assert "m.py" in result.stderr
+
+    def test_adds_profile_to_json_output(self):
+        result = runner.invoke(
+            app, ["--format", "json", "check", "--all", "--no-cache", "--profile"]
+        )
+
+        profile = json.loads(result.stdout)["profile"]
+        phases = [row["name"] for row in profile["phases"]]
+        assert phases == ["read", "parse", "symbols", "sections", "rules"]
+        assert {row["name"] for row in profile["checks"]} >= {"enrichment", "presence"}
+        assert profile["slowest_files"][0]["file"].endswith("m.py")
+
+    def test_json_output_has_no_profile_without_flag(self):
+        result = runner.invoke(
+            app, ["--format", "json", "check", "--all", "--no-cache"]
+        )
+
+        assert "profile" not in json.loads(result.stdout)
+
+    def test_runs_per_file_checks_serially(self, mocker, tmp_path):
+        (tmp_path / "n.py").write_text(_SOURCE, encoding="utf-8")
+        parallel = mocker.patch("docvet.cli._run_parallel")
+
+        runner.invoke(app, ["check", "--all", "--no-cache", "--profile", "--jobs", "4"])
+
+        parallel.assert_not_called()
+
+    def test_warm_cache_still_profiles_every_rule(self):
+        runner.invoke(app, ["check", "--all"])
+
+        result = runner.invoke(app, ["--format", "json", "check", "--all", "--profile"])
+
+        profile = json.loads(result.stdout)["profile"]
+        phases = [row["name"] for row in profile["phases"]]
+        assert phases == ["read", "parse", "symbols", "sections", "rules"]
+        assert "missing_raises" in {row["name"] for row in profile["rules"]}
+
+    @pytest.mark.parametrize("flag", ["--watch", "--stream"])
+    def test_rejects_watch_and_stream(self, flag):
+        result = runner.invoke(app, ["check", "--profile", flag])
+
+        assert result.exit_code == 2
+        assert "--profile cannot be used" in result.output
@@ -11,13 +11,17 @@ from docvet.checks import Finding
 from docvet.config import DocvetConfig, PresenceConfig
 from docvet.reporting import (
     CheckQuality,
+    FindingTally,
     compute_quality,
     determine_exit_code,
     format_json,
+    format_jsonl,
     format_markdown,
     format_quality_summary,
     format_summary,
     format_terminal,
+    format_terminal_footer,
+    format_terminal_group,
     format_verbose_header,
     write_report,
 )
@@ -323,6 +327,77 @@ class TestWriteReport:
             write_report(findings, output, fmt="xml")
 
 
+# ---------------------------------------------------------------------------
+# format_jsonl tests
+# ---------------------------------------------------------------------------
+
+
+class TestFormatJsonl:
+    """Tests for format_jsonl."""
+
+    def test_finding_records_match_json_entries(self, make_finding):
+        findings = [make_finding(file="b.py"), make_finding(file="a.py", line=4)]
+
+        lines = list(format_jsonl(findings, 2))
+
+        records = [json.loads(line) for line in lines[:-1]]
+        expected = json.loads(format_json(findings, 2))["findings"]
+        assert records == [{"type": "finding", **entry} for entry in expected]
+        assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+
+    def test_summary_record_is_last_and_matches_json(self, make_finding):
+        from docvet.checks.presence import PresenceStats
+
+        findings = [make_finding(), make_finding(category="scaffold", line=2)]
+        suppressed = [make_finding(line=9, rule="missing-raises")]
+
+        *rest, last = format_jsonl(
+            findings,
+            3,
+            presence_stats=PresenceStats(documented=3, total=4),
+            min_coverage=80.0,
+            suppressed=suppressed,
+        )
+
+        summary = json.loads(last)
+        as_json = json.loads(
+            format_json(
+                findings,
+                3,
+                presence_stats=PresenceStats(documented=3, total=4),
+                min_coverage=80.0,
+            )
+        )
+        assert summary["type"] == "summary"
+        assert summary["total"] == 2
+        assert summary["by_category"] == as_json["summary"]["by_category"]
+        assert summary["files_checked"] == 3
+        assert summary["suppressed"] == 1
+        assert summary["presence_coverage"] == as_json["presence_coverage"]
+        assert json.loads(rest[-1])["type"] == "suppressed"
+
+    def test_summary_record_carries_profile(self):
+        profile = {"phases": [{"name": "read", "calls": 1, "seconds": 0.1}]}
+
+        *_, last = format_jsonl([], 1, profile=profile)
+
+        assert json.loads(last)["profile"] == profile
+
+    def test_no_findings_yields_only_summary(self):
+        lines = list(format_jsonl([], 0))
+
+        assert len(lines) == 1
+        assert json.loads(lines[0])["total"] == 0
+
+    def test_write_report_jsonl(self, tmp_path, make_finding):
+        output = tmp_path / "report.jsonl"
+
+        write_report([make_finding()], output, fmt="jsonl", file_count=1)
+
+        types = [json.loads(line)["type"] for line in output.read_text().splitlines()]
+        assert types == ["finding", "summary"]
+
+
 # ---------------------------------------------------------------------------
 # format_json tests (Story 23.3)
 # ---------------------------------------------------------------------------
@@ -1032,6 +1107,11 @@ class TestFormatJsonQuality:
         result = json.loads(format_json([], 10))
         assert set(result.keys()) == {"findings", "summary"}
 
+    def test_profile_key_present_when_provided(self):
+        profile = {"phases": [], "checks": [], "rules": [], "slowest_files": []}
+        result = json.loads(format_json([], 10, profile=profile))
+        assert result["profile"] == profile
+
 
 # ---------------------------------------------------------------------------
 # Scaffold category tests (Story 32.2)
@@ -1124,3 +1204,94 @@ class TestScaffoldCategory:
         findings = [make_finding(category="required")]
         result = format_summary(5, ["enrichment"], findings, 1.0)
         assert "scaffold" not in result
+
+
+# ---------------------------------------------------------------------------
+# FindingTally and streaming terminal helpers
+# ---------------------------------------------------------------------------
+
+
+class TestFindingTally:
+    """Tests for incremental finding counts used by ``check --stream``."""
+
+    def test_add_counts_by_check_and_category(self, make_finding):
+        tally = FindingTally()
+        tally.add("enrichment", [make_finding(), make_finding(category="scaffold")])
+        tally.add("coverage", [make_finding(category="recommended")])
+
+        assert tally.total == 3
+        assert tally.by_check == {"enrichment": 2, "coverage": 1}
+        assert tally.by_category == {"required": 1, "scaffold": 1, "recommended": 1}
+
+    def test_quality_matches_compute_quality_on_lists(self, make_finding):
+        findings_by_check = {
+            "enrichment": [
+                make_finding(file="a.py", symbol="f"),
+                make_finding(file="a.py", symbol="f", line=2),
+                make_finding(file="a.py", symbol="g"),
+            ],
+            "coverage": [make_finding(file="a.py"), make_finding(file="b.py")],
+        }
+        check_counts = {"enrichment": 10, "coverage": 4}
+        tally = FindingTally()
+        for check_name, findings in findings_by_check.items():
+            for finding in findings:
+                tally.add(check_name, [finding])
+
+        assert compute_quality(tally, check_counts) == compute_quality(
+            findings_by_check, check_counts
+        )
+        assert compute_quality(tally, check_counts)["enrichment"].percentage == 80
+
+    def test_exit_code_from_tally_respects_fail_on(self, make_finding):
+        config = DocvetConfig(fail_on=["enrichment"])
+        tally = FindingTally()
+        tally.add("freshness", [make_finding()])
+
+        assert determine_exit_code(tally, config) == 0
+
+        tally.add("enrichment", [make_finding()])
+
+        assert determine_exit_code(tally, config) == 1
+
+    def test_format_summary_from_tally_matches_list(self, make_finding):
+        findings = [make_finding(), make_finding(category="recommended", line=2)]
+        tally = FindingTally()
+        tally.add("enrichment", findings)
+
+        assert format_summary(3, ["enrichment"], tally, 0.5) == format_summary(
+            3, ["enrichment"], findings, 0.5
+        )
+
+
+class TestFormatTerminalGroup:
+    """Tests for the per-file terminal lines and footer."""
+
+    def test_group_sorts_by_line_without_summary(self, make_finding):
+        findings = [
+            make_finding(file="a.py", line=9, rule="r2", message="later"),
+            make_finding(file="a.py", line=3, rule="r1", message="first"),
+        ]
+
+        result = format_terminal_group(findings, no_color=True)
+
+        assert result == ("a.py:3: r1 first [required]\na.py:9: r2 later [required]\n")
+
+    def test_groups_and_footer_rebuild_format_terminal(self, make_finding):
+        a = [make_finding(file="a.py", line=1)]
+        b = [make_finding(file="b.py", line=2, category="scaffold")]
+        tally = FindingTally()
+        tally.add("enrichment", a + b)
+
+        rebuilt = (
+            format_terminal_group(a, no_color=True)
+            + "\n"
+            + format_terminal_group(b, no_color=True)
+            + "\n"
+            + format_terminal_footer(tally)
+        )
+
+        assert rebuilt == format_terminal(a + b, no_color=True)
+        assert format_terminal_footer(tally).endswith(
+            "2 findings (1 required, 0 recommended, 1 scaffold)\n"
+        )